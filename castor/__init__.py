@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-try:
-    from importlib.metadata import version as _pkg_version
 
-    __version__ = _pkg_version("opencastor")
-except Exception:
-    __version__ = "3.0.1"  # fallback
+def __getattr__(name: str):
+    # importlib.metadata is slow to import; every CLI command imports this
+    # package, but few of them need the version.
+    if name == "__version__":
+        try:
+            from importlib.metadata import version as _pkg_version
+
+            value = _pkg_version("opencastor")
+        except Exception:
+            value = "3.0.1"  # fallback
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def initialize_safety(safety_layer, config: dict):
@@ -53,6 +53,7 @@ def register_agent_tools(registry: ToolRegistry) -> None:
             },
         },
         returns="array",
+        side_effect="read_only",
     )
     registry.register(
         name="get_telemetry",
@@ -63,6 +64,7 @@ def register_agent_tools(registry: ToolRegistry) -> None:
         ),
         parameters={},
         returns="object",
+        side_effect="read_only",
     )
     registry.register(
         name="recall_episode",
@@ -84,6 +86,7 @@ def register_agent_tools(registry: ToolRegistry) -> None:
             },
         },
         returns="array",
+        side_effect="read_only",
     )
     registry.register(
         name="send_rcan_message",
@@ -123,6 +126,7 @@ def register_agent_tools(registry: ToolRegistry) -> None:
             },
         },
         returns="array",
+        side_effect="read_only",
     )
     registry.register(
         name="share_config_with_peer",
@@ -622,6 +626,7 @@ def register_working_memory_tools(registry: ToolRegistry, memory: Any) -> None:
             "key": {"type": "string", "description": "Memory key", "required": True},
         },
         returns="string",
+        side_effect="read_only",
     )
     registry.register(
         name="list_memory",
@@ -629,4 +634,5 @@ def register_working_memory_tools(registry: ToolRegistry, memory: Any) -> None:
         description="List all keys in the working memory scratchpad as JSON array.",
         parameters={},
         returns="string",
+        side_effect="read_only",
     )
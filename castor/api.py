@@ -202,6 +202,7 @@ class AppState:
     config: Optional[dict] = None
     brain = None
     driver = None
+    startup = None  # StartupGraph of the last gateway boot
     channels: dict[str, object] = {}
     last_thought: Optional[dict] = None
     boot_time: float = time.time()
@@ -233,6 +234,7 @@ class AppState:
     pqc_keypair = None  # RobotKeyPair — held for registration handshake signing
     hook_runner = None  # HookRunner — PreToolUse/PostToolUse safety gating (#817)
     swarm_worker = None  # WorkerCoordinator — subprocess-isolated perception pipeline (#821)
+    channels_task: Optional[asyncio.Task] = None  # background _start_channels() after boot
 
 
 state = AppState()
@@ -389,10 +391,23 @@ class IntentReprioritizeRequest(BaseModel):
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
-@app.get("/health")
-@app.get("/api/health")
-async def health():
-    """Health check -- returns OK if the gateway is running (unauthenticated, minimal info)."""
+def _etag_response(request: Request, content: bytes, stable: bytes, media_type: str):
+    """Return *content* with a weak ETag, or ``304`` if the client already has it.
+
+    The ETag hashes *stable* — the body with volatile fields such as uptime
+    left out — so pollers revalidating with ``If-None-Match`` get an empty
+    ``304`` until something meaningful changes.
+    """
+    from fastapi.responses import Response as _Response
+
+    etag = f'W/"{hashlib.sha1(stable).hexdigest()[:16]}"'
+    sent = request.headers.get("if-none-match", "")
+    if sent.strip() == "*" or etag in (tag.strip() for tag in sent.split(",")):
+        return _Response(status_code=304, headers={"ETag": etag})
+    return _Response(content=content, media_type=media_type, headers={"ETag": etag})
+
+
+async def _health_payload() -> dict:
     import castor as _castor_pkg
 
     return {
@@ -404,6 +419,26 @@ async def health():
     }
 
 
+@app.get("/health")
+@app.get("/api/health")
+async def health(request: Request):
+    """Health check -- returns OK if the gateway is running (unauthenticated, minimal info).
+
+    Carries an ETag that ignores ``uptime_s``; a matching ``If-None-Match``
+    gets ``304 Not Modified``.
+    """
+    import json
+
+    payload = await _health_payload()
+    stable = {k: v for k, v in payload.items() if k != "uptime_s"}
+    return _etag_response(
+        request,
+        json.dumps(payload, separators=(",", ":")).encode(),
+        json.dumps(stable, sort_keys=True).encode(),
+        "application/json",
+    )
+
+
 @app.get("/api/health/detail", dependencies=[Depends(verify_token)])
 async def health_detail():
     """Authenticated health check with full runtime state (brain, driver, channels)."""
@@ -1054,10 +1089,12 @@ async def reprioritize_intent(req: IntentReprioritizeRequest, request: Request):
 
 
 @app.get("/api/metrics", dependencies=[Depends(verify_token)])
-async def get_metrics():
-    """Prometheus text exposition format metrics (auth required — exposes provider/model info)."""
-    from fastapi.responses import Response as _Response
+async def get_metrics(request: Request):
+    """Prometheus text exposition format metrics (auth required — exposes provider/model info).
 
+    Carries an ETag that ignores the uptime gauge; a matching
+    ``If-None-Match`` gets ``304 Not Modified``.
+    """
     from castor.metrics import get_registry
 
     # Update live status gauges before rendering
@@ -1074,12 +1111,50 @@ async def get_metrics():
     except Exception:
         pass
 
-    return _Response(
-        content=get_registry().render(),
-        media_type="text/plain; version=0.0.4; charset=utf-8",
+    text = get_registry().render()
+    stable = "\n".join(
+        line for line in text.splitlines() if not line.startswith("opencastor_uptime_seconds")
+    )
+    return _etag_response(
+        request,
+        text.encode(),
+        stable.encode(),
+        "text/plain; version=0.0.4; charset=utf-8",
     )
 
 
+@app.get("/api/profile", dependencies=[Depends(verify_token)])
+async def get_profile(
+    seconds: float = Query(5.0, gt=0, le=60, description="Capture duration in seconds"),
+    hz: float = Query(100.0, ge=1, le=1000, description="Stack samples per second"),
+    format: str = Query("folded", pattern="^(folded|json)$"),
+):
+    """Capture a time-bounded CPU profile of this process.
+
+    ``format=folded`` streams folded stacks (``frame;frame;frame count``) for
+    flamegraph.pl / speedscope, preceded by ``#`` comment lines with the
+    control-loop stage timings.  ``format=json`` returns the stacks and stage
+    timings as one object.  Works whether or not profiling is armed.
+    """
+    from castor import profiler
+
+    result = await asyncio.to_thread(profiler.capture, seconds, hz)
+    if format == "json":
+        result.pop("folded", None)
+        return result
+
+    def _generate():
+        yield f"# capture seconds={result['seconds']} hz={result['hz']} samples={result['samples']}\n"
+        for name, st in sorted(result["stages"].items()):
+            yield (
+                f"# stage {name} count={st['count']} mean_ms={st['mean_ms']} "
+                f"total_ms={st['total_ms']}\n"
+            )
+        yield from result["folded"].splitlines(keepends=True)
+
+    return StreamingResponse(_generate(), media_type="text/plain; charset=utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Token usage endpoint  (issue #104)
 # ---------------------------------------------------------------------------
@@ -4313,11 +4388,44 @@ class _RecordingStartRequest(BaseModel):
     session_name: Optional[str] = None
 
 
+_recording_task: Optional[asyncio.Task] = None
+
+
+def _record_live_frame(rec) -> None:
+    frame = _capture_live_frame()
+    if frame:
+        rec.write_frame(frame)
+
+
+async def _recording_pump(rec) -> None:
+    """Feed the gateway camera into *rec* at its frame rate until it stops.
+
+    Capture and write run in a worker thread, so the ``mp4`` re-encode never
+    blocks the event loop.
+    """
+    interval = 1.0 / max(1, rec.fps)
+    while rec.is_recording:
+        t0 = time.monotonic()
+        try:
+            await asyncio.to_thread(_record_live_frame, rec)
+        except Exception as exc:
+            logger.debug("Recording frame skipped: %s", exc)
+        await asyncio.sleep(max(0.0, interval - (time.monotonic() - t0)))
+
+
+def _cancel_recording_pump() -> None:
+    global _recording_task
+    if _recording_task is not None:
+        _recording_task.cancel()
+        _recording_task = None
+
+
 @app.post("/api/recording/start", dependencies=[Depends(verify_token)])
 async def recording_start(req: _RecordingStartRequest = _RecordingStartRequest()):
     """POST /api/recording/start — Begin MP4 video recording of camera stream."""
     from castor.recorder import get_recorder
 
+    global _recording_task
     rec = get_recorder()
     if rec.is_recording:
         raise HTTPException(status_code=409, detail="Recording already in progress")
@@ -4325,6 +4433,8 @@ async def recording_start(req: _RecordingStartRequest = _RecordingStartRequest()
         rec_id = rec.start(req.session_name)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
+    _cancel_recording_pump()
+    _recording_task = asyncio.create_task(_recording_pump(rec))
     return {"ok": True, "id": rec_id, "session_name": req.session_name}
 
 
@@ -4333,7 +4443,8 @@ async def recording_stop():
     """POST /api/recording/stop — Stop recording and flush to disk."""
     from castor.recorder import get_recorder
 
-    meta = get_recorder().stop()
+    _cancel_recording_pump()
+    meta = await asyncio.to_thread(get_recorder().stop)
     if meta is None:
         raise HTTPException(status_code=409, detail="No recording in progress")
     return meta
@@ -4359,23 +4470,27 @@ async def recording_get(rec_id: str):
 
 
 @app.get("/api/recording/{rec_id}/download", dependencies=[Depends(verify_token)])
-async def recording_download(rec_id: str):
-    """GET /api/recording/{id}/download — Stream MP4 file."""
+async def recording_download(rec_id: str, segment: int = 0):
+    """GET /api/recording/{id}/download — Stream MP4 file.
+
+    MJPEG recordings are stored as segments; ``?segment=N`` picks one
+    (negative counts from the end) and its MP4 transcode is preferred.
+    """
     from fastapi.responses import FileResponse
 
     from castor.recorder import get_recorder
 
-    meta = get_recorder().get_recording(rec_id)
-    if meta is None:
+    rec = get_recorder()
+    if rec.get_recording(rec_id) is None:
         raise HTTPException(status_code=404, detail="Recording not found")
-    path = Path(meta["path"])
-    if not path.exists():
+    path = rec.segment_file(rec_id, segment)
+    if path is None or not path.is_file():
         raise HTTPException(status_code=404, detail="Recording file not found on disk")
-    return FileResponse(
-        str(path),
-        media_type="video/mp4",
-        filename=f"{rec_id}.mp4",
-    )
+    if path.suffix == ".avi":
+        media_type, filename = "video/x-msvideo", f"{rec_id}_{path.stem}.avi"
+    else:
+        media_type, filename = "video/mp4", f"{rec_id}.mp4"
+    return FileResponse(str(path), media_type=media_type, filename=filename)
 
 
 @app.delete("/api/recording/{rec_id}", dependencies=[Depends(verify_token)])
@@ -5887,6 +6002,25 @@ async def _start_channels():
             logger.warning(f"Failed to start channel {name}: {e}")
 
 
+def _launch_channels() -> None:
+    """Start channels in the background, keeping the task so shutdown can cancel it."""
+
+    def _on_done(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Channel startup failed", exc_info=task.exception())
+
+    state.channels_task = asyncio.create_task(_start_channels())
+    state.channels_task.add_done_callback(_on_done)
+
+
+async def _cancel_channels_task() -> None:
+    """Cancel a channel startup that is still running and wait for it to unwind."""
+    task, state.channels_task = state.channels_task, None
+    if task is not None and not task.done():
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
 async def _stop_channels():
     """Gracefully stop all active channels."""
     for name, channel in state.channels.items():
@@ -5901,6 +6035,13 @@ async def _stop_channels():
 # Lifecycle events
 # ---------------------------------------------------------------------------
 async def on_startup():
+    from castor.startup import StartupGraph
+
+    # Independent subsystems start concurrently; network services are deferred
+    # until the gateway is serving (see castor/startup.py)
+    boot = StartupGraph()
+    state.startup = boot
+
     # Always initialize thought history ring buffer (no config needed)
     state.thought_history = collections.deque(maxlen=50)
 
@@ -5932,6 +6073,23 @@ async def on_startup():
                 state.config = yaml.safe_load(f)
             logger.info(f"Loaded config: {state.config['metadata']['robot_name']}")
 
+            # Arm the profiler if requested (the runtime may already have done so)
+            try:
+                from castor import profiler as _profiler
+
+                if not _profiler.is_enabled():
+                    _profiler.configure(state.config)
+            except Exception as _prof_exc:
+                logger.debug("Profiler init skipped: %s", _prof_exc)
+
+            # Recording settings (RCAN ``recording`` block) for /api/recording/*
+            try:
+                from castor import recorder as _recording
+
+                _recording.configure(state.config)
+            except Exception as _rec_exc:
+                logger.warning("Recorder config ignored: %s", _rec_exc)
+
             # (v3.0 migration) Config validation now happens upstream via rcan-py's
             # rcan.validate.validate_config on ROBOT.md ingress. No in-request revalidation.
 
@@ -6035,161 +6193,191 @@ async def on_startup():
             except Exception as e:
                 logger.debug(f"RCAN NodeClient init skipped: {e}")
 
-            # Initialize brain
-            from castor.providers import get_provider
+            # The subsystems below form a startup graph: the brain warmup, PQC
+            # identity and hardware probes initialise concurrently.
+            from castor.drivers import get_driver
+            from castor.main import (
+                Camera,
+                Listener,
+                Speaker,
+                set_shared_camera,
+                set_shared_speaker,
+            )
 
-            state.brain = get_provider(state.config["agent"])
-            state.brain._caps = state.config.get("rcan_protocol", {}).get("capabilities", [])
-            state.brain._robot_name = state.config.get("metadata", {}).get("robot_name", "robot")
-            logger.info(f"Brain online: {state.config['agent'].get('model')}")
+            # Initialize brain
+            @boot.step("brain", required=True)
+            def _init_brain():
+                from castor.providers import get_provider
+
+                state.brain = get_provider(state.config["agent"])
+                state.brain._caps = state.config.get("rcan_protocol", {}).get("capabilities", [])
+                state.brain._robot_name = state.config.get("metadata", {}).get(
+                    "robot_name", "robot"
+                )
+                logger.info(f"Brain online: {state.config['agent'].get('model')}")
 
             # Initialize offline fallback manager (if configured)
-            if state.config.get("offline_fallback", {}).get("enabled"):
-                try:
-                    from castor.offline_fallback import OfflineFallbackManager
+            @boot.step("offline_fallback", after=("brain",))
+            def _init_offline_fallback():
+                if state.config.get("offline_fallback", {}).get("enabled"):
+                    try:
+                        from castor.offline_fallback import OfflineFallbackManager
 
-                    state.offline_fallback = OfflineFallbackManager(
-                        config=state.config,
-                        primary_provider=state.brain,
-                    )
-                    state.offline_fallback.start()
-                    logger.info("Offline fallback manager started")
-                except Exception as _of_exc:
-                    logger.warning("Offline fallback init failed: %s", _of_exc)
+                        state.offline_fallback = OfflineFallbackManager(
+                            config=state.config,
+                            primary_provider=state.brain,
+                        )
+                        state.offline_fallback.start()
+                        logger.info("Offline fallback manager started")
+                    except Exception as _of_exc:
+                        logger.warning("Offline fallback init failed: %s", _of_exc)
 
             # Initialize provider fallback manager (for quota/credit errors)
-            if state.config.get("provider_fallback", {}).get("enabled"):
-                try:
-                    from castor.provider_fallback import ProviderFallbackManager
+            @boot.step("provider_fallback", after=("brain",))
+            def _init_provider_fallback():
+                if state.config.get("provider_fallback", {}).get("enabled"):
+                    try:
+                        from castor.provider_fallback import ProviderFallbackManager
 
-                    state.provider_fallback = ProviderFallbackManager(
-                        config=state.config,
-                        primary_provider=state.brain,
-                    )
-                    state.provider_fallback.probe_fallback()
-                    logger.info("Provider fallback manager ready")
-                except Exception as _pf_exc:
-                    logger.warning("Provider fallback init failed: %s", _pf_exc)
+                        state.provider_fallback = ProviderFallbackManager(
+                            config=state.config,
+                            primary_provider=state.brain,
+                        )
+                        state.provider_fallback.probe_fallback()
+                        logger.info("Provider fallback manager ready")
+                    except Exception as _pf_exc:
+                        logger.warning("Provider fallback init failed: %s", _pf_exc)
 
             # Initialize message signing (RCAN §16, issue #441)
-            try:
-                from castor.rcan.message_signing import get_signer as _get_signer
+            @boot.step("message_signing")
+            def _init_message_signing():
+                try:
+                    from castor.rcan.message_signing import get_signer as _get_signer
 
-                _sig = _get_signer(state.config)
-                if _sig and _sig.available:
-                    logger.info("RCAN message signing ready (kid=%s)", _sig.key_id)
-                    if state.fs:
-                        state.fs.proc.set_value("rcan_signing_kid", _sig.key_id)
-            except Exception as _se:
-                logger.debug("RCAN signing init skipped: %s", _se)
+                    _sig = _get_signer(state.config)
+                    if _sig and _sig.available:
+                        logger.info("RCAN message signing ready (kid=%s)", _sig.key_id)
+                        if state.fs:
+                            state.fs.proc.set_value("rcan_signing_kid", _sig.key_id)
+                except Exception as _se:
+                    logger.debug("RCAN signing init skipped: %s", _se)
 
             # Initialize PQC robot identity (issue #808)
             # ROBOT_OWNER_MODE=true (default) → pqc-v1 (ML-DSA-65 only, owned robots)
             # ROBOT_OWNER_MODE=false → pqc-hybrid-v1 (Ed25519 + ML-DSA-65, external)
-            try:
-                from castor.crypto.pqc import (
-                    PQC_HYBRID_V1,
-                    PQC_V1,
-                    load_or_generate_robot_keypair,
-                    robot_identity_record,
-                )
+            @boot.step("pqc_identity")
+            def _init_pqc_identity():
+                try:
+                    from castor.crypto.pqc import (
+                        PQC_HYBRID_V1,
+                        PQC_V1,
+                        load_or_generate_robot_keypair,
+                        robot_identity_record,
+                    )
 
-                _owner_mode = os.environ.get("ROBOT_OWNER_MODE", "true").lower() not in (
-                    "false",
-                    "0",
-                    "no",
-                )
-                _pqc_profile = PQC_V1 if _owner_mode else PQC_HYBRID_V1
-                _kp, _generated = load_or_generate_robot_keypair(profile=_pqc_profile)
-                state.pqc_identity = robot_identity_record(_kp)
-                state.pqc_keypair = _kp
-                if _generated:
-                    logger.info(
-                        "PQC robot identity created (%s). "
-                        "Private key stored at ~/.opencastor/robot_identity.json — "
-                        "back up before fleet expansion.",
-                        _kp.profile,
+                    _owner_mode = os.environ.get("ROBOT_OWNER_MODE", "true").lower() not in (
+                        "false",
+                        "0",
+                        "no",
                     )
-                else:
+                    _pqc_profile = PQC_V1 if _owner_mode else PQC_HYBRID_V1
+                    _kp, _generated = load_or_generate_robot_keypair(profile=_pqc_profile)
+                    state.pqc_identity = robot_identity_record(_kp)
+                    state.pqc_keypair = _kp
+                    if _generated:
+                        logger.info(
+                            "PQC robot identity created (%s). "
+                            "Private key stored at ~/.opencastor/robot_identity.json — "
+                            "back up before fleet expansion.",
+                            _kp.profile,
+                        )
+                    else:
+                        logger.info(
+                            "PQC robot identity loaded (profile=%s)",
+                            state.pqc_identity.get("crypto_profile"),
+                        )
                     logger.info(
-                        "PQC robot identity loaded (profile=%s)",
-                        state.pqc_identity.get("crypto_profile"),
+                        "PQC registration handshake enabled (POST /robot/register, /robot/verify)"
                     )
-                logger.info(
-                    "PQC registration handshake enabled (POST /robot/register, /robot/verify)"
-                )
-            except Exception as _pqc_e:
-                logger.warning("PQC robot identity init failed (non-fatal): %s", _pqc_e)
+                except Exception as _pqc_e:
+                    logger.warning("PQC robot identity init failed (non-fatal): %s", _pqc_e)
 
             # Load live robot context into brain (issue: feat/live-robot-context)
-            try:
-                from castor.brain.robot_context import build_robot_context
-
-                _ctx = build_robot_context(state.config)
-                if state.brain is not None:
-                    state.brain.set_robot_context(_ctx)
-                logger.info(
-                    "Robot context loaded: rrn=%s host=%s loa=%s errors=%d",
-                    _ctx.rrn,
-                    _ctx.hostname,
-                    _ctx.active_loa,
-                    len(_ctx.last_errors),
-                )
-            except Exception as _rctx_e:
-                logger.warning("Robot context init failed (non-fatal): %s", _rctx_e)
-
-            # Initialize multi-provider failover chain (agent.fallbacks in RCAN YAML)
-            _agent_cfg = state.config.get("agent", {})
-            if _agent_cfg.get("fallbacks"):
+            @boot.step("robot_context", after=("brain",))
+            def _init_robot_context():
                 try:
-                    from castor.brain import build_provider  # provider factory
-                    from castor.providers.failover import ProviderFailoverChain
-
-                    def _provider_factory(pkey: str, pmodel: str):
-                        cfg_copy = dict(state.config)
-                        cfg_copy.setdefault("agent", {})["provider"] = pkey
-                        cfg_copy["agent"]["model"] = pmodel
-                        return build_provider(cfg_copy)
+                    from castor.brain.robot_context import build_robot_context
 
-                    failover_chain = ProviderFailoverChain.from_config(
-                        state.config, _provider_factory
+                    _ctx = build_robot_context(state.config)
+                    if state.brain is not None:
+                        state.brain.set_robot_context(_ctx)
+                    logger.info(
+                        "Robot context loaded: rrn=%s host=%s loa=%s errors=%d",
+                        _ctx.rrn,
+                        _ctx.hostname,
+                        _ctx.active_loa,
+                        len(_ctx.last_errors),
                     )
-                    if failover_chain is not None:
-                        state.failover_chain = failover_chain
-                        logger.info(
-                            "Multi-provider failover chain ready: %d fallback(s)",
-                            len(failover_chain._fallbacks),
-                        )
-                except Exception as _fc_exc:
-                    logger.warning("Failover chain init failed (non-fatal): %s", _fc_exc)
-
-            # Initialize driver (simulation-safe)
-            from castor.drivers import get_driver
-            from castor.main import Camera, Speaker
+                except Exception as _rctx_e:
+                    logger.warning("Robot context init failed (non-fatal): %s", _rctx_e)
 
-            state.driver = get_driver(state.config)
+            # Initialize multi-provider failover chain (agent.fallbacks in RCAN YAML)
+            @boot.step("failover_chain")
+            def _init_failover_chain():
+                _agent_cfg = state.config.get("agent", {})
+                if _agent_cfg.get("fallbacks"):
+                    try:
+                        from castor.brain import build_provider  # provider factory
+                        from castor.providers.failover import ProviderFailoverChain
 
-            # Initialize camera + speaker for live frames and TTS
-            from castor.main import set_shared_camera, set_shared_speaker
+                        def _provider_factory(pkey: str, pmodel: str):
+                            cfg_copy = dict(state.config)
+                            cfg_copy.setdefault("agent", {})["provider"] = pkey
+                            cfg_copy["agent"]["model"] = pmodel
+                            return build_provider(cfg_copy)
 
-            state.camera = Camera(state.config)
-            set_shared_camera(state.camera)
-            if state.fs:
-                state.fs.proc.set_camera("online" if state.camera.is_available() else "offline")
+                        failover_chain = ProviderFailoverChain.from_config(
+                            state.config, _provider_factory
+                        )
+                        if failover_chain is not None:
+                            state.failover_chain = failover_chain
+                            logger.info(
+                                "Multi-provider failover chain ready: %d fallback(s)",
+                                len(failover_chain._fallbacks),
+                            )
+                    except Exception as _fc_exc:
+                        logger.warning("Failover chain init failed (non-fatal): %s", _fc_exc)
+
+            # Hardware (simulation-safe)
+            @boot.step("driver", required=True)
+            def _init_driver():
+                state.driver = get_driver(state.config)
+
+            # Camera + speaker for live frames and TTS
+            @boot.step("camera", required=True)
+            def _init_camera():
+                state.camera = Camera(state.config)
+                set_shared_camera(state.camera)
+                if state.fs:
+                    state.fs.proc.set_camera("online" if state.camera.is_available() else "offline")
 
-            state.speaker = Speaker(state.config)
-            set_shared_speaker(state.speaker)
-            if state.fs:
-                state.fs.proc.set_speaker("online" if state.speaker.enabled else "offline")
+            @boot.step("speaker", required=True)
+            def _init_speaker():
+                state.speaker = Speaker(state.config)
+                set_shared_speaker(state.speaker)
+                if state.fs:
+                    state.fs.proc.set_speaker("online" if state.speaker.enabled else "offline")
 
-            # Initialize STT listener (issue #119)
-            from castor.main import Listener
+            # STT listener (issue #119)
+            @boot.step("listener", required=True)
+            def _init_listener():
+                state.listener = Listener(state.config)
+                logger.info(
+                    "Listener %s",
+                    "online" if state.listener.enabled else "offline (stt_enabled not set)",
+                )
 
-            state.listener = Listener(state.config)
-            logger.info(
-                "Listener %s",
-                "online" if state.listener.enabled else "offline (stt_enabled not set)",
-            )
+            boot.run()
 
             # Initialize Sisyphus learner loop (provider-wired for LLM augmentation)
             try:
@@ -6238,12 +6426,14 @@ async def on_startup():
 
             # Start snapshot manager background thread (issue #148)
             try:
+                from castor.monitor_scheduler import scheduler_from_config
                 from castor.snapshot import get_manager as _snap_mgr
 
                 _snap_interval = float(state.config.get("snapshot_interval_s", 60))
                 _snap_mgr().start(
                     interval_s=_snap_interval,
                     state_getter=lambda: state,
+                    scheduler=scheduler_from_config(state.config),
                 )
                 logger.info("Snapshot manager started (interval=%ss)", _snap_interval)
             except Exception as _snap_exc:
@@ -6282,7 +6472,10 @@ async def on_startup():
         )
 
     # Start mDNS (opt-in via rcan_protocol.enable_mdns)
-    if state.config:
+    @boot.step("mdns", deferred=True)
+    def _start_mdns():
+        if not state.config:
+            return
         rcan_proto = state.config.get("rcan_protocol", {})
         if rcan_proto.get("enable_mdns"):
             try:
@@ -6303,7 +6496,10 @@ async def on_startup():
                 logger.debug(f"mDNS startup skipped: {e}")
 
     # Start RCAN-MQTT transport (opt-in via rcan_protocol.mqtt_transport.enabled)
-    if state.config:
+    @boot.step("mqtt_transport", deferred=True)
+    def _start_mqtt_transport():
+        if not state.config:
+            return
         mqtt_cfg = state.config.get("rcan_protocol", {}).get("mqtt_transport", {})
         if mqtt_cfg.get("enabled"):
             try:
@@ -6329,7 +6525,10 @@ async def on_startup():
                 logger.debug("RCAN-MQTT startup skipped: %s", e)
 
     # Auto-start contribute (opt-in via agent.contribute.enabled in RCAN config)
-    if state.config:
+    @boot.step("contribute", deferred=True)
+    def _start_contribute():
+        if not state.config:
+            return
         contribute_cfg = state.config.get("agent", {}).get("contribute", {})
         if contribute_cfg.get("enabled"):
             try:
@@ -6345,12 +6544,20 @@ async def on_startup():
             except Exception as _contrib_exc:
                 logger.debug("Contribute auto-start skipped: %s", _contrib_exc)
 
-    await _start_channels()
-
     host = os.getenv("OPENCASTOR_API_HOST", "127.0.0.1")
     port = os.getenv("OPENCASTOR_API_PORT", "8000")
     logger.info(f"OpenCastor Gateway ready on {host}:{port}")
 
+    # Messaging channels and the deferred network services start once the
+    # gateway is serving requests
+    boot.mark("ready")
+    _launch_channels()
+
+    def _log_startup_trace():
+        logger.info("%s", boot.format_trace())
+
+    boot.run_deferred(on_done=_log_startup_trace if os.getenv("OPENCASTOR_STARTUP_TRACE") else None)
+
     # Wake-up greeting — non-blocking so startup is not delayed
     _robot_name_wakeup = (state.config or {}).get("metadata", {}).get("robot_name", "robot")
     if hasattr(state, "speaker") and state.speaker and getattr(state.speaker, "enabled", False):
@@ -9437,8 +9644,15 @@ async def on_shutdown():
     except Exception:
         pass
 
+    await _cancel_channels_task()
     await _stop_channels()
 
+    if state.hook_runner is not None:
+        try:
+            state.hook_runner.close()
+        except Exception:
+            pass
+
     # Stop RCAN-MQTT transport
     if hasattr(state, "rcan_mqtt") and state.rcan_mqtt is not None:
         try:
@@ -9456,6 +9670,17 @@ async def on_shutdown():
         state.mdns_browser.stop()
         state.mdns_browser = None
 
+    # Finish any API-started recording before the camera closes
+    _cancel_recording_pump()
+    try:
+        from castor.recorder import active_recorder
+
+        rec = active_recorder()
+        if rec is not None:
+            rec.stop()
+    except Exception as exc:
+        logger.warning("Recording stop failed: %s", exc)
+
     # Clear shared references first so in-flight requests cannot grab
     # a closing/closed device.
     from castor.main import set_shared_camera, set_shared_fs, set_shared_speaker
@@ -9558,9 +9783,16 @@ def main():
     parser.add_argument("--config", default="robot.rcan.yaml", help="RCAN config file")
     parser.add_argument("--host", default=os.getenv("OPENCASTOR_API_HOST", "127.0.0.1"))
     parser.add_argument("--port", type=int, default=int(os.getenv("OPENCASTOR_API_PORT", "8000")))
+    parser.add_argument(
+        "--startup-trace",
+        action="store_true",
+        help="Print per-subsystem startup timings and the critical path",
+    )
     args = parser.parse_args()
 
     os.environ["OPENCASTOR_CONFIG"] = args.config
+    if args.startup_trace:
+        os.environ["OPENCASTOR_STARTUP_TRACE"] = "1"
 
     # Pre-flight checks (#556)
     _assert_port_free(args.host, args.port)
@@ -9721,6 +9953,32 @@ async def get_contribute_endpoint(request: Request):
         }
 
 
+@app.get("/api/telemetry/snapshot", dependencies=[Depends(verify_token)])
+async def telemetry_snapshot(request: Request):
+    """GET /api/telemetry/snapshot — status, health, contribute and skills in one response.
+
+    Built in-process from the same handlers as the individual endpoints so the
+    cloud bridge can publish telemetry with a single request per cycle.  Each
+    view is gated on the same minimum role as its standalone endpoint; a view
+    that fails or that the caller's role may not read is omitted.
+    """
+    views = {
+        "status": (get_status, None),
+        "health": (_health_payload, None),
+        "contribute": (get_contribute_endpoint, "operator"),
+        "skills": (get_skills, None),
+    }
+    snapshot: dict = {}
+    for name, (handler, min_role) in views.items():
+        try:
+            if min_role is not None:
+                _check_min_role(request, min_role)
+            snapshot[name] = await (handler() if name == "health" else handler(request))
+        except Exception as exc:
+            logger.debug("Telemetry snapshot: %s view omitted: %s", name, exc)
+    return snapshot
+
+
 @app.post("/api/contribute/start", dependencies=[Depends(verify_token)])
 async def start_contribute_endpoint(request: Request):
     """POST /api/contribute/start — Start idle compute contribution.
@@ -37,6 +37,8 @@ class BatteryMonitor:
         self._adc = None
         self._running = False
         self._thread = None
+        self._scheduler = None
+        self._job = None
         self._last_voltage = None
         self._warned = False
 
@@ -94,39 +96,52 @@ class BatteryMonitor:
             logger.debug(f"Battery read error: {exc}")
             return 0.0
 
-    def start(self, interval: float = 10.0):
-        """Start background monitoring thread."""
+    def start(self, interval: float = 10.0, scheduler=None):
+        """Start background monitoring (a thread, or a critical job on
+        *scheduler* when one is given)."""
         if not self.enabled:
             return
 
         self._running = True
+        if scheduler is not None:
+            self._scheduler = scheduler
+            self._job = scheduler.every(
+                f"battery-{id(self):x}", self.check, interval, critical=True, first_delay_s=0
+            )
+            return
         self._thread = threading.Thread(target=self._monitor_loop, args=(interval,), daemon=True)
         self._thread.start()
 
     def stop(self):
-        """Stop the background monitoring thread."""
+        """Stop the background monitoring thread (or cancel its job)."""
         self._running = False
+        if self._job is not None:
+            self._scheduler.cancel(self._job)
+            self._job = None
         if self._thread:
             self._thread.join(timeout=2)
 
+    def check(self):
+        """Read the voltage once and fire the warn/critical callbacks."""
+        voltage = self.read_voltage()
+
+        if voltage > 0:
+            if voltage <= self.critical_voltage:
+                logger.critical(
+                    f"BATTERY CRITICAL: {voltage}V (threshold: {self.critical_voltage}V)"
+                )
+                if self._on_critical:
+                    self._on_critical(voltage)
+            elif voltage <= self.warn_voltage and not self._warned:
+                logger.warning(f"Battery low: {voltage}V (threshold: {self.warn_voltage}V)")
+                self._warned = True
+                if self._on_warn:
+                    self._on_warn(voltage)
+            elif voltage > self.warn_voltage:
+                self._warned = False
+
     def _monitor_loop(self, interval: float):
         """Background loop that checks voltage periodically."""
         while self._running:
-            voltage = self.read_voltage()
-
-            if voltage > 0:
-                if voltage <= self.critical_voltage:
-                    logger.critical(
-                        f"BATTERY CRITICAL: {voltage}V (threshold: {self.critical_voltage}V)"
-                    )
-                    if self._on_critical:
-                        self._on_critical(voltage)
-                elif voltage <= self.warn_voltage and not self._warned:
-                    logger.warning(f"Battery low: {voltage}V (threshold: {self.warn_voltage}V)")
-                    self._warned = True
-                    if self._on_warn:
-                        self._on_warn(voltage)
-                elif voltage > self.warn_voltage:
-                    self._warned = False
-
+            self.check()
             time.sleep(interval)
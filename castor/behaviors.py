@@ -28,12 +28,18 @@ Usage::
 from __future__ import annotations
 
 import concurrent.futures
+import functools
+import importlib
 import logging
+import operator
+import re
 import threading
 import time
 from concurrent.futures import wait as _futures_wait
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+
+from castor.event_bus import Waiter, get_bus
 
 logger = logging.getLogger("OpenCastor.Behaviors")
 
@@ -44,6 +50,171 @@ class _BreakLoop(Exception):
     """Sentinel raised by ``break_on`` step to exit enclosing loops."""
 
 
+# ---------------------------------------------------------------------------
+# Compiled expressions
+# ---------------------------------------------------------------------------
+
+# Scan order matters: two-character operators must be tried before ``>``/``<``.
+_EXPR_OPS: dict[str, Callable[[Any, Any], bool]] = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "!=": operator.ne,
+    "==": operator.eq,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+# Named operators of the sensor ``condition`` / ``repeat_until`` steps
+_SENSOR_OPS: dict[str, Callable[[Any, Any], bool]] = {
+    "lt": operator.lt,
+    "gt": operator.gt,
+    "lte": operator.le,
+    "gte": operator.ge,
+    "eq": operator.eq,
+    "neq": operator.ne,
+}
+
+# Named operators of the driver ``conditional`` / ``event_wait`` steps
+_DRIVER_OPS: dict[str, Callable[[Any, Any], bool]] = {
+    "lt": operator.lt,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "eq": operator.eq,
+    "ne": operator.ne,
+}
+
+_VAR_REF = re.compile(r"\$var\.(\w+)")
+_PLACEHOLDER = re.compile(r"\$[\w.]+")  # bare $item / $item.key, substituted at runtime
+
+# event_wait: a bus topic published this recently has a live publisher, so the
+# step waits on the bus instead of polling the driver itself.
+_BUS_LIVE_S = 1.0
+# How often a bus wait re-checks ``_running`` (stop() wakes waiters directly)
+_BUS_RECHECK_S = 0.25
+
+# Step keys holding nested step lists
+_NESTED_STEP_KEYS = ("steps", "inner_steps", "then_steps", "else_steps", "then", "else")
+
+
+def _compile_operand(text: str, condition: str) -> Callable[[dict[str, Any]], float]:
+    m = _VAR_REF.fullmatch(text)
+    if m is None:
+        try:
+            constant = float(text)
+        except ValueError:
+            raise ValueError(
+                f"Cannot evaluate condition {condition!r}: {text!r} is not a number"
+                " or $var.<name> reference"
+            ) from None
+        return lambda _vars: constant
+
+    name = m.group(1)
+
+    def _read_var(variables: dict[str, Any]) -> float:
+        val = variables.get(name)
+        if val is not None and not isinstance(val, bool):
+            try:
+                return float(val)
+            except (TypeError, ValueError):
+                pass
+        raise ValueError(f"Cannot evaluate condition {condition!r}: $var.{name}={val!r}")
+
+    return _read_var
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_expr(condition: str) -> Callable[[dict[str, Any]], bool]:
+    """Compile a ``lhs op rhs`` condition into a function of the variable store.
+
+    Each side is a number or a ``$var.<name>`` reference; operators are
+    ``>``, ``>=``, ``<``, ``<=``, ``==``, ``!=``.  Parsing happens once per
+    distinct string, so loops pay only for the variable lookups and the
+    comparison.
+
+    Raises:
+        ValueError: If the condition has no operator or an operand is neither
+            a number nor a variable reference.
+    """
+    text = condition.strip()
+    for op_str, op_fn in _EXPR_OPS.items():
+        lhs_s, sep, rhs_s = text.partition(op_str)
+        if sep:
+            lhs = _compile_operand(lhs_s.strip(), condition)
+            rhs = _compile_operand(rhs_s.strip(), condition)
+            return lambda variables: op_fn(lhs(variables), rhs(variables))
+    raise ValueError(f"No supported operator found in condition {condition!r}")
+
+
+@functools.lru_cache(maxsize=256)
+def _field_path(field: str) -> tuple[str, ...]:
+    return tuple(field.split("."))
+
+
+# module path → imported module; resolved on first read, not per call
+_driver_modules: dict[str, Any] = {}
+
+
+def _driver_module(path: str) -> Any:
+    module = _driver_modules.get(path)
+    if module is None:
+        module = _driver_modules[path] = importlib.import_module(path)
+    return module
+
+
+# sensor name → (module, getter, read method)
+_SENSOR_READERS: dict[str, tuple[str, str, str]] = {
+    "lidar": ("castor.drivers.lidar_driver", "get_lidar", "obstacles"),
+    "thermal": ("castor.drivers.thermal_driver", "get_thermal", "get_hotspot"),
+    "imu": ("castor.drivers.imu_driver", "get_imu", "read"),
+}
+
+
+def _check_steps(steps: Any, where: str) -> None:
+    """Compile every condition and operator in *steps* (recursively).
+
+    Raises:
+        ValueError: Naming the offending step, e.g. ``steps[3].inner_steps[0]``.
+    """
+    if not isinstance(steps, list):
+        return
+    for i, step in enumerate(steps):
+        if not isinstance(step, dict):
+            continue
+        here = f"{where}[{i}]"
+        step_type = step.get("type")
+        condition = step.get("condition")
+        if (
+            step_type in ("assert", "unless", "break_on")
+            and isinstance(condition, str)
+            and condition.strip()
+            and not _PLACEHOLDER.fullmatch(condition.strip())
+        ):
+            try:
+                compile_expr(condition)
+            except ValueError as exc:
+                raise ValueError(f"{here} ({step_type}): {exc}") from None
+        op = step.get("op")
+        if isinstance(op, str) and not op.startswith("$"):
+            ops = _SENSOR_OPS if step_type in ("condition", "repeat_until") else None
+            if step_type in ("conditional", "event_wait"):
+                ops = _DRIVER_OPS
+            if ops is not None and op not in ops:
+                raise ValueError(
+                    f"{here} ({step_type}): unknown op {op!r}; expected one of {sorted(ops)}"
+                )
+        for key in _NESTED_STEP_KEYS:
+            _check_steps(step.get(key), f"{here}.{key}")
+
+
+# driver name → (module, driver class, read method)
+_DRIVER_READERS: dict[str, tuple[str, str, str]] = {
+    "battery": ("castor.drivers.battery_driver", "BatteryDriver", "read"),
+    "imu": ("castor.drivers.imu_driver", "IMUDriver", "read"),
+    "lidar": ("castor.drivers.lidar_driver", "LidarDriver", "obstacles"),
+}
+
+
 class BehaviorRunner:
     """Execute named behavior scripts that drive the robot through a sequence of steps.
 
@@ -139,6 +310,9 @@ class BehaviorRunner:
 
         self._events: dict[str, Any] = {}  # name → threading.Event
         self._events_lock: _threading2.Lock = _threading2.Lock()
+        # Event-bus waiters cancelled and bus subscriptions dropped on stop()
+        self._waiters: set[Waiter] = set()
+        self._event_subs: list[int] = []
 
         # Issue #387: robot tag set for tag-based step filtering
         robot_tags = self.config.get("robot_tags") or self.config.get("tags") or []
@@ -176,7 +350,8 @@ class BehaviorRunner:
         FileNotFoundError
             If the file does not exist.
         ValueError
-            If required keys (``name``, ``steps``) are missing.
+            If required keys (``name``, ``steps``) are missing, or a step's
+            ``condition`` expression or ``op`` is malformed.
         yaml.YAMLError
             If the file is not valid YAML.
         """
@@ -202,6 +377,9 @@ class BehaviorRunner:
         if not isinstance(data["steps"], list):
             raise ValueError("'steps' must be a list")
 
+        # Compile conditions now so a typo fails here rather than mid-mission
+        _check_steps(data["steps"], "steps")
+
         logger.info("Loaded behavior '%s' with %d step(s)", data["name"], len(data["steps"]))
         return data
 
@@ -266,6 +444,13 @@ class BehaviorRunner:
             for ev in self._events.values():
                 ev.set()  # unblock any waiting event_trigger steps
             self._events.clear()
+            waiters, self._waiters = self._waiters, set()
+            subs, self._event_subs = self._event_subs, []
+        for waiter in waiters:
+            waiter.cancel()
+        bus = get_bus()
+        for token in subs:
+            bus.unsubscribe(token)
         if self.driver is not None:
             try:
                 self.driver.stop()
@@ -606,31 +791,20 @@ class BehaviorRunner:
         dict
             The sensor reading dict, or ``{}`` on failure / unknown sensor.
         """
-        sensor_data: dict = {}
-        if sensor == "lidar":
-            try:
-                from castor.drivers.lidar_driver import get_lidar  # type: ignore
-
-                sensor_data = get_lidar().obstacles()
-            except (ImportError, Exception) as exc:
-                logger.warning("sensor read: lidar query failed (%s) — using {}", exc)
-        elif sensor == "thermal":
-            try:
-                from castor.drivers.thermal_driver import get_thermal  # type: ignore
-
-                sensor_data = get_thermal().get_hotspot()
-            except (ImportError, Exception) as exc:
-                logger.warning("sensor read: thermal query failed (%s) — using {}", exc)
-        elif sensor == "imu":
-            try:
-                from castor.drivers.imu_driver import get_imu  # type: ignore
-
-                sensor_data = get_imu().read()
-            except (ImportError, Exception) as exc:
-                logger.warning("sensor read: imu query failed (%s) — using {}", exc)
-        elif sensor != "none":
-            logger.warning("sensor read: unknown sensor '%s' — using {}", sensor)
-        return sensor_data
+        reader = _SENSOR_READERS.get(sensor)
+        if reader is None:
+            if sensor != "none":
+                logger.warning("sensor read: unknown sensor '%s' — using {}", sensor)
+            return {}
+        module_path, getter, method = reader
+        try:
+            # The getter is looked up on the (cached) module each call so
+            # that patched drivers are honoured.
+            device = getattr(_driver_module(module_path), getter)()
+            return getattr(device, method)()
+        except Exception as exc:
+            logger.warning("sensor read: %s query failed (%s) — using {}", sensor, exc)
+            return {}
 
     @staticmethod
     def _eval_condition(sensor: str, field: Optional[str], op: str, value: Any) -> bool:
@@ -655,15 +829,6 @@ class BehaviorRunner:
             Result of the comparison, or ``False`` if the field is missing /
             the operator is unknown.
         """
-        _OPS = {
-            "lt": lambda a, b: a < b,
-            "gt": lambda a, b: a > b,
-            "lte": lambda a, b: a <= b,
-            "gte": lambda a, b: a >= b,
-            "eq": lambda a, b: a == b,
-            "neq": lambda a, b: a != b,
-        }
-
         if field is None:
             return False
 
@@ -671,7 +836,7 @@ class BehaviorRunner:
 
         # Support dot-path traversal (e.g. "sectors.front")
         actual: Any = sensor_data
-        for part in field.split("."):
+        for part in _field_path(field):
             if not isinstance(actual, dict):
                 actual = None
                 break
@@ -685,7 +850,7 @@ class BehaviorRunner:
             )
             return False
 
-        op_fn = _OPS.get(op)
+        op_fn = _SENSOR_OPS.get(op)
         if op_fn is None:
             logger.warning("_eval_condition: unknown op '%s' — returning False", op)
             return False
@@ -800,15 +965,7 @@ class BehaviorRunner:
             branch = else_steps
             result = False
         else:
-            _OPS = {
-                "lt": lambda a, b: a < b,
-                "gt": lambda a, b: a > b,
-                "lte": lambda a, b: a <= b,
-                "gte": lambda a, b: a >= b,
-                "eq": lambda a, b: a == b,
-                "neq": lambda a, b: a != b,
-            }
-            op_fn = _OPS.get(op)
+            op_fn = _SENSOR_OPS.get(op)
             if op_fn is None:
                 logger.warning("condition step: unknown op '%s' — treating condition as False", op)
                 result = False
@@ -1342,26 +1499,18 @@ class BehaviorRunner:
             The extracted value, or ``None`` if the driver is unavailable,
             the field is missing, or any exception occurs.
         """
+        reader = _DRIVER_READERS.get(driver)
+        if reader is None:
+            logger.warning("_get_sensor_value: unknown driver '%s' — returning None", driver)
+            return None
+        module_path, cls_name, method = reader
         try:
-            if driver == "battery":
-                from castor.drivers.battery_driver import BatteryDriver  # type: ignore
-
-                return BatteryDriver({}).read().get(field)
-            if driver == "imu":
-                from castor.drivers.imu_driver import IMUDriver  # type: ignore
-
-                return IMUDriver({}).read().get(field)
-            if driver == "lidar":
-                from castor.drivers.lidar_driver import LidarDriver  # type: ignore
-
-                return LidarDriver({}).obstacles().get(field)
+            device = getattr(_driver_module(module_path), cls_name)({})
+            return getattr(device, method)().get(field)
         except Exception as exc:  # noqa: BLE001
             logger.warning("_get_sensor_value: driver=%s field=%s error: %s", driver, field, exc)
             return None
 
-        logger.warning("_get_sensor_value: unknown driver '%s' — returning None", driver)
-        return None
-
     def _step_conditional(self, step: dict) -> None:
         """Evaluate a sensor reading and branch into ``then`` or ``else`` steps.
 
@@ -1423,15 +1572,6 @@ class BehaviorRunner:
             then_steps: list = step.get("then") or []
             else_steps: list = step.get("else") or []
 
-            _OPS = {
-                "lt": lambda a, b: a < b,
-                "lte": lambda a, b: a <= b,
-                "gt": lambda a, b: a > b,
-                "gte": lambda a, b: a >= b,
-                "eq": lambda a, b: a == b,
-                "ne": lambda a, b: a != b,
-            }
-
             # Read the sensor value.
             actual = self._get_sensor_value(driver_name, field)
             if actual is None:
@@ -1443,7 +1583,7 @@ class BehaviorRunner:
                 return
 
             # Validate operator.
-            op_fn = _OPS.get(op)
+            op_fn = _DRIVER_OPS.get(op)
             if op_fn is None:
                 logger.warning(
                     "conditional step: unknown op '%s' — skipping both branches",
@@ -1484,8 +1624,13 @@ class BehaviorRunner:
     def _step_event_wait(self, step: dict) -> None:
         """Pause behavior execution until a sensor condition is met or a timeout expires.
 
-        Polls ``_get_sensor_value()`` at 100 ms intervals until the condition
-        evaluates to ``True`` or ``timeout_s`` seconds have elapsed.
+        Subscribes to the sensor's topic on the :mod:`castor.event_bus` and
+        wakes as soon as a matching value is published.  While nobody else is
+        publishing the topic the step reads ``_get_sensor_value()`` itself
+        every 100 ms (any bus publish in between still wakes it at once).
+        Publishes caused by those reads — drivers decorated with
+        ``@publishes`` republish what they return — do not count as a live
+        publisher.
 
         Supported sensor format: ``"driver.field"`` (e.g. ``"imu.vibration_rms"``).
         Supported operators: ``gt``, ``lt``, ``gte``, ``lte``, ``eq``, ``ne``.
@@ -1525,15 +1670,6 @@ class BehaviorRunner:
         threshold = step.get("value")
         timeout_s: float = float(step.get("timeout_s", 30.0))
 
-        _OPS = {
-            "gt": lambda a, b: a > b,
-            "lt": lambda a, b: a < b,
-            "gte": lambda a, b: a >= b,
-            "lte": lambda a, b: a <= b,
-            "eq": lambda a, b: a == b,
-            "ne": lambda a, b: a != b,
-        }
-
         if not sensor_path or "." not in sensor_path:
             logger.warning(
                 "event_wait step: 'sensor' must be 'driver.field' (got %r) — skipping",
@@ -1541,7 +1677,7 @@ class BehaviorRunner:
             )
             return
 
-        op_fn = _OPS.get(op)
+        op_fn = _DRIVER_OPS.get(op)
         if op_fn is None:
             logger.warning("event_wait step: unknown op %r — skipping", op)
             return
@@ -1550,6 +1686,9 @@ class BehaviorRunner:
         deadline = time.monotonic() + timeout_s
         poll_interval_s = 0.1
 
+        def _matches(actual: Any) -> bool:
+            return actual is not None and bool(op_fn(actual, threshold))
+
         logger.info(
             "event_wait step: waiting for %s %s %s (timeout=%.1fs)",
             sensor_path,
@@ -1558,36 +1697,54 @@ class BehaviorRunner:
             timeout_s,
         )
 
-        while self._running:
-            if time.monotonic() >= deadline:
-                logger.info(
-                    "event_wait step: timeout after %.1f s waiting for %s %s %s",
-                    timeout_s,
-                    sensor_path,
-                    op,
-                    threshold,
-                )
-                return
+        bus = get_bus()
+        waiter = bus.watch(sensor_path, _matches, max_age=_BUS_LIVE_S)
+        self._track_waiter(waiter)
+        own_publish: Optional[float] = None  # bus stamp left by this step's last read
+        try:
+            while self._running:
+                if waiter.met:
+                    logger.info(
+                        "event_wait step: condition met — %s=%r %s %r",
+                        sensor_path,
+                        waiter.value,
+                        op,
+                        threshold,
+                    )
+                    return
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.info(
+                        "event_wait step: timeout after %.1f s waiting for %s %s %s",
+                        timeout_s,
+                        sensor_path,
+                        op,
+                        threshold,
+                    )
+                    return
 
-            try:
-                actual = self._get_sensor_value(driver_name, field)
-                if actual is not None:
+                stamp = bus.published_at(sensor_path)
+                live = (
+                    stamp is not None
+                    and stamp != own_publish
+                    and time.monotonic() - stamp <= _BUS_LIVE_S
+                )
+                if not live:
+                    # No live publisher: read the driver ourselves
                     try:
-                        if op_fn(actual, threshold):
-                            logger.info(
-                                "event_wait step: condition met — %s=%r %s %r",
-                                sensor_path,
-                                actual,
-                                op,
-                                threshold,
-                            )
-                            return
-                    except TypeError:
-                        pass  # type mismatch — keep polling
-            except Exception as exc:  # noqa: BLE001
-                logger.debug("event_wait step: sensor read error: %s", exc)
-
-            time.sleep(poll_interval_s)
+                        waiter.offer(self._get_sensor_value(driver_name, field))
+                    except Exception as exc:  # noqa: BLE001
+                        logger.debug("event_wait step: sensor read error: %s", exc)
+                    own_publish = bus.published_at(sensor_path)
+                    if waiter.met:
+                        continue
+                    wait_s = poll_interval_s
+                else:
+                    wait_s = _BUS_RECHECK_S
+                waiter.wait(min(wait_s, remaining))
+        finally:
+            waiter.close()
+            self._untrack_waiter(waiter)
 
         logger.info("event_wait step: stopped externally before condition met")
 
@@ -1997,43 +2154,11 @@ class BehaviorRunner:
     def _eval_expr(self, condition: str) -> bool:
         """Evaluate a simple ``lhs op rhs`` condition string.
 
-        Substitutes ``$var.<name>`` tokens from ``self._vars`` before
-        evaluating.  Only numeric comparisons are supported (no exec/eval).
+        Resolves ``$var.<name>`` operands from ``self._vars``.  Only numeric
+        comparisons are supported (no exec/eval); the parsed form is cached
+        by :func:`compile_expr`.
         """
-        import re as _re
-
-        # Substitute $var.<name> placeholders
-        def _sub(m: _re.Match) -> str:
-            var_name = m.group(1)
-            val = self._vars.get(var_name)
-            return str(val) if val is not None else "None"
-
-        expr = _re.sub(r"\$var\.(\w+)", _sub, condition.strip())
-
-        # Parse: <lhs> <op> <rhs>
-        _OPS = {
-            ">=": lambda a, b: a >= b,
-            "<=": lambda a, b: a <= b,
-            "!=": lambda a, b: a != b,
-            "==": lambda a, b: a == b,
-            ">": lambda a, b: a > b,
-            "<": lambda a, b: a < b,
-        }
-        for op_str, op_fn in _OPS.items():
-            if op_str in expr:
-                parts = expr.split(op_str, 1)
-                if len(parts) == 2:
-                    lhs_s = parts[0].strip()
-                    rhs_s = parts[1].strip()
-                    try:
-                        lhs = float(lhs_s)
-                        rhs = float(rhs_s)
-                        return op_fn(lhs, rhs)
-                    except (ValueError, TypeError) as exc:
-                        raise ValueError(
-                            f"Cannot evaluate condition {condition!r}: lhs={lhs_s!r}, rhs={rhs_s!r}"
-                        ) from exc
-        raise ValueError(f"No supported operator found in condition {condition!r}")
+        return compile_expr(condition)(self._vars)
 
     # ------------------------------------------------------------------
     # Issue #379 — event_trigger step + set_event / clear_event
@@ -2042,18 +2167,38 @@ class BehaviorRunner:
     def set_event(self, name: str) -> None:
         """Set the named event, unblocking any waiting event_trigger step.
 
-        Creates the event if it does not yet exist.
+        Creates the event if it does not yet exist, and publishes
+        ``event.<name>`` on the event bus for other listeners.
 
         Args:
             name: Event name string (must match the ``event:`` key in the step).
         """
-        import threading as _th
+        self._named_event(name).set()
+        get_bus().publish(f"event.{name}")
+        logger.debug("BehaviorRunner.set_event: %r", name)
+
+    def _named_event(self, name: str) -> threading.Event:
+        """Return the runner's event *name*, creating it on first use.
 
+        A new event also subscribes to the bus topic ``event.<name>``, so any
+        subsystem publishing that topic fires it.
+        """
         with self._events_lock:
-            if name not in self._events:
-                self._events[name] = _th.Event()
-            self._events[name].set()
-        logger.debug("BehaviorRunner.set_event: %r", name)
+            ev = self._events.get(name)
+            if ev is None:
+                ev = self._events[name] = threading.Event()
+                self._event_subs.append(
+                    get_bus().subscribe(f"event.{name}", lambda _topic, _value: ev.set())
+                )
+            return ev
+
+    def _track_waiter(self, waiter: Waiter) -> None:
+        with self._events_lock:
+            self._waiters.add(waiter)
+
+    def _untrack_waiter(self, waiter: Waiter) -> None:
+        with self._events_lock:
+            self._waiters.discard(waiter)
 
     def clear_event(self, name: str) -> None:
         """Clear the named event.
@@ -2084,8 +2229,6 @@ class BehaviorRunner:
             ``on_timeout`` (str, default ``"stop"``): ``"stop"`` sets
                 ``_running=False``; ``"warn"`` logs a warning and continues.
         """
-        import threading as _th
-
         event_name: str = step.get("event", "")
         if not event_name:
             logger.warning("event_trigger step: 'event' key missing — skipping")
@@ -2094,10 +2237,7 @@ class BehaviorRunner:
         timeout_s: float = float(step.get("timeout_s", 30.0))
         on_timeout: str = step.get("on_timeout", "stop")
 
-        with self._events_lock:
-            if event_name not in self._events:
-                self._events[event_name] = _th.Event()
-            ev = self._events[event_name]
+        ev = self._named_event(event_name)
 
         logger.debug("event_trigger: waiting for %r (timeout_s=%.1f)", event_name, timeout_s)
         fired = ev.wait(timeout=timeout_s if timeout_s > 0 else None)
@@ -2178,7 +2318,7 @@ class BehaviorRunner:
         Example step::
 
             - type: unless
-              condition: "battery.soc_pct > 20"
+              condition: "$var.battery_pct > 20"
               inner_steps:
                 - type: speak
                   text: "Battery low!"
@@ -2186,7 +2326,7 @@ class BehaviorRunner:
         Parameters
         ----------
         step:
-            ``condition`` (str, required): Expression evaluated by :meth:`_eval_condition`.
+            ``condition`` (str, required): Expression evaluated by :meth:`_eval_expr`.
             ``inner_steps`` (list, required): Steps to run when condition is False.
         """
         condition = step.get("condition", "")
@@ -2222,12 +2362,12 @@ class BehaviorRunner:
         Example step::
 
             - type: break_on
-              condition: "imu.steps > 100"
+              condition: "$var.steps > 100"
 
         Parameters
         ----------
         step:
-            ``condition`` (str, required): Expression evaluated by :meth:`_eval_condition`.
+            ``condition`` (str, required): Expression evaluated by :meth:`_eval_expr`.
                 If omitted, always breaks.
         """
         condition = step.get("condition", "")
@@ -2350,11 +2490,7 @@ class BehaviorRunner:
             logger.warning("wait_for_event step: 'event' key missing — skipping")
             return
 
-        # Ensure event exists
-        with self._events_lock:
-            if event_name not in self._events:
-                self._events[event_name] = threading.Event()
-            ev = self._events[event_name]
+        ev = self._named_event(event_name)
 
         logger.info(
             "wait_for_event step: waiting for event %r (timeout_s=%.1f)",
@@ -2424,7 +2560,8 @@ class BehaviorRunner:
     def _step_emit_event(self, step: dict) -> None:
         """Set a named threading.Event, unblocking any steps waiting on it.
 
-        Creates the event in ``self._events`` if it does not yet exist.
+        Creates the event in ``self._events`` if it does not yet exist and
+        publishes ``event.<name>`` on the event bus.
 
         Example::
 
@@ -2441,9 +2578,48 @@ class BehaviorRunner:
             logger.warning("emit_event step: 'event' key missing — skipping")
             return
 
-        with self._events_lock:
-            if event_name not in self._events:
-                self._events[event_name] = threading.Event()
-            self._events[event_name].set()
+        self._named_event(event_name).set()
+        get_bus().publish(f"event.{event_name}")
 
         logger.debug("emit_event step: set event %r", event_name)
+
+
+def benchmark(n_steps: int = 2000, runs: int = 5) -> dict[str, float]:
+    """Time the interpreter on a synthetic *n_steps* patrol with no hardware.
+
+    The patrol mixes ``set_var`` with ``assert``/``unless``/``break_on``
+    conditions inside a ``while_true`` body, so the figures are pure
+    dispatch and expression overhead.  Returns microseconds:
+    ``{"step_us", "expr_us"}`` (best of *runs*).
+    """
+    body: list = []
+    for i in range(max(n_steps // 4, 1)):
+        body += [
+            {"type": "set_var", "name": "battery_pct", "value": 80 - i % 50},
+            {"type": "assert", "condition": "$var.battery_pct > 20", "on_fail": "warn"},
+            {
+                "type": "unless",
+                "condition": "$var.battery_pct >= 10",
+                "inner_steps": [{"type": "speak", "text": "low"}],
+            },
+            {"type": "break_on", "condition": "$var.battery_pct < 5"},
+        ]
+    behavior = {
+        "name": "bench_patrol",
+        "steps": [{"type": "while_true", "max_iterations": 1, "inner_steps": body}],
+    }
+    _check_steps(behavior["steps"], "steps")
+    runner = BehaviorRunner()
+    best = float("inf")
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        runner.run(behavior)
+        best = min(best, time.perf_counter() - t0)
+
+    runner._vars["battery_pct"] = 50
+    n_evals = 10_000
+    t0 = time.perf_counter()
+    for _ in range(n_evals):
+        runner._eval_expr("$var.battery_pct > 20")
+    expr_us = (time.perf_counter() - t0) / n_evals * 1e6
+    return {"step_us": best / len(body) * 1e6, "expr_us": expr_us}
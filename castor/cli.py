@@ -26,6 +26,8 @@ Usage:
     castor record --config robot.rcan.yaml             # Record a session
     castor replay session.jsonl                        # Replay a recorded session
     castor benchmark --config robot.rcan.yaml          # Performance profiling
+    castor bench imports                               # CLI import-time profile
+    castor bench loop --ticks 5000                     # Control-loop hot-path benchmark
     castor lint --config robot.rcan.yaml               # Deep config validation
     castor validate --config bot.rcan.yaml             # RCAN conformance check
     castor rcan-check [--config robot.rcan.yaml]       # RCAN §6 safety field check
@@ -260,6 +262,8 @@ def cmd_run(args) -> None:
     sys.argv = ["castor.main", "--config", config_path]
     if args.simulate:
         sys.argv.append("--simulate")
+    if getattr(args, "startup_trace", False):
+        sys.argv.append("--startup-trace")
     run_main()
 
 
@@ -276,6 +280,8 @@ def cmd_gateway(args) -> None:
         "--port",
         str(args.port),
     ]
+    if getattr(args, "startup_trace", False):
+        sys.argv.append("--startup-trace")
     run_gateway()
 
 
@@ -655,34 +661,6 @@ def cmd_contribute_cli(args) -> None:
         print(f"\n  Error: {exc}\n  Is the gateway running? (castor run)")
 
 
-def cmd_leaderboard(args) -> None:
-    """Print fleet leaderboard table."""
-    from castor.commands.leaderboard import cmd_leaderboard as _cmd
-
-    _cmd(args)
-
-
-def cmd_compete(args) -> None:
-    """Manage competition entry and status."""
-    from castor.commands.compete import cmd_compete as _cmd
-
-    _cmd(args)
-
-
-def cmd_season(args) -> None:
-    """Display season overview and class standings."""
-    from castor.commands.season import cmd_season as _cmd
-
-    _cmd(args)
-
-
-def cmd_research(args) -> None:
-    """Manage the harness research pipeline."""
-    from castor.commands.research import cmd_research as _cmd
-
-    _cmd(args)
-
-
 def cmd_provider(args) -> None:
     """Manage gated model providers — test auth, list models, show status."""
     provider_action = getattr(args, "provider_action", "list")
@@ -6455,7 +6433,7 @@ def main() -> None:
             "Command groups:\n"
             "  Setup:       wizard, quickstart, configure, install-service, learn\n"
             "  Run:         run, gateway, dashboard, demo, shell, repl\n"
-            "  Diagnostics: doctor, fix, status, logs, lint, benchmark, test\n"
+            "  Diagnostics: doctor, fix, status, logs, lint, benchmark, bench, test\n"
             "  Hardware:    test-hardware, calibrate, record, replay, watch\n"
             "  Config:      migrate, backup, restore, export, diff, profile\n"
             "  Safety:      approvals, privacy, audit\n"
@@ -6505,6 +6483,11 @@ def main() -> None:
         choices=["full", "minimal", "debug"],
         help="Dashboard layout when --dashboard is used (default: full)",
     )
+    p_run.add_argument(
+        "--startup-trace",
+        action="store_true",
+        help="Print per-subsystem startup timings and the critical path",
+    )
 
     # castor gateway
     p_gw = sub.add_parser(
@@ -6516,6 +6499,11 @@ def main() -> None:
     p_gw.add_argument("--config", default="robot.rcan.yaml", help="RCAN config file")
     p_gw.add_argument("--host", default="127.0.0.1", help="Bind address")
     p_gw.add_argument("--port", type=int, default=8000, help="Port number")
+    p_gw.add_argument(
+        "--startup-trace",
+        action="store_true",
+        help="Log per-subsystem startup timings and the critical path",
+    )
 
     # castor mcp — MCP server (Model Context Protocol)
     p_mcp = sub.add_parser(
@@ -7178,6 +7166,82 @@ def main() -> None:
         help="Write benchmark results to this JSON file (used with --providers)",
     )
 
+    # castor bench imports | loop
+    p_bench_suite = sub.add_parser(
+        "bench",
+        help="Benchmark suites (imports: CLI import time, loop: control-loop hot path)",
+        epilog=(
+            "Examples:\n"
+            "  castor bench imports\n"
+            '  castor bench imports status "fleet status" --runs 5\n'
+            "  castor bench imports status --json --output imports.json\n"
+            "  castor bench loop --ticks 5000 --latency-ms 20 --output loop.json\n"
+            "  castor bench loop --ticks 5000 --compare loop.json\n"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    p_bench_sub = p_bench_suite.add_subparsers(dest="bench_cmd")
+    p_bench_imports = p_bench_sub.add_parser(
+        "imports", help="Profile what each CLI subcommand imports at startup"
+    )
+    p_bench_imports.add_argument(
+        "commands",
+        nargs="*",
+        metavar="COMMAND",
+        help="Subcommands to profile, quoted with their arguments (default: status, logs)",
+    )
+    p_bench_imports.add_argument(
+        "--runs", type=int, default=3, help="Runs per command; the fastest is kept (default: 3)"
+    )
+    p_bench_imports.add_argument(
+        "--top", type=int, default=5, help="Slowest imports listed per command (default: 5)"
+    )
+    p_bench_imports.add_argument(
+        "--json", action="store_true", dest="output_json", help="Print results as JSON"
+    )
+    p_bench_imports.add_argument("--output", default=None, help="Write JSON results to this file")
+    p_bench_loop = p_bench_sub.add_parser(
+        "loop",
+        help="Run the control loop on a simulated robot with a mock brain",
+    )
+    p_bench_loop.add_argument(
+        "--ticks", type=int, default=2000, help="Measured ticks (default: 2000)"
+    )
+    p_bench_loop.add_argument(
+        "--warmup", type=int, default=100, help="Unmeasured warmup ticks (default: 100)"
+    )
+    p_bench_loop.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Mock provider latency (default: 0)"
+    )
+    p_bench_loop.add_argument(
+        "--jitter-ms", type=float, default=0.0, help="Mock provider ± jitter (default: 0)"
+    )
+    p_bench_loop.add_argument("--seed", type=int, default=0, help="Jitter seed (default: 0)")
+    p_bench_loop.add_argument(
+        "--resolution", default="640x480", help="Synthetic camera WxH (default: 640x480)"
+    )
+    p_bench_loop.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="Trace Python allocations (slower; reports heap growth by source line)",
+    )
+    p_bench_loop.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        default=None,
+        help="Compare with an earlier --output file; exit 1 on regression",
+    )
+    p_bench_loop.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative change counted as a regression (default: 0.10)",
+    )
+    p_bench_loop.add_argument(
+        "--json", action="store_true", dest="output_json", help="Print results as JSON"
+    )
+    p_bench_loop.add_argument("--output", default=None, help="Write JSON results to this file")
+
     # castor lint
     p_lint = sub.add_parser(
         "lint",
@@ -8912,6 +8976,8 @@ def main() -> None:
 
     args = parser.parse_args()
 
+    # Handlers are functions here, or "module:function" strings for handlers
+    # living in their own module — those are imported only when invoked.
     commands = {
         "run": cmd_run,
         "gateway": cmd_gateway,
@@ -9003,9 +9069,7 @@ def main() -> None:
         # Issue #348
         "snapshot": cmd_snapshot,
         # llmfit model fit analysis
-        "fit": lambda _args: __import__(
-            "castor.llmfit_helper", fromlist=["run_fit_command"]
-        ).run_fit_command(),
+        "fit": "castor.llmfit_helper:run_fit_command",
         "init": cmd_init,
         # SO-ARM101 arm setup (issue #658)
         "arm": _cmd_arm,
@@ -9029,16 +9093,17 @@ def main() -> None:
         "optimize": _cmd_optimize,
         "provider": cmd_provider,
         # Issue #740 — leaderboard/compete/season/research
-        "leaderboard": cmd_leaderboard,
-        "compete": cmd_compete,
-        "season": cmd_season,
-        "research": cmd_research,
+        "leaderboard": "castor.commands.leaderboard:cmd_leaderboard",
+        "compete": "castor.commands.compete:cmd_compete",
+        "season": "castor.commands.season:cmd_season",
+        "research": "castor.commands.research:cmd_research",
         # Issue #780 — revocation CLI
         "revocation": cmd_revocation,
         # Issue #779 — delegation chain management
         "delegation": cmd_delegation,
         # Issue #781 — PQ key rotation CLI
         "key-rotation": cmd_key_rotation,
+        "bench": "castor.commands.bench:cmd_bench",
     }
 
     # castor delegation — RCAN delegation chain (issue #779)
@@ -9114,6 +9179,10 @@ def main() -> None:
         pass
 
     handler = commands.get(args.command)
+    if isinstance(handler, str):
+        from castor.lazy import resolve
+
+        handler = resolve(handler)
     if handler:
         handler(args)
     else:
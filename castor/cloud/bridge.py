@@ -39,6 +39,7 @@ Usage::
 
 from __future__ import annotations
 
+import copy
 import logging
 import re as _re
 import signal
@@ -292,6 +293,44 @@ def _detect_pick_place_intent(instruction: str) -> tuple[str, str] | None:
     return None
 
 
+# ---------------------------------------------------------------------------
+# Telemetry deltas
+# ---------------------------------------------------------------------------
+
+
+def _telemetry_delta(current: dict[str, Any], acked: dict[str, Any]) -> dict[str, Any]:
+    """Return the parts of *current* that differ from *acked*, as a nested dict.
+
+    Maps are compared field by field; any other value (including lists) is a
+    leaf and is resent whole when it changes.  Keys missing from *current*
+    are left alone — the bridge writes with ``merge=True``, which never
+    deletes fields.
+    """
+    delta: dict[str, Any] = {}
+    for key, value in current.items():
+        old = acked.get(key, _MISSING)
+        if isinstance(value, dict) and isinstance(old, dict):
+            sub = _telemetry_delta(value, old)
+            if sub:
+                delta[key] = sub
+        elif value != old or type(value) is not type(old):
+            delta[key] = value
+    return delta
+
+
+def _merge_acked(acked: dict[str, Any], delta: dict[str, Any]) -> None:
+    """Apply an acknowledged *delta* to the *acked* baseline in place."""
+    for key, value in delta.items():
+        old = acked.get(key)
+        if isinstance(value, dict) and isinstance(old, dict):
+            _merge_acked(old, value)
+        else:
+            acked[key] = copy.deepcopy(value)
+
+
+_MISSING = object()
+
+
 class CastorBridge:
     """Firebase ↔ local castor gateway relay daemon.
 
@@ -373,6 +412,16 @@ class CastorBridge:
         # Live fields (status, model_runtime, system) pushed every cycle.
         self._telemetry_cycle: int = 0
         self._STATIC_PUSH_EVERY: int = 10  # push static fields every N live cycles
+        # Field-level deltas: only fields that differ from the last document
+        # Firestore acknowledged are written; a full resync every N cycles.
+        self._telemetry_acked: dict[str, Any] = {}
+        self._skills_acked: Any = None
+        self._FULL_PUSH_EVERY: int = 60  # ~30 min at 30s
+        self._snapshot_supported: bool = True  # gateway has /api/telemetry/snapshot
+
+        # Pooled gateway HTTP client — see _http_client()
+        self._http: Any = None
+        self._http_lock = threading.Lock()
 
         # BigQuery batch buffer — flushed every 5 min or 10 samples
         self._bq_buffer: list[dict[str, Any]] = []
@@ -1016,6 +1065,38 @@ class CastorBridge:
         }
     )
 
+    def _fetch_gateway_views(self) -> dict[str, Any]:
+        """Fetch the gateway's status, health, contribute and skills views.
+
+        Prefers ``/api/telemetry/snapshot``, which the gateway assembles
+        in-process, so a cycle costs one request on the pooled client.  Older
+        gateways without that endpoint get the four individual GETs.
+        """
+        client = self._http_client()
+        headers = self._auth_headers()
+        if self._snapshot_supported:
+            resp = client.get(
+                f"{self.gateway_url}/api/telemetry/snapshot", headers=headers, timeout=5.0
+            )
+            if resp.status_code == 200:
+                return resp.json()
+            if resp.status_code in (404, 405):
+                log.info("Gateway has no telemetry snapshot endpoint; using per-view GETs")
+                self._snapshot_supported = False
+            else:
+                return {}
+
+        views: dict[str, Any] = {}
+        for name in ("status", "health", "contribute", "skills"):
+            try:
+                resp = client.get(f"{self.gateway_url}/api/{name}", headers=headers, timeout=5.0)
+                if resp.status_code == 200:
+                    views[name] = resp.json()
+            except Exception:
+                if name == "status":
+                    raise
+        return views
+
     def _publish_telemetry(self) -> None:
         """Fetch live status from gateway and push to Firestore.
 
@@ -1026,72 +1107,54 @@ class CastorBridge:
           capability arrays, provider configs, security posture, WS URLs, etc.
         - harness_config: NOT pushed — app manages this via user_harness_config.
         - BigQuery: live fields buffered and flushed every _BQ_FLUSH_EVERY samples.
+        - Firestore writes carry only fields that changed since the last
+          acknowledged write (full resync every _FULL_PUSH_EVERY cycles); the
+          skills subdocument is rewritten only when the registry changes.
         """
         try:
-            import httpx
-
-            headers = self._auth_headers()
-            with httpx.Client(timeout=5.0) as client:
-                resp = client.get(f"{self.gateway_url}/api/status", headers=headers)
-
-            telemetry: dict[str, Any] = {}
-            if resp.status_code == 200:
-                telemetry = resp.json()
-
-            # Also fetch health
-            try:
-                with httpx.Client(timeout=5.0) as client:
-                    hr = client.get(f"{self.gateway_url}/api/health", headers=headers)
-                if hr.status_code == 200:
-                    telemetry["health"] = hr.json()
-            except Exception:
-                pass
+            views = self._fetch_gateway_views()
+            telemetry: dict[str, Any] = dict(views.get("status") or {})
+            if views.get("health") is not None:
+                telemetry["health"] = views["health"]
 
             # harness_config intentionally NOT fetched here.
             # The Flutter app persists it as robots/{rrn}.user_harness_config
             # which takes priority over telemetry. Fetching it here every 30s
             # was writing ~1KB/cycle (2.8MB/day) for data that changes weekly.
 
-            # Fetch contribution status for Flutter client
-            try:
-                with httpx.Client(timeout=5.0) as client:
-                    cr = client.get(f"{self.gateway_url}/api/contribute", headers=headers)
-                if cr.status_code == 200:
-                    telemetry["contribute"] = cr.json()
-            except Exception:
-                pass
-
-            # Fetch skills + slash commands for Software screen
-            try:
-                with httpx.Client(timeout=5.0) as client:
-                    sk = client.get(f"{self.gateway_url}/api/skills", headers=headers)
-                if sk.status_code == 200:
-                    skills_data = sk.json()
+            # Contribution status for Flutter client
+            if views.get("contribute") is not None:
+                telemetry["contribute"] = views["contribute"]
 
-                    # Merge RCAN skills into the skills document
-                    try:
-                        from castor.skills.rcan_skills import list_skills as _list_rcan_skills
+            # Skills + slash commands for Software screen
+            skills_data = views.get("skills")
+            if isinstance(skills_data, dict):
+                # Merge RCAN skills into the skills document
+                try:
+                    from castor.skills.rcan_skills import list_skills as _list_rcan_skills
 
-                        rcan_skill_docs = [
-                            {
-                                "name": s["name"],
-                                "description": s["description"],
-                                "loa_required": s["loa_required"],
-                                "rcan_message_type": s["rcan_message_type"],
-                                "version": s["version"],
-                            }
-                            for s in _list_rcan_skills()
-                        ]
-                        existing = skills_data.get("rcan_skills", [])
-                        # Deduplicate by name — RCAN skills take precedence
-                        merged_names = {s["name"] for s in rcan_skill_docs}
-                        skills_data["rcan_skills"] = rcan_skill_docs + [
-                            s for s in existing if s.get("name") not in merged_names
-                        ]
-                    except Exception:
-                        pass
+                    rcan_skill_docs = [
+                        {
+                            "name": s["name"],
+                            "description": s["description"],
+                            "loa_required": s["loa_required"],
+                            "rcan_message_type": s["rcan_message_type"],
+                            "version": s["version"],
+                        }
+                        for s in _list_rcan_skills()
+                    ]
+                    existing = skills_data.get("rcan_skills", [])
+                    # Deduplicate by name — RCAN skills take precedence
+                    merged_names = {s["name"] for s in rcan_skill_docs}
+                    skills_data["rcan_skills"] = rcan_skill_docs + [
+                        s for s in existing if s.get("name") not in merged_names
+                    ]
+                except Exception:
+                    pass
 
-                    # Write to telemetry/skills subcollection for slashCommandsProvider
+                # Write to telemetry/skills subcollection for slashCommandsProvider —
+                # only when the registry changed since the last acknowledged write.
+                if skills_data != self._skills_acked:
                     try:
                         self._robot_ref().collection("telemetry").document("skills").set(
                             {
@@ -1101,16 +1164,13 @@ class CastorBridge:
                             },
                             merge=False,
                         )
+                        self._skills_acked = skills_data
                     except Exception:
                         pass
-                    # Also embed summary in main telemetry doc
-                    telemetry["skills_count"] = len(skills_data.get("skills", []))
-                    telemetry["builtin_commands_count"] = len(
-                        skills_data.get("builtin_commands", [])
-                    )
-                    telemetry["rcan_skills_count"] = len(skills_data.get("rcan_skills", []))
-            except Exception:
-                pass
+                # Also embed summary in main telemetry doc
+                telemetry["skills_count"] = len(skills_data.get("skills", []))
+                telemetry["builtin_commands_count"] = len(skills_data.get("builtin_commands", []))
+                telemetry["rcan_skills_count"] = len(skills_data.get("rcan_skills", []))
 
             # Normalise: ensure opencastor_version is always set at both
             # telemetry.opencastor_version AND top-level opencastor_version so
@@ -1178,7 +1238,17 @@ class CastorBridge:
                 update_doc["telemetry"] = {**live_tele, **static_tele}
                 log.debug("Pushed static telemetry fields (cycle %d)", self._telemetry_cycle)
 
-            self._robot_ref().set(update_doc, merge=True)
+            # ── Field-level delta against the last acknowledged document ──
+            # set(merge=True) merges nested maps, so a sparse document only
+            # touches the fields it names.  The baseline advances only after
+            # Firestore accepts the write; a failed cycle is retried in full
+            # on the next one.
+            if self._telemetry_cycle % self._FULL_PUSH_EVERY == 1:
+                self._telemetry_acked = {}
+            delta = _telemetry_delta(update_doc, self._telemetry_acked)
+            if delta:
+                self._robot_ref().set(delta, merge=True)
+                _merge_acked(self._telemetry_acked, delta)
             self._record_firestore_success()
 
             # ── Buffer for BigQuery ───────────────────────────────────────
@@ -1320,6 +1390,23 @@ class CastorBridge:
             headers["Authorization"] = f"Bearer {self.gateway_token}"
         return headers
 
+    def _http_client(self) -> Any:
+        """Return the bridge's long-lived, pooled gateway client (created lazily).
+
+        Every gateway call goes through this client so keep-alive connections
+        are reused instead of paying a TCP handshake per request.  Callers pass
+        a per-request ``timeout=``.
+        """
+        with self._http_lock:
+            if self._http is None:
+                import httpx
+
+                self._http = httpx.Client(
+                    timeout=10.0,
+                    limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+                )
+            return self._http
+
     def _execute_command(self, cmd_id: str, doc: dict[str, Any]) -> None:
         """Execute a single command — runs in its own thread."""
         cmd_ref = self._commands_ref().document(cmd_id)
@@ -1661,7 +1748,7 @@ class CastorBridge:
         Creates a Firestore task doc, optionally waits for user confirmation
         (ask mode), then calls the gateway endpoint and returns its result.
         """
-        import httpx
+        client = self._http_client()
 
         task_id = str(uuid.uuid4())[:8]
 
@@ -1682,22 +1769,22 @@ class CastorBridge:
 
         # Pre-scan: fetch latest detection to populate detected_objects
         try:
-            with httpx.Client(timeout=5.0) as _client:
-                _det_resp = _client.get(
-                    f"{self.gateway_url}/api/detection/latest",
-                    headers=self._auth_headers(),
+            _det_resp = client.get(
+                f"{self.gateway_url}/api/detection/latest",
+                headers=self._auth_headers(),
+                timeout=5.0,
+            )
+            if _det_resp.status_code == 200:
+                _det = _det_resp.json()
+                _objects = [d.get("label", "") for d in _det.get("detections", [])]
+                self._update_task_doc(
+                    task_id,
+                    {
+                        "detected_objects": _objects,
+                        "phase": "SCAN",
+                        "status": initial_status,
+                    },
                 )
-                if _det_resp.status_code == 200:
-                    _det = _det_resp.json()
-                    _objects = [d.get("label", "") for d in _det.get("detections", [])]
-                    self._update_task_doc(
-                        task_id,
-                        {
-                            "detected_objects": _objects,
-                            "phase": "SCAN",
-                            "status": initial_status,
-                        },
-                    )
         except Exception:
             pass  # best-effort
 
@@ -1724,18 +1811,18 @@ class CastorBridge:
 
         headers = self._auth_headers()
         try:
-            with httpx.Client(timeout=120.0) as client:
-                resp = client.post(
-                    f"{self.gateway_url}/api/arm/pick_place",
-                    json={
-                        "target": target,
-                        "destination": destination,
-                        "task_id": task_id,
-                        "firebase_project": self.firebase_project,
-                        "rrn": self.rrn,
-                    },
-                    headers=headers,
-                )
+            resp = client.post(
+                f"{self.gateway_url}/api/arm/pick_place",
+                json={
+                    "target": target,
+                    "destination": destination,
+                    "task_id": task_id,
+                    "firebase_project": self.firebase_project,
+                    "rrn": self.rrn,
+                },
+                headers=headers,
+                timeout=120.0,
+            )
             resp.raise_for_status()
             ct = resp.headers.get("content-type", "")
             result = resp.json() if "application/json" in ct else {"raw": resp.text}
@@ -1843,7 +1930,7 @@ class CastorBridge:
         mission_context: Optional[str] = None,
     ) -> dict[str, Any]:
         """Forward a validated command to the local castor gateway."""
-        import httpx
+        client = self._http_client()
 
         # Build mission context from doc if not explicitly provided
         if mission_context is None:
@@ -1858,51 +1945,50 @@ class CastorBridge:
             _STATUS_COMMAND_INSTRUCTIONS = {"LIST_SKILLS", "DESCRIBE_SKILLS", "CAPABILITIES"}
             _instr_norm = instruction.upper().strip()
             if _instr_norm == "SNAPSHOT":
-                with httpx.Client(timeout=10.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/snapshot/take",
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/snapshot/take",
+                    headers=headers,
+                    timeout=10.0,
+                )
             elif _instr_norm in _STATUS_COMMAND_INSTRUCTIONS or (
                 _instr_norm not in {"STATUS", "GET_STATUS", ""}
                 and not _instr_norm.startswith("STATUS")
             ):
-                with httpx.Client(timeout=30.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/command",
-                        json={
-                            "instruction": instruction,
-                            "scope": "status",
-                            "channel": "opencastor_app",
-                        },
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/command",
+                    json={
+                        "instruction": instruction,
+                        "scope": "status",
+                        "channel": "opencastor_app",
+                    },
+                    headers=headers,
+                    timeout=30.0,
+                )
             else:
-                with httpx.Client(timeout=10.0) as client:
-                    resp = client.get(f"{self.gateway_url}/api/status", headers=headers)
+                resp = client.get(f"{self.gateway_url}/api/status", headers=headers, timeout=10.0)
 
         elif scope == "safety":
             if "estop" in instruction.lower():
-                with httpx.Client(timeout=5.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/estop",
-                        json={"reason": doc.get("reason", "remote estop via castor bridge")},
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/estop",
+                    json={"reason": doc.get("reason", "remote estop via castor bridge")},
+                    headers=headers,
+                    timeout=5.0,
+                )
             elif "resume" in instruction.lower():
-                with httpx.Client(timeout=5.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/resume",
-                        json={"reason": "remote resume via castor bridge"},
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/resume",
+                    json={"reason": "remote resume via castor bridge"},
+                    headers=headers,
+                    timeout=5.0,
+                )
             else:
-                with httpx.Client(timeout=10.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/command",
-                        json={"instruction": instruction},
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/command",
+                    json={"instruction": instruction},
+                    headers=headers,
+                    timeout=10.0,
+                )
 
         elif scope == "system":
             # System-level actions sent from the app (e.g. OTA upgrade, config reload).
@@ -1916,91 +2002,91 @@ class CastorBridge:
                 body: dict[str, Any] = {}
                 if version:
                     body["version"] = version
-                with httpx.Client(timeout=15.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/system/upgrade",
-                        json=body,
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/system/upgrade",
+                    json=body,
+                    headers=headers,
+                    timeout=15.0,
+                )
             elif instr_upper == "REBOOT":
-                with httpx.Client(timeout=10.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/system/reboot",
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/system/reboot",
+                    headers=headers,
+                    timeout=10.0,
+                )
             elif instr_upper == "RELOAD_CONFIG":
-                with httpx.Client(timeout=10.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/config/reload",
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/config/reload",
+                    headers=headers,
+                    timeout=10.0,
+                )
             elif instr_upper == "PAUSE":
-                with httpx.Client(timeout=5.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/runtime/pause",
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/runtime/pause",
+                    headers=headers,
+                    timeout=5.0,
+                )
             elif instr_upper == "RESUME":
-                with httpx.Client(timeout=5.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/runtime/resume",
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/runtime/resume",
+                    headers=headers,
+                    timeout=5.0,
+                )
             elif instr_upper == "SHUTDOWN":
-                with httpx.Client(timeout=10.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/system/shutdown",
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/system/shutdown",
+                    headers=headers,
+                    timeout=10.0,
+                )
             elif instr_upper == "OPTIMIZE":
-                with httpx.Client(timeout=60.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/command",
-                        json={
-                            "instruction": "OPTIMIZE",
-                            "scope": "system",
-                            "channel": "opencastor_app",
-                        },
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/command",
+                    json={
+                        "instruction": "OPTIMIZE",
+                        "scope": "system",
+                        "channel": "opencastor_app",
+                    },
+                    headers=headers,
+                    timeout=60.0,
+                )
             elif instr_upper == "SHARE_CONFIG":
-                with httpx.Client(timeout=30.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/command",
-                        json={
-                            "instruction": "SHARE_CONFIG",
-                            "scope": "system",
-                            "channel": "opencastor_app",
-                        },
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/command",
+                    json={
+                        "instruction": "SHARE_CONFIG",
+                        "scope": "system",
+                        "channel": "opencastor_app",
+                    },
+                    headers=headers,
+                    timeout=30.0,
+                )
             elif instr_upper.startswith("INSTALL:"):
-                with httpx.Client(timeout=30.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/command",
-                        json={
-                            "instruction": instruction,
-                            "scope": "system",
-                            "channel": "opencastor_app",
-                        },
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/command",
+                    json={
+                        "instruction": instruction,
+                        "scope": "system",
+                        "channel": "opencastor_app",
+                    },
+                    headers=headers,
+                    timeout=30.0,
+                )
             else:
                 # Unknown system instruction — route to /api/command as fallback
                 # so the agent can interpret it rather than silently dropping it.
                 log.warning(
                     "bridge: unknown system instruction %r — routing to /api/command", instruction
                 )
-                with httpx.Client(timeout=30.0) as client:
-                    resp = client.post(
-                        f"{self.gateway_url}/api/command",
-                        json={
-                            "instruction": instruction,
-                            "scope": "system",
-                            "channel": "opencastor_app",
-                        },
-                        headers=headers,
-                    )
+                resp = client.post(
+                    f"{self.gateway_url}/api/command",
+                    json={
+                        "instruction": instruction,
+                        "scope": "system",
+                        "channel": "opencastor_app",
+                    },
+                    headers=headers,
+                    timeout=30.0,
+                )
 
         elif scope in ("chat", "control"):
             pick_place = _detect_pick_place_intent(instruction)
@@ -2018,12 +2104,12 @@ class CastorBridge:
             # v1.6 GAP-18: pass media_chunks as context for vision-capable providers
             if media_chunks:
                 payload["media_chunks"] = media_chunks
-            with httpx.Client(timeout=60.0) as client:
-                resp = client.post(
-                    f"{self.gateway_url}/api/command",
-                    json=payload,
-                    headers=headers,
-                )
+            resp = client.post(
+                f"{self.gateway_url}/api/command",
+                json=payload,
+                headers=headers,
+                timeout=60.0,
+            )
 
         else:
             payload_else: dict[str, Any] = {
@@ -2035,12 +2121,12 @@ class CastorBridge:
                 payload_else["system_context"] = mission_context
             if media_chunks:
                 payload_else["media_chunks"] = media_chunks
-            with httpx.Client(timeout=30.0) as client:
-                resp = client.post(
-                    f"{self.gateway_url}/api/command",
-                    json=payload_else,
-                    headers=headers,
-                )
+            resp = client.post(
+                f"{self.gateway_url}/api/command",
+                json=payload_else,
+                headers=headers,
+                timeout=30.0,
+            )
 
         ct = resp.headers.get("content-type", "")
         if "application/json" in ct:
@@ -2329,6 +2415,13 @@ class CastorBridge:
             )
         except Exception:
             pass
+        with self._http_lock:
+            if self._http is not None:
+                try:
+                    self._http.close()
+                except Exception:
+                    pass
+                self._http = None
         log.info("Bridge stopped. Robot %s marked offline.", self.rrn)
 
 
@@ -0,0 +1,91 @@
+"""
+castor/commands/bench.py — Startup and hot-path benchmarks.
+
+Usage (via CLI)::
+    castor bench imports                     # lightweight commands
+    castor bench imports status "fleet status" --runs 3
+    castor bench imports status --json --output imports.json
+    castor bench loop --ticks 5000 --latency-ms 20 --output loop.json
+    castor bench loop --ticks 5000 --compare loop.json
+"""
+
+from __future__ import annotations
+
+import json
+import shlex
+import sys
+
+
+def _cmd_bench_imports(args) -> None:
+    from castor.import_profile import LIGHTWEIGHT_COMMANDS, print_profiles, profile_command
+
+    commands = [shlex.split(c) for c in getattr(args, "commands", None) or []]
+    if not commands:
+        commands = [list(c) for c in LIGHTWEIGHT_COMMANDS]
+    runs = getattr(args, "runs", 3)
+    top = getattr(args, "top", 5)
+    profiles = [profile_command(argv, runs=runs) for argv in commands]
+
+    data = {"runs": runs, "commands": [p.to_dict(top=top) for p in profiles]}
+    output = getattr(args, "output", None)
+    if output:
+        with open(output, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=2)
+            fh.write("\n")
+    if getattr(args, "output_json", False):
+        print(json.dumps(data, indent=2))
+    else:
+        print_profiles(profiles, top=top)
+        if output:
+            print(f"  Results written to {output}\n")
+
+
+def _cmd_bench_loop(args) -> None:
+    from castor.loop_bench import compare, print_loop_bench, run_loop_bench
+
+    res = getattr(args, "resolution", "640x480")
+    width, _, height = res.lower().partition("x")
+    result = run_loop_bench(
+        ticks=getattr(args, "ticks", 2000),
+        warmup=getattr(args, "warmup", 100),
+        latency_ms=getattr(args, "latency_ms", 0.0),
+        jitter_ms=getattr(args, "jitter_ms", 0.0),
+        seed=getattr(args, "seed", 0),
+        resolution=(int(width), int(height or width)),
+        trace_allocations=getattr(args, "tracemalloc", False),
+    )
+
+    regressions = None
+    baseline_path = getattr(args, "compare", None)
+    if baseline_path:
+        with open(baseline_path, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = compare(result, baseline, threshold=getattr(args, "threshold", 0.10))
+        result["regressions"] = regressions
+
+    output = getattr(args, "output", None)
+    if output:
+        with open(output, "w", encoding="utf-8") as fh:
+            json.dump(result, fh, indent=2)
+            fh.write("\n")
+    if getattr(args, "output_json", False):
+        print(json.dumps(result, indent=2))
+    else:
+        print_loop_bench(result, regressions)
+        if output:
+            print(f"  Results written to {output}\n")
+    if regressions:
+        sys.exit(1)
+
+
+def cmd_bench(args) -> None:
+    """Dispatch ``castor bench <suite>``."""
+    suite = getattr(args, "bench_cmd", None)
+    if suite == "imports":
+        _cmd_bench_imports(args)
+    elif suite == "loop":
+        _cmd_bench_loop(args)
+    else:
+        print("Usage: castor bench {imports,loop}")
+        print("  imports  — import-time profile of CLI subcommands")
+        print("  loop     — perception-action loop on a simulated robot")
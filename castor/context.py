@@ -6,6 +6,14 @@ Assembles the context window for each harness turn:
 
 Also handles context compaction when approaching the token budget.
 
+The independent data sections (skill selection, episodic RAG, telemetry)
+are gathered concurrently, each under its own deadline; a section that
+runs late is dropped from this turn rather than stalling the prompt, so
+assembly costs the slowest section instead of the sum.  Static sections
+(persona, tool list, formatted skill bodies) are memoized between turns,
+and token counts are cached per section text — exact when ``tiktoken`` is
+installed, the 4-chars-per-token heuristic otherwise.
+
 Reference: https://www.philschmid.de/agent-harness-2026
 
 Usage::
@@ -20,9 +28,12 @@ Usage::
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
@@ -33,9 +44,70 @@ logger = logging.getLogger("OpenCastor.Context")
 
 __all__ = ["ContextBuilder", "BuiltContext"]
 
+try:
+    import tiktoken
+
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
 # Rough token estimate: 1 token ≈ 4 chars (conservative for English + code)
 _CHARS_PER_TOKEN = 4
 
+# Default per-section deadline for concurrent gathering (ms)
+_DEFAULT_SECTION_DEADLINE_MS = 750
+
+# Max distinct texts kept in the token-count cache
+_TOKEN_CACHE_SIZE = 512
+
+
+class _TokenCounter:
+    """Per-text token counter with an LRU cache.
+
+    Uses a local ``tiktoken`` encoding when available (exact for OpenAI
+    models, close for others); otherwise falls back to the character
+    heuristic.  Counts are cached by text so unchanged sections are never
+    re-tokenized between turns.
+    """
+
+    def __init__(self, encoding: str = "cl100k_base", max_entries: int = _TOKEN_CACHE_SIZE):
+        self._enc = None
+        if HAS_TIKTOKEN:
+            try:
+                self._enc = tiktoken.get_encoding(encoding)
+            except Exception as exc:
+                logger.debug("tiktoken encoding %r unavailable: %s", encoding, exc)
+        self._cache: OrderedDict[str, int] = OrderedDict()
+        self._max = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def exact(self) -> bool:
+        return self._enc is not None
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        with self._lock:
+            n = self._cache.get(text)
+            if n is not None:
+                self._cache.move_to_end(text)
+                self.hits += 1
+                return n
+        if self._enc is not None:
+            n = len(self._enc.encode(text, disallowed_special=()))
+        else:
+            n = len(text) // _CHARS_PER_TOKEN
+        with self._lock:
+            self.misses += 1
+            self._cache[text] = n
+            if len(self._cache) > self._max:
+                self._cache.popitem(last=False)
+        return n
+
+
 # Default model context limits (tokens) — used for compaction threshold
 _DEFAULT_CONTEXT_LIMITS: dict[str, int] = {
     "gemini-2.5-flash": 1_000_000,
@@ -62,6 +134,11 @@ class BuiltContext:
     skill_injected: Optional[str] = None
     rag_chunks: int = 0
     telemetry_injected: bool = False
+    token_exact: bool = False
+    # Sections dropped this turn because they missed their deadline
+    late_sections: list[str] = field(default_factory=list)
+    # Wall time per gathered section (ms)
+    section_ms: dict[str, float] = field(default_factory=dict)
 
 
 class ContextBuilder:
@@ -108,6 +185,16 @@ class ContextBuilder:
         # context_budget: if > 1.0, treat as absolute token count; otherwise as
         # a ratio of the model's context limit.
         self._context_budget: float = float(harness_cfg.get("context_budget", 0.8))
+        # Per-section deadlines for concurrent gathering; a section may be
+        # overridden via harness.context_deadlines_ms.{skill,memory,telemetry}.
+        self._deadline_ms: float = float(
+            harness_cfg.get("context_deadline_ms", _DEFAULT_SECTION_DEADLINE_MS)
+        )
+        self._section_deadlines_ms: dict = dict(harness_cfg.get("context_deadlines_ms", {}))
+
+        self._tokens = _TokenCounter()
+        # Memoized static sections: key → formatted text
+        self._memo: dict[str, tuple[Any, str]] = {}
 
         # Detect model for context limit
         _model = self._config.get("model", "default")
@@ -128,33 +215,40 @@ class ContextBuilder:
         rag_chunks = 0
         telemetry_injected = False
 
+        # Gather the independent sections concurrently, each under a deadline
+        jobs: dict[str, Any] = {}
+        if self._skill_loader is not None:
+            jobs["skill"] = self._select_skill(ctx.instruction)
+        if self._auto_rag:
+            jobs["memory"] = self._fetch_episodic_memory(ctx.instruction)
+        if self._auto_telemetry:
+            jobs["telemetry"] = self._fetch_telemetry()
+        gathered, late, section_ms = await self._gather_sections(jobs)
+
         # 1. Persona
         sections.append(self._build_persona())
 
         # 2. Skill (if skill loader available + match found)
-        if self._skill_loader is not None:
-            skill = await self._select_skill(ctx.instruction)
-            if skill is not None:
-                sections.append(self._format_skill(skill))
-                skill_injected = skill.get("name")
+        skill = gathered.get("skill")
+        if skill is not None:
+            sections.append(self._format_skill_cached(skill))
+            skill_injected = skill.get("name")
 
         # 3. Episodic memory (RAG)
-        if self._auto_rag:
-            chunks = await self._fetch_episodic_memory(ctx.instruction)
-            if chunks:
-                sections.append(self._format_memory(chunks))
-                rag_chunks = len(chunks)
+        chunks = gathered.get("memory")
+        if chunks:
+            sections.append(self._format_memory(chunks))
+            rag_chunks = len(chunks)
 
         # 4. Telemetry
-        if self._auto_telemetry:
-            telemetry = await self._fetch_telemetry()
-            if telemetry:
-                sections.append(self._format_telemetry(telemetry))
-                telemetry_injected = True
+        telemetry = gathered.get("telemetry")
+        if telemetry:
+            sections.append(self._format_telemetry(telemetry))
+            telemetry_injected = True
 
         # 5. Tool descriptions
         if self._tool_registry:
-            sections.append(self._format_tools(ctx.scope))
+            sections.append(self._format_tools_cached(ctx.scope))
 
         system_prompt = "\n\n".join(filter(None, sections))
 
@@ -169,8 +263,8 @@ class ContextBuilder:
             }
         )
 
-        # 8. Estimate tokens
-        token_estimate = self._estimate_tokens(system_prompt, messages)
+        # 8. Count tokens (per-section, cached)
+        token_estimate = self._count_tokens(sections, messages)
 
         # 9. Compact if needed
         was_compacted = False
@@ -185,15 +279,17 @@ class ContextBuilder:
             messages, was_compacted, compact_summary = await self._compact_history(
                 messages, budget_tokens
             )
-            token_estimate = self._estimate_tokens(system_prompt, messages)
+            token_estimate = self._count_tokens(sections, messages)
 
         logger.debug(
-            "Context built in %.1fms: tokens≈%d compacted=%s skill=%s rag=%d",
+            "Context built in %.1fms: tokens%s%d compacted=%s skill=%s rag=%d late=%s",
             (time.perf_counter() - t0) * 1000,
+            "=" if self._tokens.exact else "≈",
             token_estimate,
             was_compacted,
             skill_injected,
             rag_chunks,
+            late,
         )
 
         return BuiltContext(
@@ -205,12 +301,83 @@ class ContextBuilder:
             skill_injected=skill_injected,
             rag_chunks=rag_chunks,
             telemetry_injected=telemetry_injected,
+            token_exact=self._tokens.exact,
+            late_sections=late,
+            section_ms=section_ms,
+        )
+
+    async def _gather_sections(
+        self, jobs: dict[str, Any]
+    ) -> tuple[dict[str, Any], list[str], dict[str, float]]:
+        """Await section coroutines concurrently, each under its deadline.
+
+        Returns ``(results, late_section_names, per_section_ms)``.  Late or
+        failed sections are simply absent from *results*; a section that
+        raises is logged and does not fail the build.
+        """
+
+        async def _timed(name: str, coro: Any) -> tuple[str, Any, float, str]:
+            deadline_s = float(self._section_deadlines_ms.get(name, self._deadline_ms)) / 1000.0
+            t0 = time.perf_counter()
+            try:
+                value = await asyncio.wait_for(coro, timeout=deadline_s)
+                return name, value, (time.perf_counter() - t0) * 1000, "ok"
+            except asyncio.TimeoutError:
+                logger.debug(
+                    "Context section %r missed its %.0fms deadline", name, deadline_s * 1000
+                )
+                return name, None, (time.perf_counter() - t0) * 1000, "late"
+            except Exception as exc:
+                logger.warning("Context section %r failed; omitting it: %s", name, exc)
+                return name, None, (time.perf_counter() - t0) * 1000, "failed"
+
+        results: dict[str, Any] = {}
+        late: list[str] = []
+        timings: dict[str, float] = {}
+        for name, value, ms, status in await asyncio.gather(
+            *(_timed(name, coro) for name, coro in jobs.items())
+        ):
+            timings[name] = round(ms, 2)
+            if status == "late":
+                late.append(name)
+            elif status == "ok":
+                results[name] = value
+        return results, late, timings
+
+    def _memoize(self, slot: str, key: Any, render: Any) -> str:
+        """Return the cached text for *slot* if *key* is unchanged, else re-render."""
+        cached = self._memo.get(slot)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        text = render()
+        self._memo[slot] = (key, text)
+        return text
+
+    def _format_skill_cached(self, skill: dict) -> str:
+        key = (
+            skill.get("name"),
+            skill.get("body", ""),
+            json.dumps(skill.get("config", {}), sort_keys=True, default=str),
+            tuple(skill.get("references", [])),
+            tuple(skill.get("scripts", [])),
+        )
+        return self._memoize(f"skill:{key[0]}", key, lambda: self._format_skill(skill))
+
+    def _format_tools_cached(self, scope: str) -> str:
+        from castor.harness import SCOPE_LEVELS
+
+        tools = getattr(self._tool_registry, "_tools", {})
+        control = SCOPE_LEVELS.get(scope, 2) >= SCOPE_LEVELS["control"]
+        # Re-registering a tool creates a new ToolDefinition, changing the key
+        key = (control, tuple((name, id(defn)) for name, defn in tools.items()))
+        return self._memoize(
+            f"tools:{'control' if control else 'chat'}", key, lambda: self._format_tools(scope)
         )
 
     # ── Section builders ──────────────────────────────────────────────────────
 
     def _build_persona(self) -> str:
-        """Build the robot persona section."""
+        """Build the robot persona section (memoized on name + capabilities)."""
         robot_name = self._config.get("name", "robot")
         # Try to get from shared state
         try:
@@ -225,12 +392,16 @@ class ContextBuilder:
         caps = self._config.get("capabilities", [])
         caps_str = ", ".join(caps) if caps else "chat, status"
 
-        return (
-            f"[PERSONA]\n"
-            f"You are {robot_name}, an autonomous robot running OpenCastor.\n"
-            f"Capabilities: {caps_str}\n"
-            f"You have access to tools listed below. Use them to fulfil the user's request.\n"
-            f"Be concise, accurate, and safe. Never fabricate sensor readings."
+        return self._memoize(
+            "persona",
+            (robot_name, caps_str),
+            lambda: (
+                f"[PERSONA]\n"
+                f"You are {robot_name}, an autonomous robot running OpenCastor.\n"
+                f"Capabilities: {caps_str}\n"
+                f"You have access to tools listed below. Use them to fulfil the user's request.\n"
+                f"Be concise, accurate, and safe. Never fabricate sensor readings."
+            ),
         )
 
     def _format_skill(self, skill: dict) -> str:
@@ -361,7 +532,13 @@ class ContextBuilder:
         return {}
 
     async def _select_skill(self, instruction: str) -> Optional[dict]:
-        """Use SkillSelector to find the best matching skill for this instruction."""
+        """Use SkillSelector to find the best matching skill for this instruction.
+
+        Runs in a worker thread so it overlaps with the other sections.
+        """
+        return await asyncio.to_thread(self._select_skill_sync, instruction)
+
+    def _select_skill_sync(self, instruction: str) -> Optional[dict]:
         try:
             from castor.skills.loader import SkillSelector
 
@@ -426,13 +603,12 @@ class ContextBuilder:
 
     # ── Utilities ─────────────────────────────────────────────────────────────
 
-    @staticmethod
-    def _estimate_tokens(system_prompt: str, messages: list[dict]) -> int:
-        """Rough token count estimate."""
-        total_chars = len(system_prompt)
+    def _count_tokens(self, sections: list[str], messages: list[dict]) -> int:
+        """Token count of the system sections plus messages, cached per text."""
+        total = sum(self._tokens.count(sec) for sec in sections if sec)
         for m in messages:
-            total_chars += len(str(m.get("content", "")))
-        return total_chars // _CHARS_PER_TOKEN
+            total += self._tokens.count(str(m.get("content", "")))
+        return total
 
     @staticmethod
     def _get_context_limit(model_name: str) -> int:
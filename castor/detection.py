@@ -27,6 +27,8 @@ import threading
 import time
 from typing import Optional
 
+from castor.event_bus import get_bus
+
 logger = logging.getLogger("OpenCastor.Detection")
 
 _DEFAULT_MODEL = os.getenv("CASTOR_DETECTION_MODEL", "auto")
@@ -167,6 +169,14 @@ class ObjectDetector:
 
         self._last_latency_ms = (time.monotonic() - t0) * 1000
         self._last = results
+        people = sum(1 for d in results if d.class_name == "person")
+        get_bus().publish_many(
+            (
+                ("vision.detections", [d.class_name for d in results]),
+                ("vision.person_count", people),
+                ("vision.person_detected", people > 0),
+            )
+        )
         return results
 
     def detect_and_annotate(self, jpeg_bytes: bytes) -> bytes:
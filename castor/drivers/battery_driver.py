@@ -39,6 +39,8 @@ import threading
 import time
 from typing import Any, Optional
 
+from castor.event_bus import publishes
+
 logger = logging.getLogger("OpenCastor.BatteryDriver")
 
 try:
@@ -321,6 +323,7 @@ class BatteryDriver:
 
     # ── Public API ────────────────────────────────────────────────────────────
 
+    @publishes("battery")
     def read(self) -> dict[str, Any]:
         """Read battery state from INA219 (or mock).
 
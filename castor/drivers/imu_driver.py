@@ -23,6 +23,8 @@ import threading
 import time
 from typing import Any, Optional
 
+from castor.event_bus import publishes
+
 try:
     import numpy as np
 
@@ -522,6 +524,7 @@ class IMUDriver:
 
     # ── Public API ────────────────────────────────────────────────────────────
 
+    @publishes("imu")
     def read(self) -> dict:
         """Read current IMU data.
 
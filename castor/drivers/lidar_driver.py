@@ -26,6 +26,8 @@ import threading
 import time
 from typing import Any, Optional
 
+from castor.event_bus import publishes
+
 logger = logging.getLogger("OpenCastor.Lidar")
 
 try:
@@ -349,6 +351,7 @@ class LidarDriver:
 
     # ── Obstacle analysis ─────────────────────────────────────────────────────
 
+    @publishes("lidar")
     def obstacles(self) -> dict:
         """Analyse the most recent scan and return per-sector minimum distances.
 
@@ -136,7 +136,7 @@ class SimulationDriver(DriverBase):
     """
 
     def __init__(self, config: dict[str, Any]):
-        super().__init__(config)
+        self.config = config
         self._default_speed = float(config.get("default_speed", 0.5))
         self._backend_name = _resolve_backend(config)
         self._backend: Any = None
@@ -184,7 +184,7 @@ class SimulationDriver(DriverBase):
         the legacy ``move(**kwargs)`` path and the new SafetyLayer path
         share the same core logic.
         """
-        self._apply_motion(linear=linear, angular=angular)
+        self._apply_motion(direction="", linear=linear, angular=angular)
 
     def _apply_motion(
         self,
@@ -228,10 +228,12 @@ class SimulationDriver(DriverBase):
                 angular,
             )
 
-    def move(self, **kwargs: Any) -> None:
-        """Execute a movement command (legacy kwargs form).
+    def move(self, linear: float = 0.0, angular: float = 0.0, **kwargs: Any) -> None:
+        """Execute a movement command.
 
-        Accepted kwargs (following PCA9685 / RCAN action schema):
+        The runtime calls ``move(linear, angular)``.  The legacy kwargs form
+        is selected by passing ``direction``; accepted kwargs (following
+        PCA9685 / RCAN action schema):
             - direction: "forward" | "backward" | "left" | "right" | "stop"
             - speed: 0.0–1.0
             - linear: direct linear velocity (m/s)
@@ -240,6 +242,15 @@ class SimulationDriver(DriverBase):
         Note: Prefer ``DriverBase.move(linear, angular)`` for SafetyLayer routing.
               This kwargs form is retained for backward compatibility.
         """
+        if "direction" not in kwargs:
+            # Velocity form: SafetyLayer routing, then _move()
+            super().move(
+                linear,
+                angular,
+                linear_x=kwargs.get("linear_x"),
+                angular_z=kwargs.get("angular_z"),
+            )
+            return
         self._apply_motion(
             direction=str(kwargs.get("direction", "stop")).lower(),
             speed=float(kwargs.get("speed", self._default_speed)),
@@ -7,6 +7,8 @@ import random
 import threading
 from typing import Any, Optional
 
+from castor.event_bus import publishes
+
 logger = logging.getLogger("OpenCastor.ThermalDriver")
 
 try:
@@ -138,6 +140,7 @@ class ThermalDriver:
                 # Degrade gracefully: return mock data rather than raising
                 return self._mock_capture()
 
+    @publishes("thermal")
     def get_hotspot(self) -> dict[str, Any]:
         """Find the hottest pixel in the current frame.
 
@@ -253,6 +253,11 @@ class EmbeddingInterpreter:
         """True when the interpreter is enabled via config."""
         return self._enabled
 
+    @property
+    def backend(self):
+        """The underlying :class:`EmbeddingBackend`."""
+        return self._backend
+
     def set_goal(self, goal_text: str) -> None:
         """Embed and store the current mission goal.
 
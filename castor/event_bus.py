@@ -0,0 +1,289 @@
+"""
+castor/event_bus.py — In-process pub/sub bus for sensor readings and events.
+
+Drivers and subsystems publish values under dotted topics
+(``imu.accel_g.x``, ``battery.voltage_v``, ``vision.person_detected``,
+``event.obstacle_cleared``).  Waiters register a predicate on a topic and are
+woken by the publishing thread itself, so a behavior waiting for "bumper
+pressed" reacts within the publish call instead of at the next poll.
+
+Usage::
+
+    from castor.event_bus import get_bus
+
+    bus = get_bus()
+    bus.publish("bumper.pressed", True)
+
+    with bus.watch("bumper.pressed", lambda v: v is True) as waiter:
+        if waiter.wait(timeout=5.0):
+            print("bumped:", waiter.value)
+
+Driver read methods opt in with :func:`publishes`, which flattens the
+returned dict into ``<source>.<key>[.<subkey>]`` topics.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("OpenCastor.EventBus")
+
+__all__ = ["EventBus", "Waiter", "get_bus", "publishes", "reset_bus"]
+
+Predicate = Callable[[Any], bool]
+Subscriber = Callable[[str, Any], None]
+
+
+class Waiter:
+    """A one-shot wait for a value on a topic that satisfies a predicate.
+
+    Created by :meth:`EventBus.watch`; use as a context manager (or call
+    :meth:`close`) so the bus stops offering it values.
+    """
+
+    __slots__ = ("topic", "_predicate", "_event", "_bus", "value", "met", "cancelled")
+
+    def __init__(self, bus: EventBus, topic: str, predicate: Optional[Predicate]) -> None:
+        self.topic = topic
+        self._predicate = predicate
+        self._event = threading.Event()
+        self._bus = bus
+        self.value: Any = None
+        self.met = False
+        self.cancelled = False
+
+    def offer(self, value: Any) -> bool:
+        """Test *value* against the predicate; wake the waiter on a match."""
+        if self.met:
+            return True
+        try:
+            ok = self._predicate is None or bool(self._predicate(value))
+        except Exception:  # type mismatch etc. — not a match
+            ok = False
+        if ok:
+            self.value = value
+            self.met = True
+            self._event.set()
+        return ok
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until matched, cancelled or *timeout*; returns :attr:`met`."""
+        if not self.met and not self.cancelled:
+            self._event.wait(timeout)
+        return self.met
+
+    def cancel(self) -> None:
+        """Wake the waiter without a match."""
+        self.cancelled = True
+        self._event.set()
+
+    def close(self) -> None:
+        self._bus._discard(self)
+
+    def __enter__(self) -> Waiter:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class EventBus:
+    """Thread-safe topic bus: latest-value cache, subscribers and waiters.
+
+    Subscribers and waiters run on the publishing thread, outside the bus
+    lock; subscriber exceptions are logged and swallowed so a bad listener
+    cannot break a driver read.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latest: dict[str, tuple[Any, float]] = {}
+        self._subscribers: dict[str, dict[int, Subscriber]] = {}
+        self._waiters: dict[str, set[Waiter]] = {}
+        self._tokens: dict[int, str] = {}
+        self._ids = itertools.count(1)
+        self.published = 0
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def publish(self, topic: str, value: Any = True) -> None:
+        """Publish *value* on *topic* (default ``True`` for plain events)."""
+        self.publish_many(((topic, value),))
+
+    def publish_reading(self, source: str, reading: Mapping[str, Any]) -> None:
+        """Publish every leaf of *reading* as ``<source>.<dotted.key>``."""
+        self.publish_many(_flatten(source, reading))
+
+    def publish_many(self, items: Iterable[tuple[str, Any]]) -> None:
+        now = time.monotonic()
+        deliveries: list[tuple[str, Any, list[Subscriber], list[Waiter]]] = []
+        with self._lock:
+            for topic, value in items:
+                self._latest[topic] = (value, now)
+                self.published += 1
+                subs = self._subscribers.get(topic)
+                waiters = self._waiters.get(topic)
+                if subs or waiters:
+                    deliveries.append(
+                        (
+                            topic,
+                            value,
+                            list(subs.values()) if subs else [],
+                            list(waiters) if waiters else [],
+                        )
+                    )
+        for topic, value, subs, waiters in deliveries:
+            for waiter in waiters:
+                waiter.offer(value)
+            for callback in subs:
+                try:
+                    callback(topic, value)
+                except Exception as exc:
+                    logger.warning("EventBus subscriber for %r raised: %s", topic, exc)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def latest(self, topic: str, default: Any = None) -> Any:
+        """Most recently published value on *topic* (or *default*)."""
+        entry = self._latest.get(topic)
+        return entry[0] if entry is not None else default
+
+    def age(self, topic: str) -> Optional[float]:
+        """Seconds since *topic* was last published, or None if never."""
+        entry = self._latest.get(topic)
+        return time.monotonic() - entry[1] if entry is not None else None
+
+    def published_at(self, topic: str) -> Optional[float]:
+        """``time.monotonic()`` of the last publish on *topic*, or None if never."""
+        entry = self._latest.get(topic)
+        return entry[1] if entry is not None else None
+
+    # ------------------------------------------------------------------
+    # Subscribing
+    # ------------------------------------------------------------------
+
+    def subscribe(self, topic: str, callback: Subscriber) -> int:
+        """Call ``callback(topic, value)`` on every publish; returns a token."""
+        with self._lock:
+            token = next(self._ids)
+            self._subscribers.setdefault(topic, {})[token] = callback
+            self._tokens[token] = topic
+        return token
+
+    def unsubscribe(self, token: int) -> bool:
+        with self._lock:
+            topic = self._tokens.pop(token, None)
+            if topic is None:
+                return False
+            subs = self._subscribers.get(topic, {})
+            subs.pop(token, None)
+            if not subs:
+                self._subscribers.pop(topic, None)
+        return True
+
+    def watch(
+        self,
+        topic: str,
+        predicate: Optional[Predicate] = None,
+        max_age: Optional[float] = None,
+    ) -> Waiter:
+        """Register a :class:`Waiter` for the next matching value on *topic*.
+
+        With no *predicate* any publish matches.  When *max_age* is given the
+        cached latest value is offered first if it is at most that old, so a
+        condition that already holds is met immediately.
+        """
+        waiter = Waiter(self, topic, predicate)
+        with self._lock:
+            self._waiters.setdefault(topic, set()).add(waiter)
+            entry = self._latest.get(topic)
+        if max_age is not None and entry is not None and time.monotonic() - entry[1] <= max_age:
+            waiter.offer(entry[0])
+        return waiter
+
+    def wait_for(
+        self,
+        topic: str,
+        predicate: Optional[Predicate] = None,
+        timeout: Optional[float] = None,
+        max_age: Optional[float] = None,
+    ) -> tuple[bool, Any]:
+        """Block until a matching value is published; returns ``(met, value)``."""
+        with self.watch(topic, predicate, max_age=max_age) as waiter:
+            met = waiter.wait(timeout)
+            return met, waiter.value
+
+    def _discard(self, waiter: Waiter) -> None:
+        with self._lock:
+            waiters = self._waiters.get(waiter.topic)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    self._waiters.pop(waiter.topic, None)
+
+
+def _flatten(prefix: str, reading: Mapping[str, Any]) -> Iterable[tuple[str, Any]]:
+    for key, value in reading.items():
+        topic = f"{prefix}.{key}"
+        if isinstance(value, Mapping):
+            yield from _flatten(topic, value)
+        else:
+            yield topic, value
+
+
+def publishes(source: str) -> Callable:
+    """Decorate a driver read method so each dict it returns is published.
+
+    Publishing failures are logged at debug level and never affect the
+    caller's result.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = fn(*args, **kwargs)
+            if isinstance(result, Mapping):
+                try:
+                    get_bus().publish_reading(source, result)
+                except Exception as exc:
+                    logger.debug("EventBus publish for %s failed: %s", source, exc)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+# ---------------------------------------------------------------------------
+# Singleton
+# ---------------------------------------------------------------------------
+
+_bus: Optional[EventBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_bus() -> EventBus:
+    """Return the process-wide :class:`EventBus`."""
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                _bus = EventBus()
+    return _bus
+
+
+def reset_bus() -> None:
+    """Replace the global bus (useful in tests)."""
+    global _bus
+    with _bus_lock:
+        _bus = None
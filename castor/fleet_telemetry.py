@@ -17,17 +17,26 @@ Usage::
     ])
     snapshot = agg.fetch_all()   # → list[RobotSnapshot]
     payload  = agg.to_dict()     # → JSON-ready dict
+
+Fetches run on one background asyncio loop that owns a pooled
+``httpx.AsyncClient``: at most ``concurrency`` robots are in flight, each
+robot gets ``deadline_s`` to answer, and responses carrying an ``ETag`` are
+revalidated with ``If-None-Match`` so unchanged robots answer ``304`` with
+no body.  Within ``stale_s`` after the TTL the last results are served
+immediately while a refresh runs in the background.
 """
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import json
 import logging
 import os
 import threading
 import time
+from concurrent.futures import Future
 from typing import Any, Optional
-from urllib import request as _urllib_request
 
 logger = logging.getLogger("OpenCastor.FleetTelemetry")
 
@@ -37,6 +46,9 @@ _CACHE_TTL_SECONDS: float = float(os.getenv("FLEET_TELEMETRY_CACHE_TTL", "10"))
 # HTTP request timeout per robot
 _FETCH_TIMEOUT: float = float(os.getenv("FLEET_TELEMETRY_FETCH_TIMEOUT", "5"))
 
+# Window after the TTL during which cached results are served while refreshing
+_STALE_SECONDS: float = float(os.getenv("FLEET_TELEMETRY_STALE_WINDOW", "30"))
+
 
 # ---------------------------------------------------------------------------
 # Data types
@@ -55,6 +67,8 @@ class RobotSnapshot:
         latency_ms:   Fetch round-trip latency in milliseconds.
         error:        Error string if fetch failed.
         timestamp:    Unix timestamp of this snapshot.
+        stale:        True when this is a previous result served because the
+                      robot missed its deadline.
     """
 
     def __init__(
@@ -75,6 +89,7 @@ class RobotSnapshot:
         self.latency_ms = latency_ms
         self.error = error
         self.timestamp = time.time()
+        self.stale = False
 
     def extract_metric(self, metric_name: str) -> Optional[float]:
         """Extract a scalar metric value from the raw Prometheus text.
@@ -116,6 +131,7 @@ class RobotSnapshot:
             "latency_ms": round(self.latency_ms, 1),
             "error": self.error,
             "timestamp": round(self.timestamp, 1),
+            "stale": self.stale,
             "health": self.health,
             "metrics": {
                 "uptime_s": self.extract_metric("opencastor_uptime_seconds"),
@@ -137,23 +153,49 @@ class FleetAggregator:
     """Fetches and caches telemetry from a list of fleet robots.
 
     Args:
-        robots:  List of ``{"name": str, "url": str}`` dicts.
-        threads: Number of parallel fetch threads (default: 8).
-        ttl_s:   Cache TTL in seconds (default: from env ``FLEET_TELEMETRY_CACHE_TTL``).
+        robots:      List of ``{"name": str, "url": str}`` dicts.
+        concurrency: Maximum robots fetched at once (default: 8).
+        ttl_s:       Cache TTL in seconds (default: from env ``FLEET_TELEMETRY_CACHE_TTL``).
+        deadline_s:  Per-robot budget for both requests (default: fetch timeout).
+        stale_s:     Serve-stale window after the TTL while a background
+                     refresh runs (0 disables).
+        threads:     Deprecated alias for *concurrency*.
     """
 
     def __init__(
         self,
         robots: list[dict[str, str]],
-        threads: int = 8,
+        concurrency: int = 8,
         ttl_s: float = _CACHE_TTL_SECONDS,
+        deadline_s: float = _FETCH_TIMEOUT,
+        stale_s: float = _STALE_SECONDS,
+        threads: Optional[int] = None,
     ) -> None:
+        if threads is not None:
+            import warnings
+
+            warnings.warn(
+                "FleetAggregator(threads=...) is deprecated; use concurrency=...",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            concurrency = threads
         self._robots = robots
-        self._threads = threads
+        self._concurrency = max(1, concurrency)
         self._ttl_s = ttl_s
+        self._deadline_s = deadline_s
+        self._stale_s = stale_s
         self._cache: dict[str, RobotSnapshot] = {}
         self._lock = threading.Lock()
         self._last_fetch: float = 0.0
+        # url → (etag, body) for conditional requests
+        self._validators: dict[str, tuple[str, str]] = {}
+        self.not_modified = 0  # 304 responses received (payload skipped)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._client: Any = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._refreshing: Optional[Future] = None
 
     @classmethod
     def from_config(cls, config: dict) -> FleetAggregator:
@@ -187,10 +229,11 @@ class FleetAggregator:
         return cls(robots)
 
     def fetch_all(self, force: bool = False) -> list[RobotSnapshot]:
-        """Fetch telemetry from all robots in parallel.
+        """Fetch telemetry from all robots concurrently.
 
         Returns cached results if they are younger than *ttl_s*, unless
-        *force* is ``True``.
+        *force* is ``True``.  Results within the stale window are returned
+        immediately and refreshed in the background.
 
         Args:
             force: Bypass the cache and always re-fetch.
@@ -198,30 +241,17 @@ class FleetAggregator:
         Returns:
             List of :class:`RobotSnapshot` (one per configured robot).
         """
-        now = time.monotonic()
-        if not force and (now - self._last_fetch) < self._ttl_s:
-            with self._lock:
-                return list(self._cache.values())
-
-        snapshots: list[RobotSnapshot] = []
-        lock = threading.Lock()
-
-        def _fetch(robot: dict) -> None:
-            snap = self._fetch_robot(robot)
-            with lock:
-                snapshots.append(snap)
-
-        threads = [threading.Thread(target=_fetch, args=(r,), daemon=True) for r in self._robots]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join(timeout=_FETCH_TIMEOUT + 2)
-
-        with self._lock:
-            self._cache = {s.name: s for s in snapshots}
-            self._last_fetch = now
-
-        return snapshots
+        cached = self._cached(force)
+        if cached is not None:
+            return cached
+        return self._submit(self._refresh()).result()
+
+    async def fetch_all_async(self, force: bool = False) -> list[RobotSnapshot]:
+        """Awaitable :meth:`fetch_all` for use from an event loop (e.g. FastAPI)."""
+        cached = self._cached(force)
+        if cached is not None:
+            return cached
+        return await asyncio.wrap_future(self._submit(self._refresh()))
 
     def to_dict(self, force: bool = False) -> dict[str, Any]:
         """Return a JSON-serialisable aggregate snapshot.
@@ -241,7 +271,100 @@ class FleetAggregator:
             "timestamp": round(time.time(), 1),
         }
 
-    def _fetch_robot(self, robot: dict) -> RobotSnapshot:
+    def close(self) -> None:
+        """Close the pooled client and stop the background loop."""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=5)
+        except Exception as exc:
+            logger.debug("Fleet telemetry shutdown: %s", exc)
+        loop.call_soon_threadsafe(loop.stop)
+        self._loop = None
+        self._semaphore = None  # bound to the stopped loop
+
+    async def _shutdown(self) -> None:
+        current = asyncio.current_task()
+        pending = [t for t in asyncio.all_tasks() if t is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._semaphore = None
+
+    # ------------------------------------------------------------------
+    # Cache / scheduling
+    # ------------------------------------------------------------------
+
+    def _cached(self, force: bool) -> Optional[list[RobotSnapshot]]:
+        """Cached snapshots when fresh (or stale-but-usable), else None."""
+        if force:
+            return None
+        age = time.monotonic() - self._last_fetch
+        with self._lock:
+            if not self._cache and self._robots:
+                return None
+            cached = list(self._cache.values())
+        if age < self._ttl_s:
+            return cached
+        if age < self._ttl_s + self._stale_s:
+            with self._lock:
+                if self._refreshing is None or self._refreshing.done():
+                    self._refreshing = self._submit(self._refresh())
+            return cached
+        return None
+
+    def _submit(self, coro: Any) -> Future:
+        """Run *coro* on the aggregator's event loop thread."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, daemon=True, name="fleet-telemetry"
+                ).start()
+                self._loop = loop
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    async def _refresh(self) -> list[RobotSnapshot]:
+        started = time.monotonic()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        snapshots = list(await asyncio.gather(*(self._fetch_bounded(r) for r in self._robots)))
+        with self._lock:
+            self._cache = {s.name: s for s in snapshots}
+            self._last_fetch = started
+        return snapshots
+
+    async def _fetch_bounded(self, robot: dict) -> RobotSnapshot:
+        name = robot.get("name", "unknown")
+        async with self._semaphore:
+            t0 = time.monotonic()
+            try:
+                return await asyncio.wait_for(self._fetch_robot(robot), self._deadline_s)
+            except asyncio.TimeoutError:
+                with self._lock:
+                    previous = self._cache.get(name)
+                if previous is not None:
+                    previous = copy.copy(previous)
+                    previous.stale = True
+                    return previous
+                return RobotSnapshot(
+                    name=name,
+                    base_url=robot.get("url", "").rstrip("/"),
+                    ok=False,
+                    latency_ms=(time.monotonic() - t0) * 1000,
+                    error=f"deadline exceeded ({self._deadline_s:g}s)",
+                )
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    async def _fetch_robot(self, robot: dict) -> RobotSnapshot:
         """Fetch metrics and health from a single robot.
 
         Args:
@@ -256,7 +379,7 @@ class FleetAggregator:
         t0 = time.monotonic()
 
         try:
-            metrics_text = self._get(f"{url}/api/metrics", token)
+            metrics_text = await self._get(f"{url}/api/metrics", token)
         except Exception as exc:
             return RobotSnapshot(
                 name=name,
@@ -269,7 +392,7 @@ class FleetAggregator:
         # Try health endpoint (non-fatal if missing)
         health: dict = {}
         try:
-            health_raw = self._get(f"{url}/health", token)
+            health_raw = await self._get(f"{url}/health", token)
             health = json.loads(health_raw) if isinstance(health_raw, str) else health_raw
         except Exception as e:
             logger.warning("Health probe failed for %s: %s", name, e)
@@ -284,8 +407,8 @@ class FleetAggregator:
             latency_ms=latency_ms,
         )
 
-    def _get(self, url: str, token: str = "", timeout: float = _FETCH_TIMEOUT) -> str:
-        """HTTP GET returning the response body as a string.
+    async def _get(self, url: str, token: str = "", timeout: float = _FETCH_TIMEOUT) -> str:
+        """HTTP GET on the pooled client, revalidating with ``If-None-Match``.
 
         Args:
             url:     Full URL.
@@ -293,13 +416,33 @@ class FleetAggregator:
             timeout: Request timeout in seconds.
 
         Returns:
-            Response body as UTF-8 string.
+            Response body as a string (the cached body on ``304``).
         """
-        req = _urllib_request.Request(url)
-        if token:
-            req.add_header("Authorization", f"Bearer {token}")
-        with _urllib_request.urlopen(req, timeout=timeout) as resp:
-            return resp.read().decode("utf-8", errors="replace")
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self._concurrency * 2,
+                    max_keepalive_connections=self._concurrency * 2,
+                )
+            )
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        validator = self._validators.get(url)
+        if validator is not None:
+            headers["If-None-Match"] = validator[0]
+        resp = await self._client.get(url, headers=headers, timeout=timeout)
+        if resp.status_code == 304 and validator is not None:
+            self.not_modified += 1
+            return validator[1]
+        resp.raise_for_status()
+        body = resp.text
+        etag = resp.headers.get("etag")
+        if etag:
+            self._validators[url] = (etag, body)
+        else:
+            self._validators.pop(url, None)
+        return body
 
     @property
     def robot_count(self) -> int:
@@ -332,6 +475,8 @@ def get_fleet_aggregator(config: Optional[dict] = None) -> FleetAggregator:
     global _fleet_agg
     with _fleet_lock:
         if _fleet_agg is None or config is not None:
+            if _fleet_agg is not None:
+                _fleet_agg.close()
             _fleet_agg = FleetAggregator.from_config(config or {})
     return _fleet_agg
 
@@ -340,6 +485,8 @@ def reset_fleet_aggregator() -> None:
     """Reset the global singleton (useful in tests)."""
     global _fleet_agg
     with _fleet_lock:
+        if _fleet_agg is not None:
+            _fleet_agg.close()
         _fleet_agg = None
 
 
@@ -255,6 +255,7 @@ class CastorFS:
         """Flush memory and update proc status."""
         self.proc.update_status("shutdown")
         self.memory.flush_to_disk()
+        self.context.flush_to_disk()
         logger.info("CastorFS shut down")
 
     # ------------------------------------------------------------------
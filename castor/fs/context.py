@@ -28,6 +28,7 @@ import time
 from collections.abc import Callable
 from typing import Any, Optional, Union
 
+from castor.fs.journal import DEFAULT_COMPACT_EVERY, Journal
 from castor.fs.namespace import Namespace
 
 logger = logging.getLogger("OpenCastor.FS.Context")
@@ -51,6 +52,10 @@ class ContextWindow:
         summariser:        Optional callable ``(entries) -> str`` for
                            custom summarisation.  Defaults to a simple
                            concatenation of observations.
+        persist_dir:       Optional directory; when set, the window is
+                           journaled to disk (see :mod:`castor.fs.journal`)
+                           and restored on construction.
+        compact_every:     Journal operations between snapshot compactions.
     """
 
     def __init__(
@@ -59,12 +64,17 @@ class ContextWindow:
         max_depth: int = DEFAULT_WINDOW_DEPTH,
         summary_threshold: int = DEFAULT_SUMMARY_THRESHOLD,
         summariser: Optional[Callable] = None,
+        persist_dir: Optional[str] = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
     ):
         self.ns = ns
         self.max_depth = max_depth
         self.summary_threshold = summary_threshold
         self._summariser = summariser or self._default_summariser
         self._lock = threading.Lock()
+        self._journal = (
+            Journal(persist_dir, "context", compact_every=compact_every) if persist_dir else None
+        )
         self._bootstrap()
 
     def _bootstrap(self):
@@ -72,6 +82,8 @@ class ContextWindow:
         self.ns.write("/tmp/context/window", [])
         self.ns.write("/tmp/context/summary", "")
         self.ns.write("/tmp/context/turn_count", 0)
+        if self._journal is not None and self._journal.exists():
+            self._load_from_disk()
 
     def push(self, role: str, content: str, metadata: Optional[dict] = None):
         """Add an entry to the context window.
@@ -92,6 +104,8 @@ class ContextWindow:
             self.ns.append("/tmp/context/window", entry)
             count = (self.ns.read("/tmp/context/turn_count") or 0) + 1
             self.ns.write("/tmp/context/turn_count", count)
+            if self._journal is not None:
+                self._journal.record({"op": "push", "v": entry})
             self._maybe_summarise()
 
     def get_window(self) -> list[dict]:
@@ -114,6 +128,60 @@ class ContextWindow:
             self.ns.write("/tmp/context/window", [])
             self.ns.write("/tmp/context/summary", "")
             self.ns.write("/tmp/context/turn_count", 0)
+            if self._journal is not None:
+                self._journal.record({"op": "clear"})
+
+    def flush_to_disk(self, compact: bool = False):
+        """Append journaled changes to disk, compacting when due.
+
+        No-op unless the window was created with ``persist_dir``.
+        """
+        if self._journal is None:
+            return
+        try:
+            with self._lock:
+                if compact or self._journal.needs_compaction:
+                    self._journal.compact(
+                        [
+                            {
+                                "window": self.ns.read("/tmp/context/window") or [],
+                                "summary": self.ns.read("/tmp/context/summary") or "",
+                                "turn_count": self.ns.read("/tmp/context/turn_count") or 0,
+                            }
+                        ]
+                    )
+                else:
+                    self._journal.flush()
+        except Exception as exc:
+            logger.warning("Failed to flush context window: %s", exc)
+
+    def _load_from_disk(self):
+        """Restore the window from the snapshot and replay the journal."""
+        try:
+            records, ops = self._journal.load()
+        except Exception as exc:
+            logger.warning("Failed to load context journal: %s", exc)
+            return
+        window: list[dict] = []
+        summary = ""
+        turn_count = 0
+        for record in records:
+            window = list(record.get("window", []))
+            summary = record.get("summary", "")
+            turn_count = record.get("turn_count", 0)
+        for op in ops:
+            kind = op.get("op")
+            if kind == "push":
+                window.append(op["v"])
+                turn_count += 1
+            elif kind == "summarise":
+                summary = op["summary"]
+                window = window[-op["keep"] :] if op["keep"] else []
+            elif kind == "clear":
+                window, summary, turn_count = [], "", 0
+        self.ns.write("/tmp/context/window", window)
+        self.ns.write("/tmp/context/summary", summary)
+        self.ns.write("/tmp/context/turn_count", turn_count)
 
     def build_prompt_context(self) -> str:
         """Build a text block suitable for injection into a system prompt.
@@ -158,6 +226,10 @@ class ContextWindow:
 
         self.ns.write("/tmp/context/summary", combined)
         self.ns.write("/tmp/context/window", to_keep)
+        if self._journal is not None:
+            # Journal the result, not the inputs: custom summarisers need
+            # not be deterministic, so replay must not re-run them.
+            self._journal.record({"op": "summarise", "summary": combined, "keep": len(to_keep)})
         logger.debug(
             "Context summarised: %d entries -> summary, keeping %d", len(to_summarise), len(to_keep)
         )
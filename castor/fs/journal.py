@@ -0,0 +1,212 @@
+"""
+OpenCastor Virtual Filesystem -- Journal.
+
+Append-only change journal with periodic snapshot compaction, used by
+:class:`~castor.fs.memory.MemoryStore` and
+:class:`~castor.fs.context.ContextWindow` to persist state.
+
+On disk a journal named ``memory`` consists of two line-delimited JSON
+files inside the persistence directory::
+
+    memory.snapshot.jsonl   {"snapshot": 1, "seq": 812, "t": ...}
+                            {"tier": "semantic", "key": "facts", "value": {...}}
+                            ...
+    memory.journal.jsonl    {"seq": 813, "op": "fact", "k": "door", "v": {...}}
+                            {"seq": 814, "op": "episode", "v": {...}}
+
+Every recorded operation gets a monotonically increasing sequence
+number.  A flush appends only the operations recorded since the last
+flush, so its cost is proportional to what changed rather than to the
+size of the store.  Once enough operations have accumulated the owner
+compacts: the full state is written to a fresh snapshot (atomically,
+via rename) stamped with the last sequence number, and the journal is
+truncated.  Recovery loads the snapshot and replays journal operations
+whose sequence number is newer than the snapshot, so a crash between
+writing the snapshot and truncating the journal never double-applies.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Union
+
+logger = logging.getLogger("OpenCastor.FS.Journal")
+
+# Journal operations accumulated before the owner should compact.
+DEFAULT_COMPACT_EVERY = 500
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist a rename in *directory* (a no-op where directories cannot be opened)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class Journal:
+    """Append-only operation log with snapshot compaction.
+
+    Operations are plain dicts.  :meth:`record` serialises them
+    immediately (so later mutation of the caller's objects cannot leak
+    into the log) and buffers the line until :meth:`flush`.
+
+    Args:
+        directory:      Directory holding the journal and snapshot files.
+        name:           File stem (``memory`` -> ``memory.journal.jsonl``).
+        compact_every:  Journal length (in operations) after which
+                        :attr:`needs_compaction` becomes true.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        name: str,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+    ):
+        self.directory = Path(directory)
+        self.name = name
+        self.compact_every = max(1, int(compact_every))
+        self.journal_path = self.directory / f"{name}.journal.jsonl"
+        self.snapshot_path = self.directory / f"{name}.snapshot.jsonl"
+        self._lock = threading.Lock()
+        self._pending: list[str] = []
+        self._seq = 0
+        self._journal_ops = 0
+        self._has_snapshot = self.snapshot_path.exists()
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def record(self, op: dict) -> int:
+        """Buffer *op* for the next flush.  Returns its sequence number."""
+        with self._lock:
+            self._seq += 1
+            self._pending.append(_dumps({"seq": self._seq, **op}))
+            return self._seq
+
+    @property
+    def pending(self) -> int:
+        """Number of recorded operations not yet flushed."""
+        return len(self._pending)
+
+    @property
+    def needs_compaction(self) -> bool:
+        """True when the journal is long enough (or no snapshot exists yet)."""
+        with self._lock:
+            if not self._has_snapshot:
+                return self._journal_ops + len(self._pending) > 0
+            return self._journal_ops + len(self._pending) >= self.compact_every
+
+    def flush(self) -> int:
+        """Append buffered operations to the journal file.
+
+        Returns the number of operations written.
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            lines, self._pending = self._pending, []
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            self._journal_ops += len(lines)
+            return len(lines)
+
+    def compact(self, records: Iterable[dict]) -> None:
+        """Replace the snapshot with *records* and truncate the journal.
+
+        *records* must describe the full current state, including every
+        operation recorded so far; buffered operations are discarded.
+        """
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_suffix(".jsonl.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(_dumps({"snapshot": 1, "seq": self._seq, "t": time.time()}) + "\n")
+                for record in records:
+                    f.write(_dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+            _fsync_dir(self.directory)
+            self._has_snapshot = True
+            # Truncate only after the snapshot is durable
+            with open(self.journal_path, "w", encoding="utf-8"):
+                pass
+            self._pending = []
+            self._journal_ops = 0
+
+    # ------------------------------------------------------------------
+    # Recovery
+    # ------------------------------------------------------------------
+    def exists(self) -> bool:
+        """True if a snapshot or journal file is present on disk."""
+        return self.snapshot_path.exists() or self.journal_path.exists()
+
+    def load(self) -> tuple[list[dict], list[dict]]:
+        """Read persisted state.
+
+        Returns ``(snapshot_records, ops)`` where *ops* are the journal
+        operations newer than the snapshot, in sequence order.  Torn or
+        corrupt lines (e.g. from a crash mid-write) are skipped.
+        """
+        snapshot_seq = 0
+        records: list[dict] = []
+        for i, item in enumerate(self._read_lines(self.snapshot_path)):
+            if i == 0 and "snapshot" in item:
+                snapshot_seq = int(item.get("seq", 0))
+                continue
+            records.append(item)
+
+        self._repair_tail(self.journal_path)
+        ops = [
+            item
+            for item in self._read_lines(self.journal_path)
+            if int(item.get("seq", 0)) > snapshot_seq
+        ]
+        with self._lock:
+            self._seq = max([snapshot_seq] + [int(op["seq"]) for op in ops])
+            self._journal_ops = len(ops)
+            self._has_snapshot = self.snapshot_path.exists()
+        return records, ops
+
+    @staticmethod
+    def _repair_tail(path: Path) -> None:
+        """Terminate a torn final line so the next append starts cleanly."""
+        if not path.exists() or path.stat().st_size == 0:
+            return
+        with open(path, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    @staticmethod
+    def _read_lines(path: Path) -> list[dict]:
+        if not path.exists():
+            return []
+        items = []
+        with open(path, encoding="utf-8") as f:
+            for lineno, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    items.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning("Skipping corrupt line %d in %s", lineno, path)
+        return items
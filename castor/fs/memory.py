@@ -24,6 +24,11 @@ for performance and because the safety layer calls into memory for context
 building. Permission gating and auditing are enforced by
 :class:`~castor.fs.safety.SafetyLayer` when external code interacts with
 the virtual filesystem.
+
+Persistence is journaled (see :mod:`castor.fs.journal`): every mutation
+is recorded as a small operation, flushes append only what changed,
+and the full store is rewritten into a compact snapshot only every
+``compact_every`` operations.
 """
 
 import json
@@ -33,6 +38,7 @@ import time
 from pathlib import Path
 from typing import Any, Optional
 
+from castor.fs.journal import DEFAULT_COMPACT_EVERY, Journal
 from castor.fs.namespace import Namespace
 
 logger = logging.getLogger("OpenCastor.FS.Memory")
@@ -42,6 +48,8 @@ DEFAULT_EPISODIC_LIMIT = 500
 DEFAULT_SEMANTIC_LIMIT = 200
 DEFAULT_PROCEDURAL_LIMIT = 50
 
+_TIERS = ("episodic", "semantic", "procedural")
+
 
 class MemoryStore:
     """Manages the three memory tiers inside the virtual filesystem.
@@ -55,11 +63,25 @@ class MemoryStore:
         ns:            The underlying namespace.
         persist_dir:   Optional real filesystem path for persistence.
                        If set, memory is periodically flushed to disk.
+        compact_every: Journal operations between snapshot compactions.
     """
 
-    def __init__(self, ns: Namespace, persist_dir: Optional[str] = None):
+    def __init__(
+        self,
+        ns: Namespace,
+        persist_dir: Optional[str] = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+    ):
         self.ns = ns
         self.persist_dir = Path(persist_dir) if persist_dir else None
+        self._journal = (
+            Journal(self.persist_dir, "memory", compact_every=compact_every)
+            if self.persist_dir
+            else None
+        )
+        # mtime of each tier node as last written by this store; used to
+        # detect writes that bypassed the journal (e.g. via SafetyLayer).
+        self._seen_mtime: dict[str, float] = {}
         self._lock = threading.Lock()
         self._limits = {
             "episodic": DEFAULT_EPISODIC_LIMIT,
@@ -104,6 +126,7 @@ class MemoryStore:
         with self._lock:
             self.ns.append("/var/memory/episodic/events", episode)
             self._enforce_limit("episodic")
+            self._log({"op": "episode", "v": episode}, "/var/memory/episodic/events")
         return episode
 
     def get_episodes(self, limit: int = 20, tag: Optional[str] = None) -> list[dict]:
@@ -136,6 +159,7 @@ class MemoryStore:
                 "updated": time.time(),
             }
             self.ns.write("/var/memory/semantic/facts", facts)
+            self._log({"op": "fact", "k": key, "v": facts[key]}, "/var/memory/semantic/facts")
             self._enforce_limit("semantic")
 
     def recall_fact(self, key: str) -> Optional[Any]:
@@ -156,6 +180,7 @@ class MemoryStore:
             if key in facts:
                 del facts[key]
                 self.ns.write("/var/memory/semantic/facts", facts)
+                self._log({"op": "forget", "k": key}, "/var/memory/semantic/facts")
                 return True
             return False
 
@@ -179,6 +204,10 @@ class MemoryStore:
                 "executions": 0,
             }
             self.ns.write("/var/memory/procedural/behaviors", behaviors)
+            self._log(
+                {"op": "behavior", "k": name, "v": behaviors[name]},
+                "/var/memory/procedural/behaviors",
+            )
             self._enforce_limit("procedural")
 
     def get_behavior(self, name: str) -> Optional[dict]:
@@ -199,6 +228,10 @@ class MemoryStore:
                 behaviors[name]["executions"] += 1
                 behaviors[name]["last_executed"] = time.time()
                 self.ns.write("/var/memory/procedural/behaviors", behaviors)
+                self._log(
+                    {"op": "behavior", "k": name, "v": behaviors[name]},
+                    "/var/memory/procedural/behaviors",
+                )
 
     def remove_behavior(self, name: str) -> bool:
         """Remove a behavior from procedural memory."""
@@ -207,6 +240,7 @@ class MemoryStore:
             if name in behaviors:
                 del behaviors[name]
                 self.ns.write("/var/memory/procedural/behaviors", behaviors)
+                self._log({"op": "forget_behavior", "k": name}, "/var/memory/procedural/behaviors")
                 return True
             return False
 
@@ -227,7 +261,9 @@ class MemoryStore:
                 sorted_keys = sorted(facts.keys(), key=lambda k: facts[k].get("updated", 0))
                 for key in sorted_keys[: len(facts) - limit]:
                     del facts[key]
+                    self._log({"op": "forget", "k": key}, None)
                 self.ns.write("/var/memory/semantic/facts", facts)
+                self._mark_seen("/var/memory/semantic/facts")
         elif tier == "procedural":
             behaviors = self.ns.read("/var/memory/procedural/behaviors") or {}
             if len(behaviors) > limit:
@@ -237,27 +273,71 @@ class MemoryStore:
                 )
                 for name in sorted_names[: len(behaviors) - limit]:
                     del behaviors[name]
+                    self._log({"op": "forget_behavior", "k": name}, None)
                 self.ns.write("/var/memory/procedural/behaviors", behaviors)
+                self._mark_seen("/var/memory/procedural/behaviors")
 
     # ------------------------------------------------------------------
-    # Persistence (flush to / load from disk)
+    # Persistence (journal + snapshot)
     # ------------------------------------------------------------------
-    def flush_to_disk(self):
-        """Persist all memory tiers to the configured directory."""
-        if not self.persist_dir:
+    def _log(self, op: dict, path: Optional[str]):
+        """Record *op* in the journal and remember the node's mtime."""
+        if self._journal is None:
+            return
+        self._journal.record(op)
+        if path:
+            self._mark_seen(path)
+
+    def _mark_seen(self, path: str):
+        if self._journal is None:
+            return
+        st = self.ns.stat(path)
+        if st is not None:
+            self._seen_mtime[path] = st["mtime"]
+
+    def _journal_external_writes(self):
+        """Journal tier nodes that were modified outside this store."""
+        for tier in _TIERS:
+            data_path = f"/var/memory/{tier}"
+            for child in self.ns.ls(data_path) or []:
+                path = f"{data_path}/{child}"
+                st = self.ns.stat(path)
+                if st is None or st["type"] == "dir":
+                    continue
+                if self._seen_mtime.get(path) != st["mtime"]:
+                    self._journal.record(
+                        {"op": "put", "tier": tier, "key": child, "v": self.ns.read(path)}
+                    )
+                    self._seen_mtime[path] = st["mtime"]
+
+    def _snapshot_records(self) -> list[dict]:
+        records = []
+        for tier in _TIERS:
+            data_path = f"/var/memory/{tier}"
+            for child in self.ns.ls(data_path) or []:
+                records.append(
+                    {"tier": tier, "key": child, "value": self.ns.read(f"{data_path}/{child}")}
+                )
+        return records
+
+    def flush_to_disk(self, compact: bool = False):
+        """Persist changes since the last flush to the configured directory.
+
+        Appends pending journal operations; rewrites the snapshot only when
+        the journal has grown past ``compact_every`` operations, no
+        snapshot exists yet, or *compact* is true.
+        """
+        if self._journal is None:
             return
         try:
-            self.persist_dir.mkdir(parents=True, exist_ok=True)
-            for tier in ("episodic", "semantic", "procedural"):
-                data_path = f"/var/memory/{tier}"
-                children = self.ns.ls(data_path) or []
-                tier_data = {}
-                for child in children:
-                    tier_data[child] = self.ns.read(f"{data_path}/{child}")
-                out_path = self.persist_dir / f"{tier}.json"
-                with open(out_path, "w") as f:
-                    json.dump(tier_data, f, indent=2, default=str)
-            logger.info("Memory flushed to %s", self.persist_dir)
+            with self._lock:
+                self._journal_external_writes()
+                if compact or self._journal.needs_compaction:
+                    self._journal.compact(self._snapshot_records())
+                    logger.info("Memory snapshot compacted to %s", self.persist_dir)
+                else:
+                    written = self._journal.flush()
+                    logger.debug("Memory journal: %d ops flushed", written)
         except Exception as exc:
             logger.warning(
                 "Failed to flush memory to %s: %s",
@@ -265,11 +345,63 @@ class MemoryStore:
                 exc,
             )
 
+    def _apply_op(self, op: dict):
+        """Replay a single journal operation into the namespace."""
+        kind = op.get("op")
+        if kind == "episode":
+            self.ns.append("/var/memory/episodic/events", op["v"])
+            events = self.ns.read("/var/memory/episodic/events") or []
+            limit = self._limits["episodic"]
+            if len(events) > limit:
+                self.ns.write("/var/memory/episodic/events", events[-limit:])
+        elif kind == "fact":
+            facts = self.ns.read("/var/memory/semantic/facts") or {}
+            facts[op["k"]] = op["v"]
+            self.ns.write("/var/memory/semantic/facts", facts)
+        elif kind == "forget":
+            facts = self.ns.read("/var/memory/semantic/facts") or {}
+            facts.pop(op["k"], None)
+            self.ns.write("/var/memory/semantic/facts", facts)
+        elif kind == "behavior":
+            behaviors = self.ns.read("/var/memory/procedural/behaviors") or {}
+            behaviors[op["k"]] = op["v"]
+            self.ns.write("/var/memory/procedural/behaviors", behaviors)
+        elif kind == "forget_behavior":
+            behaviors = self.ns.read("/var/memory/procedural/behaviors") or {}
+            behaviors.pop(op["k"], None)
+            self.ns.write("/var/memory/procedural/behaviors", behaviors)
+        elif kind == "put":
+            self.ns.write(f"/var/memory/{op['tier']}/{op['key']}", op["v"])
+        else:
+            logger.warning("Unknown memory journal op: %r", kind)
+
     def _load_from_disk(self):
         """Load persisted memory from disk into the namespace."""
         if not self.persist_dir or not self.persist_dir.exists():
             return
-        for tier in ("episodic", "semantic", "procedural"):
+        if self._journal.exists():
+            try:
+                records, ops = self._journal.load()
+                for record in records:
+                    self.ns.write(f"/var/memory/{record['tier']}/{record['key']}", record["value"])
+                for op in ops:
+                    self._apply_op(op)
+                logger.info(
+                    "Loaded memory from disk (%d snapshot entries, %d journal ops)",
+                    len(records),
+                    len(ops),
+                )
+            except Exception as exc:
+                logger.warning("Failed to load memory journal: %s", exc)
+        else:
+            self._load_legacy_json()
+        for tier in _TIERS:
+            for child in self.ns.ls(f"/var/memory/{tier}") or []:
+                self._mark_seen(f"/var/memory/{tier}/{child}")
+
+    def _load_legacy_json(self):
+        """Load the pre-journal ``<tier>.json`` files, if present."""
+        for tier in _TIERS:
             in_path = self.persist_dir / f"{tier}.json"
             if in_path.exists():
                 try:
@@ -277,6 +409,7 @@ class MemoryStore:
                         tier_data = json.load(f)
                     for key, value in tier_data.items():
                         self.ns.write(f"/var/memory/{tier}/{key}", value)
+                        self._journal.record({"op": "put", "tier": tier, "key": key, "v": value})
                     logger.info("Loaded %s memory from disk (%d entries)", tier, len(tier_data))
                 except Exception as exc:
                     logger.warning("Failed to load %s memory: %s", tier, exc)
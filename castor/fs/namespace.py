@@ -7,18 +7,38 @@ is addressed as a path (e.g. ``/dev/motor``, ``/var/memory/episodic``).
 
 Nodes are lightweight dicts that can hold arbitrary data, metadata,
 and permission bits.  The tree supports ``read``, ``write``, ``list``,
-``stat``, ``mkdir``, and ``unlink`` operations, all gated by the
-permission layer.
+``stat``, ``mkdir``, ``unlink``, and ``rename`` operations, all gated
+by the permission layer.
+
+Alongside the tree, the namespace keeps a flat interned
+``path -> node`` index so that hot-path lookups such as
+``/dev/motor/left/speed`` resolve with a single hash probe instead of
+a per-component walk from the root.
 """
 
 import logging
+import sys
 import threading
 import time
+from functools import lru_cache
 from typing import Any, Optional
 
 logger = logging.getLogger("OpenCastor.FS")
 
 
+@lru_cache(maxsize=4096)
+def _parse_path(path: str) -> tuple[str, tuple[str, ...]]:
+    """Normalise *path* into ``(canonical_path, parts)``.
+
+    Results are cached: the same handful of paths are resolved many
+    times per tick, and the canonical string is interned so index
+    lookups compare by identity first.
+    """
+    parts = tuple(p for p in path.strip().split("/") if p)
+    canonical = sys.intern("/" + "/".join(parts))
+    return canonical, parts
+
+
 class FSNode:
     """A single node in the virtual filesystem tree.
 
@@ -81,6 +101,8 @@ class Namespace:
     def __init__(self):
         self._root = FSNode("/", node_type="dir")
         self._lock = threading.RLock()
+        # Flat interned path -> node table, kept in sync with the tree.
+        self._index: dict[str, FSNode] = {"/": self._root}
 
     # ------------------------------------------------------------------
     # Path helpers
@@ -88,47 +110,80 @@ class Namespace:
     @staticmethod
     def _split(path: str) -> list[str]:
         """Normalise and split an absolute path into components."""
-        path = path.strip()
-        if not path.startswith("/"):
-            path = "/" + path
-        parts = [p for p in path.split("/") if p]
-        return parts
-
-    def _walk(self, parts: list[str], create_parents: bool = False) -> Optional[FSNode]:
-        """Walk the tree from root, optionally creating intermediate dirs."""
+        return list(_parse_path(path)[1])
+
+    def _lookup(self, path: str) -> Optional[FSNode]:
+        """Resolve *path* through the flat index (O(1))."""
+        return self._index.get(_parse_path(path)[0])
+
+    def _walk(self, parts, create_parents: bool = False) -> Optional[FSNode]:
+        """Resolve *parts*, optionally creating intermediate dirs.
+
+        Existing nodes are found through the index; the tree is only
+        walked when parents have to be created.
+        """
+        node = self._index.get("/" + "/".join(parts))
+        if node is not None or not create_parents:
+            return node
         node = self._root
+        prefix = ""
         for part in parts:
-            if part not in node.children:
-                if create_parents:
-                    node.children[part] = FSNode(part, node_type="dir")
-                else:
-                    return None
-            node = node.children[part]
+            prefix = f"{prefix}/{part}"
+            child = node.children.get(part)
+            if child is None:
+                child = FSNode(part, node_type="dir")
+                node.children[part] = child
+                self._index[sys.intern(prefix)] = child
+            node = child
         return node
 
     def _parent_and_name(self, path: str):
         """Return (parent_node, basename) for a path, or (None, None)."""
-        parts = self._split(path)
+        parts = _parse_path(path)[1]
         if not parts:
             return None, None
         parent = self._walk(parts[:-1])
         return parent, parts[-1]
 
+    def _attach(self, parent: FSNode, canonical: str, node: FSNode) -> None:
+        """Link *node* under *parent* and register it in the index."""
+        parent.children[node.name] = node
+        self._index[canonical] = node
+
+    def _index_subtree(self, prefix: str, node: FSNode) -> None:
+        self._index[sys.intern(prefix)] = node
+        for name, child in node.children.items():
+            self._index_subtree(f"{prefix}/{name}", child)
+
+    def _unindex_subtree(self, prefix: str, node: FSNode) -> None:
+        self._index.pop(prefix, None)
+        for name, child in node.children.items():
+            self._unindex_subtree(f"{prefix}/{name}", child)
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def mkdir(self, path: str, meta: Optional[dict] = None) -> bool:
         """Create a directory (and parents) at *path*.  Returns True on success."""
         with self._lock:
-            parts = self._split(path)
-            node = self._root
-            for part in parts:
-                if part not in node.children:
-                    node.children[part] = FSNode(part, node_type="dir", meta=meta)
-                elif not node.children[part].is_dir:
-                    logger.error("mkdir: %s exists as file", path)
-                    return False
-                node = node.children[part]
+            canonical, parts = _parse_path(path)
+            node = self._index.get(canonical)
+            if node is not None and not node.is_dir:
+                logger.error("mkdir: %s exists as file", path)
+                return False
+            if node is None:
+                node = self._root
+                prefix = ""
+                for part in parts:
+                    prefix = f"{prefix}/{part}"
+                    child = node.children.get(part)
+                    if child is None:
+                        child = FSNode(part, node_type="dir", meta=meta)
+                        self._attach(node, sys.intern(prefix), child)
+                    elif not child.is_dir:
+                        logger.error("mkdir: %s exists as file", path)
+                        return False
+                    node = child
             if meta:
                 node.meta.update(meta)
             return True
@@ -136,28 +191,27 @@ class Namespace:
     def write(self, path: str, data: Any, meta: Optional[dict] = None) -> bool:
         """Write *data* to a file node at *path*, creating parents as needed."""
         with self._lock:
-            parts = self._split(path)
+            canonical, parts = _parse_path(path)
             if not parts:
                 return False
-            parent = self._walk(parts[:-1], create_parents=True)
-            name = parts[-1]
-            if name in parent.children and parent.children[name].is_dir:
-                logger.error("write: %s is a directory", path)
-                return False
-            if name in parent.children:
-                node = parent.children[name]
+            node = self._index.get(canonical)
+            if node is not None:
+                if node.is_dir:
+                    logger.error("write: %s is a directory", path)
+                    return False
                 node.data = data
                 node.mtime = time.time()
                 if meta:
                     node.meta.update(meta)
-            else:
-                parent.children[name] = FSNode(name, data=data, meta=meta)
+                return True
+            parent = self._walk(parts[:-1], create_parents=True)
+            self._attach(parent, canonical, FSNode(parts[-1], data=data, meta=meta))
             return True
 
     def read(self, path: str) -> Any:
         """Read the data payload of a file node.  Returns ``None`` if missing."""
         with self._lock:
-            node = self._walk(self._split(path))
+            node = self._lookup(path)
             if node is None:
                 return None
             if node.is_dir:
@@ -167,14 +221,14 @@ class Namespace:
     def append(self, path: str, entry: Any) -> bool:
         """Append *entry* to a file whose data is a list.  Creates if absent."""
         with self._lock:
-            parts = self._split(path)
+            canonical, parts = _parse_path(path)
             if not parts:
                 return False
-            parent = self._walk(parts[:-1], create_parents=True)
-            name = parts[-1]
-            if name not in parent.children:
-                parent.children[name] = FSNode(name, data=[])
-            node = parent.children[name]
+            node = self._index.get(canonical)
+            if node is None:
+                parent = self._walk(parts[:-1], create_parents=True)
+                node = FSNode(parts[-1], data=[])
+                self._attach(parent, canonical, node)
             if not isinstance(node.data, list):
                 node.data = [node.data]
             node.data.append(entry)
@@ -184,7 +238,7 @@ class Namespace:
     def ls(self, path: str = "/") -> Optional[list[str]]:
         """List children of a directory node."""
         with self._lock:
-            node = self._walk(self._split(path)) if path != "/" else self._root
+            node = self._lookup(path)
             if node is None or not node.is_dir:
                 return None
             return sorted(node.children.keys())
@@ -192,7 +246,7 @@ class Namespace:
     def stat(self, path: str) -> Optional[dict]:
         """Return stat info for a node, or ``None`` if not found."""
         with self._lock:
-            node = self._walk(self._split(path)) if path != "/" else self._root
+            node = self._lookup(path)
             if node is None:
                 return None
             return node.stat()
@@ -200,9 +254,7 @@ class Namespace:
     def exists(self, path: str) -> bool:
         """Check whether a node exists at *path*."""
         with self._lock:
-            if path == "/":
-                return True
-            return self._walk(self._split(path)) is not None
+            return self._lookup(path) is not None
 
     def unlink(self, path: str) -> bool:
         """Remove a node (file or empty dir).  Returns True on success."""
@@ -215,13 +267,52 @@ class Namespace:
                 logger.error("unlink: %s is a non-empty directory", path)
                 return False
             del parent.children[name]
+            self._index.pop(_parse_path(path)[0], None)
+            return True
+
+    def rename(self, src: str, dst: str) -> bool:
+        """Move the node at *src* (and its subtree) to *dst*.
+
+        Parents of *dst* are created as needed.  Fails if *src* is
+        missing, *dst* already exists, or *dst* lies inside *src*.
+        """
+        with self._lock:
+            src_canonical, src_parts = _parse_path(src)
+            dst_canonical, dst_parts = _parse_path(dst)
+            if not src_parts or not dst_parts:
+                return False
+            node = self._index.get(src_canonical)
+            if node is None or dst_canonical in self._index:
+                return False
+            if dst_canonical.startswith(src_canonical + "/"):
+                logger.error("rename: cannot move %s into itself", src)
+                return False
+            new_parent = self._walk(dst_parts[:-1], create_parents=True)
+            old_parent = self._index[_parse_path("/".join(src_parts[:-1]))[0]]
+            del old_parent.children[node.name]
+            self._unindex_subtree(src_canonical, node)
+            node.name = dst_parts[-1]
+            node.mtime = time.time()
+            new_parent.children[node.name] = node
+            self._index_subtree(dst_canonical, node)
             return True
 
+    def stats(self) -> dict[str, int]:
+        """Return path-index and parse-cache counters."""
+        info = _parse_path.cache_info()
+        with self._lock:
+            nodes = len(self._index)
+        return {
+            "nodes": nodes,
+            "path_cache_hits": info.hits,
+            "path_cache_misses": info.misses,
+        }
+
     def walk(self, path: str = "/") -> list[str]:
         """Recursively list all paths under *path*."""
         results = []
         with self._lock:
-            node = self._walk(self._split(path)) if path != "/" else self._root
+            node = self._lookup(path)
             if node is None:
                 return results
             self._walk_recursive(path.rstrip("/") or "/", node, results)
@@ -28,6 +28,7 @@ required capability AND have the path permission to proceed.
 
 import logging
 from enum import Flag, auto
+from types import MappingProxyType
 from typing import Optional
 
 logger = logging.getLogger("OpenCastor.FS.Perm")
@@ -150,6 +151,27 @@ class ACL:
         return {p: _mode_str(m) for p, m in self.entries.items()}
 
 
+class _DenyAllACL(ACL):
+    """The shared default-deny ACL returned for unmapped paths.
+
+    Read-only: it is handed to every caller that looks up an unknown path,
+    so granting through it would grant on all of them.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.entries = MappingProxyType({})
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get("_frozen"):
+            raise AttributeError("the default-deny ACL is read-only; use set_acl()")
+        super().__setattr__(name, value)
+
+
+_DENY_ALL = _DenyAllACL()
+
+
 # -----------------------------------------------------------------------
 # Permission table
 # -----------------------------------------------------------------------
@@ -157,11 +179,16 @@ class PermissionTable:
     """Maps filesystem paths to ACL entries.
 
     Supports prefix matching: an ACL on ``/dev`` applies to
-    ``/dev/motor`` unless a more-specific ACL exists.
+    ``/dev/motor`` unless a more-specific ACL exists.  Resolved
+    prefix lookups are memoised per path and invalidated whenever an
+    ACL is set, so repeated checks on hot paths are a single dict probe.
     """
 
+    _RESOLVED_MAX = 4096
+
     def __init__(self):
         self._acls: dict[str, ACL] = {}
+        self._resolved: dict[str, ACL] = {}
         self._caps: dict[str, Cap] = {}
         self._install_defaults()
 
@@ -261,9 +288,19 @@ class PermissionTable:
     def set_acl(self, path: str, acl: ACL):
         """Set the ACL for a specific path."""
         self._acls[path] = acl
+        self._resolved.clear()
 
     def get_acl(self, path: str) -> ACL:
         """Get the most-specific ACL for *path* using prefix matching."""
+        acl = self._resolved.get(path)
+        if acl is None:
+            acl = self._resolve_acl(path)
+            if len(self._resolved) >= self._RESOLVED_MAX:
+                self._resolved.clear()
+            self._resolved[path] = acl
+        return acl
+
+    def _resolve_acl(self, path: str) -> ACL:
         # Exact match first
         if path in self._acls:
             return self._acls[path]
@@ -274,7 +311,7 @@ class PermissionTable:
             if prefix in self._acls:
                 return self._acls[prefix]
         # Default deny
-        return ACL()
+        return _DENY_ALL
 
     def grant_cap(self, principal: str, cap: Cap):
         """Grant additional capabilities to a principal."""
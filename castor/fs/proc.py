@@ -186,6 +186,7 @@ class ProcFS:
                 "budget_ms": self.ns.read("/proc/loop/budget_ms"),
                 "motor_hz": self.ns.read("/proc/loop/motor_hz"),
             },
+            "fs": self.ns.stats(),
             "brain": {
                 "provider": self.ns.read("/proc/brain/provider"),
                 "model": self.ns.read("/proc/brain/model"),
@@ -124,6 +124,7 @@ class HailoVision:
         self._model_path = model_path
         self._input_name = None
         self._input_hw = (640, 640)
+        self._resize_buf: np.ndarray | None = None  # reused across frames
         self.confidence = confidence
         self.available = False
 
@@ -167,7 +168,12 @@ class HailoVision:
             )
 
             h, w = self._input_hw
-            resized = cv2.resize(frame, (w, h))
+            if frame.shape[:2] == (h, w):
+                resized = frame
+            else:
+                if self._resize_buf is None or self._resize_buf.shape != (h, w, frame.shape[2]):
+                    self._resize_buf = np.empty((h, w, frame.shape[2]), dtype=frame.dtype)
+                resized = cv2.resize(frame, (w, h), dst=self._resize_buf)
             input_data = {self._input_name: np.expand_dims(resized, axis=0)}
 
             hef = HEF(self._model_path)
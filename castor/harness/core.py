@@ -35,7 +35,7 @@ import uuid
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 
-from castor.tools import ToolRegistry, ToolResult
+from castor.tools import CONCURRENT_SIDE_EFFECTS, ToolRegistry, ToolResult
 
 if TYPE_CHECKING:
     from castor.providers.base import BaseProvider, Thought
@@ -375,6 +375,8 @@ class AgentHarness:
         self._context_budget: float = float(harness_cfg.get("context_budget", 0.8))
         self._auto_rag: bool = bool(harness_cfg.get("auto_rag", True))
         self._auto_telemetry: bool = bool(harness_cfg.get("auto_telemetry", True))
+        # Max pure/read-only tool calls from one model turn run at once (1 = serial)
+        self._tool_concurrency: int = max(1, int(harness_cfg.get("tool_concurrency", 4)))
 
         # Register extended agent tools
         try:
@@ -768,14 +770,28 @@ class AgentHarness:
                 # Final text response — done
                 return raw_response, tools_called, iteration + 1
 
-            # Execute each tool call
-            for call in tool_calls:
+            # Execute tool calls.  Runs of consecutive pure/read-only calls
+            # execute concurrently; everything else keeps strict call order.
+            idx = 0
+            while idx < len(tool_calls):
+                batch = self._concurrent_batch(tool_calls, idx)
+                if len(batch) > 1:
+                    results = await self._execute_batch(batch, root_span)
+                    for call, tr in zip(batch, results, strict=True):
+                        self._record_tool_result(call, tr, tools_called, messages, consent_granted)
+                        for hook in self.hooks:
+                            await hook.on_tool_call(call, tr)
+                    idx += len(batch)
+                    continue
+
+                call = tool_calls[idx]
+                idx += 1
                 name = call.get("name", "")
                 args = call.get("args", {})
 
                 # P66: ESTOP always executes
                 if name in ESTOP_TOOLS:
-                    tr = await asyncio.to_thread(self._execute_tool, name, args)
+                    tr = await self._execute_traced(name, args, root_span)
                     record = ToolCallRecord(
                         tool_name=name,
                         args=args,
@@ -812,30 +828,11 @@ class AgentHarness:
                         return consent_thought, tools_called, iteration + 1
 
                 # Execute non-blocked tool
-                tr = await asyncio.to_thread(self._execute_tool, name, args)
-                is_phys = name in PHYSICAL_TOOLS
-                record = ToolCallRecord(
-                    tool_name=name,
-                    args=args,
-                    result=tr.result,
-                    latency_ms=tr.duration_ms,
-                    p66_consent_required=is_phys,
-                    p66_consent_granted=is_phys and consent_granted,
-                    error=tr.error,
-                )
-                tools_called.append(record)
+                tr = await self._execute_traced(name, args, root_span)
+                self._record_tool_result(call, tr, tools_called, messages, consent_granted)
                 for hook in self.hooks:
                     await hook.on_tool_call(call, tr)
 
-                # Append tool result to messages for next iteration
-                messages.append(
-                    {
-                        "role": "tool",
-                        "name": name,
-                        "content": str(tr.result) if tr.ok else f"Error: {tr.error}",
-                    }
-                )
-
         # Hit iteration limit
         logger.warning("Harness: reached max_iterations=%d", self._max_iterations)
         limit_thought = _Thought(
@@ -844,6 +841,99 @@ class AgentHarness:
         )
         return limit_thought, tools_called, self._max_iterations
 
+    def _concurrent_batch(self, tool_calls: list[dict], start: int) -> list[dict]:
+        """Return the run of concurrency-safe calls beginning at *start*.
+
+        A call qualifies when its tool is annotated ``pure`` or
+        ``read_only`` and is not a P66 physical or ESTOP tool.  The run
+        stops at the first call that does not qualify, so reads never
+        move across a mutation or actuation.
+        """
+        if self._tool_concurrency <= 1:
+            return tool_calls[start : start + 1]
+        side_effect = getattr(self._tool_registry, "side_effect", None)
+        end = start
+        while end < len(tool_calls):
+            name = tool_calls[end].get("name", "")
+            if (
+                side_effect is None
+                or name in PHYSICAL_TOOLS
+                or name in ESTOP_TOOLS
+                or side_effect(name) not in CONCURRENT_SIDE_EFFECTS
+            ):
+                break
+            end += 1
+        return tool_calls[start : max(end, start + 1)]
+
+    async def _execute_traced(self, name: str, args: dict, root_span: Any = None) -> ToolResult:
+        """Run one tool in a worker thread, wrapped in a ``tool.<name>`` span."""
+        if self.span_tracer is None or root_span is None:
+            return await asyncio.to_thread(self._execute_tool, name, args)
+        span = self.span_tracer.start_span(name=f"tool.{name}", parent=root_span)
+        tr = await asyncio.to_thread(self._execute_tool, name, args)
+        self.span_tracer.end_span(span, status="ok" if tr.ok else "error", error=tr.error)
+        return tr
+
+    async def _execute_batch(self, batch: list[dict], root_span: Any = None) -> list[ToolResult]:
+        """Run concurrency-safe calls together, bounded by ``tool_concurrency``.
+
+        Spans are opened in call order before dispatch and results are
+        returned in call order, so traces and trajectories stay
+        deterministic regardless of completion order.
+        """
+        sem = asyncio.Semaphore(self._tool_concurrency)
+        spans: list[Any] = []
+        if self.span_tracer is not None and root_span is not None:
+            spans = [
+                self.span_tracer.start_span(
+                    name=f"tool.{call.get('name', '')}",
+                    parent=root_span,
+                    attributes={"concurrent": True, "batch_size": len(batch)},
+                )
+                for call in batch
+            ]
+
+        async def _one(call: dict) -> ToolResult:
+            async with sem:
+                return await asyncio.to_thread(
+                    self._execute_tool, call.get("name", ""), call.get("args", {})
+                )
+
+        results = await asyncio.gather(*(_one(call) for call in batch))
+        for span, tr in zip(spans, results, strict=False):
+            self.span_tracer.end_span(span, status="ok" if tr.ok else "error", error=tr.error)
+        return list(results)
+
+    @staticmethod
+    def _record_tool_result(
+        call: dict,
+        tr: ToolResult,
+        tools_called: list[ToolCallRecord],
+        messages: list[dict],
+        consent_granted: bool,
+    ) -> None:
+        """Append the call record and the tool message for the next iteration."""
+        name = call.get("name", "")
+        is_phys = name in PHYSICAL_TOOLS
+        tools_called.append(
+            ToolCallRecord(
+                tool_name=name,
+                args=call.get("args", {}),
+                result=tr.result,
+                latency_ms=tr.duration_ms,
+                p66_consent_required=is_phys,
+                p66_consent_granted=is_phys and consent_granted,
+                error=tr.error,
+            )
+        )
+        messages.append(
+            {
+                "role": "tool",
+                "name": name,
+                "content": str(tr.result) if tr.ok else f"Error: {tr.error}",
+            }
+        )
+
     async def _run_estop(self, ctx: HarnessContext, run_id: str, t0: float) -> HarnessResult:
         """P66 ESTOP path — bypass all harness steps, call provider directly."""
         logger.warning("P66 ESTOP bypass activated: %r", ctx.instruction[:60])
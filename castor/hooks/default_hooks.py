@@ -4,14 +4,23 @@ Default hook definitions for OpenCastor hardware safety gating.
 Installs two shell scripts into ~/.opencastor/hooks/ on first use:
   - safety_check.sh  — denies motion commands when /tmp/robot-estop flag exists
   - audit_log.sh     — appends a JSON audit line for every tool call
+
+While an installed script still matches the shipped content, the equivalent
+in-process Python hook (:func:`safety_check` / :func:`audit_log`) is used
+instead so the default hooks cost a function call, not a shell.  Editing a
+script switches that hook back to running the script.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
-from castor.hooks.runner import HookDefinition, HookEvent
+from castor.hooks.runner import HookDefinition, HookEvent, HookResult
 
 logger = logging.getLogger("OpenCastor.DefaultHooks")
 
@@ -58,22 +67,52 @@ def _ensure_script(name: str, content: str) -> str:
     return str(path)
 
 
+def _is_stock(path: str, content: str) -> bool:
+    try:
+        return Path(path).read_text() == content
+    except OSError:
+        return False
+
+
+def safety_check(payload: dict[str, Any]) -> HookResult:
+    """In-process equivalent of ``safety_check.sh``."""
+    if os.path.exists("/tmp/robot-estop"):
+        return HookResult(
+            allowed=False,
+            message="E-stop active: /tmp/robot-estop flag is set. Motion denied.",
+        )
+    return HookResult(allowed=True)
+
+
+def audit_log(payload: dict[str, Any]) -> None:
+    """In-process equivalent of ``audit_log.sh``."""
+    path = Path(os.environ.get("HOME", str(Path.home()))) / ".opencastor" / "audit.log"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    line = json.dumps({"ts": ts, "event": payload}, default=str)
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(line + "\n")
+
+
 def get_default_hooks() -> list[HookDefinition]:
     """Return the default set of hook definitions, installing scripts as needed."""
     safety_script = _ensure_script("safety_check.sh", _SAFETY_CHECK_SCRIPT)
     audit_script = _ensure_script("audit_log.sh", _AUDIT_LOG_SCRIPT)
 
-    return [
-        HookDefinition(
-            tools=_MOTION_TOOLS,
-            script=safety_script,
-            event=HookEvent.PRE_TOOL_USE,
-            timeout_s=5.0,
-        ),
-        HookDefinition(
-            tools=["*"],
-            script=audit_script,
-            event=HookEvent.POST_TOOL_USE,
-            timeout_s=5.0,
-        ),
-    ]
+    safety = HookDefinition(
+        tools=_MOTION_TOOLS,
+        script=safety_script,
+        event=HookEvent.PRE_TOOL_USE,
+        timeout_s=5.0,
+    )
+    if _is_stock(safety_script, _SAFETY_CHECK_SCRIPT):
+        safety.fn = safety_check
+    audit = HookDefinition(
+        tools=["*"],
+        script=audit_script,
+        event=HookEvent.POST_TOOL_USE,
+        timeout_s=5.0,
+    )
+    if _is_stock(audit_script, _AUDIT_LOG_SCRIPT):
+        audit.fn = audit_log
+    return [safety, audit]
@@ -1,22 +1,72 @@
 """
 PreToolUse / PostToolUse hook runner for hardware safety gating.
 
-Hooks are small shell scripts invoked before or after a named tool call.
-A pre-tool hook can deny the call (exit 1) or allow it (exit 0).
-Post-tool hooks are fire-and-forget.
+Hooks run before or after a named tool call.  A pre-tool hook can deny the
+call (exit 1 / return False) or allow it (exit 0 / return None).  Post-tool
+hooks are advisory; their outcome is logged, never raised.
+
+Two kinds of hook are supported:
+
+* Shell hooks (``script``) — bash scripts that receive the call as JSON on
+  stdin.  They are started by a small pool of long-lived bash workers that
+  accept newline-delimited JSON requests, so a hook call skips Python's
+  subprocess setup (pipes, reader threads) and only costs the worker's
+  ``bash "$script"``.  Each script still runs as its own process, exactly
+  as it would standalone: its own ``$0``, ``exit`` and ``set -e``, and none
+  of the worker's variables.  Scripts whose path cannot be passed through
+  the worker protocol fall back to a one-shot ``bash`` subprocess.
+* Python hooks (``python`` / ``fn``) — called in-process with the same JSON
+  payload as a dict.  ``python`` is either ``"package.module:function"`` or
+  the name of an ``opencastor.hooks`` entry point.  A call that times out
+  keeps its thread (Python threads cannot be killed), so the pool it ran on
+  is retired and later hooks get a fresh one.
+
+Every hook has its own timeout; a hook that times out or fails to run is
+logged and treated as allowing the call (fail-open).  Matching post-tool
+hooks are independent of each other and run concurrently.
 """
 
 from __future__ import annotations
 
+import importlib
 import json
 import logging
+import os
+import queue
+import signal
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures import wait as wait_futures
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Optional
 
 logger = logging.getLogger("OpenCastor.HookRunner")
 
+_EP_GROUP_HOOKS = "opencastor.hooks"
+
+# Worker loop: one JSON request per line in, one JSON reply per line out.
+# Request:  {"id":N,"script":"/path","payload":{...}}   (keys in this order)
+# Reply:    {"id":N,"rc":0,"stderr":"..."}
+_WORKER_SCRIPT = r"""
+errf=$(mktemp)
+trap 'rm -f "$errf"' EXIT
+while IFS= read -r line; do
+  id=${line#'{"id":'}; id=${id%%,*}
+  script=${line#*'"script":"'}; script=${script%%'","payload":'*}
+  payload=${line#*'"payload":'}; payload=${payload%'}'}
+  bash "$script" <<<"$payload" >/dev/null 2>"$errf"
+  rc=$?
+  err=$(<"$errf")
+  err=${err//\\/\\\\}; err=${err//\"/\\\"}
+  err=${err//$'\n'/\\n}; err=${err//$'\r'/\\r}; err=${err//$'\t'/\\t}
+  printf '{"id":%s,"rc":%d,"stderr":"%s"}\n' "$id" "$rc" "$err"
+done
+"""
+
 
 class HookEvent(Enum):
     PRE_TOOL_USE = "pre_tool_use"
@@ -26,9 +76,17 @@ class HookEvent(Enum):
 @dataclass
 class HookDefinition:
     tools: list[str]
-    script: str
+    script: str = ""
     event: HookEvent = HookEvent.PRE_TOOL_USE
     timeout_s: float = 5.0
+    python: str = ""
+    fn: Optional[Callable[[dict[str, Any]], Any]] = None
+
+    @property
+    def label(self) -> str:
+        if self.fn is not None:
+            return getattr(self.fn, "__qualname__", repr(self.fn))
+        return self.python or self.script
 
 
 @dataclass
@@ -37,23 +95,213 @@ class HookResult:
     message: str = ""
 
 
+class _ShellWorker:
+    """One long-lived bash process running hook scripts on request."""
+
+    def __init__(self) -> None:
+        self._proc: Optional[subprocess.Popen] = None
+        self._replies: queue.Queue = queue.Queue()
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._proc.pid if self._proc is not None else None
+
+    def _ensure(self) -> subprocess.Popen:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        proc = subprocess.Popen(
+            ["bash", "-c", _WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            start_new_session=True,
+        )
+        # Fresh queue per process so replies from a killed worker never leak
+        self._replies = queue.Queue()
+        threading.Thread(
+            target=self._read,
+            args=(proc, self._replies),
+            daemon=True,
+            name="hook-worker-reader",
+        ).start()
+        self._proc = proc
+        return proc
+
+    @staticmethod
+    def _read(proc: subprocess.Popen, replies: queue.Queue) -> None:
+        try:
+            for line in proc.stdout:
+                replies.put(line)
+        except Exception:
+            pass
+        replies.put(None)
+
+    def run(self, script: str, payload: dict[str, Any], timeout_s: float) -> tuple[int, str]:
+        with self._lock:
+            proc = self._ensure()
+            self._seq += 1
+            seq = self._seq
+            body = json.dumps(payload, default=str)
+            request = f'{{"id":{seq},"script":{json.dumps(script)},"payload":{body}}}\n'
+            proc.stdin.write(request)
+            proc.stdin.flush()
+            deadline = time.monotonic() + timeout_s
+            while True:
+                try:
+                    line = self._replies.get(timeout=max(deadline - time.monotonic(), 0.0))
+                except queue.Empty:
+                    # The script may be wedged; the only safe reset is a new worker
+                    self.close()
+                    raise subprocess.TimeoutExpired(script, timeout_s) from None
+                if line is None:
+                    self._proc = None
+                    raise RuntimeError("hook worker exited")
+                reply = json.loads(line, strict=False)
+                if reply.get("id") == seq:
+                    return int(reply["rc"]), str(reply.get("stderr", "")).strip()
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None or proc.poll() is not None:
+            return
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except Exception:
+            proc.kill()
+        proc.wait(timeout=2)
+
+
+class _ShellPool:
+    """Fixed-size pool of :class:`_ShellWorker` processes, started on demand."""
+
+    def __init__(self, size: int) -> None:
+        self._workers = [_ShellWorker() for _ in range(max(1, size))]
+        self._idle: queue.Queue[_ShellWorker] = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def run(self, script: str, payload: dict[str, Any], timeout_s: float) -> tuple[int, str]:
+        worker = self._idle.get()
+        try:
+            return worker.run(script, payload, timeout_s)
+        finally:
+            self._idle.put(worker)
+
+    def pids(self) -> list[int]:
+        return [w.pid for w in self._workers if w.pid is not None]
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.close()
+
+
+def _worker_safe(script: str) -> bool:
+    """True if *script* survives the worker protocol without JSON escaping."""
+    return bool(script) and json.dumps(script) == f'"{script}"'
+
+
 class HookRunner:
-    """Runs registered hook scripts around tool invocations."""
+    """Runs registered hooks around tool invocations.
+
+    Args:
+        hooks:          Hook definitions, evaluated in order.
+        shell_workers:  Number of persistent bash workers for shell hooks.
+        persistent:     Run shell hooks through the worker pool (default).
+                        ``False`` spawns one ``bash`` process per invocation.
+    """
 
-    def __init__(self, hooks: list[HookDefinition]) -> None:
+    def __init__(
+        self,
+        hooks: list[HookDefinition],
+        shell_workers: int = 2,
+        persistent: bool = True,
+    ) -> None:
         self._hooks = hooks
+        self._persistent = persistent
+        self._shell = _ShellPool(shell_workers) if persistent else None
+        self._resolved: dict[str, Optional[Callable]] = {}
+        self._resolve_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._fanout: Optional[ThreadPoolExecutor] = None
 
     def _matching_hooks(self, tool_name: str, event: HookEvent) -> list[HookDefinition]:
         return [
             h for h in self._hooks if h.event == event and (tool_name in h.tools or "*" in h.tools)
         ]
 
+    # ── Python hooks ──────────────────────────────────────────────────
+
+    def _resolve(self, hook: HookDefinition) -> Optional[Callable]:
+        if hook.fn is not None:
+            return hook.fn
+        with self._resolve_lock:
+            if hook.python in self._resolved:
+                return self._resolved[hook.python]
+            fn: Optional[Callable] = None
+            try:
+                if ":" in hook.python:
+                    module, _, attr = hook.python.partition(":")
+                    fn = getattr(importlib.import_module(module), attr)
+                else:
+                    from importlib.metadata import entry_points
+
+                    for ep in entry_points(group=_EP_GROUP_HOOKS):
+                        if ep.name == hook.python:
+                            fn = ep.load()
+                            break
+                    if fn is None:
+                        logger.warning(
+                            "Hook entry point %s/%s not found", _EP_GROUP_HOOKS, hook.python
+                        )
+            except Exception as exc:
+                logger.warning("Failed to load Python hook %s: %s", hook.python, exc)
+            self._resolved[hook.python] = fn
+            return fn
+
+    def _run_python(self, hook: HookDefinition, payload: dict[str, Any]) -> tuple[int, str]:
+        """Call a Python hook with a timeout. Returns (returncode, message)."""
+        fn = self._resolve(hook)
+        if fn is None:
+            return 0, ""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hook")
+            executor = self._executor
+        try:
+            outcome = executor.submit(fn, payload).result(timeout=hook.timeout_s)
+        except FutureTimeout:
+            logger.warning("Hook %s timed out after %ss — failing open", hook.label, hook.timeout_s)
+            # The wedged call keeps its thread; retire the pool so it cannot
+            # fill up with them.  Calls already running there finish normally.
+            with self._executor_lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False)
+            return 0, ""
+        except Exception as exc:
+            logger.warning("Hook %s raised: %s — failing open", hook.label, exc)
+            return 0, ""
+        if isinstance(outcome, HookResult):
+            return (0 if outcome.allowed else 1), outcome.message
+        if outcome is False:
+            return 1, ""
+        return 0, ""
+
+    # ── Shell hooks ───────────────────────────────────────────────────
+
     def _run_script(self, hook: HookDefinition, stdin_data: dict[str, Any]) -> tuple[int, str]:
         """Run hook script with JSON on stdin. Returns (returncode, stderr)."""
         try:
+            if self._shell is not None and _worker_safe(hook.script):
+                return self._shell.run(hook.script, stdin_data, hook.timeout_s)
             result = subprocess.run(
                 ["bash", hook.script],
-                input=json.dumps(stdin_data),
+                input=json.dumps(stdin_data, default=str),
                 capture_output=True,
                 text=True,
                 timeout=hook.timeout_s,
@@ -70,30 +318,51 @@ class HookRunner:
             logger.warning("Hook script %s failed to run: %s — failing open", hook.script, exc)
             return 0, ""
 
+    def _invoke(self, hook: HookDefinition, payload: dict[str, Any]) -> tuple[int, str]:
+        if hook.fn is not None or hook.python:
+            return self._run_python(hook, payload)
+        return self._run_script(hook, payload)
+
+    # ── Public API ────────────────────────────────────────────────────
+
     def run_pre_tool(self, tool_name: str, tool_args: dict[str, Any]) -> HookResult:
-        """Run all matching PRE_TOOL_USE hooks. First denial wins."""
+        """Run all matching PRE_TOOL_USE hooks in order. First denial wins."""
         hooks = self._matching_hooks(tool_name, HookEvent.PRE_TOOL_USE)
         stdin_data = {"tool": tool_name, "args": tool_args}
         for hook in hooks:
-            returncode, stderr = self._run_script(hook, stdin_data)
+            returncode, stderr = self._invoke(hook, stdin_data)
             if returncode != 0:
-                msg = stderr or f"Hook '{hook.script}' denied tool '{tool_name}'"
+                msg = stderr or f"Hook '{hook.label}' denied tool '{tool_name}'"
                 logger.info("Pre-tool hook denied %s: %s", tool_name, msg)
                 return HookResult(allowed=False, message=msg)
         return HookResult(allowed=True)
 
     def run_post_tool(self, tool_name: str, result: Any) -> None:
-        """Fire-and-forget POST_TOOL_USE hooks (errors logged, not raised)."""
+        """Run POST_TOOL_USE hooks concurrently (errors logged, not raised)."""
         hooks = self._matching_hooks(tool_name, HookEvent.POST_TOOL_USE)
+        if not hooks:
+            return
         stdin_data = {"tool": tool_name, "result": result}
-        for hook in hooks:
-            try:
-                subprocess.Popen(
-                    ["bash", hook.script],
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    text=True,
-                ).communicate(input=json.dumps(stdin_data), timeout=hook.timeout_s)
-            except Exception as exc:
-                logger.debug("Post-tool hook %s error (ignored): %s", hook.script, exc)
+        if len(hooks) == 1:
+            self._post_one(hooks[0], stdin_data)
+            return
+        if self._fanout is None:
+            self._fanout = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hook-post")
+        wait_futures([self._fanout.submit(self._post_one, h, stdin_data) for h in hooks])
+
+    def _post_one(self, hook: HookDefinition, stdin_data: dict[str, Any]) -> None:
+        try:
+            returncode, stderr = self._invoke(hook, stdin_data)
+            if returncode != 0:
+                logger.debug("Post-tool hook %s exited %d: %s", hook.label, returncode, stderr)
+        except Exception as exc:
+            logger.debug("Post-tool hook %s error (ignored): %s", hook.label, exc)
+
+    def close(self) -> None:
+        """Stop shell workers and hook threads."""
+        if self._shell is not None:
+            self._shell.close()
+        for pool in (self._executor, self._fanout):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._executor = self._fanout = None
@@ -0,0 +1,192 @@
+"""
+castor/import_profile.py — Import-time profile of CLI subcommands.
+
+Runs ``python -X importtime -m castor.cli <command>`` in a fresh interpreter
+and summarises what the command imported and how long that took::
+
+    from castor.import_profile import profile_command
+
+    prof = profile_command(["status"])
+    prof.import_ms        # total self time of every import
+    prof.heavy            # heavy dependencies the command pulled in
+    prof.top(5)           # slowest modules by self time
+
+``castor bench imports [COMMAND ...]`` prints the same for several commands,
+or writes JSON (``--json`` / ``--output``) to compare across commits.
+
+The command really runs, so only profile commands that are safe to execute
+offline (the defaults in :data:`LIGHTWEIGHT_COMMANDS` are).
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional, Sequence
+
+__all__ = [
+    "HEAVY_MODULES",
+    "LIGHTWEIGHT_COMMANDS",
+    "CommandProfile",
+    "ImportRecord",
+    "parse_importtime",
+    "profile_command",
+    "print_profiles",
+]
+
+#: Modules a lightweight command should never need.  Matching is by
+#: top-level name or dotted prefix.
+HEAVY_MODULES = (
+    "numpy",
+    "cv2",
+    "torch",
+    "transformers",
+    "onnxruntime",
+    "fastapi",
+    "starlette",
+    "uvicorn",
+    "anthropic",
+    "openai",
+    "google.genai",
+    "google.generativeai",
+    "httpx",
+    "castor.api",
+    "castor.main",
+    "castor.providers.base",
+)
+
+#: Commands operators run interactively over SSH; they must start fast.
+LIGHTWEIGHT_COMMANDS: tuple[tuple[str, ...], ...] = (
+    ("status",),
+    ("logs", "--lines", "1"),
+)
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class CommandProfile:
+    """Import profile of one CLI invocation."""
+
+    command: str
+    returncode: int
+    wall_ms: float
+    records: list[ImportRecord] = field(default_factory=list)
+
+    @property
+    def import_ms(self) -> float:
+        return sum(r.self_us for r in self.records) / 1000.0
+
+    @property
+    def modules(self) -> int:
+        return len(self.records)
+
+    @property
+    def heavy(self) -> list[str]:
+        """Entries of :data:`HEAVY_MODULES` that the command imported."""
+        names = {r.module for r in self.records}
+        return [h for h in HEAVY_MODULES if any(n == h or n.startswith(h + ".") for n in names)]
+
+    def top(self, n: int = 10) -> list[ImportRecord]:
+        return sorted(self.records, key=lambda r: r.self_us, reverse=True)[:n]
+
+    def by_package(self) -> dict[str, float]:
+        """Self time in ms grouped by top-level package, slowest first."""
+        totals: dict[str, int] = {}
+        for r in self.records:
+            pkg = r.module.split(".", 1)[0]
+            totals[pkg] = totals.get(pkg, 0) + r.self_us
+        return {
+            k: round(v / 1000.0, 2)
+            for k, v in sorted(totals.items(), key=lambda kv: kv[1], reverse=True)
+        }
+
+    def to_dict(self, top: int = 10) -> dict:
+        return {
+            "command": self.command,
+            "returncode": self.returncode,
+            "wall_ms": round(self.wall_ms, 2),
+            "import_ms": round(self.import_ms, 2),
+            "modules": self.modules,
+            "heavy": self.heavy,
+            "packages": self.by_package(),
+            "top": [asdict(r) for r in self.top(top)],
+        }
+
+
+def parse_importtime(text: str) -> list[ImportRecord]:
+    """Parse ``-X importtime`` stderr; other lines are ignored."""
+    records = []
+    for line in text.splitlines():
+        m = _LINE_RE.match(line)
+        if m:
+            self_us, cum_us, indent, module = m.groups()
+            records.append(ImportRecord(module, int(self_us), int(cum_us), (len(indent) - 1) // 2))
+    return records
+
+
+def profile_command(
+    argv: Sequence[str],
+    *,
+    runs: int = 1,
+    python: Optional[str] = None,
+    env: Optional[dict] = None,
+    timeout: float = 60.0,
+) -> CommandProfile:
+    """Run ``castor <argv>`` under ``-X importtime`` and return its profile.
+
+    With *runs* > 1 the fastest run is kept, which filters out disk-cache
+    and scheduler noise.
+    """
+    cmd = [python or sys.executable, "-X", "importtime", "-m", "castor.cli", *argv]
+    run_env = dict(os.environ if env is None else env)
+    run_env.setdefault("LOG_LEVEL", "WARNING")
+    best: Optional[CommandProfile] = None
+    for _ in range(max(1, runs)):
+        t0 = time.perf_counter()
+        proc = subprocess.run(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=run_env,
+            timeout=timeout,
+        )
+        prof = CommandProfile(
+            command=" ".join(argv),
+            returncode=proc.returncode,
+            wall_ms=(time.perf_counter() - t0) * 1000.0,
+            records=parse_importtime(proc.stderr),
+        )
+        if best is None or prof.import_ms < best.import_ms:
+            best = prof
+    return best
+
+
+def print_profiles(profiles: Sequence[CommandProfile], top: int = 5) -> None:
+    """Print a per-command summary table followed by each command's slowest imports."""
+    print(f"\n  {'command':<28}{'wall ms':>9}{'import ms':>11}{'modules':>9}  heavy")
+    print("  " + "─" * 70)
+    for p in profiles:
+        heavy = ", ".join(p.heavy) or "—"
+        print(f"  {p.command:<28}{p.wall_ms:>9.1f}{p.import_ms:>11.1f}{p.modules:>9}  {heavy}")
+    for p in profiles:
+        print(f"\n  castor {p.command} — slowest imports (self ms)")
+        for r in p.top(top):
+            print(f"    {r.self_us / 1000.0:>7.1f}  {r.module}")
+    print()
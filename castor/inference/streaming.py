@@ -4,6 +4,13 @@ castor.inference.streaming — continuous vision inference loop.
 Captures frames at a configurable FPS, runs each through the provider's
 think() function, gates on confidence, and executes actions that pass.
 
+Capture and inference are pipelined: a capture task keeps a single-slot
+mailbox filled with the freshest frame while the current frame is being
+thought about, so inference always starts on the newest frame and
+intermediate frames are dropped deliberately (and counted).  With
+``adaptive=True`` the capture rate follows the measured inference
+latency instead of running at the configured maximum.
+
 Usage::
 
     from castor.inference.streaming import StreamingInferenceLoop
@@ -40,9 +47,14 @@ from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
-_MAX_FPS = 10.0
+_MAX_FPS = 30.0
 _DEFAULT_FPS = 2.0
 _DEFAULT_MIN_CONFIDENCE = 0.75
+# Adaptive mode captures this many frames per inference so a fresh frame is
+# always waiting when the previous inference finishes.
+_CAPTURE_HEADROOM = 1.5
+# Smoothing factor for the inference-latency EWMA.
+_LATENCY_ALPHA = 0.3
 
 # Optional integrations — graceful no-ops if not installed
 try:
@@ -83,12 +95,32 @@ ExecuteFn = Callable[[dict[str, Any]], Awaitable[None]]
 @dataclass
 class StreamingStats:
     frames_captured: int = 0
+    frames_dropped: int = 0
     frames_gated_pass: int = 0
     frames_gated_block: int = 0
     actions_executed: int = 0
     errors: int = 0
+    inference_ms: float = 0.0  # EWMA of think() latency
+    target_fps: float = 0.0
+    frame_age_ms_last: float = 0.0
+    frame_age_ms_max: float = 0.0
+    frame_age_ms_total: float = 0.0
+    frame_age_samples: int = 0
     started_at: float = field(default_factory=time.monotonic)
 
+    @property
+    def frame_age_ms_mean(self) -> float:
+        """Mean capture-to-actuation age of executed frames."""
+        if not self.frame_age_samples:
+            return 0.0
+        return self.frame_age_ms_total / self.frame_age_samples
+
+    def record_frame_age(self, age_ms: float) -> None:
+        self.frame_age_ms_last = age_ms
+        self.frame_age_ms_max = max(self.frame_age_ms_max, age_ms)
+        self.frame_age_ms_total += age_ms
+        self.frame_age_samples += 1
+
     @property
     def elapsed_s(self) -> float:
         return time.monotonic() - self.started_at
@@ -102,10 +134,12 @@ class StreamingStats:
     def summary(self) -> str:
         return (
             f"frames={self.frames_captured} "
+            f"dropped={self.frames_dropped} "
             f"passed={self.frames_gated_pass} "
             f"blocked={self.frames_gated_block} "
             f"actions={self.actions_executed} "
             f"fps={self.actual_fps:.1f} "
+            f"frame_age_ms={self.frame_age_ms_mean:.0f}/{self.frame_age_ms_max:.0f} "
             f"elapsed={self.elapsed_s:.1f}s"
         )
 
@@ -122,9 +156,11 @@ class StreamingInferenceLoop:
         think_fn:        Async callable accepting a frame, returning a result dict
                          with at least ``{"confidence": float, "cmd": str, ...}``
         execute_fn:      Async callable accepting a result dict; triggers the action
-        fps:             Target frames per second (capped at 10)
+        fps:             Maximum capture frames per second (capped at 30)
         min_confidence:  Minimum confidence to pass the gate and execute an action
         dry_run:         If True, gate and log but never call execute_fn
+        adaptive:        If True, lower the capture rate to track measured
+                         inference latency (never above ``fps``)
     """
 
     def __init__(
@@ -135,6 +171,7 @@ class StreamingInferenceLoop:
         fps: float = _DEFAULT_FPS,
         min_confidence: float = _DEFAULT_MIN_CONFIDENCE,
         dry_run: bool = False,
+        adaptive: bool = True,
     ) -> None:
         self._get_frame = get_frame_fn
         self._think = think_fn
@@ -142,8 +179,13 @@ class StreamingInferenceLoop:
         self.fps = min(fps, _MAX_FPS)
         self.min_confidence = min_confidence
         self.dry_run = dry_run
-        self.stats = StreamingStats()
+        self.adaptive = adaptive
+        self.target_fps = self.fps
+        self.stats = StreamingStats(target_fps=self.fps)
         self._task: Optional[asyncio.Task] = None  # type: ignore[type-arg]
+        # Single-slot mailbox holding the freshest (frame, captured_at) pair
+        self._latest: Optional[tuple[Any, float]] = None
+        self._frame_ready: Optional[asyncio.Event] = None
 
     @classmethod
     def from_config(
@@ -155,13 +197,15 @@ class StreamingInferenceLoop:
     ) -> StreamingInferenceLoop:
         """Build a loop from a RCAN YAML config dict.
 
-        Reads ``agent.streaming.fps`` and ``agent.streaming.min_confidence``.
+        Reads ``agent.streaming.fps``, ``agent.streaming.min_confidence``,
+        ``agent.streaming.dry_run`` and ``agent.streaming.adaptive``.
         Returns ``None`` if ``agent.streaming.enabled`` is falsy.
         """
         streaming_cfg = (config.get("agent") or {}).get("streaming") or {}
         fps = float(streaming_cfg.get("fps", _DEFAULT_FPS))
         min_conf = float(streaming_cfg.get("min_confidence", _DEFAULT_MIN_CONFIDENCE))
         dry_run = bool(streaming_cfg.get("dry_run", False))
+        adaptive = bool(streaming_cfg.get("adaptive", True))
         return cls(
             get_frame_fn=get_frame_fn,
             think_fn=think_fn,
@@ -169,6 +213,7 @@ class StreamingInferenceLoop:
             fps=fps,
             min_confidence=min_conf,
             dry_run=dry_run,
+            adaptive=adaptive,
         )
 
     # ── Properties ────────────────────────────────────────────────────────────
@@ -179,8 +224,8 @@ class StreamingInferenceLoop:
 
     @property
     def interval(self) -> float:
-        """Seconds between frames."""
-        return 1.0 / max(self.fps, 0.01)
+        """Seconds between frame captures at the current target rate."""
+        return 1.0 / max(self.target_fps, 0.01)
 
     # ── Lifecycle ─────────────────────────────────────────────────────────────
 
@@ -189,7 +234,8 @@ class StreamingInferenceLoop:
         if self.is_running:
             logger.debug("StreamingInferenceLoop already running")
             return
-        self.stats = StreamingStats()
+        self.target_fps = self.fps
+        self.stats = StreamingStats(target_fps=self.fps)
         self._task = asyncio.ensure_future(self._run())
         mode = "DRY-RUN" if self.dry_run else "LIVE"
         logger.info(
@@ -213,29 +259,80 @@ class StreamingInferenceLoop:
 
     async def _run(self) -> None:
         chain = get_commitment_chain() if HAS_CHAIN else None
+        self._latest = None
+        self._frame_ready = asyncio.Event()
+        capture_task = asyncio.ensure_future(self._capture_loop())
+        try:
+            while True:
+                await self._frame_ready.wait()
+                self._frame_ready.clear()
+                if self._latest is None:
+                    continue
+                frame, captured_at = self._latest
+                self._latest = None
+                try:
+                    await self._process(frame, captured_at, chain)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    self.stats.errors += 1
+                    logger.warning("StreamingInferenceLoop tick error: %s", exc)
+        finally:
+            capture_task.cancel()
+            try:
+                await capture_task
+            except asyncio.CancelledError:
+                pass
 
+    async def _capture_loop(self) -> None:
+        """Keep the mailbox filled with the freshest frame."""
         while True:
             t0 = time.monotonic()
             try:
-                await self._tick(chain)
+                frame = await self._get_frame()
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
                 self.stats.errors += 1
-                logger.warning("StreamingInferenceLoop tick error: %s", exc)
+                logger.warning("StreamingInferenceLoop capture error: %s", exc)
+            else:
+                self.stats.frames_captured += 1
+                record_streaming_frame()
+                if self._latest is not None:
+                    # Inference is still busy; the unconsumed frame is stale
+                    self.stats.frames_dropped += 1
+                self._latest = (frame, time.monotonic())
+                self._frame_ready.set()
 
             elapsed = time.monotonic() - t0
-            sleep_for = max(0.0, self.interval - elapsed)
-            await asyncio.sleep(sleep_for)
+            await asyncio.sleep(max(0.0, self.interval - elapsed))
+
+    def _observe_latency(self, seconds: float) -> None:
+        """Fold an inference latency sample into the EWMA and retarget."""
+        ms = seconds * 1000.0
+        if self.stats.inference_ms <= 0:
+            self.stats.inference_ms = ms
+        else:
+            self.stats.inference_ms += _LATENCY_ALPHA * (ms - self.stats.inference_ms)
+        if self.adaptive and self.stats.inference_ms > 0:
+            sustainable = _CAPTURE_HEADROOM * 1000.0 / self.stats.inference_ms
+            self.target_fps = min(self.fps, sustainable)
+        else:
+            self.target_fps = self.fps
+        self.stats.target_fps = self.target_fps
 
     async def _tick(self, chain: Any) -> None:
-        # 1. Capture
+        """Run one unpipelined capture → think → gate → execute step."""
         frame = await self._get_frame()
         self.stats.frames_captured += 1
         record_streaming_frame()
+        await self._process(frame, time.monotonic(), chain)
 
+    async def _process(self, frame: Any, captured_at: float, chain: Any) -> None:
         # 2. Infer
+        t_think = time.monotonic()
         result: dict[str, Any] = await self._think(frame)
+        self._observe_latency(time.monotonic() - t_think)
         confidence: float = float(result.get("confidence", 0.0))
         cmd = result.get("cmd", result.get("action", "unknown"))
 
@@ -258,6 +355,7 @@ class StreamingInferenceLoop:
         if not self.dry_run:
             await self._execute(result)
             self.stats.actions_executed += 1
+            self.stats.record_frame_age((time.monotonic() - captured_at) * 1000.0)
             record_streaming_action()
 
             if chain is not None:
@@ -274,10 +372,11 @@ class StreamingInferenceLoop:
                     pass
 
             logger.info(
-                "action executed: cmd=%s confidence=%.3f (frame %d)",
+                "action executed: cmd=%s confidence=%.3f (frame %d, age %.0fms)",
                 cmd,
                 confidence,
                 self.stats.frames_captured,
+                self.stats.frame_age_ms_last,
             )
         else:
             logger.info(
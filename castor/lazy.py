@@ -0,0 +1,67 @@
+"""
+castor/lazy.py — Deferred imports for heavy dependencies.
+
+Every ``castor`` invocation pays for the modules it imports before it can
+do anything.  On a low-end board a provider SDK, numpy or FastAPI costs
+tens to hundreds of milliseconds, and a command like ``castor status``
+never touches most of them.  Two helpers defer that cost until a name is
+actually used:
+
+:func:`lazy_attributes`
+    PEP 562 ``__getattr__``/``__dir__`` for a package whose public names
+    live in submodules (see ``castor/providers/__init__.py``).
+
+:func:`resolve`
+    Import the object named by a ``"package.module:attr"`` string, used
+    for CLI handlers registered by dotted path.
+
+``python -X importtime -m castor.cli <command>`` (or ``castor bench
+imports``) shows what a command imports.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable
+
+__all__ = ["lazy_attributes", "resolve"]
+
+
+def lazy_attributes(
+    package: str, attrs: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for *package*.
+
+    *attrs* maps each public name to the submodule defining it (relative,
+    e.g. ``".anthropic_provider"``, or absolute).  The first access imports
+    the submodule and stores the value in the package namespace, so later
+    lookups — and ``unittest.mock.patch`` on the package attribute — see an
+    ordinary global.
+    """
+
+    def __getattr__(name: str) -> Any:
+        target = attrs.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(target, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attrs))
+
+    return __getattr__, __dir__
+
+
+def resolve(spec: str) -> Any:
+    """Import and return the object named by ``"package.module:attr"``.
+
+    Without ``:attr`` the module itself is returned.  ``attr`` may be dotted
+    (``"pkg.mod:Class.method"``).
+    """
+    module_name, _, attr = spec.partition(":")
+    obj: Any = importlib.import_module(module_name)
+    for part in attr.split(".") if attr else ():
+        obj = getattr(obj, part)
+    return obj
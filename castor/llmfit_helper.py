@@ -288,7 +288,7 @@ def run_wizard_step(console: Any | None = None) -> dict[str, Any] | None:
 # ---------------------------------------------------------------------------
 
 
-def run_fit_command() -> None:
+def run_fit_command(args=None) -> None:
     """Entry point for `castor fit` — show hardware and model recommendations."""
     console = None
     if HAS_RICH:
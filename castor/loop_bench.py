@@ -0,0 +1,395 @@
+"""
+castor/loop_bench.py — End-to-end benchmark of the perception-action loop.
+
+The other benchmarks time one slice (provider round-trips in
+``castor/benchmarker.py``, the safety pipeline in
+``castor/safety_benchmark.py``).  This one runs the real control loop,
+``castor.main.main()``, for N ticks against:
+
+* the simulation driver (``protocol: simulation``, mock backend),
+* a synthetic camera (``camera.type: synthetic`` — pre-encoded frames),
+* the deterministic mock provider (``provider: mock``) with configurable
+  latency and seeded jitter.
+
+Every tick's stage timings come from :func:`castor.profiler.trace_ticks`
+(the same ``observe`` / ``safety.input`` / ``orient`` / ``safety.action`` /
+``act`` / ``telemetry`` laps the runtime profiler uses).  The result is
+a JSON-serialisable dict with:
+
+* ``tick_rate_hz`` and per-stage ``p50/p90/p99/max/mean`` in ms;
+* ``memory`` — RSS and allocated-block growth after warmup, both in total
+  and per 1000 ticks (least-squares slope over periodic samples), plus GC
+  collections per 1000 ticks;
+* ``allocations`` (``--tracemalloc``) — Python heap growth and the source
+  lines that grew most;
+* ``env`` — commit, Python, platform, CPU count, so runs are comparable.
+
+CLI::
+
+    castor bench loop --ticks 5000 --latency-ms 20 --output loop.json
+    castor bench loop --ticks 5000 --compare loop.json   # exit 1 on regression
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import os
+import platform
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Optional, Sequence
+
+import yaml
+
+logger = logging.getLogger("OpenCastor.LoopBench")
+
+__all__ = ["SCHEMA", "bench_config", "compare", "print_loop_bench", "run_loop_bench"]
+
+SCHEMA = "opencastor.bench.loop/1"
+
+_TICK = "tick"
+_PCTS = (50, 90, 99)
+# Differences below these are noise, whatever the relative change
+_MIN_STAGE_DELTA_MS = 0.05
+_MIN_MEMORY_DELTA_KB = 64.0
+
+
+def bench_config(
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    seed: int = 0,
+    resolution: Sequence[int] = (640, 480),
+) -> dict[str, Any]:
+    """RCAN config for the benchmark robot: simulation driver, synthetic
+    camera, mock provider, no sleep between ticks."""
+    return {
+        "rcan_version": "1.9.0",
+        "metadata": {"robot_name": "bench-bot"},
+        "agent": {
+            "provider": "mock",
+            "model": "mock",
+            "latency_ms": latency_ms,
+            "jitter_ms": jitter_ms,
+            "seed": seed,
+            "loop_sleep_s": 0,
+            "latency_budget_ms": 60_000,
+        },
+        "drivers": [{"protocol": "simulation", "backend": "mock"}],
+        "camera": {"type": "synthetic", "resolution": list(resolution)},
+        "rcan_protocol": {"port": 8000, "enable_mdns": False},
+    }
+
+
+# ── Measurement ───────────────────────────────────────────────────────────────
+
+
+def _rss_kb() -> Optional[float]:
+    """Current resident set size in KiB (Linux), or None."""
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024.0
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _gc_collections() -> list[int]:
+    return [g["collections"] for g in gc.get_stats()]
+
+
+def _percentiles(values_ms: list[float]) -> dict[str, float]:
+    if not values_ms:
+        return {}
+    ordered = sorted(values_ms)
+    n = len(ordered)
+    out = {f"p{p}": round(ordered[min(n - 1, max(0, -(-p * n // 100) - 1))], 4) for p in _PCTS}
+    out["max"] = round(ordered[-1], 4)
+    out["mean"] = round(sum(ordered) / n, 4)
+    return out
+
+
+def _slope_per_1k(samples: list[tuple[int, float]]) -> Optional[float]:
+    """Least-squares slope of ``(tick, value)`` samples, per 1000 ticks."""
+    if len(samples) < 2:
+        return None
+    n = len(samples)
+    mx = sum(t for t, _ in samples) / n
+    my = sum(v for _, v in samples) / n
+    var = sum((t - mx) ** 2 for t, _ in samples)
+    if var == 0:
+        return None
+    cov = sum((t - mx) * (v - my) for t, v in samples)
+    return round(cov / var * 1000.0, 3)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _env() -> dict[str, Any]:
+    import castor
+
+    return {
+        "commit": _git_commit(),
+        "castor_version": castor.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+# ── Runner ────────────────────────────────────────────────────────────────────
+
+
+def run_loop_bench(
+    ticks: int = 2000,
+    warmup: int = 100,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    seed: int = 0,
+    resolution: Sequence[int] = (640, 480),
+    trace_allocations: bool = False,
+    sample_every: int = 100,
+    log_level: int = logging.ERROR,
+) -> dict[str, Any]:
+    """Run the control loop for *warmup* + *ticks* ticks and return the results.
+
+    Runs in the calling (main) thread, because the runtime installs signal
+    handlers; they are restored afterwards.  The run happens in a temporary
+    working directory with its own episode database, so crash reports and
+    memory from the user's robot are neither read nor written.
+
+    Raises:
+        RuntimeError: the loop stopped before any measured tick.
+    """
+    from castor import main as runtime
+    from castor import profiler
+
+    ticks = max(1, int(ticks))
+    warmup = max(0, int(warmup))
+    sample_every = max(1, int(sample_every))
+    config = bench_config(latency_ms, jitter_ms, seed, resolution)
+
+    mem_samples: list[tuple[int, float, int]] = []  # (tick, rss_kb, blocks)
+    gc_marks: dict[str, list[int]] = {}
+    heap_marks: dict[str, Any] = {}
+
+    def _on_tick(n: int) -> None:
+        if n == warmup:
+            gc_marks["start"] = _gc_collections()
+            if trace_allocations:
+                import tracemalloc
+
+                heap_marks["start"] = tracemalloc.take_snapshot()
+        if n >= warmup and (n - warmup) % sample_every == 0:
+            mem_samples.append((n - warmup, _rss_kb() or 0.0, sys.getallocatedblocks()))
+
+    saved_argv = sys.argv
+    saved_handlers = {s: signal.getsignal(s) for s in (signal.SIGINT, signal.SIGTERM)}
+    saved_db = os.environ.get("CASTOR_MEMORY_DB")
+    saved_cwd = os.getcwd()
+    castor_logger = logging.getLogger("OpenCastor")
+    saved_level = castor_logger.level
+
+    with tempfile.TemporaryDirectory(prefix="castor-bench-") as tmp:
+        cfg_path = os.path.join(tmp, "bench.rcan.yaml")
+        with open(cfg_path, "w", encoding="utf-8") as fh:
+            yaml.safe_dump(config, fh)
+        os.environ["CASTOR_MEMORY_DB"] = os.path.join(tmp, "memory.db")
+        castor_logger.setLevel(log_level)
+        os.chdir(tmp)
+        if trace_allocations:
+            import tracemalloc
+
+            tracemalloc.start(1)
+        trace = profiler.trace_ticks(on_tick=_on_tick)
+        sys.argv = ["castor.main", "--config", cfg_path, "--max-ticks", str(warmup + ticks)]
+        t0 = time.perf_counter()
+        try:
+            runtime.main()
+        finally:
+            wall_s = time.perf_counter() - t0
+            profiler.stop_trace_ticks()
+            os.chdir(saved_cwd)
+            sys.argv = saved_argv
+            for sig, handler in saved_handlers.items():
+                signal.signal(sig, handler)
+            castor_logger.setLevel(saved_level)
+            if saved_db is None:
+                os.environ.pop("CASTOR_MEMORY_DB", None)
+            else:
+                os.environ["CASTOR_MEMORY_DB"] = saved_db
+            if trace_allocations:
+                import tracemalloc
+
+                heap_marks["end"] = tracemalloc.take_snapshot()
+                heap_marks["peak"] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+    end_rss, end_blocks = _rss_kb() or 0.0, sys.getallocatedblocks()
+    end_gc = _gc_collections()
+
+    measured = trace[warmup:]
+    if not measured:
+        raise RuntimeError(
+            f"Control loop stopped after {len(trace)} tick(s), before the {warmup} warmup "
+            "ticks finished; rerun with log_level=logging.INFO to see why"
+        )
+    stages: dict[str, list[float]] = {}
+    totals: list[float] = []
+    for tick in measured:
+        total_ns = 0
+        for name, ns in tick.items():
+            if name == "t0":
+                continue
+            stages.setdefault(name, []).append(ns / 1e6)
+            total_ns += ns
+        totals.append(total_ns / 1e6)
+    span_s = (measured[-1]["t0"] - measured[0]["t0"]) / 1e9 if len(measured) > 1 else 0.0
+
+    n = len(measured)
+    result: dict[str, Any] = {
+        "schema": SCHEMA,
+        "params": {
+            "ticks": ticks,
+            "warmup": warmup,
+            "latency_ms": latency_ms,
+            "jitter_ms": jitter_ms,
+            "seed": seed,
+            "resolution": list(resolution),
+            "trace_allocations": trace_allocations,
+        },
+        "env": _env(),
+        "ticks": n,
+        "wall_s": round(wall_s, 3),
+        "tick_rate_hz": round((n - 1) / span_s, 2) if span_s > 0 else None,
+        "stages": {_TICK: _percentiles(totals)},
+        "memory": {},
+    }
+    for name, values in stages.items():
+        result["stages"][name] = _percentiles(values)
+
+    if mem_samples:
+        mem_samples.append((n, end_rss, end_blocks))
+        first = mem_samples[0]
+        per_1k = 1000.0 / n if n else 0.0
+        gc_start = gc_marks.get("start", end_gc)
+        result["memory"] = {
+            "rss_start_kb": round(first[1], 1),
+            "rss_end_kb": round(end_rss, 1),
+            "rss_growth_kb": round(end_rss - first[1], 1),
+            "rss_growth_kb_per_1k_ticks": _slope_per_1k([(t, r) for t, r, _ in mem_samples]),
+            "blocks_growth": end_blocks - first[2],
+            "blocks_growth_per_1k_ticks": _slope_per_1k([(t, float(b)) for t, _, b in mem_samples]),
+            "gc_collections_per_1k_ticks": [
+                round((e - s) * per_1k, 2) for s, e in zip(gc_start, end_gc, strict=False)
+            ],
+        }
+    if "start" in heap_marks:
+        diff = heap_marks["end"].compare_to(heap_marks["start"], "lineno")
+        grown = sum(d.size_diff for d in diff)
+        result["allocations"] = {
+            "heap_growth_kb": round(grown / 1024.0, 1),
+            "heap_growth_kb_per_1k_ticks": round(grown / 1024.0 * 1000.0 / n, 2) if n else None,
+            "heap_peak_kb": round(heap_marks["peak"] / 1024.0, 1),
+            "top_growth": [
+                {
+                    "where": f"{d.traceback[0].filename}:{d.traceback[0].lineno}",
+                    "size_kb": round(d.size_diff / 1024.0, 2),
+                    "count": d.count_diff,
+                }
+                for d in diff[:10]
+                if d.size_diff > 0
+            ],
+        }
+    return result
+
+
+# ── Reporting ─────────────────────────────────────────────────────────────────
+
+
+def compare(result: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.10) -> list[str]:
+    """Return human-readable regressions of *result* against *baseline*.
+
+    A stage regresses when its p50 or p99 grows by more than *threshold*
+    (relative) and by more than a small absolute noise floor; tick rate
+    when it drops by more than *threshold*; memory when growth per 1000
+    ticks rises by more than *threshold* and 64 KiB.
+    """
+    out = []
+    for stage, cur in result.get("stages", {}).items():
+        base = baseline.get("stages", {}).get(stage)
+        if not base:
+            continue
+        for key in ("p50", "p99"):
+            c, b = cur.get(key), base.get(key)
+            if c is None or b is None:
+                continue
+            if c > b * (1 + threshold) and c - b > _MIN_STAGE_DELTA_MS:
+                # A zero baseline (stage too fast to time) has no relative change
+                delta = f"+{(c / b - 1) * 100:.0f}%" if b > 0 else f"+{c - b:.3f} ms"
+                out.append(f"{stage} {key}: {b:.3f} ms → {c:.3f} ms ({delta})")
+    c, b = result.get("tick_rate_hz"), baseline.get("tick_rate_hz")
+    if c and b and c < b * (1 - threshold):
+        out.append(f"tick rate: {b:.1f} Hz → {c:.1f} Hz ({(c / b - 1) * 100:.0f}%)")
+    c = result.get("memory", {}).get("rss_growth_kb_per_1k_ticks")
+    b = baseline.get("memory", {}).get("rss_growth_kb_per_1k_ticks")
+    if c is not None and b is not None and c > max(b, 0) * (1 + threshold) + _MIN_MEMORY_DELTA_KB:
+        out.append(f"RSS growth: {b:.0f} → {c:.0f} KiB per 1k ticks")
+    return out
+
+
+def print_loop_bench(result: dict[str, Any], regressions: Optional[list[str]] = None) -> None:
+    """Print a per-stage table, memory summary and any regressions."""
+    params = result["params"]
+    print(
+        f"\n  Loop benchmark — {result['ticks']} ticks after {params['warmup']} warmup, "
+        f"mock latency {params['latency_ms']}±{params['jitter_ms']} ms"
+    )
+    rate = result.get("tick_rate_hz")
+    print(f"  Tick rate: {rate:.1f} Hz" if rate else "  Tick rate: —")
+    print(f"\n  {'stage':<16}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}{'mean':>9}  (ms)")
+    print("  " + "─" * 70)
+    for name, st in result["stages"].items():
+        cells = "".join(f"{st.get(k, 0.0):>9.3f}" for k in ("p50", "p90", "p99", "max", "mean"))
+        print(f"  {name:<16}{cells}")
+    mem = result.get("memory") or {}
+    if mem:
+        print(
+            f"\n  RSS {mem['rss_start_kb'] / 1024:.1f} → {mem['rss_end_kb'] / 1024:.1f} MiB "
+            f"({mem['rss_growth_kb_per_1k_ticks']} KiB / 1k ticks), "
+            f"blocks {mem['blocks_growth']:+d} ({mem['blocks_growth_per_1k_ticks']} / 1k ticks)"
+        )
+        print(
+            f"  GC collections / 1k ticks (gen0, gen1, gen2): {mem['gc_collections_per_1k_ticks']}"
+        )
+    alloc = result.get("allocations")
+    if alloc:
+        print(
+            f"  Python heap +{alloc['heap_growth_kb']} KiB "
+            f"(peak {alloc['heap_peak_kb']} KiB); largest growth:"
+        )
+        for entry in alloc["top_growth"][:5]:
+            print(f"    {entry['size_kb']:>8.1f} KiB  {entry['where']}")
+    if regressions is not None:
+        if regressions:
+            print("\n  Regressions:")
+            for line in regressions:
+                print(f"    ✗ {line}")
+        else:
+            print("\n  No regressions against baseline.")
+    print()
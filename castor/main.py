@@ -8,6 +8,7 @@ import argparse
 import io
 import logging
 import os
+import sys
 import threading
 import time
 from pathlib import Path
@@ -18,6 +19,7 @@ import yaml
 from castor.fs import CastorFS
 from castor.providers import get_provider
 from castor.safety.bounds import BoundsChecker
+from castor.tiered_brain import BLANK_FRAME
 
 logging.basicConfig(
     level=logging.INFO,
@@ -263,6 +265,42 @@ def get_driver(config: dict):
 # ---------------------------------------------------------------------------
 # Camera abstraction (CSI via picamera2, USB via OpenCV, or blank)
 # ---------------------------------------------------------------------------
+class SyntheticFrames:
+    """Deterministic camera frames: a square sweeping across a gradient.
+
+    The frames are rendered and JPEG-encoded once, so :meth:`next` costs no
+    more than a real camera handing over an already-encoded frame.  Without
+    OpenCV every frame is :data:`BLANK_FRAME`.
+    """
+
+    def __init__(self, resolution=(640, 480), count: int = 30):
+        self._frames: list[tuple[bytes, object]] = []
+        self._index = 0
+        try:
+            import cv2
+            import numpy as np
+
+            w, h = int(resolution[0]), int(resolution[1])
+            base = np.zeros((h, w, 3), dtype=np.uint8)
+            base[:, :, 0] = np.linspace(0, 255, w, dtype=np.uint8)[None, :]
+            base[:, :, 1] = np.linspace(0, 255, h, dtype=np.uint8)[:, None]
+            side = max(8, min(w, h) // 6)
+            for i in range(max(1, count)):
+                frame = base.copy()
+                x = (i * (w - side)) // max(1, count - 1)
+                frame[h // 2 - side // 2 : h // 2 + side // 2, x : x + side] = 255
+                _, buf = cv2.imencode(".jpg", frame)
+                self._frames.append((buf.tobytes(), frame))
+        except ImportError:
+            self._frames.append((BLANK_FRAME, None))
+
+    def next(self) -> tuple[bytes, object]:
+        """Return ``(jpeg_bytes, raw_bgr_frame_or_None)`` and advance."""
+        frame = self._frames[self._index]
+        self._index = (self._index + 1) % len(self._frames)
+        return frame
+
+
 class Camera:
     """Unified camera interface with three operating modes:
 
@@ -271,8 +309,11 @@ class Camera:
       3. Blank mode (returns a fixed-size, zero-filled placeholder frame when no
          camera is available).
 
+    ``type: synthetic`` replays a short loop of pre-encoded frames instead
+    (benchmarks and CI; see :class:`SyntheticFrames`).
+
     Config (``config["camera"]``):
-      - ``type`` (str): ``"auto"`` (default), ``"csi"``, or ``"usb"``.
+      - ``type`` (str): ``"auto"`` (default), ``"csi"``, ``"usb"`` or ``"synthetic"``.
       - ``resolution`` (list[int, int]): Target frame size, default ``[640, 480]``.
 
     In normal operation, :meth:`capture_jpeg` returns a JPEG-encoded frame.
@@ -288,7 +329,9 @@ class Camera:
         self._oakd_rgb_q = None
         self._oakd_depth_q = None
         self._oakd_imu_q = None
+        self._synthetic = None
         self.last_depth = None  # Expose depth for reactive layer
+        self.last_raw = None  # Decoded BGR array of the last frame (reactive layer)
         self.last_imu = None  # Expose IMU for orientation-aware navigation (OAK-4 Pro)
 
         # Support both `camera:` (legacy flat key) and `cameras.main:` (RCAN 3.0 nested)
@@ -298,6 +341,11 @@ class Camera:
         depth_enabled = cam_cfg.get("depth_enabled", False)
         imu_enabled = cam_cfg.get("imu_enabled", False)
 
+        if cam_type == "synthetic":
+            self._synthetic = SyntheticFrames(res, int(cam_cfg.get("frames", 30)))
+            logger.info(f"Synthetic camera online ({res[0]}x{res[1]})")
+            return
+
         # --- Try OAK-D / OAK-4 Pro (DepthAI USB camera with depth) ---
         # "depthai" and "oak" are accepted aliases for "oakd"
         if cam_type in ("oakd", "auto", "depthai", "oak"):
@@ -391,13 +439,20 @@ class Camera:
         logger.warning("No camera detected. Using blank frames.")
 
     def is_available(self) -> bool:
-        """Return True if a real camera (CSI, USB, or OAK-D) is online."""
+        """Return True if a camera (CSI, USB, OAK-D or synthetic) is online."""
         return (
-            self._picam is not None or self._cv_cap is not None or self._oakd_pipeline is not None
+            self._picam is not None
+            or self._cv_cap is not None
+            or self._oakd_pipeline is not None
+            or self._synthetic is not None
         )
 
     def capture_jpeg(self) -> bytes:
         """Return a JPEG-encoded frame as bytes."""
+        if self._synthetic is not None:
+            jpeg, self.last_raw = self._synthetic.next()
+            return jpeg
+
         if self._oakd_pipeline is not None:
             try:
                 import cv2
@@ -436,9 +491,11 @@ class Camera:
                         pass
 
                 _, buf = cv2.imencode(".jpg", frame)
+                self.last_raw = frame
                 return buf.tobytes()
             except Exception:
-                return b"\x00" * 1024
+                self.last_raw = None
+                return BLANK_FRAME
 
         if self._picam is not None:
             try:
@@ -446,9 +503,11 @@ class Camera:
 
                 frame = self._picam.capture_array()
                 _, buf = cv2.imencode(".jpg", frame)
+                self.last_raw = frame
                 return buf.tobytes()
             except Exception:
-                return b"\x00" * 1024
+                self.last_raw = None
+                return BLANK_FRAME
 
         if self._cv_cap is not None:
             import cv2
@@ -456,9 +515,11 @@ class Camera:
             ret, frame = self._cv_cap.read()
             if ret:
                 _, buf = cv2.imencode(".jpg", frame)
+                self.last_raw = frame
                 return buf.tobytes()
 
-        return b"\x00" * 1024
+        self.last_raw = None
+        return BLANK_FRAME
 
     def close(self):
         if self._oakd_pipeline is not None:
@@ -499,11 +560,11 @@ class Speaker:
         tts_engine = os.getenv("CASTOR_TTS_ENGINE", "gtts")
         if tts_engine != "gtts":
             try:
-                from castor.tts_local import LocalTTS, available_engines
+                from castor.tts_local import available_engines, get_tts
 
                 avail = available_engines()
                 if avail:
-                    self._local_tts = LocalTTS(engine=tts_engine, language=self.language)
+                    self._local_tts = get_tts(engine=tts_engine, language=self.language)
                     logger.info("TTS speaker online (engine=%s)", self._local_tts.engine)
                     return
             except Exception as exc:
@@ -764,6 +825,17 @@ def main():
         default=None,
         help="Directory for persistent memory (default: none)",
     )
+    parser.add_argument(
+        "--startup-trace",
+        action="store_true",
+        help="Print per-subsystem startup timings and the critical path",
+    )
+    parser.add_argument(
+        "--max-ticks",
+        type=int,
+        default=0,
+        help="Shut down after this many control-loop ticks (benchmarks, smoke tests)",
+    )
     args = parser.parse_args()
 
     # 0. CRASH RECOVERY CHECK
@@ -789,83 +861,111 @@ def main():
         pass
 
     # 1. BOOT SEQUENCE
+    # Subsystems are steps in a startup graph: independent ones (brain warmup,
+    # hardware probes, camera, speaker) initialise concurrently, non-critical
+    # ones start after the control loop is running.  --startup-trace prints
+    # the timings and the critical path.
+    from castor.startup import StartupGraph
+
+    startup = StartupGraph()
     logger.info("Booting OpenCastor Runtime...")
-    config = load_config(args.config)
+    with startup.inline("config"):
+        config = load_config(args.config)
 
-    # 1b-pre. HARDWARE DETECTION WINS
-    # Real hardware at boot time overrides anything the wizard wrote to the config.
-    # Detected OAK-D but config says CSI? Switches to OAK-D automatically.
-    # Found PCA9685 at 0x41 but config says 0x40? Uses the real address.
-    config = apply_hardware_overrides(config)
+        # 1b-pre. HARDWARE DETECTION WINS
+        # Real hardware at boot time overrides anything the wizard wrote to the config.
+        # Detected OAK-D but config says CSI? Switches to OAK-D automatically.
+        # Found PCA9685 at 0x41 but config says 0x40? Uses the real address.
+        config = apply_hardware_overrides(config)
 
-    # 1a. STARTUP HEALTH CHECK
-    try:
-        from castor.healthcheck import print_health_report, run_startup_checks
+    # 1b. INITIALIZE VIRTUAL FILESYSTEM
+    with startup.inline("vfs"):
+        _safety_limits = {}
+        _safety_cfg = config.get("safety", {})
+        if "motor_rate_hz" in _safety_cfg:
+            _safety_limits["motor_rate_hz"] = float(_safety_cfg["motor_rate_hz"])
+        fs = CastorFS(persist_dir=args.memory_dir, limits=_safety_limits)
+        fs.boot(config)
+        set_shared_fs(fs)
+        fs.proc.set_driver("none")
+        logger.info("Virtual Filesystem Online")
 
-        health = run_startup_checks(config, simulate=args.simulate)
-        print_health_report(health)
-        if health["status"] == "critical":
-            logger.critical("Health check CRITICAL — resolve issues before continuing")
-            # Don't block, but warn loudly
-    except Exception as e:
-        logger.debug(f"Health check skipped: {e}")
+    brain = None
+    tiered = None
+    driver = None
+    camera = None
+    speaker = None
+    mdns_broadcaster = None
 
-    # 1b. INITIALIZE VIRTUAL FILESYSTEM
-    _safety_limits = {}
-    _safety_cfg = config.get("safety", {})
-    if "motor_rate_hz" in _safety_cfg:
-        _safety_limits["motor_rate_hz"] = float(_safety_cfg["motor_rate_hz"])
-    fs = CastorFS(persist_dir=args.memory_dir, limits=_safety_limits)
-    fs.boot(config)
-    set_shared_fs(fs)
-    logger.info("Virtual Filesystem Online")
+    # 1a. STARTUP HEALTH CHECK
+    @startup.step("health_check")
+    def _health_check():
+        try:
+            from castor.healthcheck import print_health_report, run_startup_checks
+
+            health = run_startup_checks(config, simulate=args.simulate)
+            print_health_report(health)
+            if health["status"] == "critical":
+                logger.critical("Health check CRITICAL — resolve issues before continuing")
+                # Don't block, but warn loudly
+        except Exception as e:
+            logger.debug(f"Health check skipped: {e}")
 
     # 1d. SECURITY POSTURE CHECK (attestation / measured boot)
-    # Generate fresh attestation if missing or stale
-    try:
-        from castor.attestation_generator import generate_attestation
+    @startup.step("attestation")
+    def _attestation():
+        # Generate fresh attestation if missing or stale
+        try:
+            from castor.attestation_generator import generate_attestation
 
-        _config_path = Path(args.config) if hasattr(args, "config") and args.config else None
-        generate_attestation(config_path=_config_path)
-    except Exception as _att_exc:
-        logger.debug("Attestation generation skipped: %s", _att_exc)
+            _config_path = Path(args.config) if hasattr(args, "config") and args.config else None
+            generate_attestation(config_path=_config_path)
+        except Exception as _att_exc:
+            logger.debug("Attestation generation skipped: %s", _att_exc)
 
-    try:
-        from castor.security_posture import publish_attestation
+        try:
+            from castor.security_posture import publish_attestation
 
-        posture = publish_attestation(fs)
-        if posture and posture.get("mode") == "degraded":
-            logger.warning(
-                "Security posture is degraded (%s)",
-                ",".join(posture.get("reasons", [])) or "attestation_unavailable",
-            )
-    except Exception as e:
-        logger.debug(f"Security posture check skipped: {e}")
+            posture = publish_attestation(fs)
+            if posture and posture.get("mode") == "degraded":
+                logger.warning(
+                    "Security posture is degraded (%s)",
+                    ",".join(posture.get("reasons", [])) or "attestation_unavailable",
+                )
+        except Exception as e:
+            logger.debug(f"Security posture check skipped: {e}")
 
     # 1c. CONSTRUCT RURI
-    try:
-        from castor.rcan.ruri import RURI
+    @startup.step("ruri")
+    def _ruri():
+        try:
+            from castor.rcan.ruri import RURI
 
-        ruri = RURI.from_config(config)
-        fs.proc.set_ruri(str(ruri))
-        logger.info(f"RURI: {ruri}")
-    except Exception as e:
-        logger.debug(f"RURI construction skipped: {e}")
+            ruri = RURI.from_config(config)
+            fs.proc.set_ruri(str(ruri))
+            logger.info(f"RURI: {ruri}")
+        except Exception as e:
+            logger.debug(f"RURI construction skipped: {e}")
 
     # 2. INITIALIZE BRAIN
-    try:
-        brain = get_provider(config["agent"])
-        logger.info(f"Brain Online: {config['agent'].get('model', 'unknown')}")
-        fs.proc.set_driver("none")
-    except Exception as e:
-        logger.critical(f"Failed to initialize Brain: {e}")
-        raise SystemExit(1) from e
+    @startup.step("brain", required=True)
+    def _brain():
+        nonlocal brain
+        try:
+            brain = get_provider(config["agent"])
+            logger.info(f"Brain Online: {config['agent'].get('model', 'unknown')}")
+        except Exception as e:
+            logger.critical(f"Failed to initialize Brain: {e}")
+            raise SystemExit(1) from e
 
     # 2b. TIERED BRAIN (optional: primary = fast brain, secondary[0] = planner)
-    tiered = None
-    secondary_models = config.get("agent", {}).get("secondary_models", [])
-    tiered_cfg = config.get("tiered_brain", {})
-    if secondary_models and tiered_cfg:
+    @startup.step("tiered_brain", after=("brain",))
+    def _tiered_brain():
+        nonlocal tiered
+        secondary_models = config.get("agent", {}).get("secondary_models", [])
+        tiered_cfg = config.get("tiered_brain", {})
+        if not (secondary_models and tiered_cfg):
+            return
         try:
             from castor.tiered_brain import TieredBrain
 
@@ -892,8 +992,13 @@ def main():
             tiered = None
 
     # 3. INITIALIZE BODY (Drivers)
-    driver = None
-    if not args.simulate:
+    # After the health check: its i2cdetect scan must not race the driver's
+    # own bus setup.
+    @startup.step("driver", after=("health_check",))
+    def _driver():
+        nonlocal driver
+        if args.simulate:
+            return
         try:
             driver = get_driver(config)
             if driver:
@@ -904,41 +1009,31 @@ def main():
             logger.error(f"Hardware Init Failed: {e}. Switching to Simulation.")
             args.simulate = True
 
-    # 3b. INITIALIZE BOUNDS CHECKER (safety limits from physics: block)
-    physics_cfg = config.get("physics", {})
-    robot_type = physics_cfg.get("type", "")
-    try:
-        from castor.safety.bounds import DEFAULT_CONFIGS
-
-        # Explicit workspace/joints/force keys in physics block take precedence;
-        # fall back to built-in defaults for known robot types, then unconstrained.
-        if any(k in physics_cfg for k in ("workspace", "joints", "force")):
-            bounds_checker = BoundsChecker.from_config(physics_cfg)
-        elif robot_type in DEFAULT_CONFIGS:
-            bounds_checker = BoundsChecker.from_robot_type(robot_type)
-        else:
-            bounds_checker = BoundsChecker()
-        logger.info(f"Bounds checker initialized (type={robot_type or 'unconfigured'})")
-    except Exception as e:
-        logger.warning(f"Bounds checker init failed ({e}), using unconstrained checker")
-        bounds_checker = BoundsChecker()
-
     # 4. INITIALIZE EYES (Camera -- CSI first, then USB, then blank)
-    camera = Camera(config)
-    set_shared_camera(camera)
-    fs.proc.set_camera("online" if camera.is_available() else "offline")
+    @startup.step("camera")
+    def _camera():
+        nonlocal camera
+        camera = Camera(config)
+        set_shared_camera(camera)
+        fs.proc.set_camera("online" if camera.is_available() else "offline")
 
     # 5. INITIALIZE VOICE (TTS via USB speaker)
-    speaker = Speaker(config)
-    set_shared_speaker(speaker)
-    fs.proc.set_speaker("online" if speaker.enabled else "offline")
-
-    # 5b. AUTO-START VOICE LOOP if a microphone is detected.
+    @startup.step("speaker")
+    def _speaker():
+        nonlocal speaker
+        speaker = Speaker(config)
+        set_shared_speaker(speaker)
+        fs.proc.set_speaker("online" if speaker.enabled else "offline")
+
+    # 5b. AUTO-START VOICE LOOP if a microphone is detected (after the loop is up).
     # Full pipeline: wake word → STT → LLM → TTS.
     # Wake phrase: CASTOR_HOTWORD env → robot_name → "hey castor".
     # Disabled if audio.wake_word_enabled: false in RCAN config.
-    _audio_cfg_main = config.get("audio", {})
-    if _audio_cfg_main.get("wake_word_enabled") is not False:
+    @startup.step("voice_loop", deferred=True)
+    def _voice_loop():
+        _audio_cfg_main = config.get("audio", {})
+        if _audio_cfg_main.get("wake_word_enabled") is False:
+            return
         try:
             from castor.voice import detect_usb_microphone
             from castor.voice_loop import get_voice_loop
@@ -961,10 +1056,14 @@ def main():
         except Exception as _vl_exc:
             logger.debug("Voice loop auto-start skipped: %s", _vl_exc)
 
-    # 6. mDNS BROADCAST (opt-in)
-    mdns_broadcaster = None
+    # 6. mDNS BROADCAST (opt-in, after the loop is up)
     rcan_proto = config["rcan_protocol"]
-    if rcan_proto.get("enable_mdns"):
+
+    @startup.step("mdns", deferred=True)
+    def _mdns():
+        nonlocal mdns_broadcaster
+        if not rcan_proto.get("enable_mdns"):
+            return
         try:
             from castor.rcan.mdns import RCANServiceBroadcaster
 
@@ -981,6 +1080,27 @@ def main():
         except Exception as e:
             logger.debug(f"mDNS broadcast skipped: {e}")
 
+    startup.run()
+
+    # 3b. INITIALIZE BOUNDS CHECKER (safety limits from physics: block)
+    physics_cfg = config.get("physics", {})
+    robot_type = physics_cfg.get("type", "")
+    try:
+        from castor.safety.bounds import DEFAULT_CONFIGS
+
+        # Explicit workspace/joints/force keys in physics block take precedence;
+        # fall back to built-in defaults for known robot types, then unconstrained.
+        if any(k in physics_cfg for k in ("workspace", "joints", "force")):
+            bounds_checker = BoundsChecker.from_config(physics_cfg)
+        elif robot_type in DEFAULT_CONFIGS:
+            bounds_checker = BoundsChecker.from_robot_type(robot_type)
+        else:
+            bounds_checker = BoundsChecker()
+        logger.info(f"Bounds checker initialized (type={robot_type or 'unconfigured'})")
+    except Exception as e:
+        logger.warning(f"Bounds checker init failed ({e}), using unconstrained checker")
+        bounds_checker = BoundsChecker()
+
     # 6b. PRIVACY POLICY (default-deny for sensors)
     try:
         from castor.privacy import PrivacyPolicy
@@ -1000,6 +1120,17 @@ def main():
     except Exception as e:
         logger.debug(f"Approval gate skipped: {e}")
 
+    # 6c-ii. SHARED MONITOR SCHEDULER (opt-in: one timer thread for the monitors below)
+    monitor_scheduler = None
+    try:
+        from castor.monitor_scheduler import scheduler_from_config
+
+        monitor_scheduler = scheduler_from_config(config)
+        if monitor_scheduler is not None:
+            logger.info("Monitor scheduler active -- monitors share one timer thread")
+    except Exception as e:
+        logger.debug(f"Monitor scheduler skipped: {e}")
+
     # 6d. BATTERY MONITOR (opt-in)
     battery_monitor = None
     try:
@@ -1016,7 +1147,7 @@ def main():
             on_critical=_on_battery_critical,
         )
         if battery_monitor.enabled:
-            battery_monitor.start()
+            battery_monitor.start(scheduler=monitor_scheduler)
             logger.info(f"Battery monitor online (warn={battery_monitor.warn_voltage}V)")
     except Exception as e:
         logger.debug(f"Battery monitor skipped: {e}")
@@ -1028,7 +1159,7 @@ def main():
 
         stop_fn = driver.stop if driver else None
         watchdog = BrainWatchdog(config, stop_fn=stop_fn)
-        watchdog.start()
+        watchdog.start(scheduler=monitor_scheduler)
     except Exception as e:
         logger.debug(f"Watchdog skipped: {e}")
 
@@ -1048,7 +1179,7 @@ def main():
             consecutive_critical=int(monitor_cfg.get("consecutive_critical", 3)),
         )
         wire_safety_layer(sensor_monitor, fs.safety)
-        sensor_monitor.start()
+        sensor_monitor.start(scheduler=monitor_scheduler)
         logger.info(
             "SensorMonitor wired to SafetyLayer — thermal/electrical events will trigger estop"
         )
@@ -1111,7 +1242,7 @@ def main():
     except Exception as e:
         logger.debug(f"Thought log skipped: {e}")
 
-    # 6h. CHANNELS (messaging — WhatsApp, Telegram, etc.)
+    # 6h. CHANNELS (messaging — WhatsApp, Telegram, etc.; started after the loop is up)
     import queue as _queue
 
     _active_channels: list = []
@@ -1119,7 +1250,11 @@ def main():
     _reply_queue: _queue.Queue[tuple] = _queue.Queue()  # (ch_obj, chat_id) pending replies
 
     channels_cfg = config.get("channels", {})
-    if channels_cfg:
+
+    @startup.step("channels", deferred=True)
+    def _channels():
+        if not channels_cfg:
+            return
         try:
             from castor.channels import create_channel
 
@@ -1265,15 +1400,25 @@ def main():
     # 7c. SWARM CONFIG snapshot (injected into SisyphusLoop after learner section)
     swarm_cfg = config.get("swarm", {})
 
-    # 7d. OPENTELEMETRY (opt-in via OPENCASTOR_OTEL_EXPORTER env var)
-    try:
-        from castor.telemetry import get_telemetry
+    # 7d. OPENTELEMETRY (opt-in via OPENCASTOR_OTEL_EXPORTER env var; after the loop is up)
+    @startup.step("telemetry", deferred=True)
+    def _telemetry():
+        try:
+            from castor.telemetry import get_telemetry
+
+            _tel = get_telemetry()
+            _robot_name = config.get("metadata", {}).get("robot_name", "opencastor")
+            _tel.enable(service_name=_robot_name, exporter="auto")
+        except Exception as _otel_exc:
+            logger.debug(f"OpenTelemetry init skipped: {_otel_exc}")
 
-        _tel = get_telemetry()
-        _robot_name = config.get("metadata", {}).get("robot_name", "opencastor")
-        _tel.enable(service_name=_robot_name, exporter="auto")
-    except Exception as _otel_exc:
-        logger.debug(f"OpenTelemetry init skipped: {_otel_exc}")
+    # 7e. PROFILER (opt-in via the RCAN ``profiling`` block; /api/profile captures)
+    from castor import profiler as _profiler
+
+    try:
+        _profiler.configure(config)
+    except Exception as _prof_exc:
+        logger.debug(f"Profiler init skipped: {_prof_exc}")
 
     # 8. THE CONTROL LOOP
     latency_budget = config.get("agent", {}).get("latency_budget_ms", 3000)
@@ -1311,9 +1456,23 @@ def main():
         except ImportError as e:
             logger.debug(f"SisyphusLoop init skipped: {e}")
 
+    def _print_startup_trace():
+        print(startup.format_trace(), file=sys.stderr, flush=True)
+
+    _first_tick = True
+    _tick_count = 0
     try:
         while not _shutdown_requested:
+            if args.max_ticks and _tick_count >= args.max_ticks:
+                logger.info(f"Reached --max-ticks {args.max_ticks}. Shutting down...")
+                break
+            _tick_count += 1
             loop_start = time.time()
+            if _first_tick:
+                _first_tick = False
+                startup.mark("first_tick")
+                startup.run_deferred(on_done=_print_startup_trace if args.startup_trace else None)
+            _profiler.begin_tick()
 
             # Check emergency stop
             if fs.is_estopped:
@@ -1359,6 +1518,7 @@ def main():
                     asyncio.run(_agent_observer.observe(sensor_pkg))
                 except Exception as e:
                     logger.debug(f"ObserverAgent observe error: {e}")
+            _profiler.lap("observe")
 
             # --- PHASE 2: ORIENT & DECIDE ---
             # Build instruction with memory context
@@ -1387,6 +1547,7 @@ def main():
                     continue
             except Exception as _sf_exc:
                 logger.debug(f"Safety input scan unavailable: {_sf_exc}")
+            _profiler.lap("safety.input")
 
             if tiered:
                 # Build sensor data from depth camera if available
@@ -1419,7 +1580,12 @@ def main():
                     except Exception as e:
                         logger.debug(f"NavigatorAgent act error: {e}")
 
-                thought = tiered.think(frame_bytes, instruction, sensor_data=sensor_data)
+                thought = tiered.think(
+                    frame_bytes,
+                    instruction,
+                    sensor_data=sensor_data,
+                    raw_frame=getattr(camera, "last_raw", None),
+                )
             else:
                 thought = brain.think(frame_bytes, instruction)
             fs.proc.record_thought(thought.raw_text, thought.action)
@@ -1434,6 +1600,7 @@ def main():
             # Watchdog heartbeat (brain responded successfully)
             if watchdog:
                 watchdog.heartbeat()
+            _profiler.lap("orient")
 
             # --- PHASE 3: ACT ---
             if thought.action:
@@ -1501,6 +1668,7 @@ def main():
                                         action_to_execute = None
                         except Exception as _wa_exc:
                             logger.debug(f"Work authorization check unavailable: {_wa_exc}")
+                _profiler.lap("safety.action")
 
                 if action_to_execute:
                     # Write action through the safety layer (clamping + rate limiting)
@@ -1613,6 +1781,7 @@ def main():
                 speaker.say(thought.raw_text[:120])
             else:
                 logger.warning("Brain produced no valid action.")
+            _profiler.lap("act")
 
             # --- PHASE 4: TELEMETRY & LATENCY CHECK ---
             latency = (time.time() - loop_start) * 1000
@@ -1698,6 +1867,7 @@ def main():
                 record_tick(_loop_tick, _last_act)
             except Exception:
                 pass
+            _profiler.lap("telemetry")
 
             # Sleep between ticks (configurable — set loop_sleep_s: 0 for high-Hz operation)
             _loop_sleep = config.get("agent", {}).get("loop_sleep_s", 1.0)
@@ -1787,6 +1957,16 @@ def main():
             except Exception:
                 pass
 
+        if monitor_scheduler:
+            try:
+                from castor.monitor_scheduler import reset_scheduler
+
+                logger.debug(f"Monitor scheduler stats: {monitor_scheduler.stats()}")
+                reset_scheduler()
+                logger.info("  ✓ Monitor scheduler stopped")
+            except Exception:
+                pass
+
         if mdns_broadcaster:
             try:
                 mdns_broadcaster.stop()
@@ -1794,6 +1974,12 @@ def main():
             except Exception:
                 pass
 
+        if tiered:
+            try:
+                tiered.close()
+            except Exception:
+                pass
+
         # Phase 4: Close hardware
         if driver and not args.simulate:
             try:
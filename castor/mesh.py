@@ -34,16 +34,49 @@ import logging
 import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
-from urllib import request as _urllib_request
 from urllib.parse import urljoin
 
+import httpx
+
 logger = logging.getLogger("OpenCastor.Mesh")
 
 # Global singleton
 _mesh_instance: Optional[MeshNode] = None
 _mesh_lock = threading.Lock()
 
+# Peers pinged at once by list_peers()
+_PING_CONCURRENCY = int(os.getenv("MESH_PING_CONCURRENCY", "8"))
+
+# Shared keep-alive client and ping pool for peer requests (created on first use)
+_client: Optional[httpx.Client] = None
+_ping_pool: Optional[ThreadPoolExecutor] = None
+_client_lock = threading.Lock()
+
+
+def _http_client() -> httpx.Client:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=_PING_CONCURRENCY * 2,
+                    max_keepalive_connections=_PING_CONCURRENCY,
+                )
+            )
+        return _client
+
+
+def _ping_executor() -> ThreadPoolExecutor:
+    global _ping_pool
+    with _client_lock:
+        if _ping_pool is None:
+            _ping_pool = ThreadPoolExecutor(
+                max_workers=_PING_CONCURRENCY, thread_name_prefix="mesh-ping"
+            )
+        return _ping_pool
+
 
 class PeerConfig:
     """Configuration for a single mesh peer.
@@ -174,15 +207,13 @@ def _http_get(url: str, token: str = "", timeout: float = 5.0) -> dict:
         Parsed JSON dict.
 
     Raises:
-        URLError: If the request fails.
+        httpx.HTTPError: If the request fails.
         ValueError: If response is not valid JSON.
     """
-    req = _urllib_request.Request(url)
-    if token:
-        req.add_header("Authorization", f"Bearer {token}")
-    with _urllib_request.urlopen(req, timeout=timeout) as resp:
-        body = resp.read()
-    return json.loads(body)
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    resp = _http_client().get(url, headers=headers, timeout=timeout)
+    resp.raise_for_status()
+    return json.loads(resp.content)
 
 
 def _http_post(url: str, payload: dict, token: str = "", timeout: float = 10.0) -> dict:
@@ -198,17 +229,17 @@ def _http_post(url: str, payload: dict, token: str = "", timeout: float = 10.0)
         Parsed JSON dict from the response.
 
     Raises:
-        URLError: If the request fails.
+        httpx.HTTPError: If the request fails.
         ValueError: If response is not valid JSON.
     """
-    data = json.dumps(payload).encode()
-    req = _urllib_request.Request(url, data=data, method="POST")
-    req.add_header("Content-Type", "application/json")
+    headers = {"Content-Type": "application/json"}
     if token:
-        req.add_header("Authorization", f"Bearer {token}")
-    with _urllib_request.urlopen(req, timeout=timeout) as resp:
-        body = resp.read()
-    return json.loads(body)
+        headers["Authorization"] = f"Bearer {token}"
+    resp = _http_client().post(
+        url, content=json.dumps(payload).encode(), headers=headers, timeout=timeout
+    )
+    resp.raise_for_status()
+    return json.loads(resp.content)
 
 
 class MeshNode:
@@ -252,13 +283,17 @@ class MeshNode:
     def list_peers(self) -> list[PeerStatus]:
         """Ping every configured peer and return health status list.
 
+        Peers are pinged concurrently on a shared pool (at most
+        ``MESH_PING_CONCURRENCY`` at once), so the call takes roughly one ping
+        timeout rather than one per unreachable peer.
+
         Returns:
             List of :class:`PeerStatus` objects (one per configured peer).
         """
-        statuses: list[PeerStatus] = []
-        for _name, peer in self._peers.items():
-            statuses.append(self._ping_peer(peer))
-        return statuses
+        peers = list(self._peers.values())
+        if len(peers) <= 1:
+            return [self._ping_peer(peer) for peer in peers]
+        return list(_ping_executor().map(self._ping_peer, peers))
 
     def route_to_peer(self, peer_name: str, instruction: str) -> RelayResult:
         """Forward *instruction* to the named peer via its ``/api/command`` endpoint.
@@ -17,10 +17,12 @@ Usage::
 
 from __future__ import annotations
 
+import bisect
 import datetime as _dt
+import math
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import Any, Optional
 
 __all__ = ["MetricsRegistry", "get_registry", "ChannelInterArrivalTracker", "RequestRateTracker"]
@@ -90,6 +92,241 @@ class Gauge:
         return "\n".join(lines)
 
 
+class _Shard:
+    """Bucket counts and running sum owned by a single observing thread."""
+
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, n: int) -> None:
+        self.counts = [0] * n
+        self.sum = 0.0
+
+
+class _ShardedBuckets:
+    """Fixed-bucket counters sharded per thread and merged at scrape time.
+
+    ``observe`` touches only the calling thread's shard, so the hot path
+    takes no lock.  Each value is counted once, in the first bucket whose
+    upper bound is >= value (the last slot is the +Inf overflow); cumulative
+    ``le`` counts are produced by :meth:`snapshot`.  Shards of threads that
+    have exited are folded into a retired shard on the next snapshot.
+    """
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = tuple(bounds)
+        self._local = threading.local()
+        self._shards: list[tuple[threading.Thread, _Shard]] = []
+        self._retired = _Shard(len(self._bounds) + 1)
+        self._lock = threading.Lock()
+
+    def _new_shard(self) -> _Shard:
+        shard = _Shard(len(self._bounds) + 1)
+        with self._lock:
+            self._shards.append((threading.current_thread(), shard))
+        self._local.shard = shard
+        return shard
+
+    def observe(self, value: float) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        shard.counts[bisect.bisect_left(self._bounds, value)] += 1
+        shard.sum += value
+
+    def snapshot(self) -> tuple[list[tuple[float, int]], float, int]:
+        """Return ``([(le, cumulative_count), ...], sum, count)`` excluding +Inf."""
+        with self._lock:
+            counts = list(self._retired.counts)
+            total_sum = self._retired.sum
+            live = []
+            for thread, shard in self._shards:
+                shard_counts = list(shard.counts)
+                for i, c in enumerate(shard_counts):
+                    counts[i] += c
+                total_sum += shard.sum
+                if thread.is_alive():
+                    live.append((thread, shard))
+                else:
+                    for i, c in enumerate(shard_counts):
+                        self._retired.counts[i] += c
+                    self._retired.sum += shard.sum
+            self._shards = live
+        cumulative = []
+        running = 0
+        for bound, c in zip(self._bounds, counts, strict=False):
+            running += c
+            cumulative.append((bound, running))
+        return cumulative, total_sum, sum(counts)
+
+
+def _k_scale(q: float, compression: float) -> float:
+    return compression / (2.0 * math.pi) * math.asin(2.0 * q - 1.0)
+
+
+class _Digest:
+    """Merging t-digest: bounded centroids, amortised O(log n) insert.
+
+    Values are buffered and merged into centroids in sorted batches.  With
+    few observations every centroid holds a single value, so quantiles are
+    exact (linear interpolation between order statistics, as numpy does);
+    beyond that, centroid size is bounded by the k1 scale function so the
+    tails stay accurate.
+    """
+
+    _BUFFER = 512
+
+    __slots__ = ("_means", "_weights", "_buffer", "_min", "_max", "_compression")
+
+    def __init__(self, compression: float = 200.0) -> None:
+        self._means: list[float] = []
+        self._weights: list[float] = []
+        self._buffer: list[float] = []
+        self._min = math.inf
+        self._max = -math.inf
+        self._compression = compression
+
+    def add(self, value: float) -> None:
+        self._buffer.append(value)
+        if len(self._buffer) >= self._BUFFER:
+            self._merge()
+
+    def merge_from(self, other: _Digest) -> None:
+        other._merge()
+        self._merge(list(zip(other._means, other._weights, strict=True)))
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+    def _merge(self, extra: Optional[list[tuple[float, float]]] = None) -> None:
+        if not self._buffer and not extra:
+            return
+        if self._buffer:
+            self._min = min(self._min, *self._buffer)
+            self._max = max(self._max, *self._buffer)
+        items = list(zip(self._means, self._weights, strict=True))
+        items.extend((v, 1.0) for v in self._buffer)
+        if extra:
+            items.extend(extra)
+        self._buffer = []
+        items.sort()
+        total = sum(w for _, w in items)
+        means: list[float] = []
+        weights: list[float] = []
+        cur_m, cur_w = items[0]
+        emitted = 0.0
+        k_left = _k_scale(0.0, self._compression)
+        for m, w in items[1:]:
+            q_right = min((emitted + cur_w + w) / total, 1.0)
+            if _k_scale(q_right, self._compression) - k_left <= 1.0:
+                cur_m += (m - cur_m) * w / (cur_w + w)
+                cur_w += w
+            else:
+                means.append(cur_m)
+                weights.append(cur_w)
+                emitted += cur_w
+                k_left = _k_scale(min(emitted / total, 1.0), self._compression)
+                cur_m, cur_w = m, w
+        means.append(cur_m)
+        weights.append(cur_w)
+        self._means, self._weights = means, weights
+
+    def count(self) -> float:
+        return sum(self._weights) + len(self._buffer)
+
+    def centroids(self) -> int:
+        self._merge()
+        return len(self._means)
+
+    def quantile(self, q: float) -> Optional[float]:
+        self._merge()
+        if not self._means:
+            return None
+        total = sum(self._weights)
+        rank = min(max(q, 0.0), 1.0) * (total - 1)
+        # Each centroid sits at the centre of the ranks it covers; the exact
+        # min/max anchor the ends when the outer centroids hold several values.
+        points: list[tuple[float, float]] = []
+        if self._weights[0] > 1:
+            points.append((0.0, self._min))
+        cum = 0.0
+        for m, w in zip(self._means, self._weights, strict=True):
+            points.append((cum + (w - 1) / 2.0, m))
+            cum += w
+        if self._weights[-1] > 1:
+            points.append((total - 1, self._max))
+        if rank <= points[0][0]:
+            return float(points[0][1])
+        for (r0, m0), (r1, m1) in zip(points, points[1:], strict=False):
+            if rank <= r1:
+                if r1 == r0:
+                    return float(m1)
+                return float(m0 + (m1 - m0) * (rank - r0) / (r1 - r0))
+        return float(points[-1][1])
+
+
+class _WindowedDigest:
+    """Sliding-window quantile sketch built from time-sliced digests.
+
+    Observations land in the newest slice; slices older than the window are
+    dropped, so quantiles reflect roughly the last *window_s* seconds.
+    Queries merge the live slices.
+    """
+
+    def __init__(self, window_s: float = 300.0, slices: int = 5) -> None:
+        self._window_s = window_s
+        self._slice_s = window_s / slices
+        self._slices: deque[tuple[float, _Digest]] = deque(maxlen=slices)
+        self._lock = threading.Lock()
+
+    def add(self, value: float) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if not self._slices or now - self._slices[-1][0] >= self._slice_s:
+                self._slices.append((now, _Digest()))
+            self._slices[-1][1].add(value)
+
+    def _merged(self) -> _Digest:
+        cutoff = time.monotonic() - self._window_s
+        with self._lock:
+            while self._slices and self._slices[0][0] < cutoff:
+                self._slices.popleft()
+            live = [d for _, d in self._slices]
+            if len(live) == 1:
+                return live[0]
+            merged = _Digest()
+            for digest in live:
+                merged.merge_from(digest)
+            return merged
+
+    def quantile(self, q: float) -> Optional[float]:
+        digest = self._merged()
+        with self._lock:
+            return digest.quantile(q)
+
+    def count(self) -> int:
+        digest = self._merged()
+        with self._lock:
+            return int(digest.count())
+
+    def centroids(self) -> int:
+        with self._lock:
+            return sum(d.centroids() for _, d in self._slices)
+
+
+class _LatencySeries:
+    """Bucket counters plus a windowed quantile sketch for one label value."""
+
+    __slots__ = ("buckets", "quantiles")
+
+    def __init__(self, bounds: tuple[float, ...], window_s: float) -> None:
+        self.buckets = _ShardedBuckets(bounds)
+        self.quantiles = _WindowedDigest(window_s)
+
+    def observe(self, value: float) -> None:
+        self.buckets.observe(value)
+        self.quantiles.add(value)
+
+
 class Histogram:
     """Histogram with fixed buckets for latency tracking."""
 
@@ -99,52 +336,59 @@ class Histogram:
         self._name = name
         self._help = help_text
         self._buckets = sorted(buckets)
-        self._counts: dict[float, float] = defaultdict(float)
-        self._sum = 0.0
-        self._total = 0.0
-        self._lock = threading.Lock()
+        self._counts = _ShardedBuckets(tuple(self._buckets))
 
     def observe(self, value: float) -> None:
-        with self._lock:
-            self._sum += value
-            self._total += 1
-            for b in self._buckets:
-                if value <= b:
-                    self._counts[b] += 1
+        self._counts.observe(value)
+
+    def snapshot(self) -> tuple[list[tuple[float, int]], float, int]:
+        """Return ``([(le, cumulative_count), ...], sum, count)``."""
+        return self._counts.snapshot()
 
     def render(self) -> str:
         lines = [f"# HELP {self._name} {self._help}", f"# TYPE {self._name} histogram"]
-        with self._lock:
-            cumulative = 0.0
-            for b in self._buckets:
-                cumulative += self._counts[b]
-                lines.append(f'{self._name}_bucket{{le="{b}"}} {cumulative:.0f}')
-            lines.append(f'{self._name}_bucket{{le="+Inf"}} {self._total:.0f}')
-            lines.append(f"{self._name}_sum {self._sum:.3f}")
-            lines.append(f"{self._name}_count {self._total:.0f}")
+        buckets, total_sum, total = self.snapshot()
+        for b, cumulative in buckets:
+            lines.append(f'{self._name}_bucket{{le="{b}"}} {cumulative}')
+        lines.append(f'{self._name}_bucket{{le="+Inf"}} {total}')
+        lines.append(f"{self._name}_sum {total_sum:.3f}")
+        lines.append(f"{self._name}_count {total}")
         return "\n".join(lines)
 
 
+def _render_labeled_histogram(
+    name: str, help_text: str, label: str, data: dict[str, _LatencySeries]
+) -> str:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for value in sorted(data.keys(), key=str):
+        buckets, total_sum, total = data[value].buckets.snapshot()
+        for b, cumulative in buckets:
+            lines.append(f'{name}_bucket{{{label}="{value}",le="{b}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{label}="{value}",le="+Inf"}} {total}')
+        lines.append(f'{name}_sum{{{label}="{value}"}} {total_sum:.3f}')
+        lines.append(f'{name}_count{{{label}="{value}"}} {total}')
+    return "\n".join(lines)
+
+
 class ProviderLatencyTracker:
     """Per-provider latency histograms rendered with a Prometheus ``provider`` label.
 
     Stored separately from :class:`Histogram` because histograms with varying
     label-sets require per-label bucket data.
 
-    Issue #347: Also stores exact sorted samples for p50/p95/p99 percentile
-    computation and exposes them as ``opencastor_provider_latency_p50_ms``,
+    Issue #347: Also exposes p50/p95/p99 as ``opencastor_provider_latency_p50_ms``,
     ``opencastor_provider_latency_p95_ms``, and ``opencastor_provider_latency_p99_ms``
-    gauges per provider.
+    gauges per provider.  Percentiles come from a sliding-window t-digest
+    covering the last ``_WINDOW_S`` seconds (exact for small sample counts).
     """
 
     _DEFAULT_BUCKETS: tuple[float, ...] = (50, 100, 200, 500, 1000, 2000, 5000, 10000)  # ms
-    # Maximum raw samples kept per provider (prevents unbounded growth)
-    _MAX_SAMPLES: int = 10_000
+    # Percentile window — older observations age out of p50/p95/p99
+    _WINDOW_S: float = 300.0
 
     def __init__(self, buckets: tuple[float, ...] = _DEFAULT_BUCKETS) -> None:
         self._buckets: tuple[float, ...] = tuple(sorted(buckets))
-        # provider_name → {counts, sum, total, samples}
-        self._data: dict[str, dict] = {}
+        self._data: dict[str, _LatencySeries] = {}
         self._lock = threading.Lock()
 
     def observe(self, provider: str, value: float) -> None:
@@ -154,30 +398,17 @@ class ProviderLatencyTracker:
             provider: Provider name string (e.g. ``"google"``, ``"anthropic"``).
             value:    Latency in milliseconds.
         """
-        with self._lock:
-            if provider not in self._data:
-                self._data[provider] = {
-                    "counts": defaultdict(float),
-                    "sum": 0.0,
-                    "total": 0.0,
-                    "samples": [],  # sorted list of raw latency values (#347)
-                }
-            d = self._data[provider]
-            d["sum"] += value
-            d["total"] += 1
-            for b in self._buckets:
-                if value <= b:
-                    d["counts"][b] += 1
-            # Maintain sorted samples list for percentile computation
-            import bisect
-
-            bisect.insort(d["samples"], value)
-            if len(d["samples"]) > self._MAX_SAMPLES:
-                # Trim oldest (smallest) sample to keep list bounded
-                d["samples"].pop(0)
+        series = self._data.get(provider)
+        if series is None:
+            with self._lock:
+                series = self._data.get(provider)
+                if series is None:
+                    series = _LatencySeries(self._buckets, self._WINDOW_S)
+                    self._data[provider] = series
+        series.observe(value)
 
     def percentile(self, provider: str, pct: float) -> Optional[float]:
-        """Compute an exact percentile from sorted samples for *provider*.
+        """Estimate a percentile of recent latencies for *provider*.
 
         Args:
             provider: Provider name string.
@@ -186,20 +417,23 @@ class ProviderLatencyTracker:
         Returns:
             Percentile value in milliseconds, or ``None`` if no samples exist.
         """
-        with self._lock:
-            d = self._data.get(provider)
-            if d is None or not d["samples"]:
-                return None
-            samples = d["samples"]
-            n = len(samples)
-            # Linear interpolation method (same as numpy percentile default)
-            index = (pct / 100.0) * (n - 1)
-            lo = int(index)
-            hi = lo + 1
-            frac = index - lo
-            if hi >= n:
-                return float(samples[-1])
-            return float(samples[lo] * (1.0 - frac) + samples[hi] * frac)
+        series = self._data.get(provider)
+        if series is None:
+            return None
+        return series.quantiles.quantile(pct / 100.0)
+
+    def totals(self, provider: str) -> tuple[float, int]:
+        """Return ``(sum_ms, count)`` over all observations for *provider*."""
+        series = self._data.get(provider)
+        if series is None:
+            return 0.0, 0
+        _, total_sum, total = series.buckets.snapshot()
+        return total_sum, total
+
+    def sample_count(self, provider: str) -> int:
+        """Number of observations currently inside the percentile window."""
+        series = self._data.get(provider)
+        return series.quantiles.count() if series is not None else 0
 
     def providers(self) -> list[str]:
         """Return sorted list of provider names that have been observed."""
@@ -221,9 +455,7 @@ class ProviderLatencyTracker:
                 f"Provider think() latency {pct_label} percentile in milliseconds"
             )
             lines.append(f"# TYPE {metric_name} gauge")
-            with self._lock:
-                providers = sorted(self._data.keys(), key=str)
-            for provider in providers:
+            for provider in self.providers():
                 val = self.percentile(provider, pct_val)
                 if val is not None:
                     lines.append(f'{metric_name}{{provider="{provider}"}} {val:.3f}')
@@ -231,24 +463,14 @@ class ProviderLatencyTracker:
 
     def render(self) -> str:
         """Render labeled histogram in Prometheus text exposition format."""
-        name = "opencastor_provider_latency_ms"
-        lines = [
-            f"# HELP {name} LLM provider think() latency in milliseconds",
-            f"# TYPE {name} histogram",
-        ]
         with self._lock:
-            for provider in sorted(self._data.keys(), key=str):
-                d = self._data[provider]
-                cumulative = 0.0
-                for b in self._buckets:
-                    cumulative += d["counts"][b]
-                    lines.append(
-                        f'{name}_bucket{{provider="{provider}",le="{b}"}} {cumulative:.0f}'
-                    )
-                lines.append(f'{name}_bucket{{provider="{provider}",le="+Inf"}} {d["total"]:.0f}')
-                lines.append(f'{name}_sum{{provider="{provider}"}} {d["sum"]:.3f}')
-                lines.append(f'{name}_count{{provider="{provider}"}} {d["total"]:.0f}')
-        return "\n".join(lines)
+            data = dict(self._data)
+        return _render_labeled_histogram(
+            "opencastor_provider_latency_ms",
+            "LLM provider think() latency in milliseconds",
+            "provider",
+            data,
+        )
 
 
 class ChannelInterArrivalTracker:
@@ -260,12 +482,11 @@ class ChannelInterArrivalTracker:
 
     _DEFAULT_BUCKETS: tuple[float, ...] = (10, 50, 100, 250, 500, 1000, 2000, 5000)  # ms
 
-    _MAX_SAMPLES: int = 1000
+    _WINDOW_S: float = 300.0
 
     def __init__(self, buckets: tuple[float, ...] = _DEFAULT_BUCKETS) -> None:
         self._buckets: tuple[float, ...] = tuple(sorted(buckets))
-        # channel_name → {counts, sum, total, samples}
-        self._data: dict[str, dict] = {}
+        self._data: dict[str, _LatencySeries] = {}
         self._last_ts: dict[str, float] = {}  # epoch seconds of last message per channel
         self._lock = threading.Lock()
 
@@ -277,29 +498,16 @@ class ChannelInterArrivalTracker:
             self._last_ts[channel] = now
             if last is None:
                 return None
-            interval_ms = (now - last) * 1000.0
-            if channel not in self._data:
-                self._data[channel] = {
-                    "counts": defaultdict(float),
-                    "sum": 0.0,
-                    "total": 0.0,
-                    "samples": [],
-                }
-            d = self._data[channel]
-            d["sum"] += interval_ms
-            d["total"] += 1
-            for b in self._buckets:
-                if interval_ms <= b:
-                    d["counts"][b] += 1
-            import bisect as _bisect
-
-            _bisect.insort(d["samples"], interval_ms)
-            if len(d["samples"]) > self._MAX_SAMPLES:
-                d["samples"].pop(0)
-            return interval_ms
+            series = self._data.get(channel)
+            if series is None:
+                series = _LatencySeries(self._buckets, self._WINDOW_S)
+                self._data[channel] = series
+        interval_ms = (now - last) * 1000.0
+        series.observe(interval_ms)
+        return interval_ms
 
     def percentile(self, channel: str, pct: float) -> Optional[float]:
-        """Return an exact percentile of recorded inter-arrival samples for *channel*.
+        """Estimate a percentile of recent inter-arrival times for *channel*.
 
         Args:
             channel: Channel name string.
@@ -308,19 +516,18 @@ class ChannelInterArrivalTracker:
         Returns:
             Inter-arrival time in milliseconds, or ``None`` if no samples.
         """
-        with self._lock:
-            d = self._data.get(channel)
-            if d is None or not d["samples"]:
-                return None
-            samples = d["samples"]
-            n = len(samples)
-            index = (pct / 100.0) * (n - 1)
-            lo = int(index)
-            hi = lo + 1
-            frac = index - lo
-            if hi >= n:
-                return float(samples[-1])
-            return float(samples[lo] * (1.0 - frac) + samples[hi] * frac)
+        series = self._data.get(channel)
+        if series is None:
+            return None
+        return series.quantiles.quantile(pct / 100.0)
+
+    def totals(self, channel: str) -> tuple[float, int]:
+        """Return ``(sum_ms, count)`` over all intervals recorded for *channel*."""
+        series = self._data.get(channel)
+        if series is None:
+            return 0.0, 0
+        _, total_sum, total = series.buckets.snapshot()
+        return total_sum, total
 
     def channels(self) -> list[str]:
         """Return sorted list of channel names that have been observed."""
@@ -329,22 +536,14 @@ class ChannelInterArrivalTracker:
 
     def render(self) -> str:
         """Render labeled histogram in Prometheus text exposition format."""
-        name = "opencastor_channel_message_interval_ms"
-        lines = [
-            f"# HELP {name} Message inter-arrival time per channel in milliseconds",
-            f"# TYPE {name} histogram",
-        ]
         with self._lock:
-            for channel in sorted(self._data.keys(), key=str):
-                d = self._data[channel]
-                cumulative = 0.0
-                for b in self._buckets:
-                    cumulative += d["counts"][b]
-                    lines.append(f'{name}_bucket{{channel="{channel}",le="{b}"}} {cumulative:.0f}')
-                lines.append(f'{name}_bucket{{channel="{channel}",le="+Inf"}} {d["total"]:.0f}')
-                lines.append(f'{name}_sum{{channel="{channel}"}} {d["sum"]:.3f}')
-                lines.append(f'{name}_count{{channel="{channel}"}} {d["total"]:.0f}')
-        return "\n".join(lines)
+            data = dict(self._data)
+        return _render_labeled_histogram(
+            "opencastor_channel_message_interval_ms",
+            "Message inter-arrival time per channel in milliseconds",
+            "channel",
+            data,
+        )
 
 
 class RequestRateTracker:
@@ -748,18 +947,16 @@ class MetricsRegistry:
 
         # Histograms
         for name, hist in self._histograms.items():
-            with hist._lock:
-                cumulative = 0.0
-                buckets: dict[str, float] = {}
-                for b in hist._buckets:
-                    cumulative += hist._counts[b]
-                    buckets[str(b)] = cumulative
-                buckets["+Inf"] = hist._total
-                snapshot["histograms"][name] = {
-                    "sum": hist._sum,
-                    "count": hist._total,
-                    "buckets": buckets,
-                }
+            if not isinstance(hist, Histogram):
+                continue
+            bucket_counts, total_sum, total = hist.snapshot()
+            buckets: dict[str, float] = {str(b): float(c) for b, c in bucket_counts}
+            buckets["+Inf"] = float(total)
+            snapshot["histograms"][name] = {
+                "sum": total_sum,
+                "count": float(total),
+                "buckets": buckets,
+            }
 
         # Provider latency
         for provider in self._provider_latency.providers():
@@ -770,10 +967,9 @@ class MetricsRegistry:
                 "p95": self._provider_latency.percentile(provider, 95.0),
                 "p99": self._provider_latency.percentile(provider, 99.0),
             }
-            with self._provider_latency._lock:
-                d = self._provider_latency._data.get(provider, {})
-                snapshot["provider_latency"][provider]["sum_ms"] = d.get("sum", 0.0)
-                snapshot["provider_latency"][provider]["count"] = d.get("total", 0.0)
+            total_sum, total = self._provider_latency.totals(provider)
+            snapshot["provider_latency"][provider]["sum_ms"] = total_sum
+            snapshot["provider_latency"][provider]["count"] = float(total)
 
         # Endpoint request rates
         for endpoint in self._request_rate.endpoints():
@@ -792,9 +988,7 @@ class MetricsRegistry:
         result: dict[str, Any] = {}
         try:
             for channel in self._channel_interarrival.channels():
-                with self._channel_interarrival._lock:
-                    d = self._channel_interarrival._data.get(channel, {})
-                    count = int(d.get("total", 0))
+                _, count = self._channel_interarrival.totals(channel)
                 result[channel] = {
                     "p50": self._channel_interarrival.percentile(channel, 50.0),
                     "p95": self._channel_interarrival.percentile(channel, 95.0),
@@ -1085,3 +1279,26 @@ def push_to_gateway(
 
 
 import os  # noqa: E402 (appended after module body)
+
+
+def benchmark_observe(iterations: int = 100_000) -> dict[str, float]:
+    """Microbenchmark the hot-path observe calls.
+
+    Returns mean nanoseconds per call for :meth:`Histogram.observe` and
+    :meth:`ProviderLatencyTracker.observe` (buckets + quantile sketch)::
+
+        python -c "from castor.metrics import benchmark_observe; print(benchmark_observe())"
+    """
+    values = [float((i * 7919) % 3000) for i in range(1024)]
+    hist = Histogram("bench_ms", "bench")
+    tracker = ProviderLatencyTracker()
+    results: dict[str, float] = {}
+    for label, fn in (
+        ("histogram_ns", hist.observe),
+        ("provider_latency_ns", lambda v: tracker.observe("bench", v)),
+    ):
+        start = time.perf_counter_ns()
+        for i in range(iterations):
+            fn(values[i & 1023])
+        results[label] = (time.perf_counter_ns() - start) / iterations
+    return results
@@ -0,0 +1,467 @@
+"""
+castor/monitor_scheduler.py — One timer thread for all background monitors.
+
+The watchdog, battery monitor, sensor monitor and snapshot manager each used
+to own a thread that slept on its own cadence.  With a shared
+:class:`MonitorScheduler` they register jobs instead:
+
+* **Periodic jobs** (:meth:`MonitorScheduler.every`) run at a fixed rate —
+  the next slot is computed from the previous *due* time, not from when the
+  job finished, so cadence does not drift.
+* **Deadline jobs** (:meth:`MonitorScheduler.after` / :meth:`~MonitorScheduler.at`)
+  run once and can be re-armed with :meth:`MonitorScheduler.reschedule`,
+  which keeps their statistics.
+
+Each job has a *slack*: how late it may start.  When the timer wakes it runs
+every job that is already due, so jobs whose windows overlap share one
+wakeup instead of each waking the CPU.  Slack therefore also bounds the
+scheduling jitter of a job.
+
+Safety-critical jobs (``critical=True``) always have zero slack and are
+dispatched first, to their own pool of critical workers.  The timer thread
+only dispatches and never runs job code.  A slow I2C read in the battery
+check therefore delays neither the watchdog deadline nor the timer, and a
+critical job never queues behind a slow snapshot.  Critical workers are
+started on demand, so there are only as many as critical jobs running at
+once.  Other jobs are handed to a small worker pool.
+
+If a periodic job is still running when its next slot comes up, that run
+is skipped and counted as an overrun.  A run that takes longer than the
+job's period is also counted as an overrun.  :meth:`MonitorScheduler.stats`
+reports per-job runs, overruns, errors, duration and start lateness.  It
+also reports the timer's total wakeups.
+
+RCAN config (opt-in; monitors keep their own threads otherwise)::
+
+    monitor_scheduler:
+      enabled: true
+      workers: 2        # pool size for non-critical jobs
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("OpenCastor.MonitorScheduler")
+
+__all__ = [
+    "Job",
+    "MonitorScheduler",
+    "get_scheduler",
+    "reset_scheduler",
+    "scheduler_from_config",
+]
+
+_DEFAULT_WORKERS = 2
+# Default slack for non-critical periodic jobs, as a fraction of the period
+_DEFAULT_SLACK_FRACTION = 0.1
+_MAX_DEFAULT_SLACK_S = 1.0
+# A critical job taking longer than this is worth a warning
+_CRITICAL_BUDGET_S = 0.05
+# Upper bound on critical worker threads.  A job never overlaps itself, so
+# in practice this is the number of critical jobs running at the same time.
+_CRITICAL_WORKERS = 16
+
+
+class Job:
+    """A registered periodic or deadline job and its timing statistics."""
+
+    __slots__ = (
+        "name",
+        "fn",
+        "interval_s",
+        "critical",
+        "slack_s",
+        "due",
+        "token",
+        "cancelled",
+        "running",
+        "runs",
+        "overruns",
+        "errors",
+        "_total_ns",
+        "_max_ns",
+        "_last_ns",
+        "_late_total_ns",
+        "_late_max_ns",
+        "_warned",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        interval_s: Optional[float],
+        critical: bool,
+        slack_s: float,
+        due: float,
+    ) -> None:
+        self.name = name
+        self.fn = fn
+        self.interval_s = interval_s
+        self.critical = critical
+        self.slack_s = slack_s
+        self.due = due
+        self.token = 0  # heap entries with a different token are stale
+        self.cancelled = False
+        self.running = False
+        self.runs = 0
+        self.overruns = 0
+        self.errors = 0
+        self._total_ns = 0
+        self._max_ns = 0
+        self._last_ns = 0
+        self._late_total_ns = 0
+        self._late_max_ns = 0
+        self._warned = False
+
+    @property
+    def periodic(self) -> bool:
+        return self.interval_s is not None
+
+    def stats(self) -> dict[str, Any]:
+        runs = self.runs or 1
+        return {
+            "critical": self.critical,
+            "interval_s": self.interval_s,
+            "slack_s": self.slack_s,
+            "runs": self.runs,
+            "overruns": self.overruns,
+            "errors": self.errors,
+            "mean_ms": round(self._total_ns / runs / 1e6, 3),
+            "max_ms": round(self._max_ns / 1e6, 3),
+            "last_ms": round(self._last_ns / 1e6, 3),
+            "mean_late_ms": round(self._late_total_ns / runs / 1e6, 3),
+            "max_late_ms": round(self._late_max_ns / 1e6, 3),
+        }
+
+
+class MonitorScheduler:
+    """Timer thread plus a small worker pool for monitor jobs.
+
+    Args:
+        workers: Worker threads for non-critical jobs (created on demand).
+        name:    Prefix for thread names.
+    """
+
+    def __init__(self, workers: int = _DEFAULT_WORKERS, name: str = "castor-monitor") -> None:
+        self._name = name
+        self._workers = max(1, int(workers))
+        self._cond = threading.Condition()
+        # [latest_start, seq, token, job] — ordered by the end of each job's window
+        self._heap: list[list[Any]] = []
+        self._jobs: dict[str, Job] = {}
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._critical_pool: Optional[ThreadPoolExecutor] = None
+        self._stopping = False
+        self.wakeups = 0
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def every(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        interval_s: float,
+        *,
+        critical: bool = False,
+        slack_s: Optional[float] = None,
+        first_delay_s: Optional[float] = None,
+    ) -> Job:
+        """Run *fn* every *interval_s* seconds (first run after *first_delay_s*,
+        default one interval).  A job with the same *name* is replaced, so
+        callers that may run more than once per process (monitor instances)
+        make the name unique."""
+        if interval_s <= 0:
+            raise ValueError(f"interval_s must be positive, got {interval_s}")
+        if critical:
+            slack_s = 0.0
+        elif slack_s is None:
+            slack_s = min(interval_s * _DEFAULT_SLACK_FRACTION, _MAX_DEFAULT_SLACK_S)
+        delay = interval_s if first_delay_s is None else max(first_delay_s, 0.0)
+        job = Job(name, fn, interval_s, critical, max(slack_s, 0.0), time.monotonic() + delay)
+        return self._register(job)
+
+    def at(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        when: float,
+        *,
+        critical: bool = False,
+        slack_s: float = 0.0,
+    ) -> Job:
+        """Run *fn* once at monotonic time *when*."""
+        job = Job(name, fn, None, critical, 0.0 if critical else max(slack_s, 0.0), when)
+        return self._register(job)
+
+    def after(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        delay_s: float,
+        *,
+        critical: bool = False,
+        slack_s: float = 0.0,
+    ) -> Job:
+        """Run *fn* once, *delay_s* seconds from now."""
+        return self.at(
+            name, fn, time.monotonic() + max(delay_s, 0.0), critical=critical, slack_s=slack_s
+        )
+
+    def reschedule(self, job: Job, when: float) -> bool:
+        """Move *job*'s next run to monotonic time *when* (re-arms deadline jobs).
+
+        Returns False if the job has been cancelled.
+        """
+        with self._cond:
+            if job.cancelled:
+                return False
+            job.due = when
+            self._push(job)
+            self._cond.notify()
+        return True
+
+    def cancel(self, job: Job) -> bool:
+        """Stop *job* from running again. Returns False if it was not active."""
+        with self._cond:
+            if job.cancelled:
+                return False
+            job.cancelled = True
+            job.token += 1
+            if self._jobs.get(job.name) is job:
+                del self._jobs[job.name]
+            self._cond.notify()
+        return True
+
+    def _register(self, job: Job) -> Job:
+        with self._cond:
+            if self._stopping:
+                raise RuntimeError("MonitorScheduler has been shut down")
+            old = self._jobs.get(job.name)
+            if old is not None:
+                old.cancelled = True
+                old.token += 1
+            self._jobs[job.name] = job
+            self._push(job)
+            self._ensure_thread()
+            self._cond.notify()
+        return job
+
+    def _push(self, job: Job) -> None:
+        job.token += 1
+        heapq.heappush(self._heap, [job.due + job.slack_s, next(self._seq), job.token, job])
+
+    # ------------------------------------------------------------------
+    # Timer
+    # ------------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, daemon=True, name=f"{self._name}-timer"
+            )
+            self._thread.start()
+
+    def _next_wake(self) -> Optional[float]:
+        heap = self._heap
+        while heap and heap[0][2] != heap[0][3].token:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def _take_ready(self, now: float) -> list[tuple[Job, float]]:
+        """Pop every live job that is due at *now* with the slot it fired for,
+        including jobs whose window has not closed yet — they ride along on
+        this wakeup."""
+        ready: list[tuple[Job, float]] = []
+        keep: list[list[Any]] = []
+        for entry in self._heap:
+            job = entry[3]
+            if entry[2] != job.token:
+                continue
+            if job.due <= now:
+                ready.append((job, job.due))
+            else:
+                keep.append(entry)
+        heapq.heapify(keep)
+        self._heap = keep
+        for job, due in ready:
+            if job.periodic:
+                next_due = due + job.interval_s
+                if next_due <= now:  # fell behind: skip the missed slots
+                    missed = int((now - due) // job.interval_s)
+                    job.overruns += missed
+                    next_due = due + (missed + 1) * job.interval_s
+                job.due = next_due
+                self._push(job)
+            else:
+                job.token += 1
+        return ready
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopping:
+                        return
+                    now = time.monotonic()
+                    wake = self._next_wake()
+                    if wake is not None and wake <= now:
+                        break
+                    self._cond.wait(None if wake is None else wake - now)
+                    self.wakeups += 1
+                ready = self._take_ready(now)
+            # Critical jobs first, then in order of their due slots
+            ready.sort(key=lambda item: (not item[0].critical, item[1]))
+            for job, due in ready:
+                self._dispatch(job, due)
+
+    def _dispatch(self, job: Job, due: float) -> None:
+        if job.cancelled:
+            return
+        if job.running:
+            job.overruns += 1
+            self._warn_overrun(job, "still running when its next slot came up")
+            return
+        job.running = True
+        if job.critical:
+            if self._critical_pool is None:
+                self._critical_pool = ThreadPoolExecutor(
+                    max_workers=_CRITICAL_WORKERS, thread_name_prefix=f"{self._name}-critical"
+                )
+            pool = self._critical_pool
+        else:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._workers, thread_name_prefix=f"{self._name}-worker"
+                )
+            pool = self._pool
+        try:
+            pool.submit(self._execute, job, due)
+        except RuntimeError:  # pool shut down underneath us
+            job.running = False
+
+    def _execute(self, job: Job, due: float) -> None:
+        start = time.monotonic()
+        t0 = time.perf_counter_ns()
+        failed = False
+        try:
+            job.fn()
+        except Exception:
+            failed = True
+            logger.exception("Monitor job %r failed", job.name)
+        finally:
+            elapsed = time.perf_counter_ns() - t0
+            # Counters first: a job seen as not running has up-to-date stats
+            late = max(int((start - due) * 1e9), 0)
+            job.runs += 1
+            if failed:
+                job.errors += 1
+            job._total_ns += elapsed
+            job._last_ns = elapsed
+            if elapsed > job._max_ns:
+                job._max_ns = elapsed
+            job._late_total_ns += late
+            if late > job._late_max_ns:
+                job._late_max_ns = late
+            overran = job.periodic and elapsed > job.interval_s * 1e9
+            if overran:
+                job.overruns += 1
+            job.running = False
+        if overran:
+            self._warn_overrun(job, f"took {elapsed / 1e6:.1f}ms (period {job.interval_s}s)")
+        elif job.critical and elapsed > _CRITICAL_BUDGET_S * 1e9:
+            self._warn_overrun(job, f"critical job took {elapsed / 1e6:.1f}ms")
+
+    def _warn_overrun(self, job: Job, detail: str) -> None:
+        log = logger.debug if job._warned else logger.warning
+        job._warned = True
+        log("Monitor job %r overran: %s", job.name, detail)
+
+    # ------------------------------------------------------------------
+    # Introspection & lifecycle
+    # ------------------------------------------------------------------
+
+    def jobs(self) -> list[str]:
+        with self._cond:
+            return list(self._jobs)
+
+    def stats(self) -> dict[str, Any]:
+        """Return ``{"wakeups", "threads", "jobs": {name: {...}}}``."""
+        with self._cond:
+            jobs = dict(self._jobs)
+        threads = 1 if self._thread is not None and self._thread.is_alive() else 0
+        for pool in (self._pool, self._critical_pool):
+            if pool is not None:
+                threads += len(getattr(pool, "_threads", ()))
+        return {
+            "wakeups": self.wakeups,
+            "threads": threads,
+            "jobs": {name: job.stats() for name, job in jobs.items()},
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Cancel all jobs and stop the timer and worker threads."""
+        with self._cond:
+            self._stopping = True
+            for job in self._jobs.values():
+                job.cancelled = True
+            self._jobs.clear()
+            self._heap.clear()
+            self._cond.notify_all()
+        if wait and self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        for pool in (self._pool, self._critical_pool):
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
+        self._pool = None
+        self._critical_pool = None
+
+
+# ---------------------------------------------------------------------------
+# Module-level singleton
+# ---------------------------------------------------------------------------
+
+_scheduler: Optional[MonitorScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler(workers: int = _DEFAULT_WORKERS) -> MonitorScheduler:
+    """Return the process-wide :class:`MonitorScheduler` (created on first use)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = MonitorScheduler(workers=workers)
+        return _scheduler
+
+
+def reset_scheduler() -> None:
+    """Shut down and discard the global scheduler (useful in tests)."""
+    global _scheduler
+    with _scheduler_lock:
+        sched, _scheduler = _scheduler, None
+    if sched is not None:
+        sched.shutdown()
+
+
+def scheduler_from_config(config: Optional[dict]) -> Optional[MonitorScheduler]:
+    """Return the shared scheduler if the RCAN ``monitor_scheduler`` block
+    enables it, else None (monitors then run their own threads)."""
+    cfg = (config or {}).get("monitor_scheduler", {}) or {}
+    if not cfg.get("enabled", False):
+        return None
+    return get_scheduler(workers=int(cfg.get("workers", _DEFAULT_WORKERS)))
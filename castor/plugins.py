@@ -45,7 +45,6 @@ import importlib.util
 import json
 import logging
 import os
-import urllib.request
 from datetime import datetime, timezone
 
 logger = logging.getLogger("OpenCastor.Plugins")
@@ -221,6 +220,8 @@ def install_plugin(source: str) -> bool:
 
     Returns ``True`` on success, ``False`` on failure.
     """
+    import urllib.request  # only needed here; keeps plugin loading cheap
+
     os.makedirs(_PLUGINS_DIR, exist_ok=True)
 
     is_url = source.startswith(("http://", "https://"))
@@ -0,0 +1,391 @@
+"""
+castor/profiler.py — Opt-in, low-overhead profiler for the control loop.
+
+Three pieces:
+
+* **Stage timers** — the loop calls :func:`begin_tick` once per iteration
+  to decide whether that tick is timed, then :func:`lap` at each phase
+  boundary (time since the previous mark) or ``with stage("name"):``
+  around a region.  On untimed ticks both return immediately, so the
+  disabled cost is a global lookup and a function call.
+* **Stack sampler** — :class:`StackSampler` is a daemon thread that snapshots
+  ``sys._current_frames()`` at a fixed rate and aggregates folded stacks
+  (``root;caller;callee count``), the input format of ``flamegraph.pl`` and
+  speedscope.
+* **Captures** — :func:`capture` runs a time-bounded, high-rate sample plus
+  full stage timing; ``GET /api/profile`` streams the result.
+  :func:`trace_ticks` keeps every tick's stage timings individually, for
+  percentiles (``castor bench loop``).
+
+Config (RCAN ``profiling`` block, all optional)::
+
+    profiling:
+      enabled: true       # arm stage timers + background sampler
+      sample_rate: 0.01   # fraction of ticks whose stages are timed
+      stack_hz: 1         # background stack samples per second (0 = off)
+
+Armed at the defaults the profiler times 1% of ticks and takes one stack
+sample per second, which is negligible even on a Raspberry Pi.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("OpenCastor.Profiler")
+
+__all__ = [
+    "StackSampler",
+    "begin_tick",
+    "capture",
+    "configure",
+    "is_enabled",
+    "lap",
+    "reset",
+    "stage",
+    "stage_stats",
+    "stop_trace_ticks",
+    "trace_ticks",
+]
+
+_DEFAULT_SAMPLE_RATE = 0.01
+_DEFAULT_STACK_HZ = 1.0
+_MAX_CAPTURE_S = 60.0
+_MAX_CAPTURE_HZ = 1000.0
+
+_enabled = False
+_sample_rate = _DEFAULT_SAMPLE_RATE
+_forced = 0  # active captures — every tick is timed while > 0
+_tick_timed = False
+_lap_t0 = 0
+
+_stats_lock = threading.Lock()
+# stage name → [count, total_ns, max_ns, last_ns]
+_stages: dict[str, list[int]] = {}
+
+_background: Optional[StackSampler] = None
+
+# Per-tick trace (castor bench loop): one {stage: ns, "t0": ns} dict per tick
+_tick_trace: Optional[list[dict[str, int]]] = None
+_tick_current: Optional[dict[str, int]] = None
+_tick_hook: Optional[Callable[[int], None]] = None
+
+
+# ── Stage timers ──────────────────────────────────────────────────────────────
+
+
+class _NoopStage:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NOOP = _NoopStage()
+
+
+class _StageTimer:
+    __slots__ = ("_name", "_t0")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._t0 = time.perf_counter_ns()
+
+    def __exit__(self, *exc: Any) -> None:
+        _record(self._name, time.perf_counter_ns() - self._t0)
+
+
+def _record(name: str, elapsed_ns: int) -> None:
+    with _stats_lock:
+        entry = _stages.get(name)
+        if entry is None:
+            _stages[name] = [1, elapsed_ns, elapsed_ns, elapsed_ns]
+            return
+        entry[0] += 1
+        entry[1] += elapsed_ns
+        if elapsed_ns > entry[2]:
+            entry[2] = elapsed_ns
+        entry[3] = elapsed_ns
+
+
+def begin_tick() -> bool:
+    """Decide whether the current loop tick is timed; returns the decision.
+
+    Lap marks are per process, so only the control loop should call this.
+    """
+    global _tick_timed, _lap_t0, _tick_current
+    _tick_timed = _forced > 0 or (_enabled and random.random() < _sample_rate)
+    if _tick_timed:
+        if _tick_trace is not None:
+            if _tick_hook is not None:
+                _tick_hook(len(_tick_trace))
+            _tick_current = {}
+            _tick_trace.append(_tick_current)
+        _lap_t0 = time.perf_counter_ns()
+        if _tick_current is not None:
+            _tick_current["t0"] = _lap_t0
+    return _tick_timed
+
+
+def lap(name: str) -> None:
+    """Record the time since the previous lap (or tick start) under *name*."""
+    global _lap_t0
+    if not _tick_timed:
+        return
+    now = time.perf_counter_ns()
+    _record(name, now - _lap_t0)
+    if _tick_current is not None:
+        _tick_current[name] = now - _lap_t0
+    _lap_t0 = now
+
+
+def stage(name: str) -> Any:
+    """Context manager timing *name* on sampled ticks (no-op otherwise)."""
+    if not _tick_timed:
+        return _NOOP
+    return _StageTimer(name)
+
+
+def stage_stats() -> dict[str, dict[str, float]]:
+    """Return ``{stage: {count, total_ms, mean_ms, max_ms, last_ms}}``."""
+    with _stats_lock:
+        snapshot = {name: list(v) for name, v in _stages.items()}
+    return {
+        name: {
+            "count": count,
+            "total_ms": round(total / 1e6, 3),
+            "mean_ms": round(total / count / 1e6, 3),
+            "max_ms": round(peak / 1e6, 3),
+            "last_ms": round(last / 1e6, 3),
+        }
+        for name, (count, total, peak, last) in snapshot.items()
+    }
+
+
+# ── Stack sampling ────────────────────────────────────────────────────────────
+
+
+class StackSampler:
+    """Periodically sample Python stacks of other threads into folded form.
+
+    Args:
+        hz:         Samples per second.
+        thread_ids: Restrict sampling to these thread idents (default: all
+                    threads except the sampler itself).
+        max_depth:  Frames kept per stack (innermost frames are kept).
+        max_stacks: Distinct stacks retained; further new stacks are
+                    counted under ``[truncated]``.
+    """
+
+    def __init__(
+        self,
+        hz: float = 100.0,
+        thread_ids: Optional[set[int]] = None,
+        max_depth: int = 64,
+        max_stacks: int = 5000,
+    ) -> None:
+        self._interval = 1.0 / max(hz, 0.001)
+        self._thread_ids = thread_ids
+        self._max_depth = max_depth
+        self._max_stacks = max_stacks
+        self._counts: dict[str, int] = {}
+        self._labels: dict[Any, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.samples = 0
+
+    def start(self) -> StackSampler:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, daemon=True, name="castor-stack-sampler"
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.sample_once()
+            except Exception as exc:
+                logger.debug("Stack sample failed: %s", exc)
+
+    def _label(self, code: Any) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({os.path.basename(code.co_filename)})"
+            self._labels[code] = label
+        return label
+
+    def sample_once(self) -> None:
+        """Take one sample of every watched thread."""
+        me = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        stacks = []
+        for tid, frame in sys._current_frames().items():
+            if tid == me or (self._thread_ids is not None and tid not in self._thread_ids):
+                continue
+            parts = []
+            while frame is not None and len(parts) < self._max_depth:
+                parts.append(self._label(frame.f_code))
+                frame = frame.f_back
+            parts.append(names.get(tid, f"thread-{tid}"))
+            stacks.append(";".join(reversed(parts)))
+        with self._lock:
+            self.samples += 1
+            for key in stacks:
+                if key not in self._counts and len(self._counts) >= self._max_stacks:
+                    key = "[truncated]"
+                self._counts[key] = self._counts.get(key, 0) + 1
+
+    def folded(self) -> dict[str, int]:
+        """Return a copy of ``{folded_stack: sample_count}``."""
+        with self._lock:
+            return dict(self._counts)
+
+    def folded_text(self) -> str:
+        """Render folded stacks, heaviest first, one ``stack count`` per line."""
+        items = sorted(self.folded().items(), key=lambda kv: kv[1], reverse=True)
+        return "".join(f"{stack} {count}\n" for stack, count in items)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self.samples = 0
+
+
+# ── Configuration & captures ──────────────────────────────────────────────────
+
+
+def configure(config: Optional[dict] = None) -> bool:
+    """Arm or disarm the profiler from an RCAN config's ``profiling`` block.
+
+    Returns True when the profiler is armed.
+    """
+    global _enabled, _sample_rate, _background
+    cfg = (config or {}).get("profiling", {}) or {}
+    _enabled = bool(cfg.get("enabled", False))
+    _sample_rate = min(max(float(cfg.get("sample_rate", _DEFAULT_SAMPLE_RATE)), 0.0), 1.0)
+    stack_hz = float(cfg.get("stack_hz", _DEFAULT_STACK_HZ))
+    if _background is not None:
+        _background.stop()
+        _background = None
+    if _enabled and stack_hz > 0:
+        _background = StackSampler(hz=stack_hz).start()
+    if _enabled:
+        logger.info(
+            "Profiler armed (sample_rate=%.3f, stack_hz=%.1f)", _sample_rate, max(stack_hz, 0)
+        )
+    return _enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def background_folded() -> dict[str, int]:
+    """Folded stacks accumulated by the armed background sampler."""
+    return _background.folded() if _background is not None else {}
+
+
+def reset() -> None:
+    """Clear stage statistics and background samples."""
+    with _stats_lock:
+        _stages.clear()
+    if _background is not None:
+        _background.clear()
+
+
+def trace_ticks(on_tick: Optional[Callable[[int], None]] = None) -> list[dict[str, int]]:
+    """Time every tick and keep each tick's laps until :func:`stop_trace_ticks`.
+
+    Returns the list being filled: one ``{stage: elapsed_ns, "t0": start_ns}``
+    dict per tick.  *on_tick(n)* is called at the start of tick *n* (0-based),
+    before its timer starts.
+    """
+    global _forced, _tick_trace, _tick_hook
+    with _stats_lock:
+        if _tick_trace is not None:
+            raise RuntimeError("A tick trace is already running")
+        _tick_trace = []
+        _tick_hook = on_tick
+        _forced += 1
+        return _tick_trace
+
+
+def stop_trace_ticks() -> None:
+    global _forced, _tick_trace, _tick_current, _tick_hook
+    with _stats_lock:
+        if _tick_trace is None:
+            return
+        _tick_trace = None
+        _tick_current = None
+        _tick_hook = None
+        _forced -= 1
+
+
+def capture(seconds: float = 5.0, hz: float = 100.0) -> dict[str, Any]:
+    """Profile the process for *seconds* and return folded stacks + stage timings.
+
+    Every loop tick is timed for the duration, whether or not the profiler
+    is armed.  Blocks the calling thread; bounds are clamped to 60 s and
+    1000 Hz.
+    """
+    global _forced
+    seconds = min(max(seconds, 0.05), _MAX_CAPTURE_S)
+    hz = min(max(hz, 1.0), _MAX_CAPTURE_HZ)
+    with _stats_lock:
+        before = {name: list(v) for name, v in _stages.items()}
+        _forced += 1
+    sampler = StackSampler(hz=hz).start()
+    started = time.time()
+    try:
+        time.sleep(seconds)
+    finally:
+        sampler.stop()
+        with _stats_lock:
+            _forced -= 1
+    # Stage timings for this capture only: subtract what was there before
+    stages = {}
+    for name, st in stage_stats().items():
+        prev = before.get(name)
+        if prev is None:
+            stages[name] = st
+            continue
+        count = st["count"] - prev[0]
+        if count <= 0:
+            continue
+        total_ms = st["total_ms"] - prev[1] / 1e6
+        stages[name] = {
+            "count": count,
+            "total_ms": round(total_ms, 3),
+            "mean_ms": round(total_ms / count, 3),
+            "last_ms": st["last_ms"],
+        }
+    return {
+        "started_at": started,
+        "seconds": seconds,
+        "hz": hz,
+        "samples": sampler.samples,
+        "stacks": sampler.folded(),
+        "folded": sampler.folded_text(),
+        "stages": stages,
+    }
@@ -1,19 +1,35 @@
-from .anthropic_provider import AnthropicProvider
-from .apple_provider import AppleProvider
-from .consensus_provider import ConsensusProvider
-from .deepseek_provider import DeepSeekProvider
-from .embedding_backend import EmbeddingBackend
-from .gated import GatedModelProvider
-from .google_provider import GoogleProvider
-from .grok_provider import GrokProvider
-from .groq_provider import GroqProvider
-from .huggingface_provider import HuggingFaceProvider
-from .llamacpp_provider import LlamaCppProvider
-from .mistral_provider import MistralProvider
-from .mlx_provider import MLXProvider
-from .ollama_provider import OllamaProvider
-from .openai_provider import OpenAIProvider
-from .taalas_provider import TaalasProvider
+"""AI provider implementations.
+
+Provider classes are imported on first use: each module pulls in its SDK,
+and a process only ever needs one or two of them.
+"""
+
+from castor.lazy import lazy_attributes
+
+_PROVIDER_MODULES = {
+    "AnthropicProvider": ".anthropic_provider",
+    "AppleProvider": ".apple_provider",
+    "ConsensusProvider": ".consensus_provider",
+    "DeepSeekProvider": ".deepseek_provider",
+    "EmbeddingBackend": ".embedding_backend",
+    "GatedModelProvider": ".gated",
+    "GoogleProvider": ".google_provider",
+    "GrokProvider": ".grok_provider",
+    "GroqProvider": ".groq_provider",
+    "HuggingFaceProvider": ".huggingface_provider",
+    "LlamaCppProvider": ".llamacpp_provider",
+    "MistralProvider": ".mistral_provider",
+    "MLXProvider": ".mlx_provider",
+    "MockProvider": ".mock_provider",
+    "OllamaProvider": ".ollama_provider",
+    "OpenAIProvider": ".openai_provider",
+    "OpenRouterProvider": ".openrouter_provider",
+    "TaalasProvider": ".taalas_provider",
+    "VertexAIProvider": ".vertex_provider",
+    "VLAProvider": ".vla_provider",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _PROVIDER_MODULES)
 
 __all__ = [
     "get_provider",
@@ -29,6 +45,7 @@ __all__ = [
     "LlamaCppProvider",
     "MistralProvider",
     "MLXProvider",
+    "MockProvider",
     "OllamaProvider",
     "OpenAIProvider",
     "GatedModelProvider",
@@ -39,30 +56,37 @@ __all__ = [
 ]
 
 
+def _provider_class(name: str):
+    """Return provider class *name*, preferring the package global so that
+    test patches on ``castor.providers.<ClassName>`` take effect."""
+    cls = globals().get(name)
+    return cls if cls is not None else __getattr__(name)
+
+
 def _builtin_get_provider(config: dict):
     """Built-in factory: initialise the correct AI provider from *config*.
 
-    Uses module-level class names so that test patches on
+    Looks classes up through :func:`_provider_class` so that test patches on
     ``castor.providers.<ClassName>`` continue to work correctly.
     """
     provider_name = config.get("provider", "google").lower()
 
     if provider_name == "google":
-        return GoogleProvider(config)
+        return _provider_class("GoogleProvider")(config)
     elif provider_name in ("apple", "apple-fm", "foundationmodels"):
-        return AppleProvider(config)
+        return _provider_class("AppleProvider")(config)
     elif provider_name == "openai":
-        return OpenAIProvider(config)
+        return _provider_class("OpenAIProvider")(config)
     elif provider_name == "anthropic":
-        return AnthropicProvider(config)
+        return _provider_class("AnthropicProvider")(config)
     elif provider_name in ("huggingface", "hf"):
-        return HuggingFaceProvider(config)
+        return _provider_class("HuggingFaceProvider")(config)
     elif provider_name == "ollama":
-        return OllamaProvider(config)
+        return _provider_class("OllamaProvider")(config)
     elif provider_name in ("llamacpp", "llama.cpp", "llama-cpp"):
-        return LlamaCppProvider(config)
+        return _provider_class("LlamaCppProvider")(config)
     elif provider_name in ("mlx", "mlx-lm", "vllm-mlx"):
-        return MLXProvider(config)
+        return _provider_class("MLXProvider")(config)
     elif provider_name in ("vertex_ai", "vertex", "vertexai"):
         from .vertex_provider import VertexAIProvider
 
@@ -72,7 +96,7 @@ def _builtin_get_provider(config: dict):
 
         return ONNXProvider(config)
     elif provider_name == "groq":
-        return GroqProvider(config)
+        return _provider_class("GroqProvider")(config)
     elif provider_name in ("vla", "openvla"):
         from .vla_provider import VLAProvider
 
@@ -82,15 +106,17 @@ def _builtin_get_provider(config: dict):
 
         return OpenRouterProvider(config)
     elif provider_name in ("deepseek", "deep_seek"):
-        return DeepSeekProvider(config)
+        return _provider_class("DeepSeekProvider")(config)
     elif provider_name in ("grok", "xai"):
-        return GrokProvider(config)
+        return _provider_class("GrokProvider")(config)
     elif provider_name in ("mistral", "mistral_ai", "mistralai"):
-        return MistralProvider(config)
+        return _provider_class("MistralProvider")(config)
     elif provider_name in ("taalas", "taalas-hc1"):
-        return TaalasProvider(config)
+        return _provider_class("TaalasProvider")(config)
     elif provider_name == "consensus":
-        return ConsensusProvider(config)
+        return _provider_class("ConsensusProvider")(config)
+    elif provider_name == "mock":
+        return _provider_class("MockProvider")(config)
     elif provider_name in ("pool", "provider_pool"):
         from .pool_provider import ProviderPool
 
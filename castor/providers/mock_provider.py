@@ -0,0 +1,88 @@
+"""Deterministic mock provider for OpenCastor.
+
+Returns a fixed cycle of actions after a configurable, seeded delay, with
+no network or model.  Used by ``castor bench loop`` to measure the control
+loop without an inference service, and handy in CI.
+
+RCAN config::
+
+    agent:
+      provider: mock
+      model: mock
+      latency_ms: 40        # simulated inference time
+      jitter_ms: 10         # ± uniform jitter, reproducible via seed
+      seed: 0
+      actions:              # cycled; default alternates move/stop
+        - {type: move, linear: 0.2, angular: 0.0}
+        - {type: stop}
+"""
+
+import json
+import logging
+import random
+import time
+from typing import Any
+
+from .base import BaseProvider, Thought
+
+logger = logging.getLogger("OpenCastor.Mock")
+
+_DEFAULT_ACTIONS = (
+    {"type": "move", "linear": 0.2, "angular": 0.0},
+    {"type": "move", "linear": 0.2, "angular": 0.3},
+    {"type": "stop"},
+)
+
+
+class MockProvider(BaseProvider):
+    """Offline provider with reproducible latency and actions.
+
+    Config options:
+        - ``latency_ms``: Simulated inference time per call (default: 0)
+        - ``jitter_ms``: Uniform ± jitter around ``latency_ms`` (default: 0)
+        - ``seed``: Seed for the jitter sequence (default: 0)
+        - ``actions``: Actions returned in turn (default: move/turn/stop)
+    """
+
+    def __init__(self, config: dict[str, Any]):
+        super().__init__(config)
+        self.model_name = config.get("model", "mock")
+        self.latency_ms = max(0.0, float(config.get("latency_ms", 0.0)))
+        self.jitter_ms = max(0.0, float(config.get("jitter_ms", 0.0)))
+        self._rng = random.Random(config.get("seed", 0))
+        self._actions = [dict(a) for a in (config.get("actions") or _DEFAULT_ACTIONS)]
+        self._texts = [json.dumps(a) for a in self._actions]
+        self.calls = 0
+        logger.info(
+            "Mock provider: latency=%.1fms jitter=%.1fms actions=%d",
+            self.latency_ms,
+            self.jitter_ms,
+            len(self._actions),
+        )
+
+    def _delay_ms(self) -> float:
+        if self.jitter_ms:
+            return max(0.0, self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms))
+        return self.latency_ms
+
+    def think(
+        self,
+        image_bytes: bytes,
+        instruction: str,
+        surface: str = "whatsapp",
+    ) -> Thought:
+        """Sleep for the configured latency and return the next action."""
+        safety_block = self._check_instruction_safety(instruction)
+        if safety_block is not None:
+            return safety_block
+
+        delay = self._delay_ms()
+        if delay:
+            time.sleep(delay / 1000.0)
+        i = self.calls % len(self._actions)
+        self.calls += 1
+        thought = Thought(
+            self._texts[i], dict(self._actions[i]), provider="mock", model=self.model_name
+        )
+        thought.latency_ms = round(delay, 1)
+        return thought
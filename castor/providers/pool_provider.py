@@ -608,7 +608,7 @@ class ProviderPool(BaseProvider):
             cost_entry = self._cost_tracker.get(i, {})
 
             # Get latency p50 from tracker
-            avg_ms = tracker.percentile(name, 0.5)
+            avg_ms = tracker.percentile(name, 50.0)
 
             stat = {
                 "name": name,
@@ -646,10 +646,10 @@ class ProviderPool(BaseProvider):
         for i, p in enumerate(self._providers):
             name = getattr(p, "model_name", None) or f"pool[{i}]"
             result[name] = {
-                "p50_ms": tracker.percentile(name, 0.50),
-                "p95_ms": tracker.percentile(name, 0.95),
-                "p99_ms": tracker.percentile(name, 0.99),
-                "sample_count": len(tracker._data.get(name, {}).get("samples", [])),
+                "p50_ms": tracker.percentile(name, 50.0),
+                "p95_ms": tracker.percentile(name, 95.0),
+                "p99_ms": tracker.percentile(name, 99.0),
+                "sample_count": tracker.sample_count(name),
             }
 
         return {"providers": result, "pool_size": len(self._providers)}
@@ -11,25 +11,43 @@ declaration.  Individual features like mDNS and JWT remain opt-in
 within that section.
 """
 
+from castor.lazy import lazy_attributes
 from castor.rcan import telemetry_fields
-from castor.rcan.capabilities import Capability, CapabilityRegistry
-from castor.rcan.http_transport import discover_robot, send_message
-from castor.rcan.invoke import InvokeCancelRequest, InvokeRequest, InvokeResult, SkillRegistry
-from castor.rcan.message import MessageType, Priority, RCANMessage
-from castor.rcan.rbac import CapabilityBroker, CapabilityLease, RCANPrincipal, RCANRole, Scope
-from castor.rcan.router import MessageRouter
-from castor.rcan.ruri import RURI
-from castor.rcan.sdk_bridge import (
-    action_to_commitment_record,
-    audit_entry_to_commitment_record,
-    check_compliance,
-    opencastor_gate_to_rcan,
-    parse_inbound,
-    rcan_gate_to_opencastor,
-    robot_uri_to_ruri,
-    ruri_to_robot_uri,
-    spec_message_to_opencastor,
-)
+
+# Imported on first use: the submodules pull in http.client/ssl, castor.fs
+# and friends, which every ``castor.rcan.<submodule>`` import would
+# otherwise pay for.
+_SUBMODULES = {
+    "Capability": ".capabilities",
+    "CapabilityRegistry": ".capabilities",
+    "discover_robot": ".http_transport",
+    "send_message": ".http_transport",
+    "InvokeCancelRequest": ".invoke",
+    "InvokeRequest": ".invoke",
+    "InvokeResult": ".invoke",
+    "SkillRegistry": ".invoke",
+    "MessageType": ".message",
+    "Priority": ".message",
+    "RCANMessage": ".message",
+    "CapabilityBroker": ".rbac",
+    "CapabilityLease": ".rbac",
+    "RCANPrincipal": ".rbac",
+    "RCANRole": ".rbac",
+    "Scope": ".rbac",
+    "MessageRouter": ".router",
+    "RURI": ".ruri",
+    "action_to_commitment_record": ".sdk_bridge",
+    "audit_entry_to_commitment_record": ".sdk_bridge",
+    "check_compliance": ".sdk_bridge",
+    "opencastor_gate_to_rcan": ".sdk_bridge",
+    "parse_inbound": ".sdk_bridge",
+    "rcan_gate_to_opencastor": ".sdk_bridge",
+    "robot_uri_to_ruri": ".sdk_bridge",
+    "ruri_to_robot_uri": ".sdk_bridge",
+    "spec_message_to_opencastor": ".sdk_bridge",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _SUBMODULES)
 
 __all__ = [
     # Core
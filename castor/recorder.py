@@ -10,7 +10,7 @@ Usage::
     rec = VideoRecorder()
     rec.start("my-session")
 
-    # In the perception-action loop:
+    # For every camera frame (the gateway does this while recording):
     rec.write_frame(jpeg_bytes)
 
     episode_id = rec.stop()   # returns the recording ID
@@ -20,12 +20,34 @@ REST API:
     POST /api/recording/stop    — {}  → {id, path, frames, duration_s}
     GET  /api/recording/list    — [{id, name, path, size_bytes, duration_s, created_at}]
     GET  /api/recording/{id}    — metadata
-    GET  /api/recording/{id}/download — MP4 stream
+    GET  /api/recording/{id}/download — MP4 stream (``?segment=N`` for MJPEG)
+
+The default ``mp4`` mode decodes, resizes and re-encodes every frame.  The
+``mjpeg`` mode is pass-through: the camera's JPEG bytes go straight into an
+MJPEG/AVI segment, so a frame costs a buffered write.  Each segment
+``seg_NNNNN.avi`` has a ``seg_NNNNN.idx`` timestamp index
+(``t_s,offset,size`` per frame; *offset* is the JPEG's byte offset in the
+AVI), segments rotate by time or size and are kept as a ring, and closed
+segments can be transcoded to MP4 on an idle-priority thread.
+
+RCAN config (optional; without it the recorder uses ``mp4`` mode)::
+
+    recording:
+      mode: mjpeg          # mjpeg (pass-through) | mp4 (re-encode)
+      fps: 5               # mp4 output rate; mjpeg uses the measured rate
+      segment_s: 60        # start a new segment after this many seconds
+      segment_mb: 256      # ... or this many MB (whichever comes first)
+      max_segments: 30     # ring: delete the oldest beyond this (0 = keep all)
+      transcode: false     # re-encode closed segments to MP4 at idle priority
 """
 
+import bisect
+import functools
 import json
 import logging
 import os
+import queue
+import struct
 import threading
 import time
 import uuid
@@ -49,6 +71,24 @@ _DEFAULT_RESOLUTION = (640, 480)
 # MP4 fourcc for compatibility
 _FOURCC = "mp4v"
 
+MODES = ("mp4", "mjpeg")
+_DEFAULT_SEGMENT_S = 60.0
+_DEFAULT_SEGMENT_MB = 256.0
+# AVI 1.0 offsets are 32-bit; stay well below the 2 GB RIFF limit
+_MAX_SEGMENT_BYTES = 1 << 30
+_JPEG_SOI = b"\xff\xd8"
+# Frame-rate bounds for AVI headers and transcodes (MPEG-4 rejects huge timebases)
+_MIN_FILE_FPS = 0.1
+_MAX_FILE_FPS = 120.0
+
+
+def _path_size(p: Path) -> int:
+    if p.is_file():
+        return p.stat().st_size
+    if p.is_dir():
+        return sum(f.stat().st_size for f in p.rglob("*") if f.is_file())
+    return 0
+
 
 class RecordingMeta:
     """Metadata for a single recording."""
@@ -75,23 +115,354 @@ class RecordingMeta:
             "frames": self.frames,
             "fps": self.fps,
             "duration_s": self.duration_s,
-            "size_bytes": self.path.stat().st_size if self.path.exists() else 0,
+            "size_bytes": _path_size(self.path),
             "created_at": self.started_at,
             "finished": self.ended_at is not None,
         }
 
 
+# ---------------------------------------------------------------------------
+# Pass-through MJPEG segments
+# ---------------------------------------------------------------------------
+
+
+def jpeg_size(data: bytes) -> Optional[tuple[int, int]]:
+    """Return ``(width, height)`` from a JPEG's SOF header without decoding it."""
+    if not data.startswith(_JPEG_SOI):
+        return None
+    i, n = 2, len(data)
+    while i + 4 <= n:
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:  # standalone markers
+            i += 2
+            continue
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            if i + 9 > n:
+                return None
+            height, width = struct.unpack(">HH", data[i + 5 : i + 9])
+            return width, height
+        if marker == 0xDA:  # start of scan before any SOF
+            return None
+        (length,) = struct.unpack(">H", data[i + 2 : i + 4])
+        i += 2 + length
+    return None
+
+
+def _chunk(fourcc: bytes, payload: bytes) -> bytes:
+    return fourcc + struct.pack("<I", len(payload)) + payload
+
+
+def _avi_header(
+    width: int,
+    height: int,
+    frames: int,
+    rate: float,
+    max_frame: int,
+    riff_size: int,
+    movi_size: int,
+) -> bytes:
+    """RIFF/AVI header up to and including the ``LIST movi`` header.
+
+    Fixed length, so :class:`MjpegAviWriter` can rewrite it in place when the
+    segment is closed and the frame count, rate and sizes are known.
+    """
+    us_per_frame = int(round(1e6 / rate)) if rate > 0 else 0
+    rate_num, rate_den = int(round(rate * 1000)) or 1, 1000
+    avih = struct.pack(
+        "<14I",
+        us_per_frame,
+        int(max_frame * rate),  # max bytes per second
+        0,
+        0x10,  # AVIF_HASINDEX
+        frames,
+        0,
+        1,  # streams
+        max_frame,
+        width,
+        height,
+        0,
+        0,
+        0,
+        0,
+    )
+    strh = struct.pack(
+        "<4s4sIHHIIIIIIII4h",
+        b"vids",
+        b"MJPG",
+        0,
+        0,
+        0,
+        0,
+        rate_den,
+        rate_num,
+        0,
+        frames,
+        max_frame,
+        0xFFFFFFFF,  # default quality
+        0,
+        0,
+        0,
+        width,
+        height,
+    )
+    strf = struct.pack(
+        "<IiiHH4sIiiII", 40, width, height, 1, 24, b"MJPG", width * height * 3, 0, 0, 0, 0
+    )
+    strl = b"strl" + _chunk(b"strh", strh) + _chunk(b"strf", strf)
+    hdrl = b"hdrl" + _chunk(b"avih", avih) + _chunk(b"LIST", strl)
+    return (
+        b"RIFF"
+        + struct.pack("<I", riff_size)
+        + b"AVI "
+        + _chunk(b"LIST", hdrl)
+        + b"LIST"
+        + struct.pack("<I", movi_size)
+        + b"movi"
+    )
+
+
+_HEADER_LEN = len(_avi_header(0, 0, 0, 0.0, 0, 0, 0))
+
+
+def read_segment_index(idx_path: Path) -> list[tuple[float, int, int]]:
+    """Load a segment's timestamp index as ``[(t_s, offset, size), ...]``."""
+    entries = []
+    with open(idx_path, encoding="utf-8") as fh:
+        for line in fh:
+            parts = line.split(",")
+            if len(parts) == 3 and parts[0][:1] != "t":
+                entries.append((float(parts[0]), int(parts[1]), int(parts[2])))
+    return entries
+
+
+@functools.lru_cache(maxsize=64)
+def _closed_segment_index(
+    idx_path: str, mtime_ns: int
+) -> tuple[list[float], list[tuple[float, int, int]]]:
+    """Parsed index of a closed segment plus its timestamps, for bisecting.
+
+    Closed segments never change, so each index is parsed once; *mtime_ns*
+    keeps a file rewritten at the same path from hitting a stale entry.
+    """
+    entries = read_segment_index(Path(idx_path))
+    return [e[0] for e in entries], entries
+
+
+class MjpegAviWriter:
+    """Append already-encoded JPEG frames to an MJPEG AVI without decoding them.
+
+    Each frame becomes one ``00dc`` chunk.  A line goes to the ``.idx``
+    timestamp index.  :meth:`close` writes the ``idx1`` index and patches the
+    header with the frame count, the measured frame rate and the frame size
+    taken from the first JPEG.
+
+    Args:
+        path:     Output ``.avi`` file.
+        t_origin: ``time.time()`` value that index timestamps are relative to.
+    """
+
+    def __init__(self, path: Path, t_origin: float):
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix(".idx")
+        self.t_origin = t_origin
+        self.frames = 0
+        self.size = _HEADER_LEN
+        self.width = 0
+        self.height = 0
+        self.t_first: Optional[float] = None
+        self.t_last: Optional[float] = None
+        self._max_frame = 0
+        self._idx1: list[tuple[int, int]] = []  # (chunk offset from "movi", size)
+        self._fh = open(self.path, "wb")  # held until close()
+        self._fh.write(_avi_header(0, 0, 0, 0.0, 0, 0, 0))
+        self._idx = open(self.index_path, "w", encoding="utf-8")
+        self._idx.write("t_s,offset,size\n")
+
+    def write(self, jpeg_bytes: bytes, t: float) -> None:
+        """Append one JPEG frame captured at wall-clock time *t*."""
+        n = len(jpeg_bytes)
+        if not self.frames:
+            self.width, self.height = jpeg_size(jpeg_bytes) or (0, 0)
+            self.t_first = t
+        self._idx1.append((self.size - _HEADER_LEN + 4, n))
+        self._fh.write(b"00dc" + struct.pack("<I", n))
+        self._fh.write(jpeg_bytes)
+        if n & 1:
+            self._fh.write(b"\0")
+        self._idx.write(f"{t - self.t_origin:.6f},{self.size + 8},{n}\n")
+        self.size += 8 + n + (n & 1)
+        self.frames += 1
+        self.t_last = t
+        if n > self._max_frame:
+            self._max_frame = n
+
+    @property
+    def rate(self) -> float:
+        """Measured frames per second (0 until two frames are written)."""
+        if self.frames < 2 or not self.t_last or self.t_last <= (self.t_first or 0):
+            return 0.0
+        return (self.frames - 1) / (self.t_last - self.t_first)
+
+    def close(self) -> dict[str, Any]:
+        """Finish the file and return the segment's metadata."""
+        idx1 = b"".join(struct.pack("<4sIII", b"00dc", 0x10, off, n) for off, n in self._idx1)
+        self._fh.write(_chunk(b"idx1", idx1))
+        riff_size = self.size + len(idx1)
+        movi_size = self.size - _HEADER_LEN + 4
+        rate = min(max(self.rate or _DEFAULT_FPS, _MIN_FILE_FPS), _MAX_FILE_FPS)
+        self._fh.seek(0)
+        self._fh.write(
+            _avi_header(
+                self.width,
+                self.height,
+                self.frames,
+                rate,
+                self._max_frame,
+                riff_size,
+                movi_size,
+            )
+        )
+        self._fh.close()
+        self._idx.close()
+        self._idx1 = []
+        return self.info()
+
+    def info(self) -> dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "index": str(self.index_path),
+            "frames": self.frames,
+            "size_bytes": self.size,
+            "width": self.width,
+            "height": self.height,
+            "start_s": round((self.t_first or self.t_origin) - self.t_origin, 3),
+            "end_s": round((self.t_last or self.t_origin) - self.t_origin, 3),
+            "fps": round(self.rate, 2),
+        }
+
+
+def _set_idle_priority() -> None:
+    """Lower the calling thread to idle priority (Linux per-thread; best effort)."""
+    try:
+        os.sched_setscheduler(0, os.SCHED_IDLE, os.sched_param(0))
+        return
+    except (AttributeError, OSError):
+        pass
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError) as exc:
+        logger.debug("Could not lower transcoder priority: %s", exc)
+
+
+class _Transcoder:
+    """Background MJPEG → MP4 re-encoder running at idle priority.
+
+    Closed segments are queued with :meth:`submit`; ``on_done(avi, mp4)``
+    is called after each one is written (``mp4`` is None on failure).
+    """
+
+    def __init__(self, on_done: Any):
+        self._queue: queue.Queue = queue.Queue()
+        self._on_done = on_done
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, segment: dict[str, Any]) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, daemon=True, name="castor-recorder-transcode"
+            )
+            self._thread.start()
+        self._queue.put(segment)
+
+    def drain(self, timeout: float = 30.0) -> bool:
+        """Wait until every queued segment is done; False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.02)
+        return True
+
+    def _run(self) -> None:
+        _set_idle_priority()
+        while True:
+            segment = self._queue.get()
+            mp4 = None
+            try:
+                try:
+                    mp4 = self._transcode(segment)
+                except Exception as exc:
+                    logger.warning("Transcode of %s failed: %s", segment.get("path"), exc)
+                # Index before task_done() so drain() never returns early.
+                self._on_done(segment["path"], mp4)
+            except Exception as exc:
+                logger.warning("Indexing transcode of %s failed: %s", segment.get("path"), exc)
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _transcode(segment: dict[str, Any]) -> Optional[str]:
+        import numpy as np  # type: ignore
+
+        avi = Path(segment["path"])
+        size = (segment["width"], segment["height"])
+        try:
+            entries = read_segment_index(Path(segment["index"]))
+            fh = open(avi, "rb")  # closed below
+        except FileNotFoundError:
+            return None  # already dropped from the segment ring
+        out = avi.with_suffix(".mp4")
+        tmp = out.with_suffix(".part.mp4")  # cv2 picks the container by extension
+        fps = min(max(segment.get("fps") or _DEFAULT_FPS, _MIN_FILE_FPS), _MAX_FILE_FPS)
+        writer = None
+        try:
+            if not entries or not all(size):
+                return None
+            writer = cv2.VideoWriter(str(tmp), cv2.VideoWriter_fourcc(*_FOURCC), fps, size, True)
+            if not writer.isOpened():
+                return None
+            for _, offset, n in entries:
+                fh.seek(offset)
+                frame = cv2.imdecode(np.frombuffer(fh.read(n), np.uint8), cv2.IMREAD_COLOR)
+                if frame is not None:
+                    writer.write(frame)
+            writer.release()
+            writer = None
+            if not avi.exists():  # dropped from the ring while we worked
+                return None
+            os.replace(tmp, out)
+            return str(out)
+        finally:
+            fh.close()
+            if writer is not None:
+                writer.release()
+            tmp.unlink(missing_ok=True)
+
+
 class VideoRecorder:
-    """Thread-safe MP4 video recorder.
+    """Thread-safe MP4 / pass-through MJPEG video recorder.
 
-    Writes JPEG camera frames (from the perception-action loop) to an MP4 file
-    using OpenCV.  Degrades gracefully to individual JPEG dumps when OpenCV is
-    unavailable.
+    In ``mp4`` mode, writes JPEG camera frames (fed by the gateway while a
+    recording started via ``/api/recording/start`` runs) to an MP4 file using OpenCV, degrading gracefully to individual
+    JPEG dumps when OpenCV is unavailable.  In ``mjpeg`` mode the JPEG bytes
+    are stored as-is in rotating AVI segments (see the module docstring);
+    OpenCV is only needed for the optional transcode.
 
     Args:
         output_dir: Directory for saved recordings.
         fps: Frames per second for the output video.
-        resolution: (width, height) tuple. Frames are resized to fit.
+        resolution: (width, height) tuple. Frames are resized to fit (``mp4``).
+        mode: ``"mp4"`` (re-encode) or ``"mjpeg"`` (pass-through segments).
+        segment_s: Seconds per MJPEG segment (0 = no time limit).
+        segment_mb: Megabytes per MJPEG segment (capped at 1 GB).
+        max_segments: Segments kept per recording; older ones are deleted
+            (0 = keep all).
+        transcode: Re-encode closed MJPEG segments to MP4 at idle priority.
     """
 
     def __init__(
@@ -99,15 +470,38 @@ class VideoRecorder:
         output_dir: Optional[Path] = None,
         fps: int = _DEFAULT_FPS,
         resolution: tuple = _DEFAULT_RESOLUTION,
+        mode: str = "mp4",
+        segment_s: float = _DEFAULT_SEGMENT_S,
+        segment_mb: float = _DEFAULT_SEGMENT_MB,
+        max_segments: int = 0,
+        transcode: bool = False,
     ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown recording mode {mode!r}; expected one of {MODES}")
         self._dir = Path(output_dir or _DEFAULT_DIR)
         self._dir.mkdir(parents=True, exist_ok=True)
         self._fps = fps
         self._resolution = resolution
         self._lock = threading.Lock()
+        self.mode = mode
+        self._segment_s = max(0.0, float(segment_s or 0))
+        self._segment_bytes = min(
+            int(float(segment_mb or 0) * 1e6) or _MAX_SEGMENT_BYTES, _MAX_SEGMENT_BYTES
+        )
+        self._max_segments = max(0, int(max_segments or 0))
+        self._transcoder: Optional[_Transcoder] = None
+        if transcode and mode == "mjpeg":
+            if HAS_CV2:
+                self._transcoder = _Transcoder(self._on_transcoded)
+            else:
+                logger.warning("recording.transcode needs opencv; keeping MJPEG segments only")
 
         self._current: Optional[RecordingMeta] = None
         self._writer: Optional[Any] = None  # cv2.VideoWriter
+        self._segment: Optional[MjpegAviWriter] = None
+        self._segments: list[dict[str, Any]] = []  # closed segments of the current recording
+        self._segment_seq = 0
+        self._dropped_segments = 0
 
         # Load index from disk
         self._index_path = self._dir / "index.json"
@@ -140,7 +534,14 @@ class VideoRecorder:
             meta = RecordingMeta(rec_id, name, path, self._fps)
             self._current = meta
 
-            if HAS_CV2:
+            if self.mode == "mjpeg":
+                meta.path = self._dir / rec_id
+                meta.path.mkdir(exist_ok=True)
+                self._segments = []
+                self._segment_seq = 0
+                self._dropped_segments = 0
+                self._open_segment()
+            elif HAS_CV2:
                 fourcc = cv2.VideoWriter_fourcc(*_FOURCC)
                 self._writer = cv2.VideoWriter(str(path), fourcc, self._fps, self._resolution)
                 if not self._writer.isOpened():
@@ -156,7 +557,7 @@ class VideoRecorder:
                 meta.path = frame_dir
 
             # Initialise the index entry now so annotations can be added during recording
-            self._index[rec_id] = {**meta.to_dict(), "annotations": []}
+            self._index[rec_id] = {**self._meta_dict(meta), "annotations": []}
             self._save_index()
 
             logger.info("Recording started: id=%s name=%s path=%s", rec_id, name, path)
@@ -175,6 +576,9 @@ class VideoRecorder:
             if self._current is None:
                 return False
 
+            if self._segment is not None:
+                return self._write_passthrough(jpeg_bytes)
+
             self._current.frames += 1
 
             if HAS_CV2 and self._writer is not None:
@@ -216,11 +620,13 @@ class VideoRecorder:
             if self._writer is not None:
                 self._writer.release()
                 self._writer = None
+            if self._segment is not None:
+                self._close_segment()
 
             self._current = None
             # Preserve any annotations accumulated during recording
             existing_annotations = self._index.get(meta.id, {}).get("annotations", [])
-            self._index[meta.id] = {**meta.to_dict(), "annotations": existing_annotations}
+            self._index[meta.id] = {**self._meta_dict(meta), "annotations": existing_annotations}
             self._save_index()
 
             logger.info(
@@ -229,19 +635,148 @@ class VideoRecorder:
                 meta.frames,
                 meta.duration_s,
             )
-            return meta.to_dict()
+            return self._meta_dict(meta)
 
     @property
     def is_recording(self) -> bool:
         """True if a recording is in progress."""
         return self._current is not None
 
+    @property
+    def fps(self) -> int:
+        """Configured frame rate (the gateway feeds frames at this rate)."""
+        return self._fps
+
     @property
     def current_info(self) -> Optional[dict[str, Any]]:
         """Metadata for the active recording, or None."""
         with self._lock:
             return self._current.to_dict() if self._current else None
 
+    # ------------------------------------------------------------------
+    # Pass-through MJPEG segments
+    # ------------------------------------------------------------------
+
+    def _meta_dict(self, meta: RecordingMeta) -> dict[str, Any]:
+        d = meta.to_dict()
+        if self.mode == "mjpeg":
+            d["mode"] = "mjpeg"
+            d["segments"] = [dict(seg) for seg in self._segments]
+            d["dropped_segments"] = self._dropped_segments
+        return d
+
+    def _open_segment(self) -> None:
+        path = self._current.path / f"seg_{self._segment_seq:05d}.avi"
+        self._segment = MjpegAviWriter(path, t_origin=self._current.started_at)
+        self._segment_seq += 1
+
+    def _close_segment(self) -> None:
+        seg = self._segment
+        self._segment = None
+        if not seg.frames:
+            seg.close()
+            for p in (seg.path, seg.index_path):
+                p.unlink(missing_ok=True)
+            return
+        info = seg.close()
+        self._segments.append(info)
+        if self._transcoder is not None:
+            self._transcoder.submit(dict(info))
+
+    def _write_passthrough(self, jpeg_bytes: bytes) -> bool:
+        if not jpeg_bytes.startswith(_JPEG_SOI):
+            return False  # blank / null-padded capture
+        now = time.time()
+        seg = self._segment
+        if seg.frames and (
+            (self._segment_s and now - seg.t_first >= self._segment_s)
+            or seg.size + len(jpeg_bytes) + 8 > self._segment_bytes
+        ):
+            self._rotate()
+            seg = self._segment
+        try:
+            seg.write(jpeg_bytes, now)
+        except OSError as exc:
+            logger.debug("MJPEG write error: %s", exc)
+            return False
+        self._current.frames += 1
+        return True
+
+    def _rotate(self) -> None:
+        self._close_segment()
+        # Ring: the open segment counts towards max_segments
+        while self._max_segments and len(self._segments) >= self._max_segments:
+            old = self._segments.pop(0)
+            self._dropped_segments += 1
+            for p in (Path(old["path"]), Path(old["index"]), Path(old["path"]).with_suffix(".mp4")):
+                try:
+                    p.unlink(missing_ok=True)
+                except OSError as exc:
+                    logger.debug("Could not remove old segment %s: %s", p, exc)
+        self._open_segment()
+        entry = self._index.get(self._current.id)
+        if entry is not None:
+            entry.update(
+                {k: v for k, v in self._meta_dict(self._current).items() if k != "annotations"}
+            )
+            self._save_index()
+
+    def _on_transcoded(self, avi_path: str, mp4_path: Optional[str]) -> None:
+        if mp4_path is None:
+            return
+        with self._lock:
+            for entry in self._index.values():
+                for seg in entry.get("segments", ()):
+                    if seg.get("path") == avi_path:
+                        seg["mp4"] = mp4_path
+                        self._save_index()
+                        break
+            for seg in self._segments:
+                if seg.get("path") == avi_path:
+                    seg["mp4"] = mp4_path
+        logger.debug("Transcoded %s → %s", avi_path, mp4_path)
+
+    def wait_transcodes(self, timeout: float = 30.0) -> bool:
+        """Block until queued segment transcodes finish; False on timeout."""
+        return self._transcoder.drain(timeout) if self._transcoder is not None else True
+
+    def segment_file(self, rec_id: str, segment: int = 0) -> Optional[Path]:
+        """Playable file for segment *segment* of an MJPEG recording (its MP4
+        transcode when there is one), or the recording file itself otherwise."""
+        entry = self._index.get(rec_id)
+        if entry is None:
+            return None
+        segments = entry.get("segments")
+        if segments is None:
+            return Path(entry["path"])
+        if not -len(segments) <= segment < len(segments):
+            return None
+        seg = segments[segment]
+        return Path(seg.get("mp4") or seg["path"])
+
+    def frame_at(self, rec_id: str, t_s: float) -> Optional[bytes]:
+        """Return the JPEG recorded at or just before *t_s* seconds into an
+        MJPEG recording, using the segments' timestamp indexes.
+
+        Only closed segments are listed, so each index is parsed once and
+        reused by later lookups."""
+        entry = self._index.get(rec_id)
+        segments = (entry or {}).get("segments") or []
+        for seg in reversed(segments):
+            if seg["start_s"] > t_s and seg is not segments[0]:
+                continue
+            try:
+                idx_path = Path(seg["index"])
+                times, entries = _closed_segment_index(str(idx_path), idx_path.stat().st_mtime_ns)
+            except OSError:
+                return None
+            i = bisect.bisect_right(times, t_s) - 1
+            _, offset, n = entries[max(i, 0)]
+            with open(seg["path"], "rb") as fh:
+                fh.seek(offset)
+                return fh.read(n)
+        return None
+
     # ------------------------------------------------------------------
     # Annotations
     # ------------------------------------------------------------------
@@ -351,11 +886,7 @@ class VideoRecorder:
         for r in recs:
             p = Path(r["path"])
             if p.exists():
-                r["size_bytes"] = (
-                    p.stat().st_size
-                    if p.is_file()
-                    else sum(f.stat().st_size for f in p.rglob("*") if f.is_file())
-                )
+                r["size_bytes"] = _path_size(p)
         return sorted(recs, key=lambda r: r.get("created_at", 0), reverse=True)
 
     def get_recording(self, rec_id: str) -> Optional[dict[str, Any]]:
@@ -412,3 +943,34 @@ def get_recorder() -> VideoRecorder:
     if _recorder is None:
         _recorder = VideoRecorder()
     return _recorder
+
+
+def configure(config: Optional[dict] = None) -> Optional[VideoRecorder]:
+    """Build the singleton from an RCAN config's ``recording`` block.
+
+    Returns the new recorder, or None when there is no block or a recording
+    is already in progress (it keeps its settings).
+    """
+    global _recorder
+    cfg = (config or {}).get("recording")
+    if not cfg:
+        return None
+    if _recorder is not None and _recorder.is_recording:
+        logger.info("Recording in progress; new recording settings apply after it stops")
+        return None
+    _recorder = VideoRecorder(
+        output_dir=cfg.get("output_dir"),
+        fps=int(cfg.get("fps", _DEFAULT_FPS)),
+        mode=cfg.get("mode", "mp4"),
+        segment_s=cfg.get("segment_s", _DEFAULT_SEGMENT_S),
+        segment_mb=cfg.get("segment_mb", _DEFAULT_SEGMENT_MB),
+        max_segments=cfg.get("max_segments", 0),
+        transcode=bool(cfg.get("transcode", False)),
+    )
+    return _recorder
+
+
+def active_recorder() -> Optional[VideoRecorder]:
+    """The singleton if it is recording, else None (cheap; never creates one)."""
+    rec = _recorder
+    return rec if rec is not None and rec.is_recording else None
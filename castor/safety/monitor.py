@@ -3,7 +3,8 @@ Continuous sensor monitoring with configurable thresholds and auto e-stop.
 
 Monitors CPU temperature, memory usage, disk usage, CPU load, and
 force/torque sensors (placeholder). Runs as a background thread with
-configurable interval.
+configurable interval, or as a critical job on a shared
+:class:`~castor.monitor_scheduler.MonitorScheduler`.
 
 Three consecutive critical readings trigger an automatic e-stop callback.
 """
@@ -182,6 +183,8 @@ class SensorMonitor:
 
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._scheduler = None
+        self._job = None
         self._consecutive_critical_count = 0
         self._last_snapshot: Optional[MonitorSnapshot] = None
         self._lock = threading.Lock()
@@ -301,64 +304,86 @@ class SensorMonitor:
         snap.overall_status = worst
         return snap
 
-    def _monitor_loop(self) -> None:
-        """Background monitoring loop."""
-        while not self._stop_event.is_set():
-            try:
-                snap = self.read_once()
-                with self._lock:
-                    self._last_snapshot = snap
-
-                if snap.overall_status == "critical":
-                    self._consecutive_critical_count += 1
-                    for cb in self._critical_callbacks:
-                        try:
-                            cb(snap)
-                        except Exception:
-                            logger.exception("Critical callback error")
-                    if (
-                        self._consecutive_critical_count >= self.consecutive_critical
-                        and self._estop_callback
-                    ):
-                        logger.critical(
-                            "Auto e-stop: %d consecutive critical readings",
-                            self._consecutive_critical_count,
-                        )
-                        try:
-                            self._estop_callback()
-                        except Exception:
-                            logger.exception("E-stop callback error")
-                        self._consecutive_critical_count = 0
-                elif snap.overall_status == "warning":
-                    self._consecutive_critical_count = 0
-                    for cb in self._warning_callbacks:
-                        try:
-                            cb(snap)
-                        except Exception:
-                            logger.exception("Warning callback error")
-                else:
+    def _tick(self) -> None:
+        """Take one reading and dispatch callbacks / auto e-stop."""
+        try:
+            snap = self.read_once()
+            with self._lock:
+                self._last_snapshot = snap
+
+            if snap.overall_status == "critical":
+                self._consecutive_critical_count += 1
+                for cb in self._critical_callbacks:
+                    try:
+                        cb(snap)
+                    except Exception:
+                        logger.exception("Critical callback error")
+                if (
+                    self._consecutive_critical_count >= self.consecutive_critical
+                    and self._estop_callback
+                ):
+                    logger.critical(
+                        "Auto e-stop: %d consecutive critical readings",
+                        self._consecutive_critical_count,
+                    )
+                    try:
+                        self._estop_callback()
+                    except Exception:
+                        logger.exception("E-stop callback error")
                     self._consecutive_critical_count = 0
+            elif snap.overall_status == "warning":
+                self._consecutive_critical_count = 0
+                for cb in self._warning_callbacks:
+                    try:
+                        cb(snap)
+                    except Exception:
+                        logger.exception("Warning callback error")
+            else:
+                self._consecutive_critical_count = 0
 
-            except Exception:
-                logger.exception("Monitor loop error")
+        except Exception:
+            logger.exception("Monitor loop error")
 
+    def _monitor_loop(self) -> None:
+        """Background monitoring loop."""
+        while not self._stop_event.is_set():
+            self._tick()
             self._stop_event.wait(self.interval)
 
-    def start(self) -> None:
-        """Start background monitoring."""
-        if self._thread and self._thread.is_alive():
+    def start(self, scheduler=None) -> None:
+        """Start background monitoring.
+
+        Args:
+            scheduler: Optional shared
+                :class:`~castor.monitor_scheduler.MonitorScheduler`; when
+                given, readings run as a critical job instead of a thread.
+        """
+        if self.running:
             return
         self._stop_event.clear()
         self._consecutive_critical_count = 0
-        self._thread = threading.Thread(
-            target=self._monitor_loop, daemon=True, name="SensorMonitor"
-        )
-        self._thread.start()
+        if scheduler is not None:
+            self._scheduler = scheduler
+            self._job = scheduler.every(
+                f"sensor_monitor-{id(self):x}",
+                self._tick,
+                self.interval,
+                critical=True,
+                first_delay_s=0,
+            )
+        else:
+            self._thread = threading.Thread(
+                target=self._monitor_loop, daemon=True, name="SensorMonitor"
+            )
+            self._thread.start()
         logger.info("Sensor monitor started (interval=%.1fs)", self.interval)
 
     def stop(self, timeout: float = 5.0) -> None:
         """Stop background monitoring."""
         self._stop_event.set()
+        if self._job is not None:
+            self._scheduler.cancel(self._job)
+            self._job = None
         if self._thread:
             self._thread.join(timeout=timeout)
             self._thread = None
@@ -366,6 +391,8 @@ class SensorMonitor:
 
     @property
     def running(self) -> bool:
+        if self._job is not None:
+            return not self._job.cancelled
         return self._thread is not None and self._thread.is_alive()
 
 
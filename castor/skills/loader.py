@@ -7,6 +7,13 @@ skill dicts ready for injection by the ContextBuilder.
 SkillSelector matches an incoming instruction to the best skill using
 keyword overlap (with embedding-based cosine similarity when available).
 
+Selection runs against a :class:`SkillIndex` built once per skill set: an
+inverted keyword index (exact + prefix lookups via a sorted vocabulary) and
+a row-normalised matrix of description embeddings.  Description vectors are
+cached on disk keyed by a hash of (embedder, description), so a selection
+costs one embedding call for the instruction plus one matrix-vector product
+regardless of how many skills are installed.
+
 Search paths (in priority order):
   1. castor/skills/builtin/   — shipped with OpenCastor
   2. ~/.config/opencastor/skills/   — user-installed
@@ -51,16 +58,27 @@ Usage::
 
 from __future__ import annotations
 
+import bisect
+import hashlib
 import json
 import logging
 import os
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 logger = logging.getLogger("OpenCastor.Skills")
 
-__all__ = ["SkillLoader", "SkillSelector", "Skill", "get_skill_data_dir"]
+__all__ = [
+    "SkillLoader",
+    "SkillSelector",
+    "SkillIndex",
+    "Skill",
+    "get_skill_data_dir",
+    "set_skill_embedder",
+]
 
 # Built-in skills directory (alongside this file)
 _BUILTIN_DIR = Path(__file__).parent / "builtin"
@@ -187,6 +205,11 @@ class SkillLoader:
 
         logger.info("SkillLoader: %d skills loaded", len(skills))
         self._cache = skills
+        # Build the selection index now so the first instruction doesn't pay for it
+        index = SkillIndex.for_skills(skills)
+        embedder = _default_embedder()
+        if embedder is not None:
+            index.ensure_embeddings(embedder)
         return skills
 
     def load_skill(self, path: Path) -> Optional[Skill]:
@@ -259,11 +282,16 @@ class SkillSelector:
 
     Selection cascade:
       1. Explicit trigger: instruction starts with /skill-name
-      2. Embedding cosine similarity (if EmbeddingInterpreter available)
+      2. Embedding cosine similarity (if an embedder is registered)
       3. Keyword overlap fallback
       4. None if no match above threshold
     """
 
+    def __init__(self, embedder: Any = None) -> None:
+        # Anything with ``embed(text)`` → vector; defaults to the registered
+        # process-wide embedder (see :func:`set_skill_embedder`).
+        self._embedder = embedder
+
     def select(
         self,
         instruction: str,
@@ -321,57 +349,240 @@ class SkillSelector:
         return True
 
     def _select_by_embedding(self, instruction: str, skills: dict[str, Skill]) -> Optional[Skill]:
-        """Select via cosine similarity of embedded descriptions."""
+        """Select via cosine similarity against the precomputed description matrix."""
+        embedder = self._embedder or _default_embedder()
+        if embedder is None:
+            return None
         try:
-            from castor.learner.embedding_interpreter import EmbeddingInterpreter
-
-            interp = EmbeddingInterpreter.get_default()
-            if interp is None:
+            index = SkillIndex.for_skills(skills)
+            if not index.ensure_embeddings(embedder):
                 return None
-
-            instr_emb = interp.embed(instruction)
-            best_score = _EMBEDDING_THRESHOLD
-            best_skill: Optional[Skill] = None
-
-            for skill in skills.values():
-                desc_emb = interp.embed(skill["description"])
-                score = _cosine_similarity(instr_emb, desc_emb)
-                if score > best_score:
-                    best_score = score
-                    best_skill = skill
-
-            if best_skill:
-                logger.debug(
-                    "Skill selected by embedding: %s (score=%.3f)", best_skill["name"], best_score
-                )
-            return best_skill
-        except Exception:
+            hit = index.match_embedding(embedder.embed(instruction))
+            if hit is None:
+                return None
+            name, score = hit
+            logger.debug("Skill selected by embedding: %s (score=%.3f)", name, score)
+            return skills[name]
+        except Exception as exc:
+            logger.debug("Embedding skill selection failed: %s", exc)
             return None
 
     def _select_by_keywords(self, instruction: str, skills: dict[str, Skill]) -> Optional[Skill]:
         """Select by keyword overlap between instruction and skill description."""
-        instr_words = set(_tokenise(instruction))
-        best_count = _KEYWORD_THRESHOLD - 1
-        best_skill: Optional[Skill] = None
-
-        for skill in skills.values():
-            desc_words = set(_tokenise(skill["description"]))
-            # Exact match + prefix match (handles see/sees, pick/picking, etc.)
-            overlap = 0
-            for iw in instr_words:
-                for dw in desc_words:
-                    if iw == dw or dw.startswith(iw) or iw.startswith(dw):
-                        overlap += 1
-                        break
-            if overlap > best_count:
-                best_count = overlap
-                best_skill = skill
-
-        if best_skill:
-            logger.debug(
-                "Skill selected by keywords: %s (overlap=%d)", best_skill["name"], best_count
-            )
-        return best_skill
+        hit = SkillIndex.for_skills(skills).match_keywords(instruction)
+        if hit is None:
+            return None
+        name, count = hit
+        logger.debug("Skill selected by keywords: %s (overlap=%d)", name, count)
+        return skills[name]
+
+
+# ── Selection index ───────────────────────────────────────────────────────────
+
+_embedder: Any = None
+_INDEX_CACHE: OrderedDict[tuple, SkillIndex] = OrderedDict()
+_INDEX_CACHE_SIZE = 8
+_index_lock = threading.Lock()
+# content-hash → vector, shared across indexes and persisted to disk.  LRU:
+# descriptions that change or disappear age out instead of piling up.
+_vectors: OrderedDict[str, list[float]] = OrderedDict()
+_VECTORS_MAX = 2048
+_vectors_loaded = False
+
+
+def set_skill_embedder(embedder: Any) -> None:
+    """Register the process-wide embedder used for skill selection.
+
+    *embedder* is any object with ``embed(text)`` returning a vector (e.g.
+    an :class:`~castor.providers.embedding_backend.EmbeddingBackend`), or
+    ``None`` to fall back to keyword matching only.
+    """
+    global _embedder
+    _embedder = embedder
+
+
+def _default_embedder() -> Any:
+    return _embedder
+
+
+def _embedder_id(embedder: Any) -> str:
+    name = getattr(embedder, "backend_name", None) or type(embedder).__name__
+    return f"{name}:{getattr(embedder, 'dimensions', '')}"
+
+
+def _vectors_path() -> Path:
+    base = Path(os.environ.get("CASTOR_SKILL_DATA", str(_SKILL_DATA_BASE)))
+    return base / "_index" / "embeddings.json"
+
+
+def _load_vectors() -> None:
+    global _vectors_loaded
+    if _vectors_loaded:
+        return
+    _vectors_loaded = True
+    path = _vectors_path()
+    try:
+        for key, vec in json.loads(path.read_text(encoding="utf-8")).items():
+            _remember_vector(key, vec)
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        logger.debug("Ignoring unreadable skill embedding cache %s: %s", path, exc)
+
+
+def _remember_vector(key: str, vec: list[float]) -> None:
+    """Add *key* as most recently used, evicting the oldest beyond the cap."""
+    _vectors[key] = vec
+    _vectors.move_to_end(key)
+    while len(_vectors) > _VECTORS_MAX:
+        _vectors.popitem(last=False)
+
+
+def _save_vectors() -> None:
+    path = _vectors_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(_vectors), encoding="utf-8")
+        os.replace(tmp, path)
+    except Exception as exc:
+        logger.debug("Failed to persist skill embeddings: %s", exc)
+
+
+class SkillIndex:
+    """Precomputed lookup structures for one skill set.
+
+    Obtain instances with :meth:`for_skills`, which caches them by the
+    skills' (name, description) pairs.
+
+    * Keyword index — description word → skill positions, plus the sorted
+      vocabulary so prefix matches (``pick``/``picking``) are a bisect
+      rather than a scan over every skill.
+    * Embedding matrix — unit-normalised description vectors, one row per
+      skill, built on first use per embedder.
+    """
+
+    def __init__(self, skills: dict[str, Skill]) -> None:
+        self.names: list[str] = list(skills)
+        postings: dict[str, set[int]] = {}
+        for pos, skill in enumerate(skills.values()):
+            for word in set(_tokenise(skill.get("description", ""))):
+                postings.setdefault(word, set()).add(pos)
+        self._postings = postings
+        self._vocab = sorted(postings)
+        self._descriptions = [s.get("description", "") for s in skills.values()]
+        self._matrix: Any = None
+        self._matrix_for: Optional[str] = None
+
+    @classmethod
+    def for_skills(cls, skills: dict[str, Skill]) -> SkillIndex:
+        key = tuple((name, s.get("description", "")) for name, s in skills.items())
+        with _index_lock:
+            index = _INDEX_CACHE.get(key)
+            if index is not None:
+                _INDEX_CACHE.move_to_end(key)
+                return index
+        index = cls(skills)
+        with _index_lock:
+            _INDEX_CACHE[key] = index
+            while len(_INDEX_CACHE) > _INDEX_CACHE_SIZE:
+                _INDEX_CACHE.popitem(last=False)
+        return index
+
+    # ── Keywords ──────────────────────────────────────────────────────
+
+    def _skills_for_word(self, word: str) -> set[int]:
+        """Skills whose description has a word equal to, extending, or prefixing *word*."""
+        hits: set[int] = set()
+        # Description words that start with *word* (includes equality)
+        i = bisect.bisect_left(self._vocab, word)
+        while i < len(self._vocab) and self._vocab[i].startswith(word):
+            hits |= self._postings[self._vocab[i]]
+            i += 1
+        # Description words that *word* starts with (tokens are >= 2 chars)
+        for end in range(2, len(word)):
+            hits |= self._postings.get(word[:end], set())
+        return hits
+
+    def match_keywords(self, instruction: str) -> Optional[tuple[str, int]]:
+        """Return ``(name, overlap)`` for the best keyword match, or None.
+
+        Overlap counts instruction words matching at least one description
+        word; ties go to the earliest skill.
+        """
+        counts = [0] * len(self.names)
+        for word in set(_tokenise(instruction)):
+            for pos in self._skills_for_word(word):
+                counts[pos] += 1
+        if not counts:
+            return None
+        best = max(range(len(counts)), key=lambda p: (counts[p], -p))
+        if counts[best] < _KEYWORD_THRESHOLD:
+            return None
+        return self.names[best], counts[best]
+
+    # ── Embeddings ────────────────────────────────────────────────────
+
+    def ensure_embeddings(self, embedder: Any) -> bool:
+        """Build the description matrix for *embedder* if needed.
+
+        Vectors already cached for the same (embedder, description) are
+        reused; only new or changed descriptions are embedded.  Returns
+        False if the matrix cannot be built.
+        """
+        ident = _embedder_id(embedder)
+        if self._matrix is not None and self._matrix_for == ident:
+            return True
+        if not self.names:
+            return False
+        try:
+            import numpy as np
+
+            with _index_lock:
+                _load_vectors()
+            rows = []
+            dirty = False
+            for desc in self._descriptions:
+                key = hashlib.sha256(f"{ident}\x1f{desc}".encode()).hexdigest()
+                with _index_lock:
+                    vec = _vectors.get(key)
+                    if vec is not None:
+                        _vectors.move_to_end(key)
+                if vec is None:
+                    vec = [float(x) for x in embedder.embed(desc)]
+                    with _index_lock:
+                        _remember_vector(key, vec)
+                    dirty = True
+                rows.append(vec)
+            matrix = np.asarray(rows, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            self._matrix = matrix / norms
+            self._matrix_for = ident
+            if dirty:
+                with _index_lock:
+                    _save_vectors()
+            return True
+        except Exception as exc:
+            logger.debug("Skill embedding index unavailable: %s", exc)
+            return False
+
+    def match_embedding(self, vector: Any) -> Optional[tuple[str, float]]:
+        """Return ``(name, cosine)`` of the nearest description above threshold."""
+        import numpy as np
+
+        if self._matrix is None:
+            return None
+        v = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(v))
+        if norm == 0 or v.shape[0] != self._matrix.shape[1]:
+            return None
+        scores = self._matrix @ (v / norm)
+        best = int(np.argmax(scores))
+        score = float(scores[best])
+        if score <= _EMBEDDING_THRESHOLD:
+            return None
+        return self.names[best], score
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -518,15 +729,3 @@ def _tokenise(text: str) -> list[str]:
     }
     words = re.findall(r"\b[a-z]+\b", text.lower())
     return [w for w in words if w not in _STOP and len(w) >= 2]
-
-
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    """Cosine similarity between two equal-length vectors."""
-    if not a or not b or len(a) != len(b):
-        return 0.0
-    dot = sum(x * y for x, y in zip(a, b, strict=False))
-    mag_a = sum(x * x for x in a) ** 0.5
-    mag_b = sum(x * x for x in b) ** 0.5
-    if mag_a == 0 or mag_b == 0:
-        return 0.0
-    return dot / (mag_a * mag_b)
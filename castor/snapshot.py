@@ -80,6 +80,8 @@ class SnapshotManager:
         self._stop_event = threading.Event()
         self._state_getter: Optional[Callable[[], Any]] = None
         self._interval_s: float = _DEFAULT_INTERVAL_S
+        self._scheduler = None
+        self._job = None
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -89,17 +91,26 @@ class SnapshotManager:
         self,
         interval_s: float = _DEFAULT_INTERVAL_S,
         state_getter: Optional[Callable[[], Any]] = None,
+        scheduler=None,
     ) -> None:
         """Start the background snapshot thread.
 
         Args:
             interval_s: Seconds between automatic snapshots.
             state_getter: Callable returning the AppState object.
+            scheduler: Optional shared
+                :class:`~castor.monitor_scheduler.MonitorScheduler`; when
+                given, snapshots run as a pooled job instead of a thread.
         """
-        if self._thread and self._thread.is_alive():
+        if (self._thread and self._thread.is_alive()) or self._job is not None:
             return
         self._interval_s = interval_s
         self._state_getter = state_getter
+        if scheduler is not None:
+            self._scheduler = scheduler
+            self._job = scheduler.every(f"snapshot-{id(self):x}", self._scheduled_take, interval_s)
+            logger.info("Snapshot manager scheduled (interval=%ss)", interval_s)
+            return
         self._stop_event.clear()
         self._thread = threading.Thread(target=self._loop, daemon=True, name="snapshot-loop")
         self._thread.start()
@@ -108,6 +119,9 @@ class SnapshotManager:
     def stop(self) -> None:
         """Stop the background snapshot thread."""
         self._stop_event.set()
+        if self._job is not None:
+            self._scheduler.cancel(self._job)
+            self._job = None
         if self._thread:
             self._thread.join(timeout=5)
         logger.info("Snapshot manager stopped")
@@ -189,10 +203,13 @@ class SnapshotManager:
 
     def _loop(self) -> None:
         while not self._stop_event.wait(self._interval_s):
-            try:
-                self.take()
-            except Exception as exc:
-                logger.warning("Snapshot loop error: %s", exc)
+            self._scheduled_take()
+
+    def _scheduled_take(self) -> None:
+        try:
+            self.take()
+        except Exception as exc:
+            logger.warning("Snapshot loop error: %s", exc)
 
 
 # ---------------------------------------------------------------------------
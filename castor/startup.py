@@ -0,0 +1,368 @@
+"""
+castor/startup.py — Dependency-declared, concurrent subsystem startup.
+
+Boot used to initialise every subsystem one after another, so a slow
+hardware probe or model warmup delayed everything behind it.  A
+:class:`StartupGraph` declares each subsystem as a step with the steps it
+needs; independent steps run concurrently on a small thread pool::
+
+    boot = StartupGraph()
+
+    @boot.step("brain", required=True)
+    def _brain():
+        ...
+
+    @boot.step("tiered_brain", after=("brain",))
+    def _tiered():
+        ...
+
+    @boot.step("channels", deferred=True)
+    def _channels():
+        ...
+
+    boot.run()            # eager steps; raises if a required step failed
+    ...                   # enter the control loop
+    boot.mark("first_tick")
+    boot.run_deferred()   # non-critical steps, in the background
+
+A step that is not ``required`` logs its failure and its dependents still
+run (each subsystem already tolerates a missing neighbour).  Sequential
+work around the graph is timed with :meth:`StartupGraph.inline`.
+
+:meth:`StartupGraph.format_trace` (``castor run --startup-trace``) lists
+every step's start offset and duration.  It also shows the critical path:
+the chain of steps and waits that decided when boot finished.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+logger = logging.getLogger("OpenCastor.Startup")
+
+__all__ = ["StartupGraph", "StartupStep"]
+
+_DEFAULT_WORKERS = 4
+
+
+class StartupStep:
+    """One subsystem initialiser and its timing."""
+
+    __slots__ = (
+        "name",
+        "fn",
+        "after",
+        "required",
+        "deferred",
+        "status",
+        "start",
+        "end",
+        "thread",
+        "error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        fn: Optional[Callable[[], Any]],
+        after: tuple[str, ...],
+        required: bool,
+        deferred: bool,
+    ) -> None:
+        self.name = name
+        self.fn = fn
+        self.after = after
+        self.required = required
+        self.deferred = deferred
+        self.status = "pending"  # pending | running | ok | failed
+        self.start: Optional[float] = None
+        self.end: Optional[float] = None
+        self.thread = ""
+        self.error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        if self.start is None or self.end is None:
+            return 0.0
+        return self.end - self.start
+
+    def to_dict(self, t0: float) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "after": list(self.after),
+            "required": self.required,
+            "deferred": self.deferred,
+            "status": self.status,
+            "start_s": None if self.start is None else round(self.start - t0, 4),
+            "duration_s": round(self.duration, 4),
+            "thread": self.thread,
+            "error": self.error,
+        }
+
+
+class StartupGraph:
+    """Concurrent, dependency-ordered startup steps with a timing trace.
+
+    Args:
+        workers: Threads used to run independent steps.
+    """
+
+    def __init__(self, workers: int = _DEFAULT_WORKERS) -> None:
+        self._workers = max(1, workers)
+        self._steps: dict[str, StartupStep] = {}
+        self._barrier: Optional[str] = None  # last inline step / graph sink
+        self._marks: dict[str, float] = {}
+        self._deferred_thread: Optional[threading.Thread] = None
+        self.t0 = time.perf_counter()
+
+    # ------------------------------------------------------------------
+    # Declaration
+    # ------------------------------------------------------------------
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        *,
+        after: Iterable[str] = (),
+        required: bool = False,
+        deferred: bool = False,
+    ) -> StartupStep:
+        """Declare step *name*, run after the steps named in *after*."""
+        if name in self._steps:
+            raise ValueError(f"Duplicate startup step: {name!r}")
+        step = StartupStep(name, fn, tuple(after), required, deferred)
+        self._steps[name] = step
+        return step
+
+    def step(
+        self,
+        name: str,
+        *,
+        after: Iterable[str] = (),
+        required: bool = False,
+        deferred: bool = False,
+    ) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+        """Decorator form of :meth:`add`."""
+
+        def decorator(fn: Callable[[], Any]) -> Callable[[], Any]:
+            self.add(name, fn, after=after, required=required, deferred=deferred)
+            return fn
+
+        return decorator
+
+    @contextlib.contextmanager
+    def inline(self, name: str) -> Iterator[None]:
+        """Time a sequential block as a step that follows everything before it."""
+        after = (self._barrier,) if self._barrier else ()
+        step = self.add(name, None, after=after)
+        step.status = "running"
+        step.thread = threading.current_thread().name
+        step.start = time.perf_counter()
+        try:
+            yield
+            step.status = "ok"
+        except BaseException as exc:
+            step.status = "failed"
+            step.error = str(exc) or type(exc).__name__
+            raise
+        finally:
+            step.end = time.perf_counter()
+            self._barrier = name
+
+    def mark(self, label: str) -> None:
+        """Record a milestone (e.g. ``first_tick``) at the current time."""
+        self._marks.setdefault(label, time.perf_counter())
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def run(self) -> None:
+        """Run all pending eager steps, concurrently where dependencies allow.
+
+        Raises the exception of the first required step that failed, after
+        the steps already running have finished.
+        """
+        self._execute([s for s in self._steps.values() if not s.deferred and s.fn is not None])
+
+    def run_deferred(
+        self, background: bool = True, on_done: Optional[Callable[[], None]] = None
+    ) -> Optional[threading.Thread]:
+        """Run deferred steps — on a daemon thread unless *background* is False.
+
+        *on_done* is called once they have all finished (immediately if
+        there are none).
+        """
+        steps = [s for s in self._steps.values() if s.deferred and s.status == "pending"]
+
+        def _run() -> None:
+            try:
+                self._execute(steps)
+            except BaseException as exc:
+                logger.warning("Deferred startup failed: %s", exc)
+            if on_done is not None:
+                on_done()
+
+        if not steps or not background:
+            _run()
+            return None
+        self._deferred_thread = threading.Thread(
+            target=_run, daemon=True, name="castor-startup-deferred"
+        )
+        self._deferred_thread.start()
+        return self._deferred_thread
+
+    def join_deferred(self, timeout: Optional[float] = None) -> None:
+        if self._deferred_thread is not None:
+            self._deferred_thread.join(timeout)
+
+    def _execute(self, steps: list[StartupStep]) -> None:
+        batch = {s.name: s for s in steps if s.status == "pending"}
+        if not batch:
+            return
+        self._validate(batch)
+        barrier = self._barrier
+        for step in batch.values():
+            # Roots of the batch follow the sequential work before them
+            if barrier and not step.after and not step.deferred:
+                step.after = (barrier,)
+        remaining = dict(batch)
+        running: dict[Future, StartupStep] = {}
+        failure: Optional[BaseException] = None
+        with ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="castor-startup"
+        ) as pool:
+            while remaining or running:
+                for name, step in list(remaining.items()):
+                    if not all(self._done(dep) for dep in step.after):
+                        continue
+                    # Checked after the dependencies, so a dependency that just
+                    # failed is seen: nothing new starts once a required step failed
+                    if any(s.required and s.status == "failed" for s in batch.values()):
+                        break
+                    del remaining[name]
+                    step.status = "running"
+                    running[pool.submit(self._call, step)] = step
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    step = running.pop(fut)
+                    exc = fut.result()
+                    if exc is not None and step.required and failure is None:
+                        failure = exc
+        if not any(s.deferred for s in batch.values()):
+            # Later inline work follows whichever step finished last
+            finished = [s for s in batch.values() if s.end is not None]
+            if finished:
+                self._barrier = max(finished, key=lambda s: s.end).name
+        if failure is not None:
+            raise failure
+
+    def _done(self, name: str) -> bool:
+        step = self._steps.get(name)
+        return step is not None and step.status in ("ok", "failed")
+
+    def _call(self, step: StartupStep) -> Optional[BaseException]:
+        step.thread = threading.current_thread().name
+        step.start = time.perf_counter()
+        try:
+            step.fn()
+        except BaseException as exc:  # SystemExit from a required step must surface
+            step.status = "failed"
+            step.error = str(exc) or type(exc).__name__
+            if not step.required:
+                logger.warning("Startup step %r failed: %s", step.name, exc)
+            return exc
+        else:
+            step.status = "ok"
+            return None
+        finally:
+            step.end = time.perf_counter()
+            logger.debug("Startup step %r: %s in %.3fs", step.name, step.status, step.duration)
+
+    def _validate(self, batch: dict[str, StartupStep]) -> None:
+        for step in batch.values():
+            for dep in step.after:
+                if dep not in self._steps:
+                    raise ValueError(f"Startup step {step.name!r} depends on unknown {dep!r}")
+                if self._steps[dep].deferred and not step.deferred:
+                    raise ValueError(
+                        f"Startup step {step.name!r} cannot depend on deferred {dep!r}"
+                    )
+        # Cycle check (depth-first over the batch)
+        state: dict[str, int] = {}
+
+        def visit(name: str, path: tuple[str, ...]) -> None:
+            if state.get(name) == 2 or name not in batch:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Startup dependency cycle: {' -> '.join(path + (name,))}")
+            state[name] = 1
+            for dep in batch[name].after:
+                visit(dep, path + (name,))
+            state[name] = 2
+
+        for name in batch:
+            visit(name, ())
+
+    # ------------------------------------------------------------------
+    # Trace
+    # ------------------------------------------------------------------
+
+    def critical_path(self, until: Optional[str] = None) -> list[StartupStep]:
+        """Steps that determined when *until* (default: the last non-deferred
+        step to finish) completed, earliest first."""
+        steps = [s for s in self._steps.values() if s.end is not None and not s.deferred]
+        if until is not None:
+            tail = self._steps.get(until)
+        else:
+            tail = max(steps, key=lambda s: s.end) if steps else None
+        path: list[StartupStep] = []
+        while tail is not None and tail.end is not None:
+            path.append(tail)
+            deps = [self._steps[d] for d in tail.after if self._steps[d].end is not None]
+            tail = max(deps, key=lambda s: s.end) if deps else None
+        path.reverse()
+        return path
+
+    def trace(self) -> dict[str, Any]:
+        """Return ``{"steps", "critical_path", "marks", "total_s"}`` (seconds
+        relative to graph creation)."""
+        eager = [s for s in self._steps.values() if not s.deferred and s.end is not None]
+        total = max((s.end for s in eager), default=self.t0) - self.t0
+        return {
+            "total_s": round(total, 4),
+            "marks": {k: round(v - self.t0, 4) for k, v in self._marks.items()},
+            "critical_path": [s.name for s in self.critical_path()],
+            "steps": [s.to_dict(self.t0) for s in self._steps.values()],
+        }
+
+    def format_trace(self) -> str:
+        """Human-readable trace: one line per step, then the critical path."""
+        tr = self.trace()
+        on_path = set(tr["critical_path"])
+        lines = [f"Startup trace — boot {tr['total_s']:.3f}s"]
+        for label, at in tr["marks"].items():
+            lines[0] += f", {label} at {at:.3f}s"
+        lines.append(f"  {'':2}{'step':<24}{'start':>8}{'dur':>8}  status")
+        for st in sorted(tr["steps"], key=lambda s: (s["start_s"] is None, s["start_s"] or 0)):
+            flag = "*" if st["name"] in on_path else ("~" if st["deferred"] else " ")
+            start = "-" if st["start_s"] is None else f"{st['start_s']:.3f}"
+            status = st["status"] + (f" ({st['error']})" if st["error"] else "")
+            lines.append(f"  {flag} {st['name']:<24}{start:>8}{st['duration_s']:>8.3f}  {status}")
+        path = [self._steps[n] for n in tr["critical_path"]]
+        if path:
+            lines.append(
+                "Critical path: "
+                + " → ".join(f"{s.name} ({s.duration:.3f}s)" for s in path)
+                + f" = {sum(s.duration for s in path):.3f}s of {tr['total_s']:.3f}s"
+            )
+        lines.append("(* critical path, ~ deferred until after boot)")
+        return "\n".join(lines)
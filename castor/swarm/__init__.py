@@ -16,6 +16,8 @@ Key classes:
   RURI, capabilities, and current status.
 - :class:`SharedMemory` — Distributed key-value store synchronized across
   swarm peers via RCAN messages.
+- :class:`TaskScheduler` — Per-capability priority heaps with leased claims
+  backing the coordinator's task queue.
 - :class:`PatchSync` — Incremental config/state patch synchronization to
   keep all swarm members consistent.
 
@@ -37,12 +39,14 @@ from castor.swarm.coordinator import SwarmCoordinator
 from castor.swarm.events import SwarmEvent
 from castor.swarm.patch_sync import PatchSync
 from castor.swarm.peer import SwarmPeer
+from castor.swarm.scheduler import TaskScheduler
 from castor.swarm.shared_memory import SharedMemory
 from castor.swarm.worker import WorkerConfig, WorkerCoordinator, WorkerResult, WorkerTask
 
 __all__ = [
     "SwarmPeer",
     "SwarmCoordinator",
+    "TaskScheduler",
     "SharedMemory",
     "SwarmConsensus",
     "PatchSync",
@@ -8,6 +8,7 @@ from uuid import uuid4
 
 from castor.swarm.consensus import DelegatedIntent, HandoffRecord, SwarmConsensus
 from castor.swarm.peer import SwarmPeer
+from castor.swarm.scheduler import DEFAULT_LEASE_S, ScoreFn, TaskScheduler
 from castor.swarm.shared_memory import SharedMemory
 
 
@@ -21,6 +22,7 @@ class SwarmTask:
     required_capability: str | None
     priority: int
     created_at: float
+    location: tuple[float, float] | None = None  # (x, y) for locality scoring
 
 
 @dataclass
@@ -36,18 +38,33 @@ class Assignment:
 
 
 class SwarmCoordinator:
-    """Coordinates task assignment across the robot fleet."""
+    """Coordinates task assignment across the robot fleet.
+
+    Pending tasks are held in a :class:`~castor.swarm.scheduler.TaskScheduler`
+    (per-capability priority heaps), and assignments hold a lease of
+    ``lease_s`` seconds that :meth:`reap_expired_leases` requeues.
+    ``score_fn(peer, task)`` picks among capable peers (lower wins); it
+    defaults to the peer's load, and
+    :func:`~castor.swarm.scheduler.locality_score` adds distance to the task.
+    """
 
     def __init__(
-        self, my_robot_id: str, shared_memory: SharedMemory, consensus: SwarmConsensus
+        self,
+        my_robot_id: str,
+        shared_memory: SharedMemory,
+        consensus: SwarmConsensus,
+        score_fn: ScoreFn | None = None,
+        lease_s: float = DEFAULT_LEASE_S,
     ) -> None:
         self.my_robot_id = my_robot_id
         self._mem = shared_memory
         self._consensus = consensus
+        self._score: ScoreFn = score_fn or (lambda peer, task: peer.load_score)
 
         self._peers: dict[str, SwarmPeer] = {}
         self._tasks: dict[str, SwarmTask] = {}
         self._assignments: dict[str, Assignment] = {}
+        self._scheduler = TaskScheduler(lease_s=lease_s)
 
     def add_peer(self, peer: SwarmPeer) -> None:
         self._peers[peer.robot_id] = peer
@@ -87,44 +104,59 @@ class SwarmCoordinator:
 
     def submit_task(self, task: SwarmTask) -> str:
         self._tasks[task.task_id] = task
+        self._scheduler.push(task)
         return task.task_id
 
     def _pending_tasks(self) -> list[SwarmTask]:
-        assigned_ids = {
-            a.task.task_id
-            for a in self._assignments.values()
-            if a.status in {"assigned", "handed_off"}
-        }
-        pending = [t for t in self._tasks.values() if t.task_id not in assigned_ids]
-        pending.sort(key=lambda t: (-t.priority, t.created_at))
-        return pending
+        return self._scheduler.pending()
 
     def assign_next(self) -> Assignment | None:
-        pending = self._pending_tasks()
-        if not pending:
+        self.reap_expired_leases()
+        if not self._scheduler.pending_count():
             return None
 
         available = self.available_peers()
         if not available:
             return None
 
-        for task in pending:
-            candidates = available
-            if task.required_capability:
-                candidates = [p for p in available if p.can_do(task.required_capability)]
-            if not candidates:
-                continue
-
-            best = min(candidates, key=lambda p: p.load_score)
-            if not self._consensus.claim_task(task.task_id):
-                continue
-
-            assignment = Assignment(
-                task=task, assigned_to=best, assigned_at=time.time(), status="assigned"
-            )
-            self._assignments[task.task_id] = assignment
-            return assignment
-        return None
+        capabilities = {cap for p in available for cap in p.capabilities}
+        skipped: list[SwarmTask] = []
+        try:
+            while True:
+                task = self._scheduler.pop(capabilities)
+                if task is None:
+                    return None
+                if not self._consensus.claim_task(task.task_id):
+                    skipped.append(task)  # claimed elsewhere; stays queued
+                    continue
+
+                candidates = available
+                if task.required_capability:
+                    candidates = [p for p in available if p.can_do(task.required_capability)]
+                best = min(candidates, key=lambda p: self._score(p, task))
+                self._scheduler.claim(task, best.robot_id)
+
+                assignment = Assignment(
+                    task=task, assigned_to=best, assigned_at=time.time(), status="assigned"
+                )
+                self._assignments[task.task_id] = assignment
+                return assignment
+        finally:
+            for task in skipped:
+                self._scheduler.push(task)
+
+    def reap_expired_leases(self) -> list[str]:
+        """Requeue tasks whose assignment lease ran out; returns their ids."""
+        expired = self._scheduler.expire_leases()
+        for task_id in expired:
+            assignment = self._assignments.get(task_id)
+            if assignment is not None:
+                assignment.status = "expired"
+            self._consensus.release_task(task_id)
+            task = self._tasks.get(task_id)
+            if task is not None:
+                self._scheduler.push(task)
+        return expired
 
     def delegate_intent(
         self,
@@ -149,9 +181,10 @@ class SwarmCoordinator:
         if not candidates:
             return None
 
-        target = min(candidates, key=lambda p: p.load_score)
+        target = min(candidates, key=lambda p: self._score(p, task))
         if not self._consensus.claim_task(task.task_id):
             return None
+        self._scheduler.claim(task, target.robot_id)
 
         intent = DelegatedIntent(
             intent_id=f"intent-{uuid4().hex}",
@@ -205,6 +238,7 @@ class SwarmCoordinator:
         assignment.assigned_to = recipient
         assignment.assigned_at = time.time()
         assignment.status = "handed_off"
+        self._scheduler.renew(task_id, to_robot_id)
         return handoff
 
     def reassign_unhealthy(self) -> list[Assignment]:
@@ -228,7 +262,7 @@ class SwarmCoordinator:
             ]
             if not candidates:
                 continue
-            replacement = min(candidates, key=lambda p: p.load_score)
+            replacement = min(candidates, key=lambda p: self._score(p, assignment.task))
 
             if assignment.intent_id:
                 handoff = self._consensus.record_handoff(
@@ -243,14 +277,19 @@ class SwarmCoordinator:
             assignment.assigned_to = replacement
             assignment.assigned_at = time.time()
             assignment.status = "assigned"
+            self._scheduler.renew(task_id, replacement.robot_id)
             reassigned.append(assignment)
         return reassigned
 
     def complete_task(self, task_id: str, success: bool) -> None:
+        """Finish a task's lease; failed tasks go back on the queue."""
         assignment = self._assignments.get(task_id)
         if assignment is not None:
             assignment.status = "completed" if success else "failed"
+        self._scheduler.complete(task_id)
         self._consensus.release_task(task_id)
+        if not success and task_id in self._tasks:
+            self._scheduler.requeue(self._tasks[task_id])
 
     def _world_model_snapshot(self) -> dict:
         return {k: v.to_dict() for k, v in self._mem.snapshot().items()}
@@ -259,7 +298,7 @@ class SwarmCoordinator:
         assigned_count = sum(
             1 for a in self._assignments.values() if a.status in {"assigned", "handed_off"}
         )
-        pending_count = len(self._pending_tasks())
+        pending_count = self._scheduler.pending_count()
         unhealthy = sum(1 for p in self._peers.values() if p.is_degraded or p.is_disconnected)
         status = {
             "peers": len(self._peers),
@@ -1,13 +1,40 @@
-"""SharedMemory — cross-robot shared knowledge store with JSON persistence."""
+"""SharedMemory — cross-robot shared knowledge store with delta sync and a change log.
+
+Every entry carries a per-key version vector (``{robot_id: counter}``).  A
+write by robot R bumps R's counter, so causally ordered writes are resolved
+by the vectors rather than by wall clocks; only genuinely concurrent writes
+fall back to ``(timestamp, robot_id)`` as a deterministic tiebreak.  Deletes
+are tombstones that replicate like writes.
+
+Anti-entropy exchanges summaries, not state: :meth:`SharedMemory.summary`
+is the version vector of everything a node has applied, and
+:meth:`SharedMemory.delta_since` returns only the entries a peer with that
+summary has not seen.  A round therefore costs O(changed keys)::
+
+    delta = peer.delta_since(mem.summary())
+    mem.apply_delta(delta)
+
+Persistence appends changed entries to ``<persist_path>.log`` on
+:meth:`SharedMemory.save` and compacts the log into the JSON snapshot at
+``persist_path`` once it outgrows the live state.  The snapshot keeps its
+bookkeeping under a reserved key, so that key cannot be written by users.
+"""
 
 from __future__ import annotations
 
+import bisect
+import copy
 import json
+import os
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+_META_KEY = "__shared_memory_meta__"
+_TOMBSTONE_TTL_S = 86400.0  # deletes older than this stop propagating
+_COMPACT_AFTER = 1000  # log lines before compaction (or the live size, if larger)
+
 
 @dataclass
 class MemoryEntry:
@@ -18,6 +45,8 @@ class MemoryEntry:
     robot_id: str  # which robot wrote it
     timestamp: float
     ttl_s: float | None  # None = permanent
+    version: dict[str, int] = field(default_factory=dict)  # per-key version vector
+    deleted: bool = False  # tombstone
 
     def is_expired(self) -> bool:
         if self.ttl_s is None:
@@ -25,13 +54,17 @@ class MemoryEntry:
         return (time.time() - self.timestamp) > self.ttl_s
 
     def to_dict(self) -> dict:
-        return {
+        d = {
             "key": self.key,
             "value": self.value,
             "robot_id": self.robot_id,
             "timestamp": self.timestamp,
             "ttl_s": self.ttl_s,
+            "version": dict(self.version),
         }
+        if self.deleted:
+            d["deleted"] = True
+        return d
 
     @classmethod
     def from_dict(cls, d: dict) -> MemoryEntry:
@@ -41,35 +74,68 @@ class MemoryEntry:
             robot_id=d["robot_id"],
             timestamp=float(d["timestamp"]),
             ttl_s=d.get("ttl_s"),
+            version={str(k): int(v) for k, v in (d.get("version") or {}).items()},
+            deleted=bool(d.get("deleted", False)),
         )
 
 
+def _dominates(a: dict[str, int], b: dict[str, int]) -> bool:
+    """True when version vector *a* has seen everything *b* has."""
+    return all(a.get(r, 0) >= c for r, c in b.items())
+
+
+def _vv_max(a: dict[str, int], b: dict[str, int]) -> dict[str, int]:
+    out = dict(a)
+    for r, c in b.items():
+        if c > out.get(r, 0):
+            out[r] = c
+    return out
+
+
 class SharedMemory:
     """Cross-robot shared knowledge store.
 
-    Persists to a JSON file and can merge remote snapshots via simple rules.
+    Args:
+        robot_id:      This robot's identity (its version-vector component).
+        persist_path:  JSON snapshot path; the change log sits beside it.
+        compact_after: Log lines tolerated before :meth:`save` compacts.
     """
 
-    def __init__(self, robot_id: str, persist_path: str | None = None) -> None:
+    def __init__(
+        self,
+        robot_id: str,
+        persist_path: str | None = None,
+        compact_after: int = _COMPACT_AFTER,
+    ) -> None:
         self.robot_id = robot_id
         if persist_path is None:
             persist_path = str(Path.home() / ".opencastor" / "swarm_memory.json")
         self._path = persist_path
+        self._log_path = persist_path + ".log"
+        self._compact_after = compact_after
         self._store: dict[str, MemoryEntry] = {}
+        self._tombstones: dict[str, MemoryEntry] = {}
+        # Knowledge summary: robot_id → highest counter whose effects are applied
+        self._summary: dict[str, int] = {}
+        # robot_id → sorted [(counter, key)] over stored version vectors; stale
+        # pairs (key since rewritten) are skipped on read and pruned lazily
+        self._index: dict[str, list[tuple[int, str]]] = {}
+        self._dirty: set[str] = set()
+        self._log_lines = 0
 
     # ------------------------------------------------------------------
     # Core API
     # ------------------------------------------------------------------
 
     def put(self, key: str, value: Any, ttl_s: float | None = None) -> None:
-        """Store a value under key, associated with this robot."""
-        self._store[key] = MemoryEntry(
-            key=key,
-            value=value,
-            robot_id=self.robot_id,
-            timestamp=time.time(),
-            ttl_s=ttl_s,
-        )
+        """Store a value under key, associated with this robot.
+
+        Raises:
+            ValueError: if *key* is the snapshot's reserved metadata key.
+        """
+        if key == _META_KEY:
+            raise ValueError(f"{_META_KEY!r} is reserved")
+        self._write(key, value, ttl_s, deleted=False)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Return the value for key, or default if missing/expired."""
@@ -82,11 +148,14 @@ class SharedMemory:
         return entry.value
 
     def delete(self, key: str) -> bool:
-        """Remove key. Returns True if key existed."""
-        if key in self._store:
-            del self._store[key]
-            return True
-        return False
+        """Remove key. Returns True if key existed.
+
+        The delete is recorded as a tombstone so it replicates to peers.
+        """
+        if key not in self._store:
+            return False
+        self._write(key, None, None, deleted=True)
+        return True
 
     def keys(self) -> list[str]:
         """Return all live (non-expired) keys."""
@@ -94,10 +163,13 @@ class SharedMemory:
         return list(self._store.keys())
 
     def expire_stale(self) -> int:
-        """Remove expired entries. Returns count removed."""
+        """Remove expired entries and old tombstones. Returns live entries removed."""
         expired = [k for k, v in self._store.items() if v.is_expired()]
         for k in expired:
             del self._store[k]
+        cutoff = time.time() - _TOMBSTONE_TTL_S
+        for k in [k for k, v in self._tombstones.items() if v.timestamp < cutoff]:
+            del self._tombstones[k]
         return len(expired)
 
     def snapshot(self) -> dict:
@@ -106,43 +178,254 @@ class SharedMemory:
         return dict(self._store)
 
     def merge(self, remote_snapshot: dict) -> int:
-        """Merge remote entries into local store.
+        """Merge a full remote snapshot into the local store.
 
-        remote_snapshot may contain MemoryEntry objects or dicts.
-        Merge rule: keep entry with the latest timestamp.
+        remote_snapshot may contain MemoryEntry objects or dicts.  Versioned
+        entries are resolved by version vector; entries without one (older
+        peers) fall back to the latest timestamp.  A snapshot is not known
+        to be complete, so the knowledge summary is left unchanged — prefer
+        :meth:`apply_delta` between versioned peers.
         Returns count of entries merged (updated or added).
         """
         merged = 0
-        for key, entry in remote_snapshot.items():
+        for entry in remote_snapshot.values():
             if isinstance(entry, dict):
                 entry = MemoryEntry.from_dict(entry)
-            if entry.is_expired():
+            if self._merge_entry(entry):
+                merged += 1
+        return merged
+
+    # ------------------------------------------------------------------
+    # Delta anti-entropy
+    # ------------------------------------------------------------------
+
+    def summary(self) -> dict[str, int]:
+        """Version vector of every write this node has applied (its digest)."""
+        return dict(self._summary)
+
+    def delta_since(self, remote_summary: dict[str, int] | None = None) -> dict:
+        """Return the entries a peer holding *remote_summary* has not seen.
+
+        The result is JSON-serialisable: ``{"from", "summary", "entries"}``.
+        Cost is proportional to the number of unseen writes, not the store.
+        """
+        remote_summary = remote_summary or {}
+        keys: set[str] = set()
+        for origin, mine in self._summary.items():
+            theirs = remote_summary.get(origin, 0)
+            if mine <= theirs:
                 continue
-            local = self._store.get(key)
-            if local is None or entry.timestamp > local.timestamp:
-                self._store[key] = entry
+            pairs = self._index.get(origin, [])
+            for counter, key in pairs[bisect.bisect_left(pairs, (theirs + 1,)) :]:
+                entry = self._store.get(key) or self._tombstones.get(key)
+                if entry is not None and entry.version.get(origin) == counter:
+                    keys.add(key)
+        entries = []
+        for key in sorted(keys):
+            entry = self._store.get(key) or self._tombstones[key]
+            if not entry.is_expired():
+                entries.append(entry.to_dict())
+        return {"from": self.robot_id, "summary": dict(self._summary), "entries": entries}
+
+    def apply_delta(self, delta: dict) -> int:
+        """Apply a peer's :meth:`delta_since` result. Returns entries changed.
+
+        A delta is complete relative to the summary it was computed against,
+        so the local summary advances to cover the sender's.
+        """
+        merged = 0
+        for raw in delta.get("entries", []):
+            entry = raw if isinstance(raw, MemoryEntry) else MemoryEntry.from_dict(raw)
+            if self._merge_entry(entry):
                 merged += 1
+        self._summary = _vv_max(self._summary, delta.get("summary") or {})
         return merged
 
+    def sync_with(self, peer: SharedMemory) -> int:
+        """One in-process anti-entropy round in both directions. Returns entries changed."""
+        changed = self.apply_delta(peer.delta_since(self.summary()))
+        changed += peer.apply_delta(self.delta_since(peer.summary()))
+        return changed
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _current(self, key: str) -> MemoryEntry | None:
+        return self._store.get(key) or self._tombstones.get(key)
+
+    def _write(self, key: str, value: Any, ttl_s: float | None, deleted: bool) -> None:
+        counter = self._summary.get(self.robot_id, 0) + 1
+        self._summary[self.robot_id] = counter
+        prev = self._current(key)
+        version = dict(prev.version) if prev is not None else {}
+        version[self.robot_id] = counter
+        self._install(
+            MemoryEntry(
+                key=key,
+                value=value,
+                robot_id=self.robot_id,
+                timestamp=time.time(),
+                ttl_s=ttl_s,
+                version=version,
+                deleted=deleted,
+            )
+        )
+
+    def _merge_entry(self, entry: MemoryEntry) -> bool:
+        """Resolve *entry* against the local copy. True when the value changed."""
+        if entry.is_expired() or entry.key == _META_KEY:
+            return False
+        local = self._current(entry.key)
+        if local is None:
+            self._install(entry)
+            return not entry.deleted
+        if not entry.version or not local.version:
+            # Unversioned (legacy) entry: last write wins by timestamp
+            if entry.timestamp > local.timestamp:
+                self._install(entry)
+                return True
+            return False
+        if _dominates(local.version, entry.version):
+            return False
+        if _dominates(entry.version, local.version):
+            self._install(entry)
+            return True
+        # Concurrent writes: deterministic winner, merged history so the
+        # result supersedes both on every peer
+        version = _vv_max(local.version, entry.version)
+        if (entry.timestamp, entry.robot_id) > (local.timestamp, local.robot_id):
+            winner, changed = entry, True
+        else:
+            winner, changed = local, False
+        self._install(copy.copy(winner), version=version)
+        return changed
+
+    def _install(self, entry: MemoryEntry, version: dict[str, int] | None = None) -> None:
+        if version is not None:
+            entry.version = version
+        key = entry.key
+        if entry.deleted:
+            self._store.pop(key, None)
+            self._tombstones[key] = entry
+        else:
+            self._tombstones.pop(key, None)
+            self._store[key] = entry
+        for origin, counter in entry.version.items():
+            self._index_add(origin, counter, key)
+        self._dirty.add(key)
+
+    def _index_add(self, origin: str, counter: int, key: str) -> None:
+        pairs = self._index.setdefault(origin, [])
+        if not pairs or pairs[-1] < (counter, key):
+            pairs.append((counter, key))
+        else:
+            bisect.insort(pairs, (counter, key))
+        if len(pairs) > 64 and len(pairs) > 2 * (len(self._store) + len(self._tombstones)):
+            self._index[origin] = [
+                (c, k) for c, k in pairs if (e := self._current(k)) and e.version.get(origin) == c
+            ]
+
+    def _rebuild_index(self) -> None:
+        self._index = {}
+        for entry in list(self._store.values()) + list(self._tombstones.values()):
+            for origin, counter in entry.version.items():
+                self._index.setdefault(origin, []).append((counter, entry.key))
+        for pairs in self._index.values():
+            pairs.sort()
+
     # ------------------------------------------------------------------
     # Persistence
     # ------------------------------------------------------------------
 
     def save(self) -> None:
-        """Persist current store to JSON file."""
+        """Persist changes since the last save.
+
+        Changed entries are appended to the change log; once the log holds
+        more lines than ``max(compact_after, live entries)`` it is folded into
+        a fresh snapshot via :meth:`compact`.
+        """
+        path = Path(self._path)
+        pending = self._log_lines + len(self._dirty) + 1
+        if not path.exists() or pending > max(self._compact_after, len(self._store)):
+            self.compact()
+            return
+        if not self._dirty:
+            return
+        lines = []
+        for key in sorted(self._dirty):
+            entry = self._current(key)
+            if entry is not None:
+                lines.append(json.dumps(entry.to_dict()))
+        lines.append(json.dumps({"_meta": {"summary": self._summary}}))
+        with open(self._log_path, "a", encoding="utf-8") as fh:
+            fh.write("\n".join(lines) + "\n")
+        self._log_lines += len(lines)
+        self._dirty.clear()
+
+    def compact(self) -> None:
+        """Rewrite the snapshot from the current state and truncate the change log."""
+        self.expire_stale()
         path = Path(self._path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        data = {k: v.to_dict() for k, v in self._store.items()}
-        path.write_text(json.dumps(data, indent=2))
+        data: dict[str, Any] = {k: v.to_dict() for k, v in self._store.items()}
+        data[_META_KEY] = {
+            "summary": self._summary,
+            "tombstones": [t.to_dict() for t in self._tombstones.values()],
+        }
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(data))
+        os.replace(tmp, path)
+        try:
+            os.unlink(self._log_path)
+        except FileNotFoundError:
+            pass
+        self._log_lines = 0
+        self._dirty.clear()
 
     def load(self) -> None:
-        """Load store from JSON file (if it exists)."""
+        """Load the snapshot and replay the change log (if they exist)."""
         path = Path(self._path)
         if not path.exists():
             return
         try:
             data = json.loads(path.read_text())
+            meta = data.pop(_META_KEY, None) or {}
             self._store = {k: MemoryEntry.from_dict(v) for k, v in data.items()}
-        except (json.JSONDecodeError, KeyError):
+            self._tombstones = {
+                t["key"]: MemoryEntry.from_dict(t) for t in meta.get("tombstones", [])
+            }
+            self._summary = {str(k): int(v) for k, v in meta.get("summary", {}).items()}
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError, AttributeError):
             # Corrupt file — start fresh
-            self._store = {}
+            self._store, self._tombstones, self._summary = {}, {}, {}
+        self._log_lines = 0
+        self._replay_log()
+        for key in [k for k, v in self._store.items() if v.deleted]:
+            self._tombstones[key] = self._store.pop(key)
+        self._rebuild_index()
+        # Our own writes are always known locally, even past a torn log tail
+        own = max((c for c, _ in self._index.get(self.robot_id, [])), default=0)
+        if own > self._summary.get(self.robot_id, 0):
+            self._summary[self.robot_id] = own
+        self._dirty.clear()
+
+    def _replay_log(self) -> None:
+        try:
+            fh = open(self._log_path, encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                    if "_meta" in record:
+                        summary = record["_meta"].get("summary", {})
+                        self._summary = {str(k): int(v) for k, v in summary.items()}
+                    else:
+                        entry = MemoryEntry.from_dict(record)
+                        self._tombstones.pop(entry.key, None)
+                        self._store[entry.key] = entry
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    break  # torn tail from an interrupted append
+                self._log_lines += 1
@@ -17,11 +17,22 @@ Three layers, fastest first:
 
 The control loop runs Layer 0 every tick, Layer 1 every tick (async),
 and Layer 2 every N ticks or when Layer 1 signals uncertainty.
+
+With ``tiered_brain.async_planner: true`` Layer 2 runs as a background
+job instead of inside the tick: at most one plan is in flight, the fast
+layer keeps ticking on the last valid plan, and a finished plan is
+adopted atomically on the next tick.  Plans carry a version (epoch) and
+an expiry; results that were superseded or expired are discarded and
+counted in :meth:`TieredBrain.get_stats`.
 """
 
+import json
 import logging
+import threading
 import time
+import zlib
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from .providers.base import Thought
 from .providers.task_router import TaskCategory, TaskRouter
@@ -43,12 +54,51 @@ _PREFER_PLANNER_CATEGORIES: frozenset[TaskCategory] = frozenset(
 )
 
 
+# Placeholder frame returned by cameras when no image is available.  Cameras
+# should return this exact object so the reactive layer can recognise it by
+# identity instead of scanning the buffer.
+BLANK_FRAME = b"\x00" * 1024
+
+# cv2.imdecode flags for decoding a JPEG at 1/N scale (cheaper than full decode).
+_REDUCED_DECODE_FLAGS = {
+    2: "IMREAD_REDUCED_COLOR_2",
+    4: "IMREAD_REDUCED_COLOR_4",
+    8: "IMREAD_REDUCED_COLOR_8",
+}
+
+# Whether this OpenCV build's Python binding takes imdecode(buf, flags, dst).
+# Probed on the first decode; None = not known yet.
+_IMDECODE_DST: bool | None = None
+
+
+def _is_blank(frame) -> bool:
+    """Return True if *frame* (bytes or ndarray) is all zeros.
+
+    O(1) for the :data:`BLANK_FRAME` sentinel and for real JPEGs (which
+    start with ``0xFF``); only buffers whose first byte is zero are scanned,
+    and ``bytes.count`` does so without allocating.
+    """
+    if frame is BLANK_FRAME:
+        return True
+    if isinstance(frame, (bytes, bytearray)):
+        if frame[0] != 0:
+            return False
+        return frame.count(0) == len(frame)
+    return not frame.any()
+
+
 class ReactiveLayer:
     """Layer 0: Rule-based reactive safety controller.
 
     Combines hardcoded rules (<1ms) with optional Hailo-8 NPU
     object detection (~20ms) for obstacle avoidance without API calls.
     Returns an action if triggered, None to pass to next layer.
+
+    Frames may be JPEG bytes or an already-decoded (optionally downscaled)
+    BGR ``numpy`` array; passing the raw array skips the JPEG decode.
+    Hailo detection reuses its decode/resize buffers, runs at most every
+    ``hailo_detect_interval`` ticks, and is skipped entirely when the
+    scene hash is unchanged since the last detection.
     """
 
     def __init__(self, config: dict):
@@ -65,8 +115,18 @@ class ReactiveLayer:
         # If camera_required=False, blank/missing frames are NOT a blocking condition.
         # The brain will run text-only (messaging, sensor data) without a live frame.
         self.camera_required = config.get("camera", {}).get("camera_required", True)
+        # Hailo detection cadence: run at most every N ticks; reuse the last
+        # result in between or whenever the scene hash has not changed.
+        self.hailo_detect_interval = max(1, int(reactive.get("hailo_detect_interval", 1)))
+        # Decode JPEGs at 1/N scale for detection (1, 2, 4 or 8).
+        self.hailo_decode_scale = int(reactive.get("hailo_decode_scale", 1))
         self._hailo = None
         self.last_detections = []  # Expose for telemetry/logging
+        self._ticks_since_detect = 0
+        self._last_scene_hash: int | None = None
+        self._last_hailo_result: dict | None = None
+        self._decode_buf = None  # last decoded frame, reused as the decode target
+        self.detect_stats = {"detections": 0, "skipped_cadence": 0, "skipped_unchanged": 0}
 
         if self.hailo_enabled:
             try:
@@ -82,17 +142,28 @@ class ReactiveLayer:
             except Exception as e:
                 logger.debug(f"Hailo vision not available: {e}")
 
-    def evaluate(self, frame_bytes: bytes, sensor_data: dict | None = None) -> dict | None:
-        """Check reactive safety rules. Returns action dict or None."""
+    def evaluate(self, frame_bytes, sensor_data: dict | None = None, raw_frame=None) -> dict | None:
+        """Check reactive safety rules. Returns action dict or None.
+
+        Args:
+            frame_bytes:  JPEG bytes, or a decoded BGR ``numpy`` array.
+            sensor_data:  Optional sensor snapshot dict.
+            raw_frame:    Optional decoded (possibly downscaled) BGR array
+                          matching *frame_bytes*; used for detection
+                          instead of decoding the JPEG.
+        """
         # Rule 1: Blank/missing frame → wait (skipped if camera_required=False)
-        if not frame_bytes or len(frame_bytes) < self.blank_threshold:
+        frame_size = 0 if frame_bytes is None else getattr(frame_bytes, "nbytes", None)
+        if frame_size is None:
+            frame_size = len(frame_bytes)
+        if not frame_size or frame_size < self.blank_threshold:
             if self.camera_required:
                 return {"type": "wait", "duration_ms": 500, "reason": "no_camera_data"}
             # camera_required=False: pass through to fast brain (text/sensor-only mode)
             return None
 
         # Rule 2: All-black frame (camera blocked/failed) — skipped if camera_required=False
-        if frame_bytes == b"\x00" * len(frame_bytes):
+        if _is_blank(frame_bytes):
             if self.camera_required:
                 return {"type": "wait", "duration_ms": 500, "reason": "blank_frame"}
             return None
@@ -111,57 +182,122 @@ class ReactiveLayer:
         # Rule 5: Hailo-8 NPU object detection (~20ms)
         if self._hailo is not None:
             try:
-                import cv2
-                import numpy as np
-
-                # Decode JPEG to frame
-                arr = np.frombuffer(frame_bytes, dtype=np.uint8)
-                frame = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-                if frame is not None:
-                    result = self._hailo.detect_obstacles(frame)
-                    self.last_detections = result.get("all_detections", [])
-
-                    nearest = result.get("nearest_obstacle")
-                    if nearest:
-                        dist_m = nearest.estimate_distance_m(self.hailo_calibration)
-                        if dist_m <= self.hailo_stop_distance_m:
-                            logger.warning(
-                                "Reactive: %s at ~%.2fm — e-stop!",
-                                nearest.class_name,
-                                dist_m,
-                            )
-                            return {
-                                "type": "stop",
-                                "reason": f"hailo_{nearest.class_name}_{dist_m:.2f}m",
-                            }
-                        if dist_m <= self.hailo_warn_distance_m:
-                            logger.info(
-                                "Reactive: %s at ~%.2fm — slowing",
-                                nearest.class_name,
-                                dist_m,
-                            )
-                            return {
-                                "type": "move",
-                                "linear": 0.0,
-                                "angular": 0.3,
-                                "reason": f"hailo_warn_{nearest.class_name}_{dist_m:.2f}m",
-                            }
-
-                    if not result["clear_path"] and result["obstacles"]:
-                        # Obstacles in center path but beyond warn distance — nudge
-                        names = [d.class_name for d in result["obstacles"][:3]]
-                        return {
-                            "type": "move",
-                            "linear": 0.0,
-                            "angular": 0.3,  # Turn to avoid
-                            "reason": f"hailo_avoid_{','.join(names)}",
-                        }
+                result = self._detect(frame_bytes, raw_frame)
+                if result is not None:
+                    return self._hailo_action(result)
             except Exception as e:
                 logger.debug(f"Hailo detection error: {e}")
 
         # No reactive trigger — pass to next layer
         return None
 
+    def _scene_hash(self, frame_bytes, raw_frame) -> int:
+        """Cheap content hash used to skip detection on unchanged scenes."""
+        if raw_frame is not None:
+            # Hash a coarse subsample: catches scene changes, costs ~KBs
+            return zlib.crc32(raw_frame[::16, ::16].tobytes())
+        if isinstance(frame_bytes, (bytes, bytearray, memoryview)):
+            return zlib.crc32(frame_bytes)
+        return zlib.crc32(frame_bytes[::16, ::16].tobytes())
+
+    def _detect(self, frame_bytes, raw_frame) -> dict | None:
+        """Run (or reuse) Hailo detection for this tick."""
+        if not isinstance(frame_bytes, (bytes, bytearray, memoryview)) and raw_frame is None:
+            raw_frame = frame_bytes
+        self._ticks_since_detect += 1
+        if self._last_hailo_result is not None:
+            if self._ticks_since_detect < self.hailo_detect_interval:
+                self.detect_stats["skipped_cadence"] += 1
+                return self._last_hailo_result
+        scene_hash = self._scene_hash(frame_bytes, raw_frame)
+        if self._last_hailo_result is not None and scene_hash == self._last_scene_hash:
+            self.detect_stats["skipped_unchanged"] += 1
+            self._ticks_since_detect = 0
+            return self._last_hailo_result
+
+        frame = raw_frame if raw_frame is not None else self._decode(frame_bytes)
+        if frame is None:
+            return None
+        result = self._hailo.detect_obstacles(frame)
+        self.detect_stats["detections"] += 1
+        self.last_detections = result.get("all_detections", [])
+        self._last_hailo_result = result
+        self._last_scene_hash = scene_hash
+        self._ticks_since_detect = 0
+        return result
+
+    def _decode(self, frame_bytes):
+        """Decode JPEG bytes (zero-copy view, optionally at reduced scale).
+
+        When the OpenCV binding accepts imdecode's ``dst`` argument, frames
+        of the same size are decoded into the previous tick's array.
+        Bindings without it (OpenCV 5.0 at least) allocate per decode.
+        Callers that already have the raw frame should pass ``raw_frame``.
+        """
+        global _IMDECODE_DST
+        import cv2
+        import numpy as np
+
+        flag_name = _REDUCED_DECODE_FLAGS.get(self.hailo_decode_scale, "IMREAD_COLOR")
+        flags = getattr(cv2, flag_name, cv2.IMREAD_COLOR)
+        arr = np.frombuffer(frame_bytes, dtype=np.uint8)
+        frame = None
+        if self._decode_buf is not None and _IMDECODE_DST is not False:
+            try:
+                frame = cv2.imdecode(arr, flags, self._decode_buf)
+                _IMDECODE_DST = True
+            except (cv2.error, TypeError):
+                if _IMDECODE_DST is None:
+                    logger.debug("cv2.imdecode has no dst argument; decoding allocates")
+                    _IMDECODE_DST = False
+                else:
+                    raise
+        if frame is None and not _IMDECODE_DST:
+            frame = cv2.imdecode(arr, flags)
+        if frame is not None and frame.size:
+            self._decode_buf = frame
+            return frame
+        return None
+
+    def _hailo_action(self, result: dict) -> dict | None:
+        """Map a Hailo obstacle result to a reactive action (or None)."""
+        nearest = result.get("nearest_obstacle")
+        if nearest:
+            dist_m = nearest.estimate_distance_m(self.hailo_calibration)
+            if dist_m <= self.hailo_stop_distance_m:
+                logger.warning(
+                    "Reactive: %s at ~%.2fm — e-stop!",
+                    nearest.class_name,
+                    dist_m,
+                )
+                return {
+                    "type": "stop",
+                    "reason": f"hailo_{nearest.class_name}_{dist_m:.2f}m",
+                }
+            if dist_m <= self.hailo_warn_distance_m:
+                logger.info(
+                    "Reactive: %s at ~%.2fm — slowing",
+                    nearest.class_name,
+                    dist_m,
+                )
+                return {
+                    "type": "move",
+                    "linear": 0.0,
+                    "angular": 0.3,
+                    "reason": f"hailo_warn_{nearest.class_name}_{dist_m:.2f}m",
+                }
+
+        if not result["clear_path"] and result["obstacles"]:
+            # Obstacles in center path but beyond warn distance — nudge
+            names = [d.class_name for d in result["obstacles"][:3]]
+            return {
+                "type": "move",
+                "linear": 0.0,
+                "angular": 0.3,  # Turn to avoid
+                "reason": f"hailo_avoid_{','.join(names)}",
+            }
+        return None
+
     def close(self):
         """Release Hailo resources."""
         if self._hailo:
@@ -204,6 +340,17 @@ class TieredBrain:
         self.last_plan = None
         self.last_plan_time = 0
 
+        # Asynchronous planner (opt-in): one plan in flight, versioned + expiring
+        tb_cfg = config.get("tiered_brain", {})
+        self.async_planner = bool(tb_cfg.get("async_planner", False))
+        self.plan_ttl_s = float(tb_cfg.get("plan_ttl_s", 30.0))
+        self._plan_lock = threading.Lock()
+        self._plan_executor: ThreadPoolExecutor | None = None
+        self._plan_future: Future | None = None
+        self._plan_epoch = 0
+        self._plan_instruction: str | None = None
+        self._active_plan: dict | None = None
+
         # Layer 3: Agent Swarm (optional — enabled via agents.enabled: true in RCAN config)
         self.orchestrator = None
         if config.get("agents", {}).get("enabled", False):
@@ -227,6 +374,10 @@ class TieredBrain:
                 from .embedding_interpreter import EmbeddingInterpreter
 
                 self.interpreter = EmbeddingInterpreter(config.get("interpreter", {}))
+                # Share the backend so skill selection can match by embedding
+                from .skills.loader import set_skill_embedder
+
+                set_skill_embedder(self.interpreter.backend)
                 logger.info(
                     "EmbeddingInterpreter enabled (backend=%s)",
                     config.get("interpreter", {}).get("backend", "auto"),
@@ -251,6 +402,12 @@ class TieredBrain:
             "total_ticks": 0,
             "interpreter_pre_count": 0,
             "interpreter_escalations": 0,
+            "planner_submitted": 0,
+            "planner_adopted": 0,
+            "planner_superseded": 0,
+            "planner_expired": 0,
+            "planner_coalesced": 0,
+            "planner_errors": 0,
         }
 
     def think(
@@ -259,6 +416,7 @@ class TieredBrain:
         instruction: str,
         sensor_data: dict | None = None,
         task_category: str | None = None,
+        raw_frame=None,
     ) -> Thought:
         """Run the tiered brain pipeline.
 
@@ -273,6 +431,8 @@ class TieredBrain:
                             - ``"reasoning"``, ``"code"``, ``"safety"``, ``"vision"``,
                               ``"search"`` — prefer planner when available.
                             - ``"navigation"`` or ``None`` — default interval-based behaviour.
+            raw_frame:      Optional decoded BGR array of the same frame; lets the
+                            reactive layer skip its JPEG decode.
 
         Returns:
             A :class:`~castor.providers.base.Thought` with an action and metadata.
@@ -290,7 +450,10 @@ class TieredBrain:
                 logger.warning("Unknown task_category %r — ignoring for routing", task_category)
 
         # Layer 0: Reactive (instant)
-        reactive_action = self.reactive.evaluate(image_bytes, sensor_data)
+        if raw_frame is None:
+            reactive_action = self.reactive.evaluate(image_bytes, sensor_data)
+        else:
+            reactive_action = self.reactive.evaluate(image_bytes, sensor_data, raw_frame=raw_frame)
         if reactive_action:
             self._layer_timestamps["reactive"].append(time.time())
             self.stats["reactive_count"] += 1
@@ -318,9 +481,16 @@ class TieredBrain:
             except Exception as exc:
                 logger.debug("Interpreter pre_think (non-fatal): %s", exc)
 
+        # Async planner: adopt a finished plan before the fast layer runs
+        adopted = None
+        fast_instruction = instruction
+        if self.async_planner and self.planner:
+            adopted = self._collect_plan(instruction)
+            fast_instruction = self._with_plan_context(instruction)
+
         # Layer 1: Fast brain
         t0 = time.time()
-        thought = self.fast.think(image_bytes, instruction)
+        thought = self.fast.think(image_bytes, fast_instruction)
         fast_ms = (time.time() - t0) * 1000
         thought.layer = "fast"
         self._layer_timestamps["fast"].append(time.time())
@@ -353,30 +523,19 @@ class TieredBrain:
                 should_plan = True
                 logger.info("Planner: escalation (fast brain produced no action)")
 
-        if should_plan and self.planner:
+        if self.async_planner and self.planner:
+            if should_plan:
+                self._submit_plan(image_bytes, instruction, sensor_data, thought, scene_ctx)
+            if adopted is not None:
+                # Planner overrides fast brain on the tick its plan lands
+                self._layer_timestamps["planner"].append(time.time())
+                return adopted
+        elif should_plan and self.planner:
             try:
-                # Inject dynamic sensor state into the USER message (not the system prompt).
-                # This keeps the system prompt prefix stable across ticks so cache hits occur.
-                # Per Claude Code's cache-first lesson: static content in system, dynamic in user.
-                from castor.prompt_cache import build_sensor_reminder
-
-                sensor_reminder = build_sensor_reminder(sensor_data or {})
-                plan_instruction = (f"{sensor_reminder}\n\n" if sensor_reminder else "") + (
-                    f"You are the strategic planner for a robot. "
-                    f"The fast brain's last response: {thought.raw_text[:200]}\n\n"
-                    f"Current task: {instruction}\n\n"
-                    f"Provide a high-level plan or corrected action as JSON."
+                plan_instruction = self._build_plan_instruction(
+                    instruction, sensor_data, thought, scene_ctx
                 )
 
-                # Inject RAG context from embedding interpreter
-                if scene_ctx and self.interpreter:
-                    try:
-                        rag = self.interpreter.format_rag_context(scene_ctx)
-                        if rag:
-                            plan_instruction = rag + "\n\n" + plan_instruction
-                    except Exception:
-                        pass
-
                 t0 = time.time()
                 plan_thought = self.planner.think(image_bytes, plan_instruction)
                 plan_ms = (time.time() - t0) * 1000
@@ -431,6 +590,175 @@ class TieredBrain:
 
         return thought
 
+    # ------------------------------------------------------------------
+    # Layer 2 helpers
+    # ------------------------------------------------------------------
+    def _build_plan_instruction(
+        self, instruction: str, sensor_data: dict | None, thought: Thought, scene_ctx
+    ) -> str:
+        # Inject dynamic sensor state into the USER message (not the system prompt).
+        # This keeps the system prompt prefix stable across ticks so cache hits occur.
+        # Per Claude Code's cache-first lesson: static content in system, dynamic in user.
+        from castor.prompt_cache import build_sensor_reminder
+
+        sensor_reminder = build_sensor_reminder(sensor_data or {})
+        plan_instruction = (f"{sensor_reminder}\n\n" if sensor_reminder else "") + (
+            f"You are the strategic planner for a robot. "
+            f"The fast brain's last response: {thought.raw_text[:200]}\n\n"
+            f"Current task: {instruction}\n\n"
+            f"Provide a high-level plan or corrected action as JSON."
+        )
+
+        # Inject RAG context from embedding interpreter
+        if scene_ctx and self.interpreter:
+            try:
+                rag = self.interpreter.format_rag_context(scene_ctx)
+                if rag:
+                    plan_instruction = rag + "\n\n" + plan_instruction
+            except Exception:
+                pass
+        return plan_instruction
+
+    def _submit_plan(
+        self,
+        image_bytes: bytes,
+        instruction: str,
+        sensor_data: dict | None,
+        thought: Thought,
+        scene_ctx,
+    ) -> bool:
+        """Start a background planner job unless one is already in flight."""
+        with self._plan_lock:
+            if self._plan_future is not None:
+                self.stats["planner_coalesced"] += 1
+                return False
+            try:
+                plan_instruction = self._build_plan_instruction(
+                    instruction, sensor_data, thought, scene_ctx
+                )
+            except Exception as e:
+                logger.warning(f"Planner error (non-fatal): {e}")
+                self.stats["planner_errors"] += 1
+                return False
+            if self._plan_executor is None:
+                self._plan_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="tiered-planner"
+                )
+            job = {
+                "epoch": self._plan_epoch,
+                "submitted": time.time(),
+                "scene_ctx": scene_ctx,
+            }
+            self._plan_future = self._plan_executor.submit(
+                self._run_plan, image_bytes, plan_instruction, job
+            )
+            self.stats["planner_submitted"] += 1
+            logger.info("Planner: background plan submitted (epoch %d)", job["epoch"])
+            return True
+
+    def _run_plan(self, image_bytes: bytes, plan_instruction: str, job: dict) -> dict:
+        t0 = time.time()
+        plan_thought = self.planner.think(image_bytes, plan_instruction)
+        job["thought"] = plan_thought
+        job["plan_ms"] = (time.time() - t0) * 1000
+        return job
+
+    def _collect_plan(self, instruction: str) -> Thought | None:
+        """Adopt a finished background plan if it is still current.
+
+        Returns the plan's :class:`Thought` on the tick it is adopted,
+        otherwise ``None``.  A change of instruction supersedes any plan
+        in flight or active.
+        """
+        with self._plan_lock:
+            if self._plan_instruction is not None and instruction != self._plan_instruction:
+                self._plan_epoch += 1
+                self._active_plan = None
+            self._plan_instruction = instruction
+
+            now = time.time()
+            if self._active_plan is not None and now >= self._active_plan["expires"]:
+                logger.info("Planner: active plan v%d expired", self._active_plan["epoch"])
+                self._active_plan = None
+                self.stats["planner_expired"] += 1
+
+            future = self._plan_future
+            if future is None or not future.done():
+                return None
+            self._plan_future = None
+
+            try:
+                job = future.result()
+            except Exception as e:
+                logger.warning(f"Planner error (non-fatal): {e}")
+                self.stats["planner_errors"] += 1
+                return None
+
+            plan_thought = job["thought"]
+            self.stats["planner_count"] += 1
+            if job["epoch"] != self._plan_epoch:
+                self.stats["planner_superseded"] += 1
+                logger.info("Planner: discarding superseded plan (epoch %d)", job["epoch"])
+                return None
+            expires = job["submitted"] + self.plan_ttl_s
+            if now >= expires:
+                self.stats["planner_expired"] += 1
+                logger.info("Planner: discarding expired plan (%.0fms)", job["plan_ms"])
+                return None
+            if not plan_thought.action:
+                return None
+
+            plan_thought.layer = "planner"
+            plan_thought.escalated = True
+            self._active_plan = {
+                "epoch": job["epoch"],
+                "action": plan_thought.action,
+                "expires": expires,
+            }
+            self.last_plan = plan_thought.action
+            self.last_plan_time = now
+            self.stats["planner_adopted"] += 1
+            logger.info(
+                f"Planner ({job['plan_ms']:.0f}ms, async): {plan_thought.action.get('type', '?')}"
+            )
+
+        scene_ctx = job.get("scene_ctx")
+        if self.interpreter and scene_ctx:
+            try:
+                self.interpreter.post_think(scene_ctx, plan_thought)
+            except Exception as exc:
+                logger.debug("Interpreter post_think (non-fatal): %s", exc)
+        return plan_thought
+
+    def _with_plan_context(self, instruction: str) -> str:
+        """Append the active (unexpired) plan to the fast brain's instruction."""
+        plan = self._active_plan
+        if plan is None or time.time() >= plan["expires"]:
+            return instruction
+        try:
+            plan_json = json.dumps(plan["action"], default=str)
+        except (TypeError, ValueError):
+            return instruction
+        return f"{instruction}\n\nCurrent plan from the strategic planner: {plan_json}"
+
+    def invalidate_plan(self):
+        """Supersede the active plan and any plan still in flight."""
+        with self._plan_lock:
+            self._plan_epoch += 1
+            self._active_plan = None
+
+    @property
+    def plan_in_flight(self) -> bool:
+        """True while a background planner job is running."""
+        return self._plan_future is not None and not self._plan_future.done()
+
+    def close(self):
+        """Stop the background planner and release reactive-layer resources."""
+        if self._plan_executor is not None:
+            self._plan_executor.shutdown(wait=False, cancel_futures=True)
+            self._plan_executor = None
+        self.reactive.close()
+
     def effective_hz(self) -> dict:
         """Return effective motor command frequency (Hz) per layer.
 
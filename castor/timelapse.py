@@ -137,9 +137,17 @@ class TimelapseGenerator:
         frame_count = 0
         width, height = 640, 480
 
+        # MJPEG recordings are a directory of segments (prefer their MP4 transcodes)
+        sources = []
         for recording in recordings:
-            rec_path = recording.get("path")
-            if not rec_path or not os.path.exists(rec_path):
+            segments = recording.get("segments")
+            if segments is not None:
+                sources.extend(seg.get("mp4") or seg.get("path") for seg in segments)
+            else:
+                sources.append(recording.get("path"))
+
+        for rec_path in sources:
+            if not rec_path or not os.path.isfile(rec_path):
                 logger.warning("Timelapse: recording file not found: %s", rec_path)
                 continue
 
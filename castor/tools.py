@@ -24,9 +24,22 @@ Usage::
     from castor.tools import ToolRegistry
 
     reg = ToolRegistry()
-    reg.register("ping", lambda: "pong")
+    reg.register("ping", lambda: "pong", side_effect="pure")
     result = reg.call("ping")   # → "pong"
     schema = reg.to_openai_tools()   # → list of OpenAI tool dicts
+
+Side-effect classes
+-------------------
+Every tool carries a side-effect class that tells the agent harness whether
+it may run concurrently with other calls from the same model turn:
+
+``pure``       No I/O; result depends only on arguments.
+``read_only``  Reads robot/world state but changes nothing.
+``mutate``     Changes software state (memory, config, messages).  Default.
+``actuate``    Moves hardware or produces output in the physical world.
+
+Only ``pure`` and ``read_only`` calls are run concurrently; the other two
+keep strict call order.
 """
 
 from __future__ import annotations
@@ -40,7 +53,24 @@ from typing import Any, Optional
 
 logger = logging.getLogger("OpenCastor.Tools")
 
-__all__ = ["ToolRegistry", "ToolDefinition", "ToolResult"]
+__all__ = [
+    "ToolRegistry",
+    "ToolDefinition",
+    "ToolResult",
+    "SIDE_EFFECT_PURE",
+    "SIDE_EFFECT_READ_ONLY",
+    "SIDE_EFFECT_MUTATE",
+    "SIDE_EFFECT_ACTUATE",
+    "CONCURRENT_SIDE_EFFECTS",
+]
+
+SIDE_EFFECT_PURE = "pure"
+SIDE_EFFECT_READ_ONLY = "read_only"
+SIDE_EFFECT_MUTATE = "mutate"
+SIDE_EFFECT_ACTUATE = "actuate"
+SIDE_EFFECTS = (SIDE_EFFECT_PURE, SIDE_EFFECT_READ_ONLY, SIDE_EFFECT_MUTATE, SIDE_EFFECT_ACTUATE)
+# Side-effect classes safe to run concurrently within one model turn
+CONCURRENT_SIDE_EFFECTS = frozenset({SIDE_EFFECT_PURE, SIDE_EFFECT_READ_ONLY})
 
 
 class ToolDefinition:
@@ -53,12 +83,16 @@ class ToolDefinition:
         fn: Callable,
         parameters: Optional[dict] = None,
         returns: str = "any",
+        side_effect: str = SIDE_EFFECT_MUTATE,
     ):
+        if side_effect not in SIDE_EFFECTS:
+            raise ValueError(f"Unknown side_effect {side_effect!r}; expected one of {SIDE_EFFECTS}")
         self.name = name
         self.description = description
         self.fn = fn
         self.parameters = parameters or {}
         self.returns = returns
+        self.side_effect = side_effect
 
     def to_openai_schema(self) -> dict:
         """Convert to OpenAI function-calling tool schema."""
@@ -168,12 +202,14 @@ class ToolRegistry:
             fn=self._builtin_get_status,
             description="Returns the robot's current status as JSON.",
             returns="object",
+            side_effect=SIDE_EFFECT_READ_ONLY,
         )
         self.register(
             name="take_snapshot",
             fn=self._builtin_take_snapshot,
             description="Captures a JPEG from the camera and returns it as base64.",
             returns="string",
+            side_effect=SIDE_EFFECT_READ_ONLY,
         )
         self.register(
             name="announce_text",
@@ -182,12 +218,14 @@ class ToolRegistry:
             parameters={
                 "text": {"type": "string", "description": "Text to speak", "required": True}
             },
+            side_effect=SIDE_EFFECT_ACTUATE,
         )
         self.register(
             name="get_distance",
             fn=self._builtin_get_distance,
             description="Returns the ultrasonic front-obstacle distance in metres. Returns -1 if unavailable.",
             returns="number",
+            side_effect=SIDE_EFFECT_READ_ONLY,
         )
 
     @staticmethod
@@ -257,14 +295,21 @@ class ToolRegistry:
         description: str = "",
         parameters: Optional[dict] = None,
         returns: str = "any",
+        side_effect: str = SIDE_EFFECT_MUTATE,
     ) -> None:
-        """Register a callable tool by name."""
+        """Register a callable tool by name.
+
+        *side_effect* is one of ``pure``, ``read_only``, ``mutate`` or
+        ``actuate`` (see module docstring); unannotated tools are treated
+        as ``mutate`` and never run concurrently.
+        """
         self._tools[name] = ToolDefinition(
             name=name,
             description=description,
             fn=fn,
             parameters=parameters or {},
             returns=returns,
+            side_effect=side_effect,
         )
         logger.debug("ToolRegistry: registered '%s'", name)
 
@@ -277,6 +322,12 @@ class ToolRegistry:
             description = tool_cfg.get("description", "")
             parameters = tool_cfg.get("parameters", {})
             returns = tool_cfg.get("returns", "any")
+            side_effect = tool_cfg.get("side_effect", SIDE_EFFECT_MUTATE)
+            if side_effect not in SIDE_EFFECTS:
+                logger.warning(
+                    "ToolRegistry: '%s' has unknown side_effect %r; using mutate", name, side_effect
+                )
+                side_effect = SIDE_EFFECT_MUTATE
             # Register a no-op placeholder (callers can override)
             self.register(
                 name=name,
@@ -284,6 +335,7 @@ class ToolRegistry:
                 description=description,
                 parameters=parameters,
                 returns=returns,
+                side_effect=side_effect,
             )
             logger.debug("ToolRegistry: registered placeholder '%s' from RCAN config", name)
 
@@ -332,6 +384,11 @@ class ToolRegistry:
         """Return list of Anthropic tool definitions."""
         return [t.to_anthropic_schema() for t in self._tools.values()]
 
+    def side_effect(self, name: str) -> str:
+        """Return the side-effect class of *name* (``mutate`` if unknown)."""
+        tool = self._tools.get(name)
+        return tool.side_effect if tool is not None else SIDE_EFFECT_MUTATE
+
     def list_tools(self) -> list[str]:
         """Return names of all registered tools."""
         return list(self._tools.keys())
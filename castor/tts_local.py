@@ -11,13 +11,27 @@ Supported engines (in priority order):
 
 Selection: CASTOR_TTS_ENGINE env var (default: auto)
 
+Engines are expensive to load (Piper/Coqui read a voice model from disk),
+so long-lived callers should take one from the process-wide pool with
+:func:`get_tts` instead of constructing :class:`LocalTTS` per reply.
+Pooled engines share a content-addressed on-disk :class:`PhraseCache`, so
+repeated phrases (status announcements, alerts, greetings) are synthesized
+once.  :meth:`LocalTTS.say_nowait` queues playback on a background player
+and returns immediately.
+
 Usage::
 
-    from castor.tts_local import LocalTTS
+    from castor.tts_local import LocalTTS, get_tts
 
     tts = LocalTTS(engine="piper", model="en_US-lessac-medium")
     audio_bytes = tts.synthesize("Hello robot world")
 
+    get_tts().say_nowait("Battery low")   # warm, cached, non-blocking
+
+Env:
+    CASTOR_TTS_CACHE_DIR   Phrase cache directory (default ~/.opencastor/tts_cache)
+    CASTOR_TTS_CACHE_MB    Phrase cache size limit in MiB (default 64; 0 disables)
+
 Install::
 
     pip install opencastor[tts]
@@ -25,9 +39,15 @@ Install::
     # Coqui:  pip install TTS
 """
 
+import asyncio
+import hashlib
 import io
 import logging
 import os
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger("OpenCastor.TTSLocal")
@@ -94,6 +114,174 @@ def _select_engine(requested: str) -> str:
     return _select_engine("auto")
 
 
+# ---------------------------------------------------------------------------
+# Phrase cache
+# ---------------------------------------------------------------------------
+
+
+class PhraseCache:
+    """Content-addressed on-disk cache of synthesized audio.
+
+    Entries are keyed by a SHA-256 of ``(engine, model, language, text)``
+    and stored as ``<dir>/<ab>/<digest>.<ext>``.  Writes are atomic; when
+    the cache grows past *max_bytes* the least recently used entries are
+    evicted.
+
+    Args:
+        directory: Cache root.
+        max_bytes: Size limit across all entries.
+    """
+
+    def __init__(self, directory, max_bytes: int = 64 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(engine: str, model: Optional[str], language: str, text: str) -> str:
+        raw = "\x1f".join((engine, model or "", language, text.strip()))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, ext: str) -> Path:
+        return self.directory / key[:2] / f"{key}.{ext}"
+
+    def get(self, key: str, ext: str) -> Optional[bytes]:
+        path = self._path(key, ext)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        self.hits += 1
+        return data
+
+    def put(self, key: str, ext: str, data: bytes) -> None:
+        if not data:
+            return
+        path = self._path(key, ext)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{ext}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.debug("TTS cache write failed: %s", exc)
+            return
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list:
+        return [p for p in self.directory.glob("*/*") if p.suffix != ".tmp"]
+
+    def _scan_size(self) -> int:
+        return sum(p.stat().st_size for p in self._entries())
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda p: p.stat().st_mtime)
+        size = sum(p.stat().st_size for p in entries)
+        target = self.max_bytes * 0.8
+        for path in entries:
+            if size <= target:
+                break
+            try:
+                size -= path.stat().st_size
+                path.unlink()
+            except OSError:
+                pass
+        self._size = size
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "dir": str(self.directory)}
+
+
+_AUDIO_EXT = {"piper": "wav", "coqui": "wav", "gtts": "mp3"}
+
+
+# ---------------------------------------------------------------------------
+# Playback
+# ---------------------------------------------------------------------------
+
+
+def _play_audio(audio: bytes) -> None:
+    """Play *audio* through pygame, blocking until it finishes."""
+    try:
+        import pygame
+
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+
+        buf = io.BytesIO(audio)
+        sound = pygame.mixer.Sound(buf)
+        sound.play()
+        while pygame.mixer.get_busy():
+            pygame.time.wait(50)
+    except Exception as exc:
+        logger.warning("LocalTTS playback error: %s", exc)
+
+
+class _Player:
+    """Background thread that plays queued audio futures in order.
+
+    Synthesis of the next phrase (on the synth executor) overlaps with
+    playback of the current one.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, audio: Future) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True, name="tts-player")
+                self._thread.start()
+        self._queue.put(audio)
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self) -> None:
+        while True:
+            future = self._queue.get()
+            try:
+                audio = future.result()
+                if audio:
+                    _play_audio(audio)
+            except Exception as exc:
+                logger.warning("LocalTTS queued playback error: %s", exc)
+            finally:
+                self._queue.task_done()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued audio has played.  Returns False on timeout."""
+        done = threading.Event()
+
+        def _wait():
+            self._queue.join()
+            done.set()
+
+        threading.Thread(target=_wait, daemon=True).start()
+        return done.wait(timeout)
+
+
+_synth_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts-synth")
+_player = _Player()
+
+
 class LocalTTS:
     """On-device TTS synthesizer.
 
@@ -101,6 +289,7 @@ class LocalTTS:
         engine: TTS engine to use (piper/coqui/gtts/auto).
         model: Model name/path (engine-specific).
         language: BCP-47 language code (default: "en").
+        cache: Optional :class:`PhraseCache` consulted before synthesizing.
     """
 
     def __init__(
@@ -108,12 +297,16 @@ class LocalTTS:
         engine: str = CASTOR_TTS_ENGINE,
         model: Optional[str] = None,
         language: str = "en",
+        cache: Optional[PhraseCache] = None,
     ):
         self._engine = _select_engine(engine)
         self._model = model
         self._language = language
         self._piper_voice = None
         self._coqui_tts = None
+        self._cache = cache
+        # Piper/Coqui model objects are not safe for concurrent synthesis
+        self._synth_lock = threading.Lock()
 
         logger.info("LocalTTS initialized (engine=%s)", self._engine)
 
@@ -138,13 +331,52 @@ class LocalTTS:
         if not text or self._engine == "none":
             return b""
 
-        if self._engine == "piper":
-            return self._synth_piper(text)
-        elif self._engine == "coqui":
-            return self._synth_coqui(text)
-        elif self._engine == "gtts":
-            return self._synth_gtts(text)
-        return b""
+        cache = self._cache
+        ext = _AUDIO_EXT.get(self._engine, "bin")
+        if cache is not None:
+            key = cache.key(self._engine, self._model, self._language, text)
+            audio = cache.get(key, ext)
+            if audio:
+                return audio
+
+        with self._synth_lock:
+            if self._engine == "piper":
+                audio = self._synth_piper(text)
+            elif self._engine == "coqui":
+                audio = self._synth_coqui(text)
+            elif self._engine == "gtts":
+                audio = self._synth_gtts(text)
+            else:
+                audio = b""
+
+        if cache is not None and audio:
+            cache.put(key, ext, audio)
+        return audio
+
+    async def synthesize_async(self, text: str) -> bytes:
+        """Synthesize *text* on the shared synth executor without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_synth_executor, self.synthesize, text)
+
+    def warm(self) -> None:
+        """Load the engine's voice model now rather than on first use."""
+        try:
+            with self._synth_lock:
+                if self._engine == "piper" and self._piper_voice is None:
+                    import piper
+
+                    self._piper_voice = piper.PiperVoice.load(
+                        self._model or "en_US-lessac-medium"
+                    )
+                elif self._engine == "coqui" and self._coqui_tts is None:
+                    from TTS.api import TTS as _CoquiTTS
+
+                    self._coqui_tts = _CoquiTTS(
+                        model_name=self._model or "tts_models/en/ljspeech/vits",
+                        progress_bar=False,
+                    )
+        except Exception as exc:
+            logger.warning("LocalTTS warm-up failed (engine=%s): %s", self._engine, exc)
 
     def say(self, text: str) -> None:
         """Synthesize and play audio using pygame (blocks until done).
@@ -154,20 +386,18 @@ class LocalTTS:
         audio = self.synthesize(text)
         if not audio:
             return
+        _play_audio(audio)
 
-        try:
-            import pygame
-
-            if not pygame.mixer.get_init():
-                pygame.mixer.init()
+    def say_nowait(self, text: str) -> Future:
+        """Queue *text* for playback and return immediately.
 
-            buf = io.BytesIO(audio)
-            sound = pygame.mixer.Sound(buf)
-            sound.play()
-            while pygame.mixer.get_busy():
-                pygame.time.wait(50)
-        except Exception as exc:
-            logger.warning("LocalTTS playback error: %s", exc)
+        Synthesis runs on the shared synth executor and playback on a
+        single background player, so queued phrases play in order.
+        Returns the synthesis future.
+        """
+        future = _synth_executor.submit(self.synthesize, text)
+        _player.submit(future)
+        return future
 
     # ------------------------------------------------------------------
     # Engine implementations
@@ -227,3 +457,56 @@ class LocalTTS:
         except Exception as exc:
             logger.warning("gTTS error: %s", exc)
             return b""
+
+
+# ---------------------------------------------------------------------------
+# Process-wide engine pool
+# ---------------------------------------------------------------------------
+
+_pool: dict = {}
+_pool_lock = threading.Lock()
+_phrase_cache: Optional[PhraseCache] = None
+
+
+def get_phrase_cache() -> Optional[PhraseCache]:
+    """Return the shared phrase cache, or ``None`` if disabled."""
+    global _phrase_cache
+    max_mb = float(os.getenv("CASTOR_TTS_CACHE_MB", "64"))
+    if max_mb <= 0:
+        return None
+    with _pool_lock:
+        if _phrase_cache is None:
+            directory = os.getenv(
+                "CASTOR_TTS_CACHE_DIR", str(Path.home() / ".opencastor" / "tts_cache")
+            )
+            _phrase_cache = PhraseCache(directory, max_bytes=int(max_mb * 1024 * 1024))
+        return _phrase_cache
+
+
+def get_tts(
+    engine: str = CASTOR_TTS_ENGINE,
+    model: Optional[str] = None,
+    language: str = "en",
+) -> LocalTTS:
+    """Return a warm pooled :class:`LocalTTS` for (backend, voice, language).
+
+    The first request for a key constructs the engine and starts loading
+    its voice model in the background; later requests reuse it.
+    """
+    resolved = _select_engine(engine)
+    key = (resolved, model, language)
+    with _pool_lock:
+        tts = _pool.get(key)
+    if tts is not None:
+        return tts
+    tts = LocalTTS(engine=resolved, model=model, language=language, cache=get_phrase_cache())
+    with _pool_lock:
+        existing = _pool.setdefault(key, tts)
+    if existing is tts:
+        _synth_executor.submit(tts.warm)
+    return existing
+
+
+def wait_for_playback(timeout: Optional[float] = None) -> bool:
+    """Block until audio queued with :meth:`LocalTTS.say_nowait` has played."""
+    return _player.drain(timeout)
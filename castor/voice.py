@@ -19,6 +19,16 @@ Usage::
 The preferred engine can be forced via the ``engine`` parameter or the
 ``CASTOR_VOICE_ENGINE`` environment variable ("whisper_api", "whisper_local",
 "whisper_cpp", "google", "auto").
+
+For repeated on-robot commands use the resident worker instead, which keeps
+the local Whisper model loaded, takes raw 16-bit PCM without any format
+conversion and can emit partial results while audio is still arriving::
+
+    from castor.voice import get_transcription_worker
+
+    worker = get_transcription_worker()
+    result = worker.transcribe(pcm_bytes, sample_rate=16000)
+    worker.stats()   # → {"p50_ms": ..., "p95_ms": ..., "model_load_ms": ...}
 """
 
 from __future__ import annotations
@@ -27,11 +37,16 @@ import contextlib
 import io
 import logging
 import os
+import queue
 import shutil
 import subprocess
 import tempfile
 import threading
 import time
+import wave
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
 from typing import Optional
 
 logger = logging.getLogger("OpenCastor.Voice")
@@ -180,18 +195,81 @@ def _transcribe_whisper_api(audio_bytes: bytes, hint_format: str = "ogg") -> Opt
         return None
 
 
+_whisper_models: dict = {}
+_whisper_models_lock = threading.Lock()
+
+
+def _get_whisper_model(name: Optional[str] = None):
+    """Load a local Whisper model once per process and reuse it."""
+    import whisper
+
+    name = name or os.getenv("CASTOR_WHISPER_MODEL", "base")
+    with _whisper_models_lock:
+        model = _whisper_models.get(name)
+        if model is None:
+            t0 = time.monotonic()
+            model = whisper.load_model(name)
+            _whisper_models[name] = model
+            logger.info(
+                "Loaded local Whisper model %r (%.0f ms)", name, (time.monotonic() - t0) * 1000
+            )
+        return model
+
+
+def _pcm16_to_float(pcm: bytes, sample_rate: int = 16000):
+    """Convert mono 16-bit PCM to the float32 16 kHz array Whisper consumes."""
+    import numpy as np
+
+    audio = np.frombuffer(pcm[: len(pcm) - len(pcm) % 2], dtype=np.int16).astype(np.float32)
+    audio /= 32768.0
+    if sample_rate != 16000 and len(audio):
+        n = int(len(audio) * 16000 / sample_rate)
+        audio = np.interp(np.linspace(0, len(audio) - 1, n), np.arange(len(audio)), audio).astype(
+            np.float32
+        )
+    return audio
+
+
+def _wav_to_pcm(audio_bytes: bytes) -> Optional[tuple[bytes, int]]:
+    """Return ``(pcm, sample_rate)`` for mono 16-bit WAV bytes, else None."""
+    try:
+        with wave.open(io.BytesIO(audio_bytes), "rb") as wf:
+            if wf.getnchannels() != 1 or wf.getsampwidth() != 2:
+                return None
+            return wf.readframes(wf.getnframes()), wf.getframerate()
+    except (wave.Error, EOFError):
+        return None
+
+
+def _pcm_to_wav(pcm: bytes, sample_rate: int) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm)
+    return buf.getvalue()
+
+
 def _transcribe_whisper_local(audio_bytes: bytes, hint_format: str = "ogg") -> Optional[str]:
     """Transcribe using local openai-whisper package."""
     try:
-        import whisper
-
+        model = _get_whisper_model()
         ext = hint_format.lstrip(".")
+
+        # PCM WAV can be handed to the model directly, skipping ffmpeg
+        decoded = _wav_to_pcm(audio_bytes) if ext == "wav" else None
+        if decoded is not None:
+            result = model.transcribe(_pcm16_to_float(*decoded))
+            text = result.get("text", "").strip()
+            logger.debug("Local Whisper transcription: %d chars", len(text))
+            return text or None
+
         with tempfile.NamedTemporaryFile(suffix=f".{ext}", delete=False) as tmp:
             tmp.write(audio_bytes)
             tmp_path = tmp.name
 
         try:
-            model = whisper.load_model("base")
             result = model.transcribe(tmp_path)
             text = result.get("text", "").strip()
             logger.debug("Local Whisper transcription: %d chars", len(text))
@@ -439,6 +517,250 @@ def available_engines() -> list[str]:
     return engines
 
 
+# ---------------------------------------------------------------------------
+# Resident transcription worker
+# ---------------------------------------------------------------------------
+
+
+class TranscriptionWorker:
+    """Background STT worker with the model loaded once.
+
+    Jobs are raw mono 16-bit PCM buffers submitted through :meth:`submit`
+    and processed in order on a single daemon thread; each returns a
+    :class:`~concurrent.futures.Future` resolving to the same dict shape
+    as :func:`transcribe_bytes` (plus ``latency_ms``), or ``None``.
+
+    With the ``whisper_local`` engine (or ``auto`` when it is installed)
+    PCM goes straight to the resident model as a float array — no
+    temp files, pydub or ffmpeg.  Other engines receive an in-memory WAV
+    via :func:`transcribe_bytes`.
+
+    Args:
+        engine:      Engine name (default ``CASTOR_VOICE_ENGINE`` or ``auto``).
+        model_name:  Local Whisper model (default ``CASTOR_WHISPER_MODEL`` or ``base``).
+        backend:     Optional ``(pcm, sample_rate) -> text`` callable that
+                     replaces engine resolution (used for tests).
+        max_samples: Latency samples retained for percentiles.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[str] = None,
+        model_name: Optional[str] = None,
+        backend: Optional[Callable[[bytes, int], Optional[str]]] = None,
+        max_samples: int = 512,
+    ):
+        self.engine = engine or os.getenv("CASTOR_VOICE_ENGINE", "auto")
+        self.model_name = model_name or os.getenv("CASTOR_WHISPER_MODEL", "base")
+        self._backend = backend
+        self._backend_engine = "custom" if backend is not None else None
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._latencies: deque = deque(maxlen=max_samples)
+        self._jobs = 0
+        self._errors = 0
+        self.model_load_ms: Optional[float] = None
+
+    # ── Lifecycle ─────────────────────────────────────────────────────
+
+    def start(self, preload: bool = False) -> None:
+        """Start the worker thread; with *preload* load the model immediately."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, daemon=True, name="stt-worker")
+            self._thread.start()
+        if preload:
+            self._queue.put(("load", None, 0, Future(), False))
+
+    def stop(self, timeout: float = 5.0) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ── Queue API ─────────────────────────────────────────────────────
+
+    def submit(self, pcm: bytes, sample_rate: int = 16000, partial: bool = False) -> Future:
+        """Queue mono 16-bit *pcm* for transcription."""
+        self.start()
+        future: Future = Future()
+        self._queue.put(("pcm", pcm, sample_rate, future, partial))
+        return future
+
+    def submit_wav(self, audio_bytes: bytes) -> Future:
+        """Queue a WAV clip; mono 16-bit WAV is unpacked to PCM in-process."""
+        decoded = _wav_to_pcm(audio_bytes)
+        if decoded is None:
+            self.start()
+            future: Future = Future()
+            self._queue.put(("wav", audio_bytes, 0, future, False))
+            return future
+        return self.submit(*decoded)
+
+    def transcribe(
+        self, pcm: bytes, sample_rate: int = 16000, timeout: Optional[float] = 60.0
+    ) -> Optional[dict]:
+        """Blocking convenience wrapper around :meth:`submit`."""
+        return self.submit(pcm, sample_rate).result(timeout)
+
+    def stream(
+        self,
+        chunks: Iterable[bytes],
+        sample_rate: int = 16000,
+        on_partial: Optional[Callable[[dict], None]] = None,
+        partial_every_s: float = 1.0,
+        timeout: Optional[float] = 60.0,
+    ) -> Optional[dict]:
+        """Transcribe audio as it arrives, reporting partial results.
+
+        Every *partial_every_s* of new audio the buffer so far is queued
+        as a partial job, unless the previous partial is still running
+        (so a slow model never falls behind the microphone).  Partials
+        are delivered to *on_partial* from the worker thread.  Returns
+        the final transcription once *chunks* is exhausted.
+        """
+        buf = bytearray()
+        step = int(partial_every_s * sample_rate) * 2
+        next_partial = step
+        inflight: Optional[Future] = None
+
+        def _deliver(future: Future) -> None:
+            if future.exception() is None and future.result():
+                on_partial(future.result())
+
+        for chunk in chunks:
+            buf.extend(chunk)
+            if on_partial is None or len(buf) < next_partial:
+                continue
+            next_partial = len(buf) + step
+            if inflight is not None and not inflight.done():
+                continue
+            inflight = self.submit(bytes(buf), sample_rate, partial=True)
+            inflight.add_done_callback(_deliver)
+
+        return self.submit(bytes(buf), sample_rate).result(timeout)
+
+    # ── Stats ─────────────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        """Return job counters and p50/p95/p99 latency in ms."""
+        with self._lock:
+            samples = sorted(self._latencies)
+            jobs, errors = self._jobs, self._errors
+        n = len(samples)
+
+        def _pct(pct: float) -> Optional[float]:
+            return round(samples[int(pct * (n - 1))], 1) if n else None
+
+        return {
+            "engine": self._backend_engine or self.engine,
+            "jobs": jobs,
+            "errors": errors,
+            "queue_depth": self._queue.qsize(),
+            "model_load_ms": self.model_load_ms,
+            "p50_ms": _pct(0.50),
+            "p95_ms": _pct(0.95),
+            "p99_ms": _pct(0.99),
+            "sample_count": n,
+        }
+
+    # ── Worker thread ─────────────────────────────────────────────────
+
+    def _resolve_backend(self) -> Callable[[bytes, int], Optional[str]]:
+        if self._backend is not None:
+            return self._backend
+        if self.engine == "whisper_local" or (
+            self.engine == "auto" and _probe_whisper_local() and not _probe_openai()
+        ):
+            t0 = time.monotonic()
+            model = _get_whisper_model(self.model_name)
+            self.model_load_ms = round((time.monotonic() - t0) * 1000, 1)
+            self._backend_engine = "whisper_local"
+
+            def _whisper(pcm: bytes, sample_rate: int) -> Optional[str]:
+                text = model.transcribe(_pcm16_to_float(pcm, sample_rate)).get("text", "")
+                return text.strip() or None
+
+            self._backend = _whisper
+        else:
+            self._backend_engine = self.engine
+
+            def _generic(pcm: bytes, sample_rate: int) -> Optional[str]:
+                result = transcribe_bytes(
+                    _pcm_to_wav(pcm, sample_rate), hint_format="wav", engine=self.engine
+                )
+                if result:
+                    self._backend_engine = result["engine"]
+                return result["text"] if result else None
+
+            self._backend = _generic
+        return self._backend
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            kind, payload, sample_rate, future, partial = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                backend = self._resolve_backend()
+                if kind == "load":
+                    future.set_result(None)
+                    continue
+                t0 = time.monotonic()
+                if kind == "wav":
+                    result = transcribe_bytes(payload, hint_format="wav", engine=self.engine)
+                    text = result["text"] if result else None
+                else:
+                    text = backend(payload, sample_rate) if payload else None
+                latency_ms = (time.monotonic() - t0) * 1000
+                with self._lock:
+                    self._jobs += 1
+                    if not partial:
+                        self._latencies.append(latency_ms)
+                if not text:
+                    future.set_result(None)
+                    continue
+                engine = self._backend_engine or self.engine
+                future.set_result(
+                    {
+                        "text": text,
+                        "confidence": _ENGINE_CONFIDENCE.get(engine, _ENGINE_CONFIDENCE["mock"]),
+                        "engine": engine,
+                        "latency_ms": round(latency_ms, 1),
+                        "partial": partial,
+                    }
+                )
+            except Exception as exc:
+                with self._lock:
+                    self._errors += 1
+                logger.warning("TranscriptionWorker job failed: %s", exc)
+                future.set_exception(exc)
+
+
+_transcription_worker: Optional[TranscriptionWorker] = None
+_transcription_worker_lock = threading.Lock()
+
+
+def get_transcription_worker() -> TranscriptionWorker:
+    """Return the process-wide :class:`TranscriptionWorker` (started lazily)."""
+    global _transcription_worker
+    with _transcription_worker_lock:
+        if _transcription_worker is None:
+            _transcription_worker = TranscriptionWorker()
+        return _transcription_worker
+
+
 # ---------------------------------------------------------------------------
 # Wake-word audio streaming
 # ---------------------------------------------------------------------------
@@ -4,9 +4,18 @@ Voice Assistant Continuous Loop.
 Implements the full pipeline:
   wake word → STT → LLM → TTS → (repeat)
 
+Latency path:
+  - A persistent microphone stream stays open between utterances and
+    recording is endpointed by voice-activity detection (WebRTC VAD when
+    ``webrtcvad`` is installed, RMS energy otherwise) instead of a fixed
+    4 s window.
+  - LLM output is streamed (``think_stream``) and spoken sentence by
+    sentence, so playback starts before the full reply has been generated.
+  - TTS engines come from the warm process-wide pool (``get_tts``).
+
 Integrates:
   - castor.hotword  (OpenWakeWord / mock)
-  - castor.voice    (whisper / google-sr / vosk)
+  - castor.voice    (resident TranscriptionWorker: whisper / google-sr)
   - brain.think()   (any BaseProvider)
   - castor.tts_local (piper / gTTS / espeak)
 
@@ -15,6 +24,7 @@ Env:
   CASTOR_HOTWORD         — wake word phrase (default "hey castor")
   CASTOR_VOICE_ENGINE    — STT engine (whisper / google / vosk)
   CASTOR_TTS_ENGINE      — TTS engine (piper / gtts / espeak)
+  CASTOR_VAD_SILENCE_MS  — trailing silence that ends an utterance (default 600)
 
 API:
   POST /api/voice/loop/start
@@ -22,19 +32,241 @@ API:
   GET  /api/voice/loop/status
 """
 
+import io
 import logging
+import math
+import os
+import queue
+import re
 import threading
 import time
-from collections.abc import Callable
-from typing import Optional
+import wave
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from typing import Optional, Union
 
 from castor.command_interpreter import get_command_interpreter
 
 logger = logging.getLogger("OpenCastor.VoiceLoop")
 
+try:
+    import webrtcvad
+
+    HAS_WEBRTCVAD = True
+except ImportError:
+    HAS_WEBRTCVAD = False
+
 _singleton: Optional["VoiceAssistantLoop"] = None
 _lock = threading.Lock()
 
+SAMPLE_RATE = 16000
+# 30 ms of 16-bit mono PCM — a frame size WebRTC VAD accepts.
+FRAME_SAMPLES = 480
+FRAME_MS = FRAME_SAMPLES * 1000 // SAMPLE_RATE
+
+# Sentence boundary: terminal punctuation followed by whitespace.
+_SENTENCE_END = re.compile(r"(?<=[.!?;:])\s+")
+
+
+# ── Audio input ───────────────────────────────────────────────────────
+
+
+class MicrophoneSource:
+    """Persistent PyAudio input stream, opened once and reused.
+
+    ``read_frame()`` returns one :data:`FRAME_SAMPLES` chunk of 16-bit
+    mono PCM at :data:`SAMPLE_RATE`.
+    """
+
+    def __init__(self, rate: int = SAMPLE_RATE, frame_samples: int = FRAME_SAMPLES):
+        self.rate = rate
+        self.frame_samples = frame_samples
+        self._pa = None
+        self._stream = None
+
+    def _open(self):
+        import pyaudio
+
+        self._pa = pyaudio.PyAudio()
+        self._stream = self._pa.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=self.rate,
+            input=True,
+            frames_per_buffer=self.frame_samples,
+        )
+
+    def read_frame(self) -> bytes:
+        if self._stream is None:
+            self._open()
+        return self._stream.read(self.frame_samples, exception_on_overflow=False)
+
+    def close(self):
+        try:
+            if self._stream is not None:
+                self._stream.stop_stream()
+                self._stream.close()
+            if self._pa is not None:
+                self._pa.terminate()
+        except Exception as exc:
+            logger.debug("Microphone close error: %s", exc)
+        self._stream = None
+        self._pa = None
+
+
+class WavFileSource:
+    """Audio source that replays a 16 kHz mono 16-bit WAV file or bytes.
+
+    Used as a fake audio device for tests and offline replays.  Once the
+    file is exhausted it returns silence.
+    """
+
+    def __init__(self, wav: Union[str, bytes], frame_samples: int = FRAME_SAMPLES):
+        fp = io.BytesIO(wav) if isinstance(wav, (bytes, bytearray)) else open(wav, "rb")
+        with fp, wave.open(fp, "rb") as wf:
+            self.rate = wf.getframerate()
+            self._pcm = wf.readframes(wf.getnframes())
+        self.frame_samples = frame_samples
+        self._pos = 0
+
+    def read_frame(self) -> bytes:
+        n = self.frame_samples * 2
+        chunk = self._pcm[self._pos : self._pos + n]
+        self._pos += n
+        return chunk.ljust(n, b"\x00")
+
+    @property
+    def exhausted(self) -> bool:
+        return self._pos >= len(self._pcm)
+
+    def close(self):
+        pass
+
+
+def _rms(frame: bytes) -> float:
+    samples = array("h", frame[: len(frame) - len(frame) % 2])
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(s * s for s in samples) / len(samples))
+
+
+class VoiceActivityDetector:
+    """Per-frame speech/non-speech classifier.
+
+    Uses WebRTC VAD when ``webrtcvad`` is installed; otherwise an RMS
+    energy gate whose threshold tracks the ambient noise floor.
+
+    Args:
+        aggressiveness:  WebRTC VAD mode (0–3).
+        energy_ratio:    Speech threshold as a multiple of the noise floor.
+        min_energy:      Absolute RMS floor below which a frame is never speech.
+        use_webrtc:      Force-enable/disable WebRTC VAD (default: auto).
+    """
+
+    def __init__(
+        self,
+        rate: int = SAMPLE_RATE,
+        aggressiveness: int = 2,
+        energy_ratio: float = 3.0,
+        min_energy: float = 300.0,
+        use_webrtc: Optional[bool] = None,
+    ):
+        self.rate = rate
+        self.energy_ratio = energy_ratio
+        self.min_energy = min_energy
+        self._noise_floor = min_energy / energy_ratio
+        use_webrtc = HAS_WEBRTCVAD if use_webrtc is None else use_webrtc
+        self._vad = webrtcvad.Vad(aggressiveness) if use_webrtc and HAS_WEBRTCVAD else None
+
+    def is_speech(self, frame: bytes) -> bool:
+        if self._vad is not None:
+            try:
+                return self._vad.is_speech(frame, self.rate)
+            except Exception:
+                pass
+        energy = _rms(frame)
+        speech = energy >= max(self.min_energy, self._noise_floor * self.energy_ratio)
+        if not speech:
+            # Slowly follow the ambient level so fans/motors do not trigger
+            self._noise_floor = 0.95 * self._noise_floor + 0.05 * energy
+        return speech
+
+
+def record_utterance(
+    source,
+    vad: VoiceActivityDetector,
+    silence_ms: int = 600,
+    max_seconds: float = 10.0,
+    start_timeout_s: float = 4.0,
+    pre_roll_ms: int = 300,
+) -> bytes:
+    """Read frames from *source* until the speaker stops; return WAV bytes.
+
+    Recording begins at the first speech frame (with *pre_roll_ms* of
+    audio kept from before it) and ends after *silence_ms* of trailing
+    non-speech.  Returns empty bytes if no speech starts within
+    *start_timeout_s*.
+    """
+    rate = getattr(source, "rate", SAMPLE_RATE)
+    pre_roll: deque = deque(maxlen=max(1, pre_roll_ms // FRAME_MS))
+    frames: list[bytes] = []
+    started = False
+    silent = 0
+    silence_frames = max(1, silence_ms // FRAME_MS)
+    max_frames = int(max_seconds * 1000 / FRAME_MS)
+    start_frames = int(start_timeout_s * 1000 / FRAME_MS)
+
+    for i in range(max_frames):
+        frame = source.read_frame()
+        if not frame:
+            break
+        speech = vad.is_speech(frame)
+        if not started:
+            if speech:
+                started = True
+                frames.extend(pre_roll)
+                frames.append(frame)
+            else:
+                pre_roll.append(frame)
+                if i >= start_frames:
+                    return b""
+            continue
+        frames.append(frame)
+        silent = 0 if speech else silent + 1
+        if silent >= silence_frames:
+            break
+
+    if not frames:
+        return b""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(b"".join(frames))
+    return buf.getvalue()
+
+
+def split_sentences(chunks: Iterable[str]) -> Iterator[str]:
+    """Regroup streamed text *chunks* into complete sentences.
+
+    Each sentence is yielded as soon as its terminating punctuation has
+    arrived; any remainder is yielded when the stream ends.
+    """
+    pending = ""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        pending += chunk
+        parts = _SENTENCE_END.split(pending)
+        for sentence in parts[:-1]:
+            if sentence.strip():
+                yield sentence.strip()
+        pending = parts[-1]
+    if pending.strip():
+        yield pending.strip()
+
 
 class VoiceAssistantLoop:
     """Continuous wake→STT→LLM→TTS voice assistant pipeline."""
@@ -45,6 +277,8 @@ class VoiceAssistantLoop:
         on_command: Optional[Callable[[str], str]] = None,
         hotword: str = "hey castor",
         dry_run_mode: bool = False,
+        audio_source=None,
+        vad: Optional[VoiceActivityDetector] = None,
     ):
         self._brain = brain
         self._on_command = on_command
@@ -55,11 +289,16 @@ class VoiceAssistantLoop:
         self._interpreter = get_command_interpreter()
         self._thread: Optional[threading.Thread] = None
         self._state = "idle"  # idle | waiting | listening | processing | speaking
+        self._audio_source = audio_source
+        self._vad = vad or VoiceActivityDetector()
+        self._silence_ms = int(os.getenv("CASTOR_VAD_SILENCE_MS", "600"))
+        self._tts_engine = None
         self._stats = {
             "sessions": 0,
             "avg_stt_ms": 0.0,
             "avg_llm_ms": 0.0,
             "avg_tts_ms": 0.0,
+            "avg_first_audio_ms": 0.0,
         }
 
     # ── Lifecycle ─────────────────────────────────────────────────────
@@ -76,6 +315,9 @@ class VoiceAssistantLoop:
         self._running = False
         self._pending_confirmation = None
         self._state = "idle"
+        if isinstance(self._audio_source, MicrophoneSource):
+            self._audio_source.close()
+            self._audio_source = None
         logger.info("VoiceAssistantLoop stopped")
 
     # ── Properties ────────────────────────────────────────────────────
@@ -130,81 +372,115 @@ class VoiceAssistantLoop:
                     continue
 
                 logger.info("STT: %r (%.0f ms)", text, stt_ms)
-                self._state = "processing"
 
-                # 2. Command interpreter + LLM
-                t1 = time.monotonic()
-                reply = self._handle_command(text)
-                llm_ms = (time.monotonic() - t1) * 1000
-                self._stats["avg_llm_ms"] = 0.9 * self._stats["avg_llm_ms"] + 0.1 * llm_ms
-                logger.info("LLM: %r (%.0f ms)", (reply or "")[:80], llm_ms)
-
-                # 3. TTS
-                self._state = "speaking"
-                t2 = time.monotonic()
-                self._tts(reply or "I didn't understand that.")
-                tts_ms = (time.monotonic() - t2) * 1000
-                self._stats["avg_tts_ms"] = 0.9 * self._stats["avg_tts_ms"] + 0.1 * tts_ms
+                # 2+3. Command interpreter + streamed LLM → sentence-wise TTS
+                self.respond(text)
 
             except Exception as exc:
                 logger.error("VoiceLoop iteration error: %s", exc)
 
         self._state = "idle"
 
+    def respond(self, text: str) -> str:
+        """Handle *text* and speak the reply as it streams; return the reply.
+
+        A producer thread pulls the LLM stream and regroups it into
+        sentences while this thread speaks them, so the first sentence is
+        audible while later ones are still being generated.
+        """
+        self._state = "processing"
+        sentences: queue.Queue = queue.Queue()
+        done = object()
+        t0 = time.monotonic()
+        llm_done = [t0]
+
+        def _produce():
+            try:
+                for sentence in split_sentences(self._handle_command_stream(text)):
+                    sentences.put(sentence)
+            except Exception as exc:
+                logger.error("LLM stream error: %s", exc)
+            finally:
+                llm_done[0] = time.monotonic()
+                sentences.put(done)
+
+        threading.Thread(target=_produce, daemon=True, name="voice-llm").start()
+
+        spoken: list[str] = []
+        first_audio_ms = None
+        tts_s = 0.0
+        while True:
+            sentence = sentences.get()
+            if sentence is done:
+                break
+            if first_audio_ms is None:
+                first_audio_ms = (time.monotonic() - t0) * 1000
+                self._state = "speaking"
+            t_say = time.monotonic()
+            self._tts(sentence)
+            tts_s += time.monotonic() - t_say
+            spoken.append(sentence)
+
+        reply = " ".join(spoken)
+        if not spoken:
+            self._state = "speaking"
+            t_say = time.monotonic()
+            self._tts("I didn't understand that.")
+            tts_s += time.monotonic() - t_say
+            first_audio_ms = (time.monotonic() - t0) * 1000
+
+        llm_ms = (llm_done[0] - t0) * 1000
+        tts_ms = tts_s * 1000
+        self._stats["avg_llm_ms"] = 0.9 * self._stats["avg_llm_ms"] + 0.1 * llm_ms
+        self._stats["avg_tts_ms"] = 0.9 * self._stats["avg_tts_ms"] + 0.1 * tts_ms
+        self._stats["avg_first_audio_ms"] = (
+            0.9 * self._stats["avg_first_audio_ms"] + 0.1 * first_audio_ms
+        )
+        logger.info("LLM: %r (%.0f ms, first audio %.0f ms)", reply[:80], llm_ms, first_audio_ms)
+        return reply
+
     # ── Pipeline stages ───────────────────────────────────────────────
 
     def _stt(self) -> str:
         try:
-            audio_bytes = self._record_audio(seconds=4)
+            audio_bytes = self._record_audio()
             if not audio_bytes:
                 return ""
-            from castor.voice import transcribe_bytes
+            from castor.voice import get_transcription_worker
 
-            return transcribe_bytes(audio_bytes, hint_format="wav") or ""
+            result = get_transcription_worker().submit_wav(audio_bytes).result(timeout=60)
+            return (result or {}).get("text", "")
         except Exception as exc:
             logger.error("STT error: %s", exc)
             return ""
 
-    def _record_audio(self, seconds: float = 4.0) -> bytes:
-        """Record microphone input using PyAudio. Returns WAV bytes."""
+    def _record_audio(self) -> bytes:
+        """Record one utterance from the persistent input stream.
+
+        Returns WAV bytes endpointed by the VAD, or empty bytes when no
+        speech was heard.
+        """
         try:
-            import io
-            import wave
-
-            import pyaudio
-
-            pa = pyaudio.PyAudio()
-            stream = pa.open(
-                format=pyaudio.paInt16,
-                channels=1,
-                rate=16000,
-                input=True,
-                frames_per_buffer=1024,
-            )
-            frames = [
-                stream.read(1024, exception_on_overflow=False)
-                for _ in range(int(16000 / 1024 * seconds))
-            ]
-            stream.stop_stream()
-            stream.close()
-            pa.terminate()
-
-            buf = io.BytesIO()
-            with wave.open(buf, "wb") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(pa.get_sample_size(pyaudio.paInt16))
-                wf.setframerate(16000)
-                wf.writeframes(b"".join(frames))
-            return buf.getvalue()
+            if self._audio_source is None:
+                self._audio_source = MicrophoneSource()
+            return record_utterance(self._audio_source, self._vad, silence_ms=self._silence_ms)
         except Exception as exc:
             logger.error("Audio record error: %s", exc)
+            if isinstance(self._audio_source, MicrophoneSource):
+                # Reopen on the next utterance (e.g. device unplugged)
+                self._audio_source.close()
+                self._audio_source = None
             return b""
 
     def _handle_command(self, text: str) -> str:
+        return "".join(self._handle_command_stream(text))
+
+    def _handle_command_stream(self, text: str) -> Iterator[str]:
         incoming = (text or "").strip()
         if incoming.lower() == "cancel" and self._pending_confirmation:
             self._pending_confirmation = None
-            return "Cancelled pending dry-run plan."
+            yield "Cancelled pending dry-run plan."
+            return
 
         if incoming.lower() == "confirm" and self._pending_confirmation:
             text = self._pending_confirmation
@@ -229,19 +505,21 @@ class VoiceAssistantLoop:
 
         if not interpreted["execution_allowed"]:
             alts = "; ".join(safety.get("alternatives") or [])
-            return (
+            yield (
                 f"[{safety['explanation_id']}] I cannot do that. {safety['rationale']} "
                 f"Safe alternatives: {alts}"
             )
+            return
 
         if interpreted.get("dry_run"):
             self._pending_confirmation = text
             steps = " ".join(
                 [f"Step {i}: {step}" for i, step in enumerate(interpreted.get("plan", []), start=1)]
             )
-            return f"[{safety['explanation_id']}] Dry-run plan. {steps} Say confirm to execute or cancel."
+            yield f"[{safety['explanation_id']}] Dry-run plan. {steps} Say confirm to execute or cancel."
+            return
 
-        return self._llm(text)
+        yield from self._llm_stream(text)
 
     def _llm(self, text: str) -> str:
         if self._on_command:
@@ -258,11 +536,27 @@ class VoiceAssistantLoop:
                 logger.error("LLM think error: %s", exc)
         return ""
 
+    def _llm_stream(self, text: str) -> Iterator[str]:
+        """Yield reply text incrementally (``think_stream`` when available)."""
+        if self._on_command or self._brain is None or not hasattr(self._brain, "think_stream"):
+            reply = self._llm(text)
+            if reply:
+                yield reply
+            return
+        try:
+            for chunk in self._brain.think_stream(b"", text):
+                if isinstance(chunk, str):
+                    yield chunk
+        except Exception as exc:
+            logger.error("LLM think_stream error: %s", exc)
+
     def _tts(self, text: str):
         try:
-            from castor.tts_local import LocalTTS
+            if self._tts_engine is None:
+                from castor.tts_local import get_tts
 
-            LocalTTS().say(text)
+                self._tts_engine = get_tts()
+            self._tts_engine.say(text)
         except Exception as exc:
             logger.warning("TTS error: %s", exc)
 
@@ -12,6 +12,12 @@ RCAN config format::
       timeout_s: 10.0            # Max time without brain response
       action: stop               # What to do: "stop" (default)
 
+With a shared :class:`~castor.monitor_scheduler.MonitorScheduler` the
+watchdog does not poll at all: it arms a critical deadline job for
+``last_heartbeat + timeout_s`` and re-arms it when it fires early because
+heartbeats kept arriving, so a timeout is detected at the deadline rather
+than up to a second after it.
+
 Usage:
     Integrated into main.py automatically.
 """
@@ -22,6 +28,9 @@ import time
 
 logger = logging.getLogger("OpenCastor.Watchdog")
 
+# Fire just after the deadline so the strict ``elapsed > timeout`` test holds
+_DEADLINE_SLOP_S = 0.005
+
 
 class BrainWatchdog:
     """Monitors brain responsiveness and stops motors on timeout."""
@@ -44,6 +53,8 @@ class BrainWatchdog:
         self._triggered = False
         self._running = False
         self._thread = None
+        self._scheduler = None
+        self._job = None
         self._lock = threading.Lock()
 
         if self.enabled:
@@ -57,42 +68,75 @@ class BrainWatchdog:
                 self._triggered = False
                 logger.info("Watchdog: brain responsive again")
 
-    def start(self):
-        """Start the watchdog timer thread."""
+    def start(self, scheduler=None):
+        """Start the watchdog.
+
+        Args:
+            scheduler: Optional shared
+                :class:`~castor.monitor_scheduler.MonitorScheduler`; when
+                given, a deadline job replaces the timer thread.
+        """
         if not self.enabled:
             return
 
         self._running = True
         self._last_heartbeat = time.time()
+        if scheduler is not None:
+            self._scheduler = scheduler
+            self._job = scheduler.after(
+                f"watchdog-{id(self):x}",
+                self._on_deadline,
+                self.timeout + _DEADLINE_SLOP_S,
+                critical=True,
+            )
+            return
         self._thread = threading.Thread(target=self._monitor_loop, daemon=True, name="watchdog")
         self._thread.start()
 
     def stop(self):
-        """Stop the watchdog thread."""
+        """Stop the watchdog thread (or cancel its scheduled job)."""
         self._running = False
+        if self._job is not None:
+            self._scheduler.cancel(self._job)
+            self._job = None
         if self._thread:
             self._thread.join(timeout=2)
 
+    def check(self) -> float:
+        """Trigger ``stop_fn`` if the brain has timed out; returns the seconds
+        since the last heartbeat."""
+        with self._lock:
+            elapsed = time.time() - self._last_heartbeat
+
+        if elapsed > self.timeout and not self._triggered:
+            self._triggered = True
+            logger.critical(
+                f"WATCHDOG: Brain unresponsive for {elapsed:.1f}s "
+                f"(timeout: {self.timeout}s) -- stopping motors!"
+            )
+            if self._stop_fn:
+                try:
+                    self._stop_fn()
+                except Exception as exc:
+                    logger.error(f"Watchdog stop failed: {exc}")
+        return elapsed
+
     def _monitor_loop(self):
         """Background thread that checks for brain timeouts."""
         while self._running:
-            with self._lock:
-                elapsed = time.time() - self._last_heartbeat
-
-            if elapsed > self.timeout and not self._triggered:
-                self._triggered = True
-                logger.critical(
-                    f"WATCHDOG: Brain unresponsive for {elapsed:.1f}s "
-                    f"(timeout: {self.timeout}s) -- stopping motors!"
-                )
-                if self._stop_fn:
-                    try:
-                        self._stop_fn()
-                    except Exception as exc:
-                        logger.error(f"Watchdog stop failed: {exc}")
-
+            self.check()
             time.sleep(1.0)
 
+    def _on_deadline(self):
+        """Scheduled deadline: check, then re-arm for the next possible timeout."""
+        elapsed = self.check()
+        remaining = self.timeout - elapsed
+        # Already triggered: look again one timeout later for a recovery
+        delay = remaining if remaining > 0 else self.timeout
+        job = self._job
+        if self._running and job is not None:
+            self._scheduler.reschedule(job, time.monotonic() + delay + _DEADLINE_SLOP_S)
+
     @property
     def is_triggered(self) -> bool:
         """True if the watchdog has triggered (brain unresponsive)."""
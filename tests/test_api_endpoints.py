@@ -6,6 +6,7 @@ Mocks AppState internals (brain, driver, fs, channels) so tests run
 without hardware, AI providers, or messaging SDKs.
 """
 
+import asyncio
 import base64
 import collections
 import time
@@ -101,6 +102,7 @@ def _reset_state_and_env(monkeypatch):
     api_mod.state.thought_history = collections.deque(maxlen=50)
     api_mod.state.learner = None
     api_mod.state.mission_runner = None
+    api_mod.state.channels_task = None
 
     # Reset the module-level API_TOKEN
     api_mod.API_TOKEN = None
@@ -191,6 +193,32 @@ class TestHealthEndpoint:
         assert "brain" not in body
         assert "driver" not in body
 
+    def test_health_etag_round_trip_ignores_uptime(self, client, api_mod):
+        first = client.get("/health")
+        etag = first.headers["etag"]
+        api_mod.state.boot_time -= 60  # uptime moves on; nothing else does
+        again = client.get("/health", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.headers["etag"] == etag and again.content == b""
+        api_mod.state.ruri = "rrn://changed"
+        changed = client.get("/health", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["rrn"] == "rrn://changed"
+
+    def test_metrics_etag_round_trip_ignores_uptime(self, client, api_mod):
+        from castor.metrics import get_registry
+
+        first = client.get("/api/metrics")
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        api_mod.state.boot_time -= 60
+        assert client.get("/api/metrics", headers={"If-None-Match": etag}).status_code == 304
+        get_registry().record_error("etag_test")
+        changed = client.get("/api/metrics", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert "etag_test" in changed.text
+
     def test_health_detail_requires_auth(self, client, api_mod):
         """/api/health/detail must require a valid token."""
         api_mod.API_TOKEN = "secret-token-123"
@@ -1692,6 +1720,86 @@ class TestSetupV2Endpoints:
         assert "first_run_success_rate" in payload
 
 
+# =====================================================================
+# GET /api/profile
+# =====================================================================
+class TestProfileEndpoint:
+    def test_folded_capture(self, client):
+        resp = client.get("/api/profile?seconds=0.1&hz=200")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain")
+        lines = resp.text.splitlines()
+        assert lines[0].startswith("# capture seconds=0.1")
+        stacks = [ln for ln in lines if not ln.startswith("#")]
+        assert stacks and all(ln.rsplit(" ", 1)[1].isdigit() for ln in stacks)
+
+    def test_json_capture(self, client):
+        resp = client.get("/api/profile?seconds=0.1&format=json")
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["samples"] >= 1
+        assert isinstance(body["stacks"], dict)
+        assert "folded" not in body
+
+    def test_capture_bounds_validated(self, client):
+        assert client.get("/api/profile?seconds=600").status_code == 422
+        assert client.get("/api/profile?hz=5000").status_code == 422
+
+
+class TestTelemetrySnapshot:
+    def test_matches_individual_views(self, client):
+        snap = client.get("/api/telemetry/snapshot").json()
+        assert set(snap) == {"status", "health", "contribute", "skills"}
+        assert snap["health"]["status"] == "ok"
+        assert snap["skills"] == client.get("/api/skills").json()
+        assert snap["contribute"] == client.get("/api/contribute").json()
+
+    def test_omits_views_above_callers_role(self, client):
+        from fastapi import Request
+
+        from castor.api import app, verify_token
+
+        async def _viewer(request: Request):
+            request.state.jwt_role = "viewer"
+
+        app.dependency_overrides[verify_token] = _viewer
+        try:
+            snap = client.get("/api/telemetry/snapshot").json()
+            assert client.get("/api/contribute").status_code == 403
+        finally:
+            app.dependency_overrides.pop(verify_token, None)
+        assert set(snap) == {"status", "health", "skills"}
+
+
+class TestChannelStartupTask:
+    async def test_failure_is_logged(self, api_mod, monkeypatch, caplog):
+        async def boom():
+            raise RuntimeError("no channels today")
+
+        monkeypatch.setattr(api_mod, "_start_channels", boom)
+        api_mod._launch_channels()
+        task = api_mod.state.channels_task
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)  # let the done-callback run
+        assert "Channel startup failed" in caplog.text
+        assert "no channels today" in caplog.text
+
+    async def test_shutdown_cancels_pending_startup(self, api_mod, monkeypatch):
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(60)
+
+        monkeypatch.setattr(api_mod, "_start_channels", slow)
+        api_mod._launch_channels()
+        task = api_mod.state.channels_task
+        await started.wait()
+        await api_mod._cancel_channels_task()
+        assert task.cancelled()
+        assert api_mod.state.channels_task is None
+
+
 # =====================================================================
 # GET /api/safety/manifest
 # =====================================================================
@@ -1808,3 +1916,39 @@ class TestWatermarkVerifyEndpoint:
             resp = client.get(f"/api/v1/watermark/verify?token={token}&rrn=RRN-1")
 
         assert resp.status_code == 200
+
+
+# =====================================================================
+# Video recording
+# =====================================================================
+class TestRecordingEndpoints:
+    def test_api_started_recording_receives_gateway_frames(self, client, tmp_path, monkeypatch):
+        from castor import recorder as recorder_mod
+
+        rec = recorder_mod.VideoRecorder(output_dir=tmp_path, fps=20, mode="mjpeg")
+        monkeypatch.setattr(recorder_mod, "_recorder", rec)
+        camera = MagicMock()
+        camera.is_available.return_value = True
+        camera.capture_jpeg.return_value = b"\xff\xd8\xff\xe0" + b"\x01" * 64 + b"\xff\xd9"
+        monkeypatch.setattr("castor.main.get_shared_camera", lambda: camera)
+
+        resp = client.post("/api/recording/start", json={"session_name": "e2e"})
+        assert resp.status_code == 200
+        deadline = time.monotonic() + 5
+        while rec.current_info["frames"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        resp = client.post("/api/recording/stop")
+
+        assert resp.status_code == 200
+        assert resp.json()["frames"] >= 3
+        assert not rec.is_recording
+        (seg,) = resp.json()["segments"]
+        assert seg["frames"] == resp.json()["frames"]
+
+    def test_stop_without_recording_is_409(self, client, tmp_path, monkeypatch):
+        from castor import recorder as recorder_mod
+
+        monkeypatch.setattr(
+            recorder_mod, "_recorder", recorder_mod.VideoRecorder(output_dir=tmp_path)
+        )
+        assert client.post("/api/recording/stop").status_code == 409
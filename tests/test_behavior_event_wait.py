@@ -227,3 +227,177 @@ def test_event_wait_default_timeout_is_30s():
             "value": 0.5,
         }
         runner._step_event_wait(step)
+
+
+# ── Event-bus wake-ups ────────────────────────────────────────────────────────
+
+
+def _run_in_thread(fn, *args):
+    done = {}
+
+    def target():
+        fn(*args)
+        done["at"] = time.monotonic()
+
+    t = threading.Thread(target=target, daemon=True)
+    t.start()
+    return t, done
+
+
+def test_event_wait_wakes_on_bus_publish():
+    from castor.event_bus import get_bus
+
+    runner = make_runner()
+    runner._running = True
+    step = {
+        "type": "event_wait",
+        "sensor": "bumper.pressed",
+        "op": "eq",
+        "value": True,
+        "timeout_s": 5.0,
+    }
+    with patch.object(runner, "_get_sensor_value", return_value=None):
+        t, done = _run_in_thread(runner._step_event_wait, step)
+        time.sleep(0.05)
+        published_at = time.monotonic()
+        get_bus().publish("bumper.pressed", True)
+        t.join(2.0)
+
+    assert "at" in done
+    # Woken by the publish, not the next 100 ms poll
+    assert done["at"] - published_at < 0.05
+
+
+def test_event_wait_does_not_poll_driver_for_live_topic():
+    from castor.event_bus import get_bus
+
+    runner = make_runner()
+    runner._running = True
+    get_bus().publish("lidar.front_mm", 900)
+    step = {
+        "type": "event_wait",
+        "sensor": "lidar.front_mm",
+        "op": "lt",
+        "value": 300,
+        "timeout_s": 0.3,
+    }
+    with patch.object(runner, "_get_sensor_value", return_value=900) as read:
+        t0 = time.monotonic()
+        runner._step_event_wait(step)
+        elapsed = time.monotonic() - t0
+    read.assert_not_called()
+    assert 0.29 <= elapsed < 0.45  # precise timeout, no poll overshoot
+
+
+def test_event_wait_keeps_polling_when_only_its_own_reads_publish():
+    from castor.event_bus import get_bus
+
+    runner = make_runner()
+    runner._running = True
+    reads = []
+
+    def publishing_read(driver, field):
+        # Like a driver read decorated with @publishes
+        reads.append(time.monotonic())
+        get_bus().publish("imu.self_published_rms", 0.1)
+        return 0.1
+
+    step = {
+        "type": "event_wait",
+        "sensor": "imu.self_published_rms",
+        "op": "gt",
+        "value": 0.5,
+        "timeout_s": 0.6,
+    }
+    with patch.object(runner, "_get_sensor_value", side_effect=publishing_read):
+        runner._step_event_wait(step)
+    # 100 ms polling gives ~6 reads; mistaking them for a live publisher gives 1
+    assert len(reads) >= 4
+
+
+def test_event_wait_stops_polling_once_an_external_publisher_appears():
+    from castor.event_bus import get_bus
+
+    runner = make_runner()
+    runner._running = True
+    reads = []
+    stop = threading.Event()
+
+    def publishing_read(driver, field):
+        reads.append(time.monotonic())
+        get_bus().publish("imu.shared_rms", 0.1)
+        return 0.1
+
+    def external_publisher():
+        while not stop.wait(0.05):
+            get_bus().publish("imu.shared_rms", 0.2)
+
+    step = {
+        "type": "event_wait",
+        "sensor": "imu.shared_rms",
+        "op": "gt",
+        "value": 0.5,
+        "timeout_s": 0.8,
+    }
+    t0 = time.monotonic()
+    timer = threading.Timer(0.2, lambda: threading.Thread(target=external_publisher).start())
+    timer.start()
+    try:
+        with patch.object(runner, "_get_sensor_value", side_effect=publishing_read):
+            runner._step_event_wait(step)
+    finally:
+        stop.set()
+    assert len([t for t in reads if t - t0 < 0.2]) >= 1
+    assert len([t for t in reads if t - t0 > 0.35]) == 0
+
+
+def test_stop_cancels_event_wait_promptly():
+    runner = make_runner()
+    runner._running = True
+    step = {
+        "type": "event_wait",
+        "sensor": "vision.person_count",
+        "op": "gt",
+        "value": 0,
+        "timeout_s": 10.0,
+    }
+    with patch.object(runner, "_get_sensor_value", return_value=None):
+        t, done = _run_in_thread(runner._step_event_wait, step)
+        time.sleep(0.05)
+        stopped_at = time.monotonic()
+        runner.stop()
+        t.join(2.0)
+
+    assert done["at"] - stopped_at < 0.15
+    assert not runner._waiters
+
+
+def test_wait_for_event_fires_on_bus_topic():
+    from castor.event_bus import get_bus
+
+    runner = make_runner()
+    runner._running = True
+    step = {"type": "wait_for_event", "event": "person_detected", "timeout_s": 5.0}
+    t, done = _run_in_thread(runner._step_wait_for_event, step)
+    time.sleep(0.05)
+    published_at = time.monotonic()
+    get_bus().publish("event.person_detected")
+    t.join(2.0)
+
+    assert done["at"] - published_at < 0.05
+    runner.stop()
+
+
+def test_emit_event_publishes_on_bus():
+    from castor.event_bus import get_bus
+
+    runner = make_runner()
+    runner._running = True
+    seen = []
+    token = get_bus().subscribe("event.docked", lambda topic, value: seen.append(topic))
+    try:
+        runner._step_emit_event({"type": "emit_event", "event": "docked"})
+    finally:
+        get_bus().unsubscribe(token)
+    assert seen == ["event.docked"]
+    runner.stop()
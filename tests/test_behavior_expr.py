@@ -0,0 +1,117 @@
+"""Tests for compiled behavior expressions and load-time validation."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+import yaml
+
+from castor.behaviors import BehaviorRunner, benchmark, compile_expr
+
+
+def _write_behavior(tmp_path, steps):
+    p = tmp_path / "patrol.behavior.yaml"
+    p.write_text(yaml.dump({"name": "patrol", "steps": steps}))
+    return str(p)
+
+
+# ── compile_expr ──────────────────────────────────────────────────────────────
+
+
+def test_compile_expr_is_cached():
+    assert compile_expr("$var.x > 1") is compile_expr("$var.x > 1")
+
+
+@pytest.mark.parametrize(
+    "expr, expected",
+    [
+        ("$var.x >= 3", True),
+        ("$var.x <= 2", False),
+        ("$var.x != 3", False),
+        ("$var.x == 3", True),
+        ("4 > $var.x", True),
+        ("$var.x < $var.y", True),
+        ("-1 < 0", True),
+    ],
+)
+def test_compiled_operators(expr, expected):
+    assert compile_expr(expr)({"x": 3, "y": "7.5"}) is expected
+
+
+def test_compiled_expr_reads_current_vars():
+    fn = compile_expr("$var.battery_pct > 20")
+    assert fn({"battery_pct": 50}) is True
+    assert fn({"battery_pct": 10}) is False
+
+
+@pytest.mark.parametrize("value", [None, True, "abc", [1]])
+def test_non_numeric_var_raises_at_eval(value):
+    fn = compile_expr("$var.v > 1")
+    with pytest.raises(ValueError, match=r"\$var\.v"):
+        fn({"v": value})
+
+
+@pytest.mark.parametrize("expr", ["no operator here", "abc > 5", "$var.x > battery.soc_pct"])
+def test_malformed_expr_raises_at_compile(expr):
+    with pytest.raises(ValueError):
+        compile_expr(expr)
+
+
+# ── load-time validation ──────────────────────────────────────────────────────
+
+
+def test_load_rejects_malformed_condition(tmp_path):
+    path = _write_behavior(tmp_path, [{"type": "assert", "condition": "$var.x >> oops"}])
+    with pytest.raises(ValueError, match=r"steps\[0\] \(assert\)"):
+        BehaviorRunner().load(path)
+
+
+def test_load_rejects_nested_malformed_condition(tmp_path):
+    steps = [
+        {"type": "wait", "seconds": 0},
+        {
+            "type": "while_true",
+            "inner_steps": [{"type": "break_on", "condition": "battery low"}],
+        },
+    ]
+    path = _write_behavior(tmp_path, steps)
+    with pytest.raises(ValueError, match=r"steps\[1\]\.inner_steps\[0\] \(break_on\)"):
+        BehaviorRunner().load(path)
+
+
+def test_load_rejects_unknown_op(tmp_path):
+    steps = [{"type": "condition", "sensor": "lidar", "field": "center_cm", "op": "ne"}]
+    path = _write_behavior(tmp_path, steps)
+    with pytest.raises(ValueError, match="unknown op 'ne'"):
+        BehaviorRunner().load(path)
+
+
+def test_load_accepts_valid_conditions_and_placeholders(tmp_path):
+    steps = [
+        {"type": "unless", "condition": "$var.x >= 10", "inner_steps": [{"type": "stop"}]},
+        {"type": "conditional", "sensor": "battery.voltage_v", "op": "ne", "value": 3},
+        {
+            "type": "for_each",
+            "items": ["1 > 0"],
+            "inner_steps": [{"type": "break_on", "condition": "$item"}],
+        },
+    ]
+    data = BehaviorRunner().load(_write_behavior(tmp_path, steps))
+    assert len(data["steps"]) == 3
+
+
+# ── sensor accessors ──────────────────────────────────────────────────────────
+
+
+def test_read_sensor_honours_patched_getter():
+    with mock.patch("castor.drivers.lidar_driver.get_lidar") as get_lidar:
+        get_lidar.return_value.obstacles.return_value = {"center_cm": 120}
+        assert BehaviorRunner._read_sensor("lidar") == {"center_cm": 120}
+        assert BehaviorRunner._eval_condition("lidar", "center_cm", "lt", 300) is True
+
+
+def test_benchmark_reports_per_step_overhead():
+    result = benchmark(n_steps=200, runs=1)
+    assert result["step_us"] > 0
+    assert result["expr_us"] > 0
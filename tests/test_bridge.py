@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import copy
+import json
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock
 
 # ---------------------------------------------------------------------------
@@ -249,6 +253,204 @@ class TestCastorBridgeUnit(unittest.TestCase):
         self.assertFalse(bridge._running)
 
 
+# ---------------------------------------------------------------------------
+# Telemetry publishing — local stub gateway + in-memory Firestore
+# ---------------------------------------------------------------------------
+
+
+class _FakeDocument:
+    """Minimal in-memory Firestore document: set(merge=...) and subcollections."""
+
+    def __init__(self):
+        self.data: dict = {}
+        self.writes: list = []
+        self.fail_next = False
+        self._collections: dict = {}
+
+    def set(self, data, merge=False):
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError("deadline exceeded")
+        self.writes.append(copy.deepcopy(data))
+        if merge:
+            _deep_merge(self.data, copy.deepcopy(data))
+        else:
+            self.data = copy.deepcopy(data)
+
+    def collection(self, name):
+        return self._collections.setdefault(name, _FakeCollection())
+
+
+class _FakeCollection:
+    def __init__(self):
+        self.docs: dict = {}
+
+    def document(self, doc_id):
+        return self.docs.setdefault(doc_id, _FakeDocument())
+
+
+class _FakeFirestore:
+    def __init__(self):
+        self._collections: dict = {}
+
+    def collection(self, name):
+        return self._collections.setdefault(name, _FakeCollection())
+
+
+def _deep_merge(dst: dict, src: dict) -> None:
+    for key, value in src.items():
+        if isinstance(value, dict) and isinstance(dst.get(key), dict):
+            _deep_merge(dst[key], value)
+        else:
+            dst[key] = value
+
+
+class _StubGateway:
+    """Local HTTP server standing in for the castor gateway."""
+
+    def __init__(self, snapshot: bool = True):
+        self.views = {
+            "status": {"version": "2026.3.14.6", "system": {"cpu_temp_c": 50.0}, "uptime_s": 1},
+            "health": {"status": "ok"},
+            "contribute": {"enabled": False},
+            "skills": {"skills": [{"name": "nav"}], "builtin_commands": []},
+        }
+        self.paths: list = []
+        self.peers: set = set()
+        gateway = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                gateway.paths.append(self.path)
+                gateway.peers.add(self.client_address)
+                name = self.path.rsplit("/", 1)[-1]
+                if self.path == "/api/telemetry/snapshot" and snapshot:
+                    body = gateway.views
+                elif name in gateway.views and self.path != "/api/telemetry/snapshot":
+                    body = gateway.views[name]
+                else:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                raw = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestTelemetryPublishing(unittest.TestCase):
+    def _make(self, snapshot: bool = True):
+        from castor.cloud.bridge import CastorBridge
+
+        gateway = _StubGateway(snapshot=snapshot)
+        self.addCleanup(gateway.close)
+        bridge = CastorBridge(
+            config={"rrn": "RRN-000000000001", "name": "bob", "owner": "rrn://x"},
+            firebase_project="test",
+            gateway_url=gateway.url,
+        )
+        self.addCleanup(bridge.stop)
+        bridge._db = _FakeFirestore()
+        return bridge, gateway, bridge._robot_ref()
+
+    def test_snapshot_endpoint_single_request_per_cycle(self):
+        bridge, gateway, doc = self._make()
+        bridge._publish_telemetry()
+        bridge._publish_telemetry()
+        self.assertEqual(gateway.paths, ["/api/telemetry/snapshot"] * 2)
+        self.assertEqual(doc.data["telemetry"]["health"], {"status": "ok"})
+        self.assertEqual(doc.data["telemetry"]["skills_count"], 1)
+        # Keep-alive: both cycles reuse the pooled connection
+        self.assertEqual(len(gateway.peers), 1)
+
+    def test_falls_back_to_individual_views(self):
+        bridge, gateway, doc = self._make(snapshot=False)
+        bridge._publish_telemetry()
+        self.assertFalse(bridge._snapshot_supported)
+        self.assertEqual(
+            gateway.paths,
+            [
+                "/api/telemetry/snapshot",
+                "/api/status",
+                "/api/health",
+                "/api/contribute",
+                "/api/skills",
+            ],
+        )
+        self.assertEqual(doc.data["telemetry"]["contribute"], {"enabled": False})
+
+    def test_second_write_carries_only_changed_fields(self):
+        bridge, gateway, doc = self._make()
+        bridge._publish_telemetry()
+        gateway.views["status"]["system"]["cpu_temp_c"] = 61.5
+        bridge._publish_telemetry()
+        delta = doc.writes[-1]
+        self.assertEqual(delta["telemetry"]["system"], {"cpu_temp_c": 61.5})
+        self.assertNotIn("health", delta["telemetry"])
+        self.assertNotIn("opencastor_version", delta)
+        self.assertIn("last_seen", delta["status"])
+        # The merged document still holds every field
+        self.assertEqual(doc.data["telemetry"]["health"], {"status": "ok"})
+        self.assertEqual(doc.data["telemetry"]["system"]["cpu_temp_c"], 61.5)
+
+    def test_failed_write_does_not_advance_baseline(self):
+        bridge, gateway, doc = self._make()
+        bridge._publish_telemetry()
+        gateway.views["status"]["system"]["cpu_temp_c"] = 70.0
+        doc.fail_next = True
+        bridge._publish_telemetry()
+        bridge._publish_telemetry()
+        self.assertEqual(doc.writes[-1]["telemetry"]["system"], {"cpu_temp_c": 70.0})
+
+    def test_skills_subdocument_written_only_on_change(self):
+        bridge, gateway, doc = self._make()
+        skills_doc = doc.collection("telemetry").document("skills")
+        bridge._publish_telemetry()
+        bridge._publish_telemetry()
+        self.assertEqual(len(skills_doc.writes), 1)
+        gateway.views["skills"]["skills"].append({"name": "arm"})
+        bridge._publish_telemetry()
+        self.assertEqual(len(skills_doc.writes), 2)
+
+    def test_periodic_full_resync(self):
+        bridge, gateway, doc = self._make()
+        bridge._FULL_PUSH_EVERY = 2
+        bridge._publish_telemetry()
+        bridge._publish_telemetry()
+        self.assertNotIn("health", doc.writes[-1]["telemetry"])
+        bridge._publish_telemetry()  # cycle 3 → 3 % 2 == 1
+        self.assertIn("health", doc.writes[-1]["telemetry"])
+
+
+class TestTelemetryDelta(unittest.TestCase):
+    def test_nested_and_leaf_changes(self):
+        from castor.cloud.bridge import _telemetry_delta
+
+        acked = {"a": {"b": 1, "c": [1, 2]}, "d": 1}
+        current = {"a": {"b": 1, "c": [1, 3]}, "d": True, "e": {"f": 2}}
+        self.assertEqual(
+            _telemetry_delta(current, acked),
+            {"a": {"c": [1, 3]}, "d": True, "e": {"f": 2}},
+        )
+        self.assertEqual(_telemetry_delta(acked, acked), {})
+
+
 # ---------------------------------------------------------------------------
 # Firestore models tests
 # ---------------------------------------------------------------------------
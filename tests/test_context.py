@@ -125,3 +125,110 @@ class TestContextBuilder:
     def test_context_limit_default(self):
         builder = _builder(config={"model": "unknown-model-xyz", "harness": {}})
         assert builder._context_limit == 32_768
+
+
+class TestConcurrentSections:
+    def _slow_builder(self, delays, deadline_ms=1000):
+        import asyncio
+
+        builder = _builder(
+            config={
+                "name": "TestBot",
+                "model": "gemini-2.5-flash",
+                "harness": {
+                    "auto_rag": True,
+                    "auto_telemetry": True,
+                    "context_deadline_ms": deadline_ms,
+                },
+            }
+        )
+
+        async def skill(_instruction):
+            await asyncio.sleep(delays["skill"])
+            return {"name": "patrol", "body": "Walk the perimeter."}
+
+        async def memory(_instruction):
+            await asyncio.sleep(delays["memory"])
+            return [{"timestamp": "t", "summary": "saw a cat"}]
+
+        async def telemetry():
+            await asyncio.sleep(delays["telemetry"])
+            return {"battery": 87}
+
+        builder._skill_loader = object()
+        builder._select_skill = skill
+        builder._fetch_episodic_memory = memory
+        builder._fetch_telemetry = telemetry
+        return builder
+
+    @pytest.mark.asyncio
+    async def test_sections_gathered_concurrently(self):
+        import time
+
+        builder = self._slow_builder({"skill": 0.15, "memory": 0.15, "telemetry": 0.15})
+        t0 = time.perf_counter()
+        built = await builder.build(HarnessContext(instruction="hi", scope="chat"), history=[])
+        assert time.perf_counter() - t0 < 0.35  # max, not sum (0.45)
+        assert built.skill_injected == "patrol"
+        assert built.rag_chunks == 1
+        assert built.telemetry_injected
+        assert built.late_sections == []
+        assert set(built.section_ms) == {"skill", "memory", "telemetry"}
+
+    @pytest.mark.asyncio
+    async def test_late_section_degrades(self):
+        builder = self._slow_builder({"skill": 0.0, "memory": 0.0, "telemetry": 0.5}, 100)
+        built = await builder.build(HarnessContext(instruction="hi", scope="chat"), history=[])
+        assert built.late_sections == ["telemetry"]
+        assert not built.telemetry_injected
+        assert "[ROBOT STATUS]" not in built.system_prompt
+        assert built.skill_injected == "patrol"
+
+    @pytest.mark.asyncio
+    async def test_failing_section_is_omitted(self):
+        builder = self._slow_builder({"skill": 0.0, "memory": 0.0, "telemetry": 0.0})
+
+        async def broken(_instruction):
+            raise ConnectionError("memory store offline")
+
+        builder._fetch_episodic_memory = broken
+        built = await builder.build(HarnessContext(instruction="hi", scope="chat"), history=[])
+        assert built.rag_chunks == 0
+        assert built.late_sections == []
+        assert built.skill_injected == "patrol"
+        assert built.telemetry_injected
+
+    @pytest.mark.asyncio
+    async def test_static_sections_memoized_between_turns(self):
+        from unittest.mock import patch
+
+        builder = _builder()
+        ctx = HarnessContext(instruction="hi", scope="chat")
+        with patch.object(builder, "_format_tools", wraps=builder._format_tools) as fmt:
+            first = await builder.build(ctx, history=[])
+            second = await builder.build(ctx, history=[])
+        assert fmt.call_count == 1
+        assert first.system_prompt == second.system_prompt
+        assert first.token_estimate == second.token_estimate
+        assert builder._tokens.hits > 0
+
+    @pytest.mark.asyncio
+    async def test_tool_section_refreshes_after_register(self):
+        reg = ToolRegistry()
+        builder = _builder(tool_registry=reg)
+        ctx = HarnessContext(instruction="hi", scope="chat")
+        await builder.build(ctx, history=[])
+        reg.register("ping_peer", lambda: "pong", description="Ping a peer")
+        built = await builder.build(ctx, history=[])
+        assert "ping_peer" in built.system_prompt
+
+
+def test_token_counter_heuristic_when_no_tokenizer(monkeypatch):
+    import castor.context as ctx_mod
+
+    monkeypatch.setattr(ctx_mod, "HAS_TIKTOKEN", False)
+    counter = ctx_mod._TokenCounter()
+    assert not counter.exact
+    assert counter.count("x" * 40) == 10
+    assert counter.count("x" * 40) == 10
+    assert counter.hits == 1 and counter.misses == 1
@@ -0,0 +1,139 @@
+"""Tests for castor.event_bus — pub/sub bus used by behavior wait steps."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from castor.event_bus import EventBus, get_bus, publishes, reset_bus
+
+
+@pytest.fixture
+def bus():
+    return EventBus()
+
+
+def _publish_later(bus, topic, value, delay):
+    def run():
+        time.sleep(delay)
+        run.published_at = time.monotonic()
+        bus.publish(topic, value)
+
+    t = threading.Thread(target=run, daemon=True)
+    t.start()
+    return run, t
+
+
+class TestPublish:
+    def test_latest_and_age(self, bus):
+        assert bus.latest("bumper.pressed") is None
+        assert bus.age("bumper.pressed") is None
+        bus.publish("bumper.pressed", True)
+        assert bus.latest("bumper.pressed") is True
+        assert 0 <= bus.age("bumper.pressed") < 1.0
+        stamp = bus.published_at("bumper.pressed")
+        assert stamp is not None and stamp <= time.monotonic()
+        bus.publish("bumper.pressed", False)
+        assert bus.published_at("bumper.pressed") >= stamp
+        assert bus.published_at("never.published") is None
+
+    def test_publish_reading_flattens_nested_dicts(self, bus):
+        bus.publish_reading("imu", {"accel_g": {"x": 0.1, "z": 1.0}, "temp_c": 30.5})
+        assert bus.latest("imu.accel_g.x") == 0.1
+        assert bus.latest("imu.accel_g.z") == 1.0
+        assert bus.latest("imu.temp_c") == 30.5
+
+    def test_subscribe_and_unsubscribe(self, bus):
+        seen = []
+        token = bus.subscribe("event.go", lambda topic, value: seen.append((topic, value)))
+        bus.publish("event.go")
+        assert bus.unsubscribe(token) is True
+        bus.publish("event.go")
+        assert seen == [("event.go", True)]
+        assert bus.unsubscribe(token) is False
+
+    def test_subscriber_exception_does_not_break_publish(self, bus):
+        seen = []
+        bus.subscribe("t", lambda *_: 1 / 0)
+        bus.subscribe("t", lambda _topic, value: seen.append(value))
+        bus.publish("t", 5)
+        assert seen == [5]
+
+
+class TestWatch:
+    def test_wakes_on_matching_publish(self, bus):
+        with bus.watch("battery.percent", lambda v: v < 20) as waiter:
+            bus.publish("battery.percent", 50)
+            assert not waiter.met
+            bus.publish("battery.percent", 15)
+            assert waiter.wait(0) is True
+            assert waiter.value == 15
+
+    def test_reaction_latency_is_publish_latency(self, bus):
+        with bus.watch("bumper.pressed", lambda v: v is True) as waiter:
+            publisher, t = _publish_later(bus, "bumper.pressed", True, 0.05)
+            assert waiter.wait(2.0)
+            woke_at = time.monotonic()
+        t.join()
+        assert woke_at - publisher.published_at < 0.02
+
+    def test_timeout_returns_false(self, bus):
+        with bus.watch("never") as waiter:
+            t0 = time.monotonic()
+            assert waiter.wait(0.1) is False
+            assert 0.09 <= time.monotonic() - t0 < 0.5
+
+    def test_cancel_wakes_waiter(self, bus):
+        waiter = bus.watch("never")
+        threading.Timer(0.05, waiter.cancel).start()
+        t0 = time.monotonic()
+        assert waiter.wait(5.0) is False
+        assert time.monotonic() - t0 < 1.0
+        assert waiter.cancelled
+        waiter.close()
+
+    def test_max_age_offers_fresh_latest(self, bus):
+        bus.publish("lidar.min_distance_mm", 150)
+        with bus.watch("lidar.min_distance_mm", lambda v: v < 200, max_age=1.0) as waiter:
+            assert waiter.met
+        with bus.watch("lidar.min_distance_mm", lambda v: v < 200) as waiter:
+            assert not waiter.met  # edge-triggered without max_age
+
+    def test_predicate_error_is_not_a_match(self, bus):
+        with bus.watch("x", lambda v: v > 1) as waiter:
+            bus.publish("x", "not a number")
+            assert not waiter.met
+
+    def test_closed_waiter_is_not_offered(self, bus):
+        waiter = bus.watch("x")
+        waiter.close()
+        bus.publish("x", 1)
+        assert not waiter.met
+
+    def test_wait_for(self, bus):
+        _publish_later(bus, "vision.person_detected", True, 0.02)
+        met, value = bus.wait_for("vision.person_detected", bool, timeout=2.0)
+        assert met and value is True
+
+
+class TestPublishesDecorator:
+    def test_driver_reading_published(self):
+        reset_bus()
+
+        class FakeDriver:
+            @publishes("battery")
+            def read(self):
+                return {"voltage_v": 11.1, "percent": 42.0}
+
+        assert FakeDriver().read() == {"voltage_v": 11.1, "percent": 42.0}
+        assert get_bus().latest("battery.percent") == 42.0
+        reset_bus()
+
+    def test_non_dict_results_pass_through(self):
+        @publishes("x")
+        def read():
+            return None
+
+        assert read() is None
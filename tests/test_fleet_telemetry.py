@@ -5,7 +5,10 @@ Issue #200 — FleetAggregator, RobotSnapshot, real-time polling.
 
 from __future__ import annotations
 
+import hashlib
+import threading
 import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch
 
 import pytest
@@ -145,6 +148,13 @@ class TestFleetAggregatorInit:
         agg = FleetAggregator.from_config({})
         assert agg.robot_count == 0
 
+    def test_threads_is_deprecated_alias_for_concurrency(self):
+        from castor.fleet_telemetry import FleetAggregator
+
+        with pytest.warns(DeprecationWarning, match="concurrency"):
+            agg = FleetAggregator(_FLEET_CFG["fleet"]["peers"], threads=3)
+        assert agg._concurrency == 3
+
 
 # ---------------------------------------------------------------------------
 # FleetAggregator.fetch_all — mocked HTTP
@@ -266,6 +276,195 @@ class TestFleetSingleton:
         assert a1 is not a2
 
 
+# ---------------------------------------------------------------------------
+# Concurrent fetching against stub robot servers
+# ---------------------------------------------------------------------------
+
+
+class _StubRobot:
+    """Local HTTP server standing in for a robot's gateway (ETag-aware)."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.metrics = _SAMPLE_METRICS
+        self.hits = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+        robot = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with robot._lock:
+                    robot.hits += 1
+                time.sleep(robot.delay)
+                body = (robot.metrics if self.path == "/api/metrics" else '{"ok": true}').encode()
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    robot.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub_robots():
+    robots: list[_StubRobot] = []
+
+    def make(n: int = 1, delay: float = 0.0) -> list[_StubRobot]:
+        new = [_StubRobot(delay) for _ in range(n)]
+        robots.extend(new)
+        return new
+
+    yield make
+    for r in robots:
+        r.close()
+
+
+def _agg_for(stubs, **kwargs):
+    from castor.fleet_telemetry import FleetAggregator
+
+    return FleetAggregator([{"name": f"r{i}", "url": s.url} for i, s in enumerate(stubs)], **kwargs)
+
+
+class TestConcurrentFetch:
+    def test_fetches_in_parallel(self, stub_robots):
+        stubs = stub_robots(6, delay=0.2)
+        agg = _agg_for(stubs, concurrency=8)
+        try:
+            t0 = time.monotonic()
+            snaps = agg.fetch_all(force=True)
+            elapsed = time.monotonic() - t0
+        finally:
+            agg.close()
+        assert all(s.ok for s in snaps)
+        # 6 robots × 2 sequential requests × 0.2 s would be 2.4 s serially
+        assert elapsed < 1.2
+
+    def test_concurrency_limit(self, stub_robots):
+        stubs = stub_robots(6, delay=0.1)
+        agg = _agg_for(stubs, concurrency=2)
+        try:
+            t0 = time.monotonic()
+            agg.fetch_all(force=True)
+            elapsed = time.monotonic() - t0
+        finally:
+            agg.close()
+        assert sum(s.hits for s in stubs) == 12
+        # 3 waves of 2 robots × 2 requests × 0.1 s; unbounded would be ~0.2 s
+        assert elapsed >= 0.55
+
+    def test_fetch_after_close_uses_a_fresh_loop(self, stub_robots):
+        stubs = stub_robots(3, delay=0.05)
+        agg = _agg_for(stubs, concurrency=1)  # robots queue on the semaphore
+        try:
+            assert all(s.ok for s in agg.fetch_all(force=True))
+            agg.close()
+            snaps = agg.fetch_all(force=True)
+        finally:
+            agg.close()
+        assert all(s.ok for s in snaps), [s.error for s in snaps]
+
+    def test_deadline_marks_slow_robot_failed(self, stub_robots):
+        fast, slow = stub_robots(1)[0], stub_robots(1, delay=1.0)[0]
+        agg = _agg_for([fast, slow], deadline_s=0.3)
+        try:
+            t0 = time.monotonic()
+            snaps = {s.name: s for s in agg.fetch_all(force=True)}
+            assert time.monotonic() - t0 < 0.9
+        finally:
+            agg.close()
+        assert snaps["r0"].ok
+        assert not snaps["r1"].ok
+        assert "deadline" in snaps["r1"].error
+
+    def test_deadline_serves_previous_snapshot_as_stale(self, stub_robots):
+        stub = stub_robots(1)[0]
+        agg = _agg_for([stub], deadline_s=0.3)
+        try:
+            first = agg.fetch_all(force=True)[0]
+            stub.delay = 1.0
+            second = agg.fetch_all(force=True)[0]
+        finally:
+            agg.close()
+        assert first.ok and not first.stale
+        assert second.ok and second.stale
+        assert second.to_dict()["stale"] is True
+
+    def test_not_modified_reuses_cached_body(self, stub_robots):
+        stub = stub_robots(1)[0]
+        agg = _agg_for([stub])
+        try:
+            agg.fetch_all(force=True)
+            snap = agg.fetch_all(force=True)[0]
+        finally:
+            agg.close()
+        assert stub.not_modified == 2  # metrics + health
+        assert agg.not_modified == 2
+        assert snap.extract_metric("opencastor_loops_total") == pytest.approx(1234.0)
+
+    def test_changed_body_is_refetched(self, stub_robots):
+        stub = stub_robots(1)[0]
+        agg = _agg_for([stub])
+        try:
+            agg.fetch_all(force=True)
+            stub.metrics = _SAMPLE_METRICS.replace("1234.0", "5678.0")
+            snap = agg.fetch_all(force=True)[0]
+        finally:
+            agg.close()
+        assert snap.extract_metric("opencastor_loops_total") == pytest.approx(5678.0)
+
+    def test_stale_while_revalidate(self, stub_robots):
+        stub = stub_robots(1, delay=0.3)[0]
+        agg = _agg_for([stub], ttl_s=0.05, stale_s=10.0)
+        try:
+            agg.fetch_all()
+            hits = stub.hits
+            time.sleep(0.1)  # past the TTL, inside the stale window
+            t0 = time.monotonic()
+            snaps = agg.fetch_all()
+            assert time.monotonic() - t0 < 0.1  # served from cache
+            assert snaps[0].ok
+            deadline = time.monotonic() + 3.0
+            while stub.hits < hits + 2 and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            agg.close()
+        assert stub.hits == hits + 2  # one background refresh
+
+    async def test_fetch_all_async(self, stub_robots):
+        stubs = stub_robots(2)
+        agg = _agg_for(stubs)
+        try:
+            snaps = await agg.fetch_all_async(force=True)
+        finally:
+            agg.close()
+        assert sorted(s.name for s in snaps) == ["r0", "r1"]
+        assert all(s.ok for s in snaps)
+
+
 # ---------------------------------------------------------------------------
 # FLEET_DASHBOARD_HTML
 # ---------------------------------------------------------------------------
@@ -5,6 +5,8 @@ import threading
 import time
 from pathlib import Path
 
+import pytest
+
 from castor.fs import Cap, CastorFS
 from castor.fs.context import ContextWindow, Pipeline
 from castor.fs.memory import MemoryStore
@@ -110,6 +112,48 @@ class TestNamespace:
             t.join()
         assert not errors
 
+    def test_deep_path_resolves_through_index(self):
+        ns = Namespace()
+        ns.write("/dev/motor/left/speed", 0.4)
+        assert ns._index["/dev/motor/left/speed"].data == 0.4
+        assert ns._index["/dev/motor/left"].is_dir
+        assert ns.read("dev/motor/left/speed/") == 0.4
+
+    def test_unlink_removes_index_entry(self):
+        ns = Namespace()
+        ns.write("/tmp/f", "data")
+        ns.unlink("/tmp/f")
+        assert "/tmp/f" not in ns._index
+        ns.write("/tmp/f", "again")
+        assert ns.read("/tmp/f") == "again"
+
+    def test_rename_moves_subtree(self):
+        ns = Namespace()
+        ns.write("/a/b/c", 1)
+        ns.write("/a/b/d", 2)
+        assert ns.rename("/a/b", "/x/y")
+        assert not ns.exists("/a/b")
+        assert not ns.exists("/a/b/c")
+        assert ns.read("/x/y/c") == 1
+        assert ns.ls("/x/y") == ["c", "d"]
+        assert sorted(ns.walk("/x")) == ["/x/y", "/x/y/c", "/x/y/d"]
+
+    def test_rename_rejects_existing_or_nested_target(self):
+        ns = Namespace()
+        ns.write("/a/b", 1)
+        ns.write("/c", 2)
+        assert not ns.rename("/a/b", "/c")
+        assert not ns.rename("/a", "/a/inner")
+        assert not ns.rename("/missing", "/z")
+        assert ns.read("/a/b") == 1
+
+    def test_stats(self):
+        ns = Namespace()
+        ns.write("/a/b", 1)
+        stats = ns.stats()
+        assert stats["nodes"] == 3
+        assert "path_cache_hits" in stats
+
 
 # =====================================================================
 # Permission tests
@@ -148,6 +192,22 @@ class TestPermissions:
         assert pt.check_access("api", "/proc/loop/latency", "r")
         assert not pt.check_access("api", "/proc/loop/latency", "w")
 
+    def test_resolved_acl_invalidated_on_set(self):
+        pt = PermissionTable()
+        assert pt.get_acl("/dev/motor/left").check("api", "w")
+        pt.set_acl("/dev/motor/left", ACL({"api": "r--"}))
+        assert not pt.get_acl("/dev/motor/left").check("api", "w")
+
+    def test_default_deny_acl_is_read_only(self):
+        pt = PermissionTable()
+        acl = pt.get_acl("/nowhere/at/all")
+        assert not acl.check("api", "r")
+        with pytest.raises(TypeError):
+            acl.entries["api"] = 7
+        with pytest.raises(AttributeError):
+            acl.entries = {"api": 7}
+        assert not pt.check_access("api", "/elsewhere", "r")
+
     def test_capability_check(self):
         pt = PermissionTable()
         # Brain has MOTOR_WRITE, channel does not
@@ -358,14 +418,112 @@ class TestMemory:
             mem1.flush_to_disk()
 
             # Verify files exist
-            assert (Path(tmpdir) / "semantic.json").exists()
-            assert (Path(tmpdir) / "episodic.json").exists()
+            assert (Path(tmpdir) / "memory.snapshot.jsonl").exists()
 
             # Load into fresh namespace
             ns2 = Namespace()
             mem2 = MemoryStore(ns2, persist_dir=tmpdir)
             assert mem2.recall_fact("persistent") is True
 
+    def test_flush_appends_only_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mem = MemoryStore(Namespace(), persist_dir=tmpdir, compact_every=100)
+            for i in range(50):
+                mem.learn_fact(f"k{i}", i)
+            mem.flush_to_disk()  # first flush writes the snapshot
+            snapshot = Path(tmpdir) / "memory.snapshot.jsonl"
+            journal = Path(tmpdir) / "memory.journal.jsonl"
+            snap_mtime = snapshot.stat().st_mtime_ns
+
+            mem.learn_fact("door", "locked")
+            mem.forget_fact("k0")
+            mem.record_episode("saw door")
+            mem.flush_to_disk()
+            assert snapshot.stat().st_mtime_ns == snap_mtime
+            assert len(journal.read_text().splitlines()) == 3
+
+            mem2 = MemoryStore(Namespace(), persist_dir=tmpdir)
+            assert mem2.recall_fact("door") == "locked"
+            assert mem2.recall_fact("k0") is None
+            assert mem2.recall_fact("k49") == 49
+            assert mem2.get_episode_count() == 1
+
+    def test_journal_compaction(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mem = MemoryStore(Namespace(), persist_dir=tmpdir, compact_every=5)
+            mem.flush_to_disk()
+            for i in range(6):
+                mem.learn_fact(f"k{i}", i)
+            mem.flush_to_disk()
+            assert (Path(tmpdir) / "memory.journal.jsonl").read_text() == ""
+            mem2 = MemoryStore(Namespace(), persist_dir=tmpdir)
+            assert mem2.list_facts() == {f"k{i}": i for i in range(6)}
+
+    def test_compaction_syncs_snapshot_before_truncating(self, monkeypatch):
+        import os
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mem = MemoryStore(Namespace(), persist_dir=tmpdir, compact_every=5)
+            mem.flush_to_disk()
+            journal = Path(tmpdir) / "memory.journal.jsonl"
+            events = []
+            real_fsync = os.fsync
+            real_open = open
+
+            def fsync(fd):
+                events.append("fsync")
+                return real_fsync(fd)
+
+            def tracking_open(path, mode="r", *args, **kwargs):
+                if Path(path) == journal and "w" in mode:
+                    events.append("truncate")
+                return real_open(path, mode, *args, **kwargs)
+
+            monkeypatch.setattr("castor.fs.journal.os.fsync", fsync)
+            monkeypatch.setattr("builtins.open", tracking_open)
+            for i in range(6):
+                mem.learn_fact(f"k{i}", i)
+            mem.flush_to_disk()
+            monkeypatch.undo()
+            assert "truncate" in events
+            # snapshot file and its directory, both before the truncation
+            assert events[: events.index("truncate")].count("fsync") >= 2
+
+    def test_replay_skips_ops_covered_by_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mem = MemoryStore(Namespace(), persist_dir=tmpdir)
+            mem.record_episode("one")
+            mem.flush_to_disk()
+            journal = Path(tmpdir) / "memory.journal.jsonl"
+            # Simulate a crash after the snapshot was written but before
+            # the journal was truncated.
+            journal.write_text('{"seq":1,"op":"episode","v":{"observation":"one"}}\n')
+            mem2 = MemoryStore(Namespace(), persist_dir=tmpdir)
+            assert mem2.get_episode_count() == 1
+
+    def test_external_writes_are_journaled(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ns = Namespace()
+            mem = MemoryStore(ns, persist_dir=tmpdir)
+            mem.flush_to_disk()
+            ns.write("/var/memory/semantic/notes", ["a", "b"])
+            mem.flush_to_disk()
+            ns2 = Namespace()
+            MemoryStore(ns2, persist_dir=tmpdir)
+            assert ns2.read("/var/memory/semantic/notes") == ["a", "b"]
+
+    def test_loads_legacy_json(self):
+        import json
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            legacy = {"facts": {"old": {"value": 1, "source": "x", "updated": 0}}}
+            (Path(tmpdir) / "semantic.json").write_text(json.dumps(legacy))
+            mem = MemoryStore(Namespace(), persist_dir=tmpdir)
+            assert mem.recall_fact("old") == 1
+            mem.flush_to_disk()
+            mem2 = MemoryStore(Namespace(), persist_dir=tmpdir)
+            assert mem2.recall_fact("old") == 1
+
 
 # =====================================================================
 # Context & pipeline tests
@@ -407,6 +565,20 @@ class TestContext:
         assert ctx.get_summary() == ""
         assert ctx.get_turn_count() == 0
 
+    def test_persisted_window_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ctx = ContextWindow(Namespace(), max_depth=4, summary_threshold=3, persist_dir=tmpdir)
+            for i in range(5):
+                ctx.push("user", f"msg {i}")
+            ctx.flush_to_disk()
+            ctx.push("brain", "after snapshot")
+            ctx.flush_to_disk()
+
+            restored = ContextWindow(Namespace(), persist_dir=tmpdir)
+            assert restored.get_window() == ctx.get_window()
+            assert restored.get_summary() == ctx.get_summary()
+            assert restored.get_turn_count() == 6
+
     def test_build_prompt_context(self):
         ns = Namespace()
         ctx = ContextWindow(ns)
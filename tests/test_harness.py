@@ -330,3 +330,112 @@ class TestConstants:
         assert "emergency_stop" in ESTOP_TOOLS
         assert "halt" in ESTOP_TOOLS
         assert "move" not in ESTOP_TOOLS
+
+
+# ── Concurrent read-only tools ────────────────────────────────────────────────
+
+
+def _multi_tool_harness(reg, tool_calls, tool_concurrency=4):
+    provider = _make_provider()
+    provider.think_with_tools.side_effect = [
+        Thought(raw_text="", tool_calls=tool_calls),
+        Thought(raw_text="done"),
+    ]
+    return AgentHarness(
+        provider=provider,
+        config={
+            "harness": {
+                "enabled": True,
+                "max_iterations": 3,
+                "tool_concurrency": tool_concurrency,
+                "hooks": {"p66_audit": False, "retry_on_error": False},
+            }
+        },
+        tool_registry=reg,
+    )
+
+
+def _slow(value, log, delay=0.2):
+    import time
+
+    def fn():
+        log.append(("start", value))
+        time.sleep(delay)
+        log.append(("end", value))
+        return value
+
+    return fn
+
+
+class TestConcurrentReadOnlyTools:
+    @pytest.mark.asyncio
+    async def test_read_only_calls_cost_longest_latency(self):
+        import time
+
+        log: list = []
+        reg = ToolRegistry()
+        for n in ("a", "b", "c"):
+            reg.register(f"read_{n}", _slow(n, log), side_effect="read_only")
+        calls = [{"name": f"read_{n}", "args": {}} for n in ("a", "b", "c")]
+        harness = _multi_tool_harness(reg, calls)
+
+        t0 = time.perf_counter()
+        result = await harness.run(HarnessContext(instruction="status?", scope="chat"))
+        elapsed = time.perf_counter() - t0
+
+        assert elapsed < 0.5  # ~0.2 s, not 0.6 s
+        assert [r.tool_name for r in result.tools_called] == ["read_a", "read_b", "read_c"]
+        assert [r.result for r in result.tools_called] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_mutating_call_keeps_order(self):
+        log: list = []
+        reg = ToolRegistry()
+        reg.register("read_a", _slow("a", log, 0.05), side_effect="read_only")
+        reg.register("write_m", _slow("m", log, 0.05))  # default: mutate
+        reg.register("read_b", _slow("b", log, 0.05), side_effect="read_only")
+        calls = [{"name": n, "args": {}} for n in ("read_a", "write_m", "read_b")]
+        harness = _multi_tool_harness(reg, calls)
+
+        await harness.run(HarnessContext(instruction="x", scope="chat"))
+
+        assert log == [
+            ("start", "a"),
+            ("end", "a"),
+            ("start", "m"),
+            ("end", "m"),
+            ("start", "b"),
+            ("end", "b"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_tool_concurrency_one_is_serial(self):
+        log: list = []
+        reg = ToolRegistry()
+        reg.register("read_a", _slow("a", log, 0.02), side_effect="pure")
+        reg.register("read_b", _slow("b", log, 0.02), side_effect="pure")
+        calls = [{"name": n, "args": {}} for n in ("read_a", "read_b")]
+        harness = _multi_tool_harness(reg, calls, tool_concurrency=1)
+
+        await harness.run(HarnessContext(instruction="x", scope="chat"))
+
+        assert log == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_spans_recorded_in_call_order(self):
+        log: list = []
+        reg = ToolRegistry()
+        reg.register("read_a", _slow("a", log, 0.1), side_effect="read_only")
+        reg.register("read_b", _slow("b", log, 0.01), side_effect="read_only")
+        calls = [{"name": n, "args": {}} for n in ("read_a", "read_b")]
+        harness = _multi_tool_harness(reg, calls)
+        harness.span_tracer = MagicMock()
+
+        await harness.run(HarnessContext(instruction="x", scope="chat"))
+
+        names = [
+            c.kwargs["name"]
+            for c in harness.span_tracer.start_span.call_args_list
+            if c.kwargs.get("name", "").startswith("tool.")
+        ]
+        assert names == ["tool.read_a", "tool.read_b"]
@@ -5,9 +5,11 @@ from __future__ import annotations
 import os
 import stat
 import tempfile
+import threading
+import time
 from pathlib import Path
 
-from castor.hooks.runner import HookDefinition, HookEvent, HookRunner
+from castor.hooks.runner import HookDefinition, HookEvent, HookResult, HookRunner
 
 
 def _make_script(content: str) -> str:
@@ -105,3 +107,158 @@ def test_specific_tool_does_not_fire_for_others():
         assert runner.run_pre_tool("get_status", {}).allowed is True
     finally:
         Path(script).unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# 7. Shell hooks reuse one persistent worker
+# ---------------------------------------------------------------------------
+def test_shell_worker_is_reused():
+    script = _make_script("#!/usr/bin/env bash\nexit 0\n")
+    runner = HookRunner([HookDefinition(tools=["*"], script=script)], shell_workers=1)
+    try:
+        runner.run_pre_tool("robot_move", {})
+        pids = runner._shell.pids()
+        for _ in range(5):
+            assert runner.run_pre_tool("robot_move", {"n": 1}).allowed is True
+        assert runner._shell.pids() == pids and len(pids) == 1
+    finally:
+        runner.close()
+        Path(script).unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# 8. Worker passes the payload on stdin and escapes stderr
+# ---------------------------------------------------------------------------
+def test_worker_stdin_and_stderr_roundtrip():
+    script = _make_script('#!/usr/bin/env bash\nINPUT=$(cat)\necho "saw $INPUT" >&2\nexit 1\n')
+    runner = HookRunner([HookDefinition(tools=["*"], script=script)])
+    try:
+        result = runner.run_pre_tool("robot_move", {"note": 'say "hi"\nnow'})
+        assert result.allowed is False
+        assert '"tool": "robot_move"' in result.message
+        assert 'say \\"hi\\"\\nnow' in result.message
+    finally:
+        runner.close()
+        Path(script).unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# 9. A timed-out worker is replaced and later hooks still run
+# ---------------------------------------------------------------------------
+def test_worker_recovers_after_timeout():
+    slow = _make_script("#!/usr/bin/env bash\nsleep 10\nexit 1\n")
+    deny = _make_script("#!/usr/bin/env bash\nexit 1\n")
+    runner = HookRunner(
+        [
+            HookDefinition(tools=["slow"], script=slow, timeout_s=0.1),
+            HookDefinition(tools=["deny"], script=deny),
+        ],
+        shell_workers=1,
+    )
+    try:
+        assert runner.run_pre_tool("slow", {}).allowed is True
+        assert runner.run_pre_tool("deny", {}).allowed is False
+    finally:
+        runner.close()
+        Path(slow).unlink(missing_ok=True)
+        Path(deny).unlink(missing_ok=True)
+
+
+def test_shell_hook_runs_as_its_own_process():
+    # Worker variables must not leak in, and $0 / exit behave as standalone.
+    script = _make_script(
+        "#!/usr/bin/env bash\n"
+        '[ -z "${line:-}${payload:-}${errf:-}" ] || { echo leaked >&2; exit 1; }\n'
+        '[ "$0" = "$BASH_SOURCE" ] || { echo "0=$0" >&2; exit 1; }\n'
+        "exit 0\n"
+    )
+    runner = HookRunner([HookDefinition(tools=["*"], script=script)], shell_workers=1)
+    try:
+        result = runner.run_pre_tool("robot_move", {})
+        assert result.allowed is True, result.message
+        assert runner.run_pre_tool("robot_move", {}).allowed is True
+    finally:
+        runner.close()
+        Path(script).unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# 10. Python hooks: callables, module paths, results and timeouts
+# ---------------------------------------------------------------------------
+def deny_everything(payload):
+    return HookResult(allowed=False, message=f"no {payload['tool']}")
+
+
+def test_python_hook_by_module_path():
+    hook = HookDefinition(tools=["*"], python=f"{__name__}:deny_everything")
+    result = HookRunner([hook]).run_pre_tool("robot_move", {})
+    assert result.allowed is False
+    assert result.message == "no robot_move"
+
+
+def test_python_hook_return_values():
+    seen = []
+    allow = HookDefinition(tools=["*"], fn=lambda p: seen.append(p))
+    deny = HookDefinition(tools=["deny"], fn=lambda p: False)
+    runner = HookRunner([allow, deny])
+    assert runner.run_pre_tool("ok", {"x": 1}).allowed is True
+    assert seen == [{"tool": "ok", "args": {"x": 1}}]
+    assert runner.run_pre_tool("deny", {}).allowed is False
+
+
+def test_python_hook_timeout_and_error_fail_open():
+    hooks = [
+        HookDefinition(tools=["*"], fn=lambda p: time.sleep(1) or False, timeout_s=0.05),
+        HookDefinition(tools=["*"], fn=lambda p: 1 / 0),
+        HookDefinition(tools=["*"], python="castor.no_such_module:fn"),
+    ]
+    assert HookRunner(hooks).run_pre_tool("robot_move", {}).allowed is True
+
+
+def test_hung_python_hooks_do_not_starve_later_hooks():
+    release = threading.Event()
+    hang = HookDefinition(tools=["hang"], fn=lambda p: release.wait(5), timeout_s=0.05)
+    deny = HookDefinition(tools=["deny"], fn=lambda p: False)
+    runner = HookRunner([hang, deny])
+    try:
+        for _ in range(6):  # more hung calls than the pool has threads
+            assert runner.run_pre_tool("hang", {}).allowed is True
+        assert runner.run_pre_tool("deny", {}).allowed is False
+    finally:
+        release.set()
+        runner.close()
+
+
+# ---------------------------------------------------------------------------
+# 11. Post-tool hooks run concurrently
+# ---------------------------------------------------------------------------
+def test_post_hooks_run_concurrently():
+    barrier = threading.Barrier(3, timeout=2)
+    hooks = [
+        HookDefinition(tools=["*"], fn=lambda p: barrier.wait(), event=HookEvent.POST_TOOL_USE)
+        for _ in range(3)
+    ]
+    runner = HookRunner(hooks)
+    start = time.monotonic()
+    runner.run_post_tool("robot_move", {"ok": True})
+    # Sequential execution would break the barrier after its 2 s timeout
+    assert time.monotonic() - start < 1.5
+    assert not barrier.broken
+    runner.close()
+
+
+# ---------------------------------------------------------------------------
+# 12. Stock default hooks run in-process; edited scripts run as shell hooks
+# ---------------------------------------------------------------------------
+def test_default_hooks_in_process_unless_edited(tmp_path, monkeypatch):
+    from castor.hooks import default_hooks
+
+    monkeypatch.setattr(default_hooks, "_HOOKS_DIR", tmp_path)
+    safety, audit = default_hooks.get_default_hooks()
+    assert safety.fn is default_hooks.safety_check
+    assert audit.fn is default_hooks.audit_log
+
+    (tmp_path / "audit_log.sh").write_text("#!/usr/bin/env bash\nexit 0\n")
+    _, audit = default_hooks.get_default_hooks()
+    assert audit.fn is None
+    assert audit.script == str(tmp_path / "audit_log.sh")
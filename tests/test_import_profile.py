@@ -0,0 +1,88 @@
+"""Tests for castor/import_profile.py and the CLI import-time budget."""
+
+import json
+import os
+
+import pytest
+
+from castor.import_profile import (
+    LIGHTWEIGHT_COMMANDS,
+    CommandProfile,
+    parse_importtime,
+    profile_command,
+)
+
+# Cumulative import time allowed for a lightweight command.  About 4× what
+# `castor status` takes on a developer laptop; override on slow CI runners.
+IMPORT_BUDGET_MS = float(os.getenv("CASTOR_CLI_IMPORT_BUDGET_MS", "400"))
+
+_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      1500 |       1620 | encodings
+import time:      3000 |       3000 |     numpy.core
+import time:       900 |       3900 |   numpy
+some unrelated stderr line
+"""
+
+
+class TestParse:
+    def test_parse_importtime(self):
+        records = parse_importtime(_SAMPLE)
+        assert [r.module for r in records] == ["_io", "encodings", "numpy.core", "numpy"]
+        assert records[2].self_us == 3000
+        assert records[3].cumulative_us == 3900
+        assert [r.depth for r in records] == [1, 0, 2, 1]
+
+    def test_profile_summary(self):
+        prof = CommandProfile("status", 0, 10.0, parse_importtime(_SAMPLE))
+        assert prof.import_ms == pytest.approx(5.52)
+        assert prof.heavy == ["numpy"]
+        assert prof.top(1)[0].module == "numpy.core"
+        assert list(prof.by_package()) == ["numpy", "encodings", "_io"]
+        data = prof.to_dict(top=2)
+        assert json.loads(json.dumps(data))["modules"] == 4
+
+
+@pytest.fixture
+def cli_env(tmp_path):
+    env = dict(os.environ)
+    env["HOME"] = str(tmp_path)
+    for key in list(env):
+        if key.endswith("_API_KEY"):
+            env.pop(key)
+    return env
+
+
+class TestCliImportBudget:
+    @pytest.mark.parametrize("argv", LIGHTWEIGHT_COMMANDS, ids=" ".join)
+    def test_lightweight_command_within_budget(self, argv, cli_env):
+        prof = profile_command(argv, runs=2, env=cli_env)
+        assert prof.returncode == 0
+        assert prof.modules > 0
+        assert prof.heavy == [], f"castor {prof.command} imports {prof.heavy}"
+        assert prof.import_ms < IMPORT_BUDGET_MS, (
+            f"castor {prof.command} spent {prof.import_ms:.0f} ms importing; slowest: "
+            + ", ".join(f"{r.module} {r.self_us / 1000:.1f}ms" for r in prof.top(5))
+        )
+
+    def test_bench_imports_writes_json(self, tmp_path, monkeypatch, capsys):
+        import argparse
+
+        from castor.commands.bench import cmd_bench
+
+        out = tmp_path / "imports.json"
+        args = argparse.Namespace(
+            bench_cmd="imports",
+            commands=["status"],
+            runs=1,
+            top=3,
+            output=str(out),
+            output_json=False,
+        )
+        monkeypatch.setenv("HOME", str(tmp_path))
+        cmd_bench(args)
+        data = json.loads(out.read_text())
+        assert data["commands"][0]["command"] == "status"
+        assert len(data["commands"][0]["top"]) == 3
+        assert "slowest imports" in capsys.readouterr().out
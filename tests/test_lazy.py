@@ -0,0 +1,102 @@
+"""Tests for castor/lazy.py and the lazy imports built on it."""
+
+import subprocess
+import sys
+import types
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from castor.lazy import lazy_attributes, resolve
+
+
+def _fresh_modules(code: str) -> set:
+    """Run *code* in a new interpreter and return the modules it imported."""
+    out = subprocess.run(
+        [sys.executable, "-c", code + "\nimport sys; print('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(out.stdout.split())
+
+
+class TestLazyAttributes:
+    def test_resolves_and_caches(self, monkeypatch):
+        pkg = types.ModuleType("fakepkg")
+        monkeypatch.setitem(sys.modules, "fakepkg", pkg)
+        pkg.__getattr__, pkg.__dir__ = lazy_attributes("fakepkg", {"dumps": "json"})
+        assert pkg.dumps is __import__("json").dumps
+        assert "dumps" in vars(pkg)
+        assert "dumps" in pkg.__dir__()
+
+    def test_unknown_name_raises_attribute_error(self, monkeypatch):
+        pkg = types.ModuleType("fakepkg")
+        monkeypatch.setitem(sys.modules, "fakepkg", pkg)
+        getattr_, _ = lazy_attributes("fakepkg", {})
+        with pytest.raises(AttributeError):
+            getattr_("nope")
+
+
+class TestResolve:
+    def test_module_and_attribute(self):
+        import os.path
+
+        assert resolve("os.path") is os.path
+        assert resolve("os.path:join") is os.path.join
+        assert resolve("castor.lazy:resolve") is resolve
+
+    def test_dotted_attribute(self):
+        import os
+
+        assert resolve("os:path.join") is os.path.join
+
+
+class TestLazyPackages:
+    def test_providers_package_imports_no_provider(self):
+        mods = _fresh_modules("import castor.providers")
+        assert not any(m.startswith("castor.providers.") for m in mods)
+        assert "numpy" not in mods
+
+    def test_rcan_package_imports_no_transport(self):
+        mods = _fresh_modules("import castor.rcan")
+        assert "castor.rcan.http_transport" not in mods
+        assert "castor.fs" not in mods
+
+    def test_castor_version_is_lazy(self):
+        mods = _fresh_modules("import castor")
+        assert "importlib.metadata" not in mods
+        import castor
+
+        assert isinstance(castor.__version__, str)
+
+    def test_provider_patch_still_applies(self):
+        from castor.providers import _builtin_get_provider
+
+        with patch("castor.providers.OllamaProvider") as mock_cls:
+            _builtin_get_provider({"provider": "ollama"})
+        mock_cls.assert_called_once_with({"provider": "ollama"})
+
+    def test_rcan_names_resolve(self):
+        from castor.rcan import RURI, MessageType
+        from castor.rcan.message import MessageType as _MT
+        from castor.rcan.ruri import RURI as _RURI
+
+        assert RURI is _RURI
+        assert MessageType is _MT
+
+
+class TestDottedPathDispatch:
+    def test_handler_imported_only_when_invoked(self):
+        from castor.cli import main
+
+        mock_registry = MagicMock()
+        mock_registry.commands = {}
+        plugins = MagicMock()
+        plugins.load_plugins.return_value = mock_registry
+        with patch("sys.argv", ["castor", "season", "--list"]):
+            with patch.dict("sys.modules", {"castor.plugins": plugins}):
+                with patch("castor.commands.season.cmd_season") as handler:
+                    main()
+        handler.assert_called_once()
+        assert handler.call_args[0][0].command == "season"
@@ -0,0 +1,152 @@
+"""Tests for castor/loop_bench.py and its building blocks (mock provider,
+synthetic camera, simulation driver)."""
+
+import argparse
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from castor.loop_bench import compare, run_loop_bench
+
+
+class TestMockProvider:
+    def test_cycles_actions(self):
+        from castor.providers.mock_provider import MockProvider
+
+        p = MockProvider({"actions": [{"type": "stop"}, {"type": "move", "linear": 0.1}]})
+        kinds = [p.think(b"", "go").action["type"] for _ in range(3)]
+        assert kinds == ["stop", "move", "stop"]
+        assert p.calls == 3
+
+    def test_seeded_jitter_is_reproducible(self):
+        from castor.providers.mock_provider import MockProvider
+
+        cfg = {"latency_ms": 10, "jitter_ms": 5, "seed": 7}
+        first, second = MockProvider(cfg), MockProvider(cfg)
+        a = [first._delay_ms() for _ in range(5)]
+        b = [second._delay_ms() for _ in range(5)]
+        assert a == b
+        assert all(5 <= d <= 15 for d in a)
+
+    def test_registered(self):
+        from castor.providers import get_provider
+
+        assert type(get_provider({"provider": "mock"})).__name__ == "MockProvider"
+
+
+class TestSyntheticCamera:
+    def test_frames_are_jpeg_and_vary(self):
+        pytest.importorskip("cv2")
+        from castor.main import SyntheticFrames
+
+        frames = SyntheticFrames((64, 48), count=4)
+        jpegs = [frames.next()[0] for _ in range(4)]
+        assert all(j[:2] == b"\xff\xd8" for j in jpegs)
+        assert len(set(jpegs)) > 1
+        assert frames.next()[0] == jpegs[0]
+
+
+class TestSimulationDriver:
+    def test_move_accepts_linear_angular(self):
+        from castor.drivers.simulation_driver import SimulationDriver
+
+        drv = SimulationDriver({"backend": "mock"})
+        drv.move(0.3, -0.2)
+        drv.move(direction="forward", speed=0.5)
+        drv.stop()
+
+    def test_velocity_move_routes_through_safety_layer(self):
+        from castor.drivers.simulation_driver import SimulationDriver
+
+        drv = SimulationDriver({"backend": "mock"})
+        layer = MagicMock()
+        layer.write.return_value = True
+        drv.set_safety_layer(layer)
+        drv.move(0.3, -0.2)
+        layer.write.assert_called_once_with(
+            "/dev/motor/cmd", {"linear": 0.3, "angular": -0.2}, principal="driver"
+        )
+        assert (drv._last_command["linear"], drv._last_command["angular"]) == (0.3, -0.2)
+        layer.write.return_value = False  # blocked commands never reach the motors
+        drv.move(0.9, 0.0)
+        assert drv._last_command["linear"] == 0.3
+
+
+class TestCompare:
+    BASE = {
+        "tick_rate_hz": 100.0,
+        "stages": {"tick": {"p50": 10.0, "p99": 20.0}, "act": {"p50": 0.01, "p99": 0.02}},
+        "memory": {"rss_growth_kb_per_1k_ticks": 10.0},
+    }
+
+    def test_no_regression_against_self(self):
+        assert compare(self.BASE, self.BASE) == []
+
+    def test_detects_slower_stage_and_rate(self):
+        cur = json.loads(json.dumps(self.BASE))
+        cur["stages"]["tick"]["p99"] = 25.0
+        cur["tick_rate_hz"] = 80.0
+        out = compare(cur, self.BASE)
+        assert any(line.startswith("tick p99") for line in out)
+        assert any(line.startswith("tick rate") for line in out)
+
+    def test_ignores_changes_below_noise_floor(self):
+        cur = json.loads(json.dumps(self.BASE))
+        cur["stages"]["act"]["p50"] = 0.03  # +200%, but only 0.02 ms
+        cur["memory"]["rss_growth_kb_per_1k_ticks"] = 40.0
+        assert compare(cur, self.BASE) == []
+
+    def test_zero_baseline_reports_absolute_delta(self):
+        base = {"stages": {"act": {"p50": 0.0, "p99": 0.0}}}
+        cur = {"stages": {"act": {"p50": 0.0, "p99": 0.5}}}
+        assert compare(cur, base) == ["act p99: 0.000 ms → 0.500 ms (+0.500 ms)"]
+        assert compare(base, base) == []
+
+
+@pytest.fixture
+def bench_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    for key in ("ANTHROPIC_API_KEY", "OPENAI_API_KEY", "GOOGLE_API_KEY"):
+        monkeypatch.delenv(key, raising=False)
+    return tmp_path
+
+
+class TestRunLoopBench:
+    def test_small_run(self, bench_home):
+        result = run_loop_bench(ticks=30, warmup=5, sample_every=10)
+        assert result["schema"] == "opencastor.bench.loop/1"
+        assert result["ticks"] == 30
+        assert result["tick_rate_hz"] > 0
+        for stage in ("tick", "observe", "orient", "act"):
+            st = result["stages"][stage]
+            assert st["p50"] <= st["p99"] <= st["max"]
+        assert "rss_growth_kb_per_1k_ticks" in result["memory"]
+        assert json.loads(json.dumps(result))["env"]["python"]
+
+    def test_cli_compare_exits_on_regression(self, bench_home, tmp_path, capsys):
+        from castor.commands.bench import cmd_bench
+
+        baseline = {"tick_rate_hz": 1e9, "stages": {}, "memory": {}}
+        path = tmp_path / "base.json"
+        path.write_text(json.dumps(baseline))
+        out = tmp_path / "loop.json"
+        args = argparse.Namespace(
+            bench_cmd="loop",
+            ticks=10,
+            warmup=2,
+            latency_ms=0.0,
+            jitter_ms=0.0,
+            seed=0,
+            resolution="64x48",
+            tracemalloc=False,
+            compare=str(path),
+            threshold=0.10,
+            output=str(out),
+            output_json=False,
+        )
+        with pytest.raises(SystemExit) as exc:
+            cmd_bench(args)
+        assert exc.value.code == 1
+        assert json.loads(out.read_text())["regressions"]
+        assert "Regressions" in capsys.readouterr().out
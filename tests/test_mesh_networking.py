@@ -5,8 +5,12 @@ Issue #220 — MeshNode, PeerConfig, route_to_peer, relay.
 
 from __future__ import annotations
 
+import threading
+import time
 from unittest.mock import patch
 
+import castor.mesh as mesh_mod
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -171,6 +175,37 @@ class TestListPeers:
         assert bob_status.ok is False
         assert "refused" in bob_status.error
 
+    def test_peers_pinged_concurrently_in_config_order(self):
+        peers = [{"name": f"p{i}", "host": f"h{i}", "port": 8000} for i in range(6)]
+        mesh = _make_mesh({"mesh": {"enabled": True, "peers": peers}})
+
+        def slow_get(url, **kwargs):
+            time.sleep(0.2)
+            return {"status": "ok"}
+
+        with patch("castor.mesh._http_get", side_effect=slow_get):
+            t0 = time.monotonic()
+            statuses = mesh.list_peers()
+            elapsed = time.monotonic() - t0
+        assert [s.name for s in statuses] == [f"p{i}" for i in range(6)]
+        assert elapsed < 0.8  # serial pings would take 1.2 s
+
+    def test_ping_pool_is_shared_across_calls(self):
+        peers = [{"name": f"p{i}", "host": f"h{i}", "port": 8000} for i in range(6)]
+        mesh = _make_mesh({"mesh": {"enabled": True, "peers": peers}})
+        threads = set()
+
+        def record_get(url, **kwargs):
+            threads.add(threading.current_thread())
+            return {"status": "ok"}
+
+        with patch("castor.mesh._http_get", side_effect=record_get):
+            for _ in range(3):
+                mesh.list_peers()
+        # A pool per call would have started up to 18 threads
+        assert len(threads) <= mesh_mod._PING_CONCURRENCY
+        assert all(t.name.startswith("mesh-ping") for t in threads)
+
 
 # ---------------------------------------------------------------------------
 # MeshNode.route_to_peer — mocked HTTP
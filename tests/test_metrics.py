@@ -1,6 +1,20 @@
 """Tests for castor/metrics.py — Prometheus metrics registry (issue #99)."""
 
-from castor.metrics import Counter, Gauge, Histogram, MetricsRegistry, get_registry
+import random
+import threading
+
+import pytest
+
+from castor.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    ProviderLatencyTracker,
+    _Digest,
+    benchmark_observe,
+    get_registry,
+)
 
 # ── Counter ───────────────────────────────────────────────────────────────────
 
@@ -62,6 +76,80 @@ def test_histogram_buckets():
     assert 'le="100"' in r
 
 
+def test_histogram_buckets_are_cumulative_not_double_counted():
+    h = Histogram("lat", "latency", buckets=(100, 200, 500))
+    for v in (50, 150, 150, 400, 900):
+        h.observe(v)
+    r = h.render()
+    assert 'lat_bucket{le="100"} 1' in r
+    assert 'lat_bucket{le="200"} 3' in r
+    assert 'lat_bucket{le="500"} 4' in r
+    assert 'lat_bucket{le="+Inf"} 5' in r
+    assert "lat_count 5" in r
+
+
+def test_histogram_merges_thread_shards():
+    h = Histogram("lat", "latency", buckets=(10,))
+    threads = [
+        threading.Thread(target=lambda: [h.observe(5) for _ in range(1000)]) for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    h.observe(50)
+    buckets, total_sum, total = h.snapshot()
+    assert buckets == [(10, 4000)]
+    assert total == 4001
+    assert total_sum == pytest.approx(20050)
+    # Exited threads are folded in and keep their counts
+    assert h.snapshot()[2] == 4001
+
+
+def test_provider_tracker_buckets_cumulative():
+    t = ProviderLatencyTracker(buckets=(100, 1000))
+    for v in (50, 500, 5000):
+        t.observe("p", v)
+    r = t.render()
+    assert 'provider="p",le="100"} 1' in r
+    assert 'provider="p",le="1000"} 2' in r
+    assert 'provider="p",le="+Inf"} 3' in r
+
+
+def test_digest_quantile_accuracy():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(5, 0.6) for _ in range(20000)]
+    digest = _Digest()
+    for v in values:
+        digest.add(v)
+    ordered = sorted(values)
+    for q in (0.5, 0.9, 0.99):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert digest.quantile(q) == pytest.approx(exact, rel=0.02)
+    assert digest.centroids() < 300
+
+
+def test_provider_percentiles_age_out(monkeypatch):
+    import castor.metrics as metrics_mod
+
+    clock = [1000.0]
+    monkeypatch.setattr(metrics_mod.time, "monotonic", lambda: clock[0])
+    t = ProviderLatencyTracker()
+    t.observe("p", 5000.0)
+    clock[0] += t._WINDOW_S + 1
+    t.observe("p", 100.0)
+    assert t.percentile("p", 99.0) == pytest.approx(100.0)
+    # Bucket totals are cumulative for the process lifetime
+    assert t.totals("p") == (5100.0, 2)
+
+
+def test_observe_microbenchmark():
+    result = benchmark_observe(iterations=20_000)
+    # Generous ceilings so slow CI hosts pass; typical values are ~0.5 µs / ~2 µs
+    assert result["histogram_ns"] < 20_000
+    assert result["provider_latency_ns"] < 50_000
+
+
 # ── MetricsRegistry ───────────────────────────────────────────────────────────
 
 
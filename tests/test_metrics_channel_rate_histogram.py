@@ -100,12 +100,11 @@ def test_channel_interarrival_percentile_unknown_channel_returns_none():
 
 def test_channel_interarrival_samples_bounded():
     tracker = ChannelInterArrivalTracker()
-    # Record many messages to test _MAX_SAMPLES cap
+    # Record many messages; sketch storage must stay bounded
     for _ in range(1100):
         tracker.record("stress")
-    with tracker._lock:
-        samples = tracker._data.get("stress", {}).get("samples", [])
-    assert len(samples) <= tracker._MAX_SAMPLES
+    assert tracker._data["stress"].quantiles.centroids() <= 250
+    assert tracker.totals("stress")[1] == 1099
 
 
 # ── p50 <= p95 <= p99 ordering ────────────────────────────────────────────────
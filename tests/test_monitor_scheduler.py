@@ -0,0 +1,300 @@
+"""Tests for castor/monitor_scheduler.py and the monitors that use it."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from castor.monitor_scheduler import (
+    MonitorScheduler,
+    get_scheduler,
+    reset_scheduler,
+    scheduler_from_config,
+)
+
+
+@pytest.fixture
+def sched():
+    s = MonitorScheduler(workers=1)
+    yield s
+    s.shutdown()
+
+
+def _wait_until(pred, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if pred():
+            return True
+        time.sleep(0.005)
+    return pred()
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+
+class TestMonitorScheduler:
+    def test_periodic_job_runs_repeatedly(self, sched):
+        hits = []
+        job = sched.every("tick", lambda: hits.append(1), 0.02, first_delay_s=0)
+        assert _wait_until(lambda: len(hits) >= 5)
+        assert job.runs >= 5
+        stats = sched.stats()["jobs"]["tick"]
+        assert stats["runs"] >= 5
+        assert stats["errors"] == 0
+
+    def test_deadline_job_runs_once(self, sched):
+        hits = []
+        sched.after("once", lambda: hits.append(1), 0.02)
+        assert _wait_until(lambda: hits)
+        time.sleep(0.1)
+        assert hits == [1]
+
+    def test_reschedule_rearms_deadline_job_and_keeps_stats(self, sched):
+        hits = []
+        job = sched.after("dl", lambda: hits.append(1), 0.01, critical=True)
+        assert _wait_until(lambda: len(hits) == 1)
+        assert sched.reschedule(job, time.monotonic() + 0.01)
+        assert _wait_until(lambda: len(hits) == 2)
+        assert job.runs == 2
+
+    def test_cancel_stops_job(self, sched):
+        hits = []
+        job = sched.every("c", lambda: hits.append(1), 0.01, first_delay_s=0)
+        assert _wait_until(lambda: hits)
+        assert sched.cancel(job)
+        time.sleep(0.03)
+        n = len(hits)
+        time.sleep(0.1)
+        assert len(hits) == n
+        assert "c" not in sched.jobs()
+        assert not sched.reschedule(job, time.monotonic())
+
+    def test_same_name_replaces_job(self, sched):
+        first, second = [], []
+        sched.every("dup", lambda: first.append(1), 0.01, first_delay_s=0)
+        sched.every("dup", lambda: second.append(1), 0.01, first_delay_s=0)
+        assert _wait_until(lambda: len(second) >= 3)
+        assert len(first) <= 1
+
+    def test_errors_are_counted_and_job_keeps_running(self, sched):
+        def boom():
+            raise RuntimeError("nope")
+
+        job = sched.every("boom", boom, 0.01, first_delay_s=0, critical=True)
+        assert _wait_until(lambda: job.errors >= 3)
+        sched.cancel(job)
+        # Stats are updated before running is cleared
+        assert _wait_until(lambda: not job.running)
+        assert job.runs == job.errors
+
+    def test_critical_job_runs_on_critical_worker(self, sched):
+        names = []
+        sched.after("c", lambda: names.append(threading.current_thread().name), 0, critical=True)
+        sched.after("n", lambda: names.append(threading.current_thread().name), 0)
+        assert _wait_until(lambda: len(names) == 2)
+        assert any("critical" in n for n in names)
+        assert any("worker" in n for n in names)
+        assert "castor-monitor-timer" not in names
+
+    def test_slow_critical_job_does_not_delay_other_critical_jobs(self, sched):
+        release = threading.Event()
+        sched.every("i2c", lambda: release.wait(2.0), 0.01, first_delay_s=0, critical=True)
+        fired = []
+        start = time.monotonic()
+        sched.after("watchdog", lambda: fired.append(time.monotonic() - start), 0.05, critical=True)
+        try:
+            assert _wait_until(lambda: fired, timeout=1.0)
+            assert fired[0] < 0.5
+        finally:
+            release.set()
+
+    def test_critical_job_not_delayed_by_slow_worker_job(self, sched):
+        release = threading.Event()
+        sched.after("slow", lambda: release.wait(2.0), 0)
+        fired = []
+        start = time.monotonic()
+        sched.after("safety", lambda: fired.append(time.monotonic() - start), 0.05, critical=True)
+        try:
+            assert _wait_until(lambda: fired, timeout=1.0)
+            assert fired[0] < 0.5
+        finally:
+            release.set()
+
+    def test_overrun_is_detected(self, sched):
+        job = sched.every("slow", lambda: time.sleep(0.05), 0.01, first_delay_s=0)
+        assert _wait_until(lambda: job.overruns >= 2)
+        assert sched.stats()["jobs"]["slow"]["overruns"] >= 2
+
+    def test_fixed_rate_does_not_drift(self, sched):
+        times = []
+        sched.every("rate", lambda: times.append(time.monotonic()), 0.02, critical=True)
+        assert _wait_until(lambda: len(times) >= 11)
+        # 10 periods; fixed-rate scheduling keeps the total near 10 × interval
+        assert times[10] - times[0] == pytest.approx(0.2, abs=0.05)
+
+    def test_overlapping_windows_share_wakeups(self, sched):
+        counts = [0, 0, 0]
+
+        def make(i):
+            def fn():
+                counts[i] += 1
+
+            return fn
+
+        for i, delay in enumerate((0.100, 0.103, 0.106)):
+            sched.every(f"j{i}", make(i), 0.1, slack_s=0.02, first_delay_s=delay)
+        assert _wait_until(lambda: min(counts) >= 5, timeout=3.0)
+        before = sched.wakeups
+        runs = sum(counts)
+        time.sleep(0.5)
+        # three jobs per slot, but the timer wakes about once per slot
+        assert sched.wakeups - before < (sum(counts) - runs)
+
+    def test_lateness_bounded_by_slack(self, sched):
+        job = sched.every("late", lambda: None, 0.02, slack_s=0.01, first_delay_s=0)
+        assert _wait_until(lambda: job.runs >= 10)
+        assert sched.stats()["jobs"]["late"]["max_late_ms"] < 60
+
+    def test_shutdown_rejects_new_jobs(self):
+        s = MonitorScheduler()
+        s.every("x", lambda: None, 1.0)
+        assert s.running
+        s.shutdown()
+        assert not s.running
+        with pytest.raises(RuntimeError):
+            s.every("y", lambda: None, 1.0)
+
+    def test_invalid_interval(self, sched):
+        with pytest.raises(ValueError):
+            sched.every("bad", lambda: None, 0)
+
+
+class TestSingleton:
+    def teardown_method(self):
+        reset_scheduler()
+
+    def test_get_scheduler_is_shared(self):
+        assert get_scheduler() is get_scheduler()
+
+    def test_scheduler_from_config(self):
+        assert scheduler_from_config({}) is None
+        assert scheduler_from_config({"monitor_scheduler": {"enabled": False}}) is None
+        s = scheduler_from_config({"monitor_scheduler": {"enabled": True, "workers": 1}})
+        assert s is get_scheduler()
+
+
+# ---------------------------------------------------------------------------
+# Monitors on the shared scheduler
+# ---------------------------------------------------------------------------
+
+
+class TestMonitorsOnScheduler:
+    def test_watchdog_deadline_triggers_without_thread(self, sched):
+        from castor.watchdog import BrainWatchdog
+
+        fired = threading.Event()
+        wd = BrainWatchdog({"watchdog": {"timeout_s": 0.1}}, stop_fn=fired.set)
+        start = time.monotonic()
+        wd.start(scheduler=sched)
+        name = wd._job.name
+        try:
+            assert wd._thread is None
+            assert fired.wait(2.0)
+            assert time.monotonic() - start == pytest.approx(0.1, abs=0.08)
+            assert wd.is_triggered
+        finally:
+            wd.stop()
+        assert name not in sched.jobs()
+
+    def test_watchdog_heartbeats_rearm_deadline(self, sched):
+        from castor.watchdog import BrainWatchdog
+
+        stop_fn = MagicMock()
+        wd = BrainWatchdog({"watchdog": {"timeout_s": 0.15}}, stop_fn=stop_fn)
+        wd.start(scheduler=sched)
+        try:
+            for _ in range(8):
+                wd.heartbeat()
+                time.sleep(0.05)
+            stop_fn.assert_not_called()
+            # Deadline job wakes about once per timeout, not once per heartbeat
+            assert wd._job.runs <= 4
+        finally:
+            wd.stop()
+
+    def test_watchdog_retriggers_after_recovery(self, sched):
+        from castor.watchdog import BrainWatchdog
+
+        stop_fn = MagicMock()
+        wd = BrainWatchdog({"watchdog": {"timeout_s": 0.05}}, stop_fn=stop_fn)
+        wd.start(scheduler=sched)
+        try:
+            assert _wait_until(lambda: stop_fn.call_count == 1)
+            wd.heartbeat()
+            assert _wait_until(lambda: stop_fn.call_count == 2)
+        finally:
+            wd.stop()
+
+    def test_sensor_monitor_runs_as_critical_job(self, sched):
+        from castor.safety.monitor import SensorMonitor
+
+        m = SensorMonitor(interval=0.02)
+        m._read_cpu_temp = lambda: 40.0
+        m.start(scheduler=sched)
+        try:
+            assert m.running
+            assert m._thread is None
+            assert _wait_until(lambda: m.last_snapshot is not None)
+            assert sched.stats()["jobs"][m._job.name]["critical"] is True
+        finally:
+            m.stop()
+        assert not m.running
+
+    def test_battery_monitor_check_on_scheduler(self, sched):
+        from castor.battery import BatteryMonitor
+
+        on_critical = MagicMock()
+        mon = BatteryMonitor({}, on_critical=on_critical)
+        mon.enabled = True
+        mon.read_voltage = lambda: 5.0
+        mon.start(interval=0.02, scheduler=sched)
+        try:
+            assert _wait_until(lambda: on_critical.call_count >= 2)
+            assert mon._thread is None
+        finally:
+            mon.stop()
+
+    def test_snapshot_manager_on_scheduler(self, sched):
+        from castor.snapshot import SnapshotManager
+
+        mgr = SnapshotManager()
+        mgr.take = MagicMock()
+        mgr.start(interval_s=0.02, scheduler=sched)
+        name = mgr._job.name
+        try:
+            assert _wait_until(lambda: mgr.take.call_count >= 2)
+            assert mgr._thread is None
+            assert sched.stats()["jobs"][name]["critical"] is False
+        finally:
+            mgr.stop()
+        assert name not in sched.jobs()
+
+    def test_second_monitor_instance_does_not_replace_the_first(self, sched):
+        from castor.battery import BatteryMonitor
+
+        callbacks = [MagicMock(), MagicMock()]
+        monitors = [BatteryMonitor({}, on_critical=cb) for cb in callbacks]
+        for mon in monitors:
+            mon.enabled = True
+            mon.read_voltage = lambda: 5.0
+            mon.start(interval=0.02, scheduler=sched)
+        try:
+            assert monitors[0]._job.name != monitors[1]._job.name
+            assert _wait_until(lambda: all(cb.call_count >= 2 for cb in callbacks))
+            assert not monitors[0]._job.cancelled
+        finally:
+            for mon in monitors:
+                mon.stop()
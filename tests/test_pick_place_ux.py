@@ -158,19 +158,19 @@ class TestDispatchPickPlace:
     def test_routes_pick_intent_to_pick_place_endpoint(self):
         bridge = _make_bridge(task_execution="automatic")
 
-        with patch("httpx.Client") as mock_client_cls:
+        with patch.object(bridge, "_http_client") as mock_client_cls:
             mock_resp = MagicMock()
             mock_resp.json.return_value = {"status": "complete", "log": []}
             mock_resp.headers = {"content-type": "application/json"}
             mock_resp.raise_for_status = MagicMock()
-            mock_client_cls.return_value.__enter__.return_value.post.return_value = mock_resp
+            mock_client_cls.return_value.post.return_value = mock_resp
 
             doc = {"scope": "chat", "instruction": "pick lego into bowl",
                    "issued_at": time.time(), "sender_type": "human"}
             result = bridge._dispatch_to_gateway("chat", "pick lego into bowl", doc)
 
         # Should have called /api/arm/pick_place, not /api/command
-        call_args = mock_client_cls.return_value.__enter__.return_value.post.call_args
+        call_args = mock_client_cls.return_value.post.call_args
         assert "/api/arm/pick_place" in call_args[0][0]
         body = call_args[1]["json"]
         assert body["target"] == "lego"
@@ -179,18 +179,18 @@ class TestDispatchPickPlace:
     def test_non_pick_intent_routes_to_api_command(self):
         bridge = _make_bridge(task_execution="automatic")
 
-        with patch("httpx.Client") as mock_client_cls:
+        with patch.object(bridge, "_http_client") as mock_client_cls:
             mock_resp = MagicMock()
             mock_resp.json.return_value = {"raw_text": "hello"}
             mock_resp.headers = {"content-type": "application/json"}
             mock_resp.raise_for_status = MagicMock()
-            mock_client_cls.return_value.__enter__.return_value.post.return_value = mock_resp
+            mock_client_cls.return_value.post.return_value = mock_resp
 
             doc = {"scope": "chat", "instruction": "what do you see",
                    "issued_at": time.time(), "sender_type": "human"}
             bridge._dispatch_to_gateway("chat", "what do you see", doc)
 
-        call_args = mock_client_cls.return_value.__enter__.return_value.post.call_args
+        call_args = mock_client_cls.return_value.post.call_args
         assert "/api/command" in call_args[0][0]
 
     def test_ask_mode_cancels_on_timeout(self):
@@ -220,12 +220,12 @@ class TestDispatchPickPlaceFirestoreRead:
         robot_doc.to_dict.return_value = {"task_execution": "automatic"}
         bridge._robot_ref().get.return_value = robot_doc
 
-        with patch("httpx.Client") as mock_client_cls:
+        with patch.object(bridge, "_http_client") as mock_client_cls:
             mock_resp = MagicMock()
             mock_resp.json.return_value = {"status": "complete", "log": []}
             mock_resp.headers = {"content-type": "application/json"}
             mock_resp.raise_for_status = MagicMock()
-            mock_client_cls.return_value.__enter__.return_value.post.return_value = mock_resp
+            mock_client_cls.return_value.post.return_value = mock_resp
 
             # With automatic mode (from Firestore), should NOT call _wait_for_confirmation
             with patch.object(bridge, "_wait_for_confirmation") as mock_wait:
@@ -0,0 +1,128 @@
+"""Tests for castor/profiler.py — stage timers and stack sampling."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from castor import profiler
+
+
+@pytest.fixture(autouse=True)
+def _disarmed():
+    profiler.configure({})
+    profiler.reset()
+    profiler.begin_tick()
+    yield
+    profiler.configure({})
+    profiler.reset()
+    profiler.begin_tick()
+
+
+class TestStageTimers:
+    def test_disabled_is_noop(self):
+        assert profiler.begin_tick() is False
+        with profiler.stage("observe"):
+            pass
+        profiler.lap("orient")
+        assert profiler.stage_stats() == {}
+
+    def test_armed_full_rate_records_laps_and_stages(self):
+        profiler.configure({"profiling": {"enabled": True, "sample_rate": 1.0, "stack_hz": 0}})
+        assert profiler.begin_tick() is True
+        time.sleep(0.002)
+        profiler.lap("observe")
+        with profiler.stage("safety"):
+            time.sleep(0.001)
+        stats = profiler.stage_stats()
+        assert stats["observe"]["count"] == 1
+        assert stats["observe"]["max_ms"] >= 1.5
+        assert stats["safety"]["mean_ms"] >= 0.5
+
+    def test_sample_rate_zero_times_nothing(self):
+        profiler.configure({"profiling": {"enabled": True, "sample_rate": 0.0, "stack_hz": 0}})
+        for _ in range(100):
+            assert profiler.begin_tick() is False
+
+    def test_trace_ticks_keeps_each_tick(self):
+        seen = []
+        trace = profiler.trace_ticks(on_tick=seen.append)
+        try:
+            with pytest.raises(RuntimeError):
+                profiler.trace_ticks()
+            for _ in range(3):
+                assert profiler.begin_tick() is True
+                profiler.lap("observe")
+                profiler.lap("act")
+        finally:
+            profiler.stop_trace_ticks()
+        assert seen == [0, 1, 2]
+        assert len(trace) == 3
+        assert set(trace[0]) == {"t0", "observe", "act"}
+        assert trace[1]["t0"] >= trace[0]["t0"]
+        assert profiler.begin_tick() is False
+
+    def test_disabled_overhead_is_tiny(self):
+        n = 50_000
+        start = time.perf_counter()
+        for _ in range(n):
+            profiler.begin_tick()
+            profiler.lap("observe")
+            with profiler.stage("act"):
+                pass
+        per_tick_us = (time.perf_counter() - start) / n * 1e6
+        assert per_tick_us < 20
+
+
+class TestStackSampler:
+    def test_folds_stacks_of_other_threads(self):
+        stop = threading.Event()
+
+        def busy_worker():
+            while not stop.is_set():
+                sum(range(100))
+
+        t = threading.Thread(target=busy_worker, name="busy")
+        t.start()
+        try:
+            sampler = profiler.StackSampler(thread_ids={t.ident})
+            for _ in range(5):
+                sampler.sample_once()
+        finally:
+            stop.set()
+            t.join()
+        folded = sampler.folded()
+        assert sampler.samples == 5
+        assert sum(folded.values()) == 5
+        stack = next(iter(folded))
+        assert stack.startswith("busy;")
+        assert "busy_worker (test_profiler.py)" in stack
+        first_line = sampler.folded_text().splitlines()[0]
+        assert first_line.rsplit(" ", 1)[1].isdigit()
+
+    def test_max_stacks_truncates(self):
+        sampler = profiler.StackSampler(max_stacks=0)
+        sampler.sample_once()
+        assert set(sampler.folded()) <= {"[truncated]"}
+
+
+class TestCapture:
+    def test_capture_times_every_tick_while_running(self):
+        def loop():
+            deadline = time.time() + 0.3
+            while time.time() < deadline:
+                profiler.begin_tick()
+                time.sleep(0.005)
+                profiler.lap("observe")
+
+        t = threading.Thread(target=loop, name="control-loop")
+        t.start()
+        result = profiler.capture(seconds=0.2, hz=200)
+        t.join()
+        assert result["samples"] > 5
+        assert result["stages"]["observe"]["count"] > 5
+        assert any("control-loop" in s for s in result["stacks"])
+        # Forced timing ends with the capture
+        assert profiler.begin_tick() is False
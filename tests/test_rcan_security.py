@@ -468,7 +468,7 @@ class TestSystemDispatch:
         mock_http.__exit__ = MagicMock(return_value=False)
         mock_http.post.return_value = mock_resp
 
-        with patch("httpx.Client", return_value=mock_http):
+        with patch.object(bridge, "_http_client", return_value=mock_http):
             bridge._dispatch_to_gateway("system", "SELF_DESTRUCT", doc)
 
         # Unknown instructions are forwarded to /api/command (not dropped)
@@ -489,7 +489,7 @@ class TestSystemDispatch:
         mock_http.__exit__ = MagicMock(return_value=False)
         mock_http.post.return_value = mock_resp
 
-        with patch("httpx.Client", return_value=mock_http):
+        with patch.object(bridge, "_http_client", return_value=mock_http):
             bridge._dispatch_to_gateway("system", "UPGRADE", doc)
 
         mock_http.post.assert_called_once()
@@ -508,7 +508,7 @@ class TestSystemDispatch:
         mock_http.__exit__ = MagicMock(return_value=False)
         mock_http.post.return_value = mock_resp
 
-        with patch("httpx.Client", return_value=mock_http):
+        with patch.object(bridge, "_http_client", return_value=mock_http):
             bridge._dispatch_to_gateway("system", "UPGRADE: 2026.3.17.1", doc)
 
         mock_http.post.assert_called_once()
@@ -527,7 +527,7 @@ class TestSystemDispatch:
         mock_http.__exit__ = MagicMock(return_value=False)
         mock_http.post.return_value = mock_resp
 
-        with patch("httpx.Client", return_value=mock_http):
+        with patch.object(bridge, "_http_client", return_value=mock_http):
             bridge._dispatch_to_gateway("system", "REBOOT", doc)
 
         mock_http.post.assert_called_once()
@@ -546,7 +546,7 @@ class TestSystemDispatch:
         mock_http.__exit__ = MagicMock(return_value=False)
         mock_http.post.return_value = mock_resp
 
-        with patch("httpx.Client", return_value=mock_http):
+        with patch.object(bridge, "_http_client", return_value=mock_http):
             bridge._dispatch_to_gateway("system", "RELOAD_CONFIG", doc)
 
         mock_http.post.assert_called_once()
@@ -571,7 +571,7 @@ class TestSystemDispatch:
             mock_http.__enter__ = MagicMock(return_value=mock_http)
             mock_http.__exit__ = MagicMock(return_value=False)
             mock_http.post.return_value = mock_resp
-            with patch("httpx.Client", return_value=mock_http):
+            with patch.object(bridge, "_http_client", return_value=mock_http):
                 bridge._dispatch_to_gateway("system", instr, doc)
             # Unknown instructions are forwarded to /api/command, not dropped
             mock_http.post.assert_called_once()
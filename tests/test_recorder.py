@@ -0,0 +1,181 @@
+"""Tests for castor/recorder.py — pass-through MJPEG segments."""
+
+import struct
+import time
+
+import pytest
+
+from castor import recorder as recorder_mod
+from castor.recorder import VideoRecorder, jpeg_size, read_segment_index
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+
+def _jpeg(i: int, size=(64, 48)) -> bytes:
+    img = np.zeros((size[1], size[0], 3), np.uint8)
+    img[:, (i * 4) % size[0] :] = (i * 40) % 255
+    return cv2.imencode(".jpg", img)[1].tobytes()
+
+
+@pytest.fixture
+def frames():
+    return [_jpeg(i) for i in range(8)]
+
+
+def _read_all(path):
+    cap = cv2.VideoCapture(str(path))
+    out = []
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        out.append(frame)
+    cap.release()
+    return out
+
+
+class TestJpegSize:
+    def test_reads_sof(self):
+        assert jpeg_size(_jpeg(0, (320, 200))) == (320, 200)
+
+    def test_rejects_non_jpeg(self):
+        assert jpeg_size(b"\x00" * 32) is None
+        assert jpeg_size(b"\xff\xd8\xff") is None
+
+
+class TestPassthrough:
+    def test_writes_playable_avi_with_index(self, tmp_path, frames):
+        rec = VideoRecorder(output_dir=tmp_path, mode="mjpeg", segment_s=0)
+        rec_id = rec.start("pt")
+        for f in frames:
+            assert rec.write_frame(f) is True
+        assert rec.write_frame(b"\x00" * 64) is False  # null-padded capture
+        meta = rec.stop()
+
+        assert meta["mode"] == "mjpeg"
+        assert meta["frames"] == len(frames)
+        (seg,) = meta["segments"]
+        assert (seg["width"], seg["height"], seg["frames"]) == (64, 48, len(frames))
+
+        avi = (tmp_path / rec_id / "seg_00000.avi").read_bytes()
+        assert avi[:4] == b"RIFF" and avi[8:12] == b"AVI "
+        assert struct.unpack("<I", avi[4:8])[0] == len(avi) - 8
+        entries = read_segment_index(tmp_path / rec_id / "seg_00000.idx")
+        assert [avi[off : off + n] for _, off, n in entries] == frames
+        assert [t for t, _, _ in entries] == sorted(t for t, _, _ in entries)
+
+        assert len(_read_all(seg["path"])) == len(frames)
+
+    def test_size_rotation_and_ring(self, tmp_path, frames):
+        seg_mb = 3.5 * len(frames[0]) / 1e6  # about three frames per segment
+        rec = VideoRecorder(
+            output_dir=tmp_path, mode="mjpeg", segment_s=0, segment_mb=seg_mb, max_segments=2
+        )
+        rec_id = rec.start()
+        for i in range(20):
+            rec.write_frame(frames[i % len(frames)])
+        meta = rec.stop()
+
+        assert meta["frames"] == 20
+        assert len(meta["segments"]) == 2
+        assert meta["dropped_segments"] > 0
+        on_disk = sorted(p.name for p in (tmp_path / rec_id).glob("*.avi"))
+        assert on_disk == [p.split("/")[-1] for p in (s["path"] for s in meta["segments"])]
+        assert sum(s["frames"] for s in meta["segments"]) < 20
+
+    def test_time_rotation(self, tmp_path, frames):
+        rec = VideoRecorder(output_dir=tmp_path, mode="mjpeg", segment_s=0.02)
+        rec.start()
+        for f in frames:
+            rec.write_frame(f)
+            time.sleep(0.01)
+        meta = rec.stop()
+        assert len(meta["segments"]) >= 2
+        assert meta["segments"][1]["start_s"] >= meta["segments"][0]["end_s"]
+
+    def test_frame_at_and_segment_file(self, tmp_path, frames):
+        rec = VideoRecorder(output_dir=tmp_path, mode="mjpeg", segment_s=0)
+        rec_id = rec.start()
+        for f in frames:
+            rec.write_frame(f)
+            time.sleep(0.002)
+        rec.stop()
+        entries = read_segment_index(tmp_path / rec_id / "seg_00000.idx")
+        assert rec.frame_at(rec_id, entries[3][0]) == frames[3]
+        assert rec.frame_at(rec_id, 1e9) == frames[-1]
+        assert rec.segment_file(rec_id, 0).suffix == ".avi"
+        assert rec.segment_file(rec_id, 5) is None
+
+    def test_frame_at_parses_each_closed_index_once(self, tmp_path, frames, monkeypatch):
+        rec = VideoRecorder(output_dir=tmp_path, mode="mjpeg", segment_s=0)
+        rec_id = rec.start()
+        for f in frames:
+            rec.write_frame(f)
+        rec.stop()
+        calls = []
+        real = recorder_mod.read_segment_index
+        monkeypatch.setattr(
+            recorder_mod, "read_segment_index", lambda p: calls.append(p) or real(p)
+        )
+        for _ in range(5):
+            assert rec.frame_at(rec_id, 1e9) == frames[-1]
+        assert len(calls) == 1
+
+    def test_transcode_to_mp4(self, tmp_path, frames):
+        rec = VideoRecorder(output_dir=tmp_path, mode="mjpeg", segment_s=0, transcode=True)
+        rec_id = rec.start()
+        for f in frames:
+            rec.write_frame(f)
+        rec.stop()
+        assert rec.wait_transcodes(timeout=30)
+        mp4 = rec.segment_file(rec_id, 0)
+        assert mp4.suffix == ".mp4"
+        assert len(_read_all(mp4)) == len(frames)
+        assert not list((tmp_path / rec_id).glob("*.part.mp4"))
+
+    def test_drain_waits_for_on_done(self, monkeypatch):
+        done = []
+
+        def on_done(avi, mp4):
+            time.sleep(0.1)
+            done.append((avi, mp4))
+
+        monkeypatch.setattr(recorder_mod._Transcoder, "_transcode", staticmethod(lambda s: "x.mp4"))
+        tc = recorder_mod._Transcoder(on_done)
+        tc.submit({"path": "x.avi"})
+        assert tc.drain(timeout=5)
+        assert done == [("x.avi", "x.mp4")]
+
+    def test_list_recordings_reports_directory_size(self, tmp_path, frames):
+        rec = VideoRecorder(output_dir=tmp_path, mode="mjpeg")
+        rec.start()
+        rec.write_frame(frames[0])
+        rec.stop()
+        (listed,) = rec.list_recordings()
+        assert listed["size_bytes"] > len(frames[0])
+
+
+class TestConfigure:
+    @pytest.fixture(autouse=True)
+    def _reset(self, monkeypatch):
+        monkeypatch.setattr(recorder_mod, "_recorder", None)
+
+    def test_no_block_keeps_default(self):
+        assert recorder_mod.configure({}) is None
+        assert recorder_mod.active_recorder() is None
+
+    def test_block_builds_singleton(self, tmp_path):
+        rec = recorder_mod.configure(
+            {"recording": {"mode": "mjpeg", "output_dir": str(tmp_path), "max_segments": 3}}
+        )
+        assert rec is recorder_mod.get_recorder()
+        assert rec.mode == "mjpeg"
+        assert recorder_mod.active_recorder() is None
+        rec.start()
+        assert recorder_mod.active_recorder() is rec
+        rec.stop()
+
+    def test_unknown_mode_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            VideoRecorder(output_dir=tmp_path, mode="h264")
@@ -6,7 +6,15 @@ import json
 
 import pytest
 
-from castor.skills.loader import SkillLoader, SkillSelector, _parse_yaml_simple, _split_frontmatter
+import castor.skills.loader as loader_mod
+from castor.skills.loader import (
+    SkillIndex,
+    SkillLoader,
+    SkillSelector,
+    _parse_yaml_simple,
+    _split_frontmatter,
+    _tokenise,
+)
 
 SAMPLE_SKILL_MD = """\
 ---
@@ -191,6 +199,110 @@ class TestSkillSelector:
         assert result["name"] == "navigate-to"
 
 
+class _WordEmbedder:
+    """Deterministic bag-of-words embedder that counts its calls."""
+
+    backend_name = "words"
+    dimensions = 64
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def embed(self, text):
+        self.calls.append(text)
+        vec = [0.0] * self.dimensions
+        for word in _tokenise(text):
+            vec[sum(map(ord, word)) % self.dimensions] += 1.0
+        return vec
+
+
+@pytest.fixture
+def fresh_index(tmp_path, monkeypatch):
+    monkeypatch.setenv("CASTOR_SKILL_DATA", str(tmp_path))
+    monkeypatch.setattr(loader_mod, "_INDEX_CACHE", type(loader_mod._INDEX_CACHE)())
+    monkeypatch.setattr(loader_mod, "_vectors", type(loader_mod._vectors)())
+    monkeypatch.setattr(loader_mod, "_vectors_loaded", False)
+    monkeypatch.setattr(loader_mod, "_embedder", None)
+    return tmp_path
+
+
+class TestSkillIndex:
+    def test_keyword_index_matches_brute_force(self, fresh_index):
+        skills = SkillLoader().load_all()
+        index = SkillIndex.for_skills(skills)
+        for instruction in (
+            "go to the table please",
+            "pick up the red brick",
+            "what do you see",
+            "search for servo specs",
+            "picking things and navigating around",
+        ):
+            instr_words = set(_tokenise(instruction))
+            expected = []
+            for name, skill in skills.items():
+                desc_words = set(_tokenise(skill["description"]))
+                overlap = sum(
+                    any(iw == dw or dw.startswith(iw) or iw.startswith(dw) for dw in desc_words)
+                    for iw in instr_words
+                )
+                expected.append((overlap, name))
+            best = max(expected, key=lambda e: e[0])
+            hit = index.match_keywords(instruction)
+            assert hit == (best[1], best[0])
+
+    def test_index_is_reused_for_same_skills(self, fresh_index):
+        skills = SkillLoader().load_all()
+        assert SkillIndex.for_skills(skills) is SkillIndex.for_skills(dict(skills))
+
+    def test_descriptions_embedded_once(self, fresh_index):
+        skills = SkillLoader().load_all()
+        embedder = _WordEmbedder()
+        selector = SkillSelector(embedder=embedder)
+        for _ in range(5):
+            selector.select("pick up the red brick", skills)
+        # one call per description, then one per instruction
+        assert len(embedder.calls) == len(skills) + 5
+
+    def test_embedding_selection(self, fresh_index):
+        skills = {
+            "a": {"name": "a", "description": "grab the cup with the gripper"},
+            "b": {"name": "b", "description": "drive to the kitchen door"},
+        }
+        selector = SkillSelector(embedder=_WordEmbedder())
+        assert selector._select_by_embedding("drive to the kitchen door", skills)["name"] == "b"
+
+    def test_vectors_persist_across_processes(self, fresh_index, monkeypatch):
+        skills = SkillLoader().load_all()
+        SkillIndex.for_skills(skills).ensure_embeddings(_WordEmbedder())
+        assert (fresh_index / "_index" / "embeddings.json").exists()
+
+        # Simulate a restart: drop in-memory state, keep the disk cache
+        monkeypatch.setattr(loader_mod, "_INDEX_CACHE", type(loader_mod._INDEX_CACHE)())
+        monkeypatch.setattr(loader_mod, "_vectors", type(loader_mod._vectors)())
+        monkeypatch.setattr(loader_mod, "_vectors_loaded", False)
+        embedder = _WordEmbedder()
+        assert SkillIndex.for_skills(skills).ensure_embeddings(embedder)
+        assert embedder.calls == []
+
+    def test_vector_cache_is_bounded_lru(self, fresh_index, monkeypatch):
+        monkeypatch.setattr(loader_mod, "_VECTORS_MAX", 3)
+        embedder = _WordEmbedder()
+        first = {"a": {"name": "a", "description": "grab the cup"}}
+        SkillIndex.for_skills(first).ensure_embeddings(embedder)
+        for i in range(5):
+            skills = {"s": {"name": "s", "description": f"drive to door {i}"}}
+            SkillIndex.for_skills(skills).ensure_embeddings(embedder)
+            SkillIndex.for_skills(first).ensure_embeddings(embedder)  # index keeps its matrix
+        assert len(loader_mod._vectors) == 3
+        assert embedder.calls.count("grab the cup") == 1
+
+    def test_load_all_warms_registered_embedder(self, fresh_index):
+        embedder = _WordEmbedder()
+        loader_mod.set_skill_embedder(embedder)
+        skills = SkillLoader().load_all()
+        assert len(embedder.calls) == len(skills)
+
+
 class TestFrontmatterParsing:
     def test_split_frontmatter(self):
         fm, body = _split_frontmatter(SAMPLE_SKILL_MD)
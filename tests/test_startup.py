@@ -0,0 +1,132 @@
+"""Tests for castor/startup.py — concurrent, dependency-ordered startup."""
+
+import threading
+import time
+
+import pytest
+
+from castor.startup import StartupGraph
+
+
+class TestStartupGraph:
+    def test_independent_steps_run_concurrently(self):
+        g = StartupGraph()
+        for name in ("a", "b", "c"):
+            g.add(name, lambda: time.sleep(0.2))
+        t0 = time.perf_counter()
+        g.run()
+        assert time.perf_counter() - t0 < 0.5
+        assert all(s["status"] == "ok" for s in g.trace()["steps"])
+
+    def test_dependencies_are_respected(self):
+        g = StartupGraph()
+        order = []
+        g.add("brain", lambda: (time.sleep(0.05), order.append("brain")))
+        g.add("tiered", lambda: order.append("tiered"), after=("brain",))
+        g.add("camera", lambda: order.append("camera"))
+        g.run()
+        assert order.index("brain") < order.index("tiered")
+        assert set(order) == {"brain", "tiered", "camera"}
+
+    def test_optional_failure_does_not_block_dependents(self, caplog):
+        g = StartupGraph()
+        ran = []
+
+        def boom():
+            raise RuntimeError("probe failed")
+
+        g.add("probe", boom)
+        g.add("after_probe", lambda: ran.append(1), after=("probe",))
+        g.run()
+        assert ran == [1]
+        steps = {s["name"]: s for s in g.trace()["steps"]}
+        assert steps["probe"]["status"] == "failed"
+        assert "probe failed" in steps["probe"]["error"]
+        assert "probe failed" in caplog.text
+
+    def test_required_failure_raises_and_stops_dependents(self):
+        g = StartupGraph()
+        ran = []
+
+        def brain():
+            raise SystemExit(1)
+
+        g.add("brain", brain, required=True)
+        g.add("tiered", lambda: ran.append(1), after=("brain",))
+        with pytest.raises(SystemExit):
+            g.run()
+        assert ran == []
+        steps = {s["name"]: s for s in g.trace()["steps"]}
+        assert steps["tiered"]["status"] == "pending"
+
+    def test_unknown_dependency_rejected(self):
+        g = StartupGraph()
+        g.add("a", lambda: None, after=("missing",))
+        with pytest.raises(ValueError, match="unknown"):
+            g.run()
+
+    def test_cycle_rejected(self):
+        g = StartupGraph()
+        g.add("a", lambda: None, after=("b",))
+        g.add("b", lambda: None, after=("a",))
+        with pytest.raises(ValueError, match="cycle"):
+            g.run()
+
+    def test_duplicate_step_rejected(self):
+        g = StartupGraph()
+        g.add("a", lambda: None)
+        with pytest.raises(ValueError):
+            g.add("a", lambda: None)
+
+    def test_deferred_steps_wait_for_run_deferred(self):
+        g = StartupGraph()
+        ran = []
+        done = threading.Event()
+
+        @g.step("channels", deferred=True)
+        def _channels():
+            ran.append(threading.current_thread().name)
+
+        g.add("brain", lambda: None)
+        g.run()
+        assert ran == []
+        g.mark("first_tick")
+        g.run_deferred(on_done=done.set)
+        assert done.wait(2.0)
+        assert len(ran) == 1
+        assert "first_tick" in g.trace()["marks"]
+
+    def test_on_done_called_without_deferred_steps(self):
+        g = StartupGraph()
+        called = []
+        assert g.run_deferred(on_done=lambda: called.append(1)) is None
+        assert called == [1]
+
+    def test_eager_step_cannot_depend_on_deferred(self):
+        g = StartupGraph()
+        g.add("late", lambda: None, deferred=True)
+        g.add("early", lambda: None, after=("late",))
+        with pytest.raises(ValueError, match="deferred"):
+            g.run()
+
+    def test_critical_path_follows_slowest_chain(self):
+        g = StartupGraph()
+        with g.inline("config"):
+            time.sleep(0.01)
+        g.add("brain", lambda: time.sleep(0.15), required=True)
+        g.add("camera", lambda: time.sleep(0.02))
+        g.add("tiered", lambda: time.sleep(0.02), after=("brain",))
+        g.run()
+        with g.inline("bounds"):
+            pass
+        assert [s.name for s in g.critical_path()] == ["config", "brain", "tiered", "bounds"]
+        text = g.format_trace()
+        assert "Critical path: config" in text
+        assert "* brain" in text
+
+    def test_inline_failure_is_recorded(self):
+        g = StartupGraph()
+        with pytest.raises(KeyError):
+            with g.inline("config"):
+                raise KeyError("agent")
+        assert g.trace()["steps"][0]["status"] == "failed"
@@ -213,3 +213,60 @@ async def test_loop_survives_execute_error():
     await loop.stop()
     assert loop.stats.errors > 0  # at least one error was caught
     assert loop.stats.frames_captured > 0  # frames were still captured
+
+
+# ── Pipelining / adaptive rate ────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_capture_overlaps_slow_inference_and_drops_stale_frames():
+    counter = {"n": 0}
+    seen = []
+
+    async def get_frame():
+        counter["n"] += 1
+        return counter["n"]
+
+    async def think(frame):
+        seen.append(frame)
+        await asyncio.sleep(0.05)
+        return {"confidence": 0.99, "cmd": "move"}
+
+    loop = StreamingInferenceLoop(
+        get_frame, think, AsyncMock(), fps=30, min_confidence=0.5, adaptive=False
+    )
+    await loop.start()
+    await asyncio.sleep(0.3)
+    await loop.stop()
+    # Camera kept capturing while thinking; stale frames were dropped
+    assert loop.stats.frames_captured > len(seen)
+    assert loop.stats.frames_dropped > 0
+    # Every inference after the first ran on a fresher frame than the last
+    assert seen == sorted(seen)
+    assert len(set(seen)) == len(seen)
+    assert loop.stats.frame_age_samples == loop.stats.actions_executed
+    assert loop.stats.frame_age_ms_max >= 50
+
+
+@pytest.mark.asyncio
+async def test_adaptive_rate_tracks_inference_latency():
+    async def think(frame):
+        await asyncio.sleep(0.1)
+        return {"confidence": 0.99, "cmd": "move"}
+
+    loop = StreamingInferenceLoop(
+        AsyncMock(return_value=b"f"), think, AsyncMock(), fps=30, min_confidence=0.5
+    )
+    await loop._tick(None)
+    assert loop.stats.inference_ms >= 95
+    # 1.5 captures per ~100 ms inference → ~15 fps, well under the 30 fps cap
+    assert loop.target_fps < 20
+    assert loop.target_fps == pytest.approx(1500.0 / loop.stats.inference_ms)
+    assert loop.interval == pytest.approx(1.0 / loop.target_fps)
+
+
+def test_summary_reports_drops_and_frame_age():
+    s = StreamingStats(frames_dropped=3)
+    s.record_frame_age(120.0)
+    assert "dropped=3" in s.summary()
+    assert "frame_age_ms=120/120" in s.summary()
@@ -0,0 +1,207 @@
+"""Tests for TaskScheduler and coordinator scheduling on top of it."""
+
+from __future__ import annotations
+
+import time
+
+from castor.swarm.consensus import SwarmConsensus
+from castor.swarm.coordinator import SwarmCoordinator, SwarmTask
+from castor.swarm.peer import SwarmPeer
+from castor.swarm.scheduler import TaskScheduler, benchmark, locality_score
+from castor.swarm.shared_memory import SharedMemory
+
+
+def _task(task_id: str, priority: int = 5, cap: str | None = None, location=None) -> SwarmTask:
+    return SwarmTask(
+        task_id=task_id,
+        task_type="inspect",
+        goal="look",
+        required_capability=cap,
+        priority=priority,
+        created_at=time.time(),
+        location=location,
+    )
+
+
+def _peer(robot_id: str, caps=None, load: float = 0.0, x=None, y=None) -> SwarmPeer:
+    metrics = {} if x is None else {"x": x, "y": y}
+    return SwarmPeer(
+        robot_id=robot_id,
+        robot_name=robot_id,
+        host="10.0.0.1",
+        port=8000,
+        capabilities=caps or [],
+        last_seen=time.time(),
+        load_score=load,
+        metrics=metrics,
+    )
+
+
+def _coordinator(**kwargs) -> SwarmCoordinator:
+    mem = SharedMemory(robot_id="coord", persist_path="/dev/null/unused")
+    return SwarmCoordinator("coord", mem, SwarmConsensus("coord", mem), **kwargs)
+
+
+class _CountingPriority(int):
+    """Task priority that counts the heap comparisons made on its key."""
+
+    comparisons = 0
+
+    def __neg__(self):
+        return _CountingPriority(-int(self))
+
+    def __eq__(self, other):
+        _CountingPriority.comparisons += 1
+        return int.__eq__(self, other)
+
+    def __lt__(self, other):
+        _CountingPriority.comparisons += 1
+        return int.__lt__(self, other)
+
+    __hash__ = int.__hash__
+
+
+def _comparisons_per_op(n_tasks: int, ops: int, build) -> float:
+    """Average key comparisons per operation against a backlog of *n_tasks*.
+
+    *build* returns ``(push, op)``: how to enqueue a task and the operation
+    being measured.
+    """
+    push, op = build()
+    for i in range(n_tasks):
+        push(_task(f"t{i}", _CountingPriority(i % 10), cap=f"cap{i % 7}"))
+    _CountingPriority.comparisons = 0
+    for _ in range(ops):
+        assert op() is not None
+    return _CountingPriority.comparisons / ops
+
+
+# ---------------------------------------------------------------------------
+# TaskScheduler
+# ---------------------------------------------------------------------------
+
+
+class TestTaskScheduler:
+    def test_priority_then_fifo(self):
+        s = TaskScheduler()
+        for tid, prio in [("a", 1), ("b", 9), ("c", 9), ("d", 5)]:
+            s.push(_task(tid, prio))
+        assert [s.pop().task_id for _ in range(4)] == ["b", "c", "d", "a"]
+        assert s.pop() is None
+
+    def test_capability_queues(self):
+        s = TaskScheduler()
+        s.push(_task("arm-job", 9, cap="arm"))
+        s.push(_task("nav-job", 5, cap="nav"))
+        s.push(_task("any-job", 1))
+        assert s.pop(["nav"]).task_id == "nav-job"
+        assert s.pop(["nav"]).task_id == "any-job"
+        assert s.pop(["nav"]) is None
+        assert s.pending_count() == 1
+
+    def test_lazy_removal_and_replace(self):
+        s = TaskScheduler()
+        s.push(_task("a", 9))
+        s.push(_task("b", 1))
+        assert s.remove("a")
+        assert s.peek().task_id == "b"
+        s.push(_task("b", 10))  # resubmitting replaces the queued copy
+        assert s.pending_count() == 1
+        assert s.pop().priority == 10
+
+    def test_lease_expiry(self):
+        s = TaskScheduler(lease_s=10)
+        task = _task("a")
+        s.push(task)
+        s.claim(s.pop(), "robot-1")
+        assert s.expire_leases(now=time.time() + 5) == []
+        assert s.expire_leases(now=time.time() + 11) == ["a"]
+        assert s.lease("a") is None
+
+    def test_renew_and_complete_supersede_old_deadlines(self):
+        s = TaskScheduler(lease_s=10)
+        s.claim(_task("a"), "robot-1")
+        s.claim(_task("b"), "robot-1")
+        s.renew("a", lease_s=100)
+        s.complete("b")
+        assert s.expire_leases(now=time.time() + 20) == []
+        assert s.lease("a").deadline > time.time() + 90
+
+    def test_explicit_zero_lease_is_not_the_default(self):
+        s = TaskScheduler(lease_s=10)
+        now = time.time()
+        s.claim(_task("a"), "robot-1", lease_s=0)
+        s.claim(_task("b"), "robot-1")
+        s.renew("b", lease_s=0)
+        assert sorted(s.expire_leases(now=now + 1)) == ["a", "b"]
+
+    def test_pop_cost_is_logarithmic_in_backlog(self):
+        def build():
+            s = TaskScheduler()
+            return s.push, lambda: s.pop(["cap1", "cap3"])
+
+        small = _comparisons_per_op(2_000, 200, build)
+        large = _comparisons_per_op(20_000, 200, build)
+        # A heap pays O(log n) per pop (ratio ~1.3 here); a scan pays O(n) (ratio 10)
+        assert large < 2 * small
+
+    def test_benchmark_reports_per_op_costs(self):
+        result = benchmark(n_tasks=2_000, assigns=100)
+        assert set(result) == {"push_us", "pop_us", "claim_cycle_us"}
+        assert all(v > 0 for v in result.values())
+
+
+# ---------------------------------------------------------------------------
+# Coordinator integration
+# ---------------------------------------------------------------------------
+
+
+class TestCoordinatorScheduling:
+    def test_lease_expiry_requeues_task(self):
+        coord = _coordinator(lease_s=0.01)
+        coord.add_peer(_peer("r1"))
+        coord.submit_task(_task("t1"))
+        first = coord.assign_next()
+        assert first is not None
+        time.sleep(0.02)
+        again = coord.assign_next()
+        assert again is not None and again.task.task_id == "t1"
+        assert first.status == "expired"
+
+    def test_failed_task_requeued_completed_task_not(self):
+        coord = _coordinator()
+        coord.add_peer(_peer("r1"))
+        coord.submit_task(_task("ok"))
+        coord.submit_task(_task("bad"))
+        coord.complete_task(coord.assign_next().task.task_id, success=True)
+        coord.complete_task(coord.assign_next().task.task_id, success=False)
+        assert coord.fleet_status()["tasks_pending"] == 1
+        assert coord.assign_next().task.task_id == "bad"
+
+    def test_task_claimed_elsewhere_stays_queued(self):
+        coord = _coordinator()
+        coord.add_peer(_peer("r1"))
+        coord.submit_task(_task("taken", priority=9))
+        coord.submit_task(_task("free", priority=1))
+        other = SwarmConsensus("other-coord", coord._mem)
+        assert other.claim_task("taken")
+        assert coord.assign_next().task.task_id == "free"
+        assert coord._scheduler.is_queued("taken")
+
+    def test_locality_score_prefers_nearby_robot(self):
+        coord = _coordinator(score_fn=locality_score)
+        coord.add_peer(_peer("far", load=0.0, x=100.0, y=0.0))
+        coord.add_peer(_peer("near", load=0.2, x=1.0, y=1.0))
+        coord.submit_task(_task("t", location=(0.0, 0.0)))
+        assert coord.assign_next().assigned_to.robot_id == "near"
+
+    def test_assignment_cost_is_logarithmic_in_backlog(self):
+        def build():
+            coord = _coordinator()
+            for i in range(20):
+                coord.add_peer(_peer(f"r{i}", caps=[f"cap{i % 5}"]))
+            return coord.submit_task, coord.assign_next
+
+        small = _comparisons_per_op(2_000, 200, build)
+        large = _comparisons_per_op(20_000, 200, build)
+        assert large < 2 * small
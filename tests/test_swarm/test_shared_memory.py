@@ -5,7 +5,9 @@ from __future__ import annotations
 import json
 import time
 
-from castor.swarm.shared_memory import MemoryEntry, SharedMemory
+import pytest
+
+from castor.swarm.shared_memory import _META_KEY, MemoryEntry, SharedMemory
 
 
 def _mem(robot_id: str = "robot-A") -> SharedMemory:
@@ -294,3 +296,154 @@ class TestPersistLoad:
         data = json.loads((tmp_path / "mem.json").read_text())
         assert "k" in data
         assert data["k"]["value"] == {"nested": True}
+
+    def test_meta_key_is_reserved(self, tmp_path):
+        path = str(tmp_path / "mem.json")
+        m = SharedMemory("robot-A", persist_path=path)
+        with pytest.raises(ValueError):
+            m.put(_META_KEY, {"summary": {}})
+        peer = SharedMemory("robot-B", persist_path=str(tmp_path / "b.json"))
+        peer._write(_META_KEY, "junk", None, deleted=False)
+        peer.put("k", 1)
+        m.sync_with(peer)
+        assert _META_KEY not in m.keys()
+        m.save()
+        m2 = SharedMemory("robot-A", persist_path=path)
+        m2.load()
+        assert m2.get("k") == 1
+        assert m2.summary() == m.summary()
+
+
+# ---------------------------------------------------------------------------
+# version vectors / delta anti-entropy
+# ---------------------------------------------------------------------------
+
+
+class TestVersionVectors:
+    def test_causal_write_wins_despite_clock_skew(self):
+        a, b = _mem("robot-A"), _mem("robot-B")
+        a.put("k", "first")
+        a._store["k"].timestamp = time.time() + 3600  # A's clock runs far ahead
+        b.sync_with(a)
+        b.put("k", "second")  # causally after A's write
+        a.sync_with(b)
+        assert a.get("k") == b.get("k") == "second"
+
+    def test_concurrent_writes_converge_deterministically(self):
+        a, b = _mem("robot-A"), _mem("robot-B")
+        a.put("k", "from-a")
+        b.put("k", "from-b")
+        a.sync_with(b)
+        assert a.get("k") == b.get("k")
+        assert a._store["k"].version == {"robot-A": 1, "robot-B": 1}
+
+    def test_delete_replicates(self):
+        a, b = _mem("robot-A"), _mem("robot-B")
+        a.put("k", 1)
+        b.sync_with(a)
+        a.delete("k")
+        b.sync_with(a)
+        assert b.get("k") is None
+        assert "k" in b._tombstones
+
+
+class TestDeltaSync:
+    def test_delta_contains_only_unseen_changes(self):
+        a, b = _mem("robot-A"), _mem("robot-B")
+        for i in range(500):
+            a.put(f"k{i}", i)
+        b.apply_delta(a.delta_since(b.summary()))
+        assert len(b.keys()) == 500
+
+        a.put("k7", "changed")
+        a.put("new", True)
+        delta = a.delta_since(b.summary())
+        assert sorted(e["key"] for e in delta["entries"]) == ["k7", "new"]
+        b.apply_delta(delta)
+        assert a.delta_since(b.summary())["entries"] == []
+
+    def test_delta_is_json_serialisable(self):
+        a, b = _mem("robot-A"), _mem("robot-B")
+        a.put("k", {"nested": [1, 2]})
+        wire = json.loads(json.dumps(a.delta_since(b.summary())))
+        assert b.apply_delta(wire) == 1
+        assert b.get("k") == {"nested": [1, 2]}
+
+    def test_multi_peer_gossip_converges(self):
+        import random
+
+        rng = random.Random(7)
+        peers = [_mem(f"robot-{i}") for i in range(10)]
+        for step in range(400):
+            p = rng.choice(peers)
+            key = f"k{rng.randrange(40)}"
+            if rng.random() < 0.15:
+                p.delete(key)
+            else:
+                p.put(key, (p.robot_id, step))
+            if step % 5 == 0:
+                x, y = rng.sample(peers, 2)
+                x.sync_with(y)
+        for _ in range(3):  # a few full gossip rounds
+            for i, p in enumerate(peers):
+                p.sync_with(peers[(i + 1) % len(peers)])
+        states = [{k: v.value for k, v in p.snapshot().items()} for p in peers]
+        assert all(s == states[0] for s in states)
+        assert all(p.summary() == peers[0].summary() for p in peers)
+
+    def test_relayed_changes_reach_third_peer(self):
+        a, b, c = _mem("robot-A"), _mem("robot-B"), _mem("robot-C")
+        a.put("x", 1)
+        b.sync_with(a)
+        c.sync_with(b)  # c never talks to a
+        assert c.get("x") == 1
+
+
+class TestChangeLog:
+    def test_save_appends_only_changes(self, tmp_path):
+        path = tmp_path / "mem.json"
+        m = SharedMemory("robot-A", persist_path=str(path))
+        for i in range(50):
+            m.put(f"k{i}", i)
+        m.save()  # first save writes the snapshot
+        snapshot_bytes = path.read_bytes()
+        m.put("k3", "changed")
+        m.delete("k4")
+        m.save()
+        assert path.read_bytes() == snapshot_bytes
+        log_lines = (tmp_path / "mem.json.log").read_text().splitlines()
+        assert len(log_lines) == 3  # two entries + summary
+
+        m2 = SharedMemory("robot-A", persist_path=str(path))
+        m2.load()
+        assert m2.get("k3") == "changed"
+        assert m2.get("k4") is None
+        assert m2.summary() == m.summary()
+
+    def test_log_compacts_into_snapshot(self, tmp_path):
+        path = tmp_path / "mem.json"
+        m = SharedMemory("robot-A", persist_path=str(path), compact_after=10)
+        m.put("k", 0)
+        m.save()
+        for i in range(20):
+            m.put("k", i)
+            m.save()
+        assert m._log_lines <= 10
+        m2 = SharedMemory("robot-A", persist_path=str(path))
+        m2.load()
+        assert m2.get("k") == 19
+
+    def test_torn_log_tail_is_ignored(self, tmp_path):
+        path = tmp_path / "mem.json"
+        m = SharedMemory("robot-A", persist_path=str(path))
+        m.put("a", 1)
+        m.save()
+        m.put("b", 2)
+        m.save()
+        with open(str(path) + ".log", "a") as fh:
+            fh.write('{"key": "c", "val')
+        m2 = SharedMemory("robot-A", persist_path=str(path))
+        m2.load()
+        assert m2.get("b") == 2
+        m2.put("d", 4)  # own counter continues past the replayed writes
+        assert m2._store["d"].version["robot-A"] == 3
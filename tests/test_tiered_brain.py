@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock
 
+import pytest
+
 from castor.providers.base import Thought
 from castor.tiered_brain import ReactiveLayer, TieredBrain
 
@@ -278,3 +280,185 @@ class TestTieredBrainGetStats:
         fast.think.return_value = Thought("ok", {"type": "move"})
         brain = TieredBrain(fast)
         assert "swarm_count" in brain.stats
+
+
+# ---------------------------------------------------------------------------
+# TieredBrain — asynchronous planner
+# ---------------------------------------------------------------------------
+
+
+class TestTieredBrainAsyncPlanner:
+    SOLID_FRAME = b"\xff\xd8\xff" + b"\x42" * 500
+
+    def _make_brain(self, planner_think, **tb_cfg):
+        fast = MagicMock()
+        fast.think.return_value = Thought("fast", {"type": "move", "linear": 0.2})
+        planner = MagicMock()
+        planner.think.side_effect = planner_think
+        cfg = {"tiered_brain": {"planner_interval": 1, "async_planner": True, **tb_cfg}}
+        return TieredBrain(fast, planner, cfg), fast, planner
+
+    def _wait_done(self, brain, timeout=2.0):
+        import time
+
+        deadline = time.time() + timeout
+        while brain.plan_in_flight and time.time() < deadline:
+            time.sleep(0.005)
+
+    def test_fast_layer_not_blocked_by_slow_planner(self):
+        import threading
+        import time
+
+        release = threading.Event()
+
+        def slow_plan(*_):
+            release.wait(2.0)
+            return Thought("plan", {"type": "stop"})
+
+        brain, fast, planner = self._make_brain(slow_plan)
+        t0 = time.time()
+        for _ in range(5):
+            thought = brain.think(self.SOLID_FRAME, "go")
+            assert thought.action["type"] == "move"
+        assert time.time() - t0 < 1.0
+        assert brain.plan_in_flight
+        assert brain.stats["planner_submitted"] == 1
+        assert brain.stats["planner_coalesced"] == 4
+        release.set()
+        brain.close()
+
+    def test_plan_adopted_on_next_tick_and_fed_to_fast_brain(self):
+        brain, fast, planner = self._make_brain(lambda *_: Thought("plan", {"type": "stop"}))
+        brain.think(self.SOLID_FRAME, "go")
+        self._wait_done(brain)
+        thought = brain.think(self.SOLID_FRAME, "go")
+        assert thought.layer == "planner"
+        assert thought.action["type"] == "stop"
+        assert brain.stats["planner_adopted"] == 1
+        assert brain.last_plan == {"type": "stop"}
+        # Fast brain saw the adopted plan in its instruction on that tick
+        assert "strategic planner" in fast.think.call_args[0][1]
+        brain.close()
+
+    def test_plan_superseded_by_new_instruction(self):
+        brain, fast, planner = self._make_brain(lambda *_: Thought("plan", {"type": "stop"}))
+        brain.think(self.SOLID_FRAME, "go to kitchen")
+        self._wait_done(brain)
+        thought = brain.think(self.SOLID_FRAME, "go to garage")
+        assert thought.action["type"] == "move"
+        assert brain.stats["planner_superseded"] == 1
+        assert brain.stats["planner_adopted"] == 0
+        brain.close()
+
+    def test_expired_plan_discarded(self):
+        brain, fast, planner = self._make_brain(
+            lambda *_: Thought("plan", {"type": "stop"}), plan_ttl_s=0.0
+        )
+        brain.think(self.SOLID_FRAME, "go")
+        self._wait_done(brain)
+        thought = brain.think(self.SOLID_FRAME, "go")
+        assert thought.action["type"] == "move"
+        assert brain.stats["planner_expired"] == 1
+        brain.close()
+
+    def test_planner_error_counted(self):
+        def boom(*_):
+            raise RuntimeError("network error")
+
+        brain, fast, planner = self._make_brain(boom)
+        brain.think(self.SOLID_FRAME, "go")
+        self._wait_done(brain)
+        thought = brain.think(self.SOLID_FRAME, "go")
+        assert thought.action["type"] == "move"
+        assert brain.stats["planner_errors"] == 1
+        brain.close()
+
+
+# ---------------------------------------------------------------------------
+# ReactiveLayer — frame analysis fast paths
+# ---------------------------------------------------------------------------
+
+
+class TestReactiveLayerFrameAnalysis:
+    def _obstacle_result(self):
+        nearest = MagicMock()
+        nearest.class_name = "person"
+        nearest.estimate_distance_m.return_value = 0.4
+        return {
+            "obstacles": [nearest],
+            "nearest_obstacle": nearest,
+            "clear_path": False,
+            "all_detections": [nearest],
+        }
+
+    def _hailo_layer(self, **reactive_cfg):
+        layer = ReactiveLayer({"reactive": reactive_cfg})
+        layer._hailo = MagicMock()
+        layer._hailo.detect_obstacles.return_value = self._obstacle_result()
+        return layer
+
+    def test_blank_sentinel_triggers_wait(self):
+        from castor.tiered_brain import BLANK_FRAME
+
+        action = ReactiveLayer({}).evaluate(BLANK_FRAME)
+        assert action["reason"] == "blank_frame"
+
+    def test_zero_prefixed_frame_with_data_passes(self):
+        frame = b"\x00" * 300 + b"\x01"
+        assert ReactiveLayer({}).evaluate(frame) is None
+
+    def test_raw_array_frame(self):
+        import numpy as np
+
+        layer = ReactiveLayer({})
+        assert layer.evaluate(np.zeros((48, 64, 3), dtype=np.uint8))["reason"] == "blank_frame"
+        assert layer.evaluate(np.full((48, 64, 3), 7, dtype=np.uint8)) is None
+
+    def test_raw_frame_skips_decode(self):
+        import numpy as np
+
+        layer = self._hailo_layer()
+        raw = np.full((48, 64, 3), 9, dtype=np.uint8)
+        frame = b"\xff\xd8\xff" + b"\x42" * 500  # not decodable
+        action = layer.evaluate(frame, raw_frame=raw)
+        assert action["type"] == "stop"
+        assert layer._hailo.detect_obstacles.call_args[0][0] is raw
+
+    def test_decode_reuses_buffer_when_supported(self):
+        cv2 = pytest.importorskip("cv2")
+        import numpy as np
+
+        from castor import tiered_brain
+
+        layer = ReactiveLayer({})
+        img = np.full((48, 64, 3), 120, dtype=np.uint8)
+        jpeg = cv2.imencode(".jpg", img)[1].tobytes()
+        first = layer._decode(jpeg)
+        second = layer._decode(jpeg)
+        assert first.shape == second.shape == (48, 64, 3)
+        assert np.array_equal(first, second)
+        assert tiered_brain._IMDECODE_DST is not None
+        if tiered_brain._IMDECODE_DST:
+            assert second is first or np.shares_memory(first, second)
+        assert layer._decode(b"\xff\xd8garbage") is None
+
+    def test_unchanged_scene_reuses_detection(self):
+        import numpy as np
+
+        layer = self._hailo_layer()
+        raw = np.full((48, 64, 3), 9, dtype=np.uint8)
+        for _ in range(3):
+            assert layer.evaluate(raw)["type"] == "stop"
+        assert layer._hailo.detect_obstacles.call_count == 1
+        assert layer.detect_stats["skipped_unchanged"] == 2
+        layer.evaluate(np.full((48, 64, 3), 200, dtype=np.uint8))
+        assert layer._hailo.detect_obstacles.call_count == 2
+
+    def test_detect_interval_cadence(self):
+        import numpy as np
+
+        layer = self._hailo_layer(hailo_detect_interval=3)
+        for i in range(6):
+            layer.evaluate(np.full((48, 64, 3), i + 1, dtype=np.uint8))
+        assert layer._hailo.detect_obstacles.call_count == 2
+        assert layer.detect_stats["skipped_cadence"] == 4
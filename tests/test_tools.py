@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 from castor.tools import ToolDefinition, ToolRegistry, ToolResult
 
 # ── ToolDefinition ────────────────────────────────────────────────────────────
@@ -167,3 +169,25 @@ def test_register_from_config():
     # get_status should still be the real built-in, not overwritten
     result = reg.call("get_status")
     assert result.ok  # real builtin returns without error
+
+
+class TestSideEffects:
+    def test_default_is_mutate(self):
+        reg = ToolRegistry()
+        reg.register("x", lambda: 1)
+        assert reg.side_effect("x") == "mutate"
+        assert reg.side_effect("missing") == "mutate"
+
+    def test_builtin_classes(self):
+        reg = ToolRegistry()
+        assert reg.side_effect("get_status") == "read_only"
+        assert reg.side_effect("announce_text") == "actuate"
+
+    def test_invalid_side_effect_rejected(self):
+        reg = ToolRegistry()
+        with pytest.raises(ValueError):
+            reg.register("x", lambda: 1, side_effect="sometimes")
+
+    def test_config_side_effect(self):
+        reg = ToolRegistry({"tools": [{"name": "peek", "side_effect": "read_only"}]})
+        assert reg.side_effect("peek") == "read_only"
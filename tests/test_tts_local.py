@@ -4,6 +4,13 @@ from unittest.mock import MagicMock, patch
 
 from castor.tts_local import LocalTTS, _select_engine, available_engines
 
+
+def _tts(engine: str) -> LocalTTS:
+    """A real LocalTTS bound to *engine*, whether or not its library is installed."""
+    with patch("castor.tts_local._select_engine", return_value=engine):
+        return LocalTTS(engine=engine)
+
+
 # ---------------------------------------------------------------------------
 # available_engines / _select_engine
 # ---------------------------------------------------------------------------
@@ -118,9 +125,7 @@ def test_synth_gtts_success():
     """_synth_gtts() returns bytes from gTTS write_to_fp."""
     fake_audio = b"FAKE_MP3_DATA"
 
-    tts = LocalTTS.__new__(LocalTTS)
-    tts._engine = "gtts"
-    tts._language = "en"
+    tts = _tts("gtts")
 
     import sys
 
@@ -140,9 +145,7 @@ def test_synth_gtts_success():
 
 def test_synth_gtts_error_returns_empty():
     """_synth_gtts() returns b'' if gTTS raises."""
-    tts = LocalTTS.__new__(LocalTTS)
-    tts._engine = "gtts"
-    tts._language = "en"
+    tts = _tts("gtts")
 
     import sys
 
@@ -159,10 +162,7 @@ def test_synth_gtts_error_returns_empty():
 
 
 def test_synth_piper_error_returns_empty():
-    tts = LocalTTS.__new__(LocalTTS)
-    tts._engine = "piper"
-    tts._model = None
-    tts._piper_voice = None
+    tts = _tts("piper")
 
     import sys
 
@@ -173,10 +173,7 @@ def test_synth_piper_error_returns_empty():
 
 
 def test_synth_coqui_error_returns_empty():
-    tts = LocalTTS.__new__(LocalTTS)
-    tts._engine = "coqui"
-    tts._model = None
-    tts._coqui_tts = None
+    tts = _tts("coqui")
 
     import sys
 
@@ -193,8 +190,7 @@ def test_synth_coqui_error_returns_empty():
 
 def test_say_no_crash_without_pygame():
     """say() should not raise even when pygame is unavailable."""
-    tts = LocalTTS.__new__(LocalTTS)
-    tts._engine = "none"
+    tts = _tts("none")
 
     # synthesize returns b"", say() should return immediately
     tts.say("anything")  # should not raise
@@ -204,9 +200,7 @@ def test_say_pygame_error_is_swallowed():
     """say() catches pygame errors and returns silently."""
     fake_audio = b"FAKE_AUDIO"
 
-    tts = LocalTTS.__new__(LocalTTS)
-    tts._engine = "gtts"
-    tts._language = "en"
+    tts = _tts("gtts")
 
     import sys
 
@@ -220,3 +214,120 @@ def test_say_pygame_error_is_swallowed():
         patch.dict(sys.modules, {"pygame": pygame_mod}),
     ):
         tts.say("hello")  # should not raise
+
+
+# ---------------------------------------------------------------------------
+# Phrase cache / engine pool / queued playback
+# ---------------------------------------------------------------------------
+
+
+def _gtts_engine(cache=None):
+    with patch("castor.tts_local.HAS_GTTS", True):
+        return LocalTTS(engine="gtts", cache=cache)
+
+
+def test_phrase_cache_skips_resynthesis(tmp_path):
+    from castor.tts_local import PhraseCache
+
+    cache = PhraseCache(tmp_path)
+    tts = _gtts_engine(cache)
+    with patch.object(tts, "_synth_gtts", return_value=b"MP3") as synth:
+        assert tts.synthesize("Battery low") == b"MP3"
+        assert tts.synthesize("Battery low") == b"MP3"
+    synth.assert_called_once()
+    assert cache.hits == 1
+    assert list(tmp_path.glob("*/*.mp3"))
+
+
+def test_phrase_cache_key_depends_on_voice():
+    from castor.tts_local import PhraseCache
+
+    a = PhraseCache.key("piper", "en_US-lessac-medium", "en", "hello")
+    b = PhraseCache.key("piper", "en_GB-alan-low", "en", "hello")
+    assert a != b
+    assert a == PhraseCache.key("piper", "en_US-lessac-medium", "en", " hello ")
+
+
+def test_phrase_cache_evicts_lru(tmp_path):
+    import os
+    import time
+
+    from castor.tts_local import PhraseCache
+
+    cache = PhraseCache(tmp_path, max_bytes=250)
+    for i in range(3):
+        key = PhraseCache.key("gtts", None, "en", f"p{i}")
+        cache.put(key, "mp3", b"x" * 100)
+        path = tmp_path / key[:2] / f"{key}.mp3"
+        if path.exists():
+            os.utime(path, (time.time() - 10 + i, time.time() - 10 + i))
+    assert cache.get(PhraseCache.key("gtts", None, "en", "p0"), "mp3") is None
+    assert cache.get(PhraseCache.key("gtts", None, "en", "p2"), "mp3") == b"x" * 100
+
+
+def test_get_tts_pools_engines(tmp_path, monkeypatch):
+    import castor.tts_local as mod
+
+    monkeypatch.setenv("CASTOR_TTS_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(mod, "_pool", {})
+    monkeypatch.setattr(mod, "_phrase_cache", None)
+    with (
+        patch("castor.tts_local.HAS_PIPER", False),
+        patch("castor.tts_local.HAS_COQUI", False),
+        patch("castor.tts_local.HAS_GTTS", True),
+    ):
+        a = mod.get_tts(engine="gtts", language="en")
+        b = mod.get_tts(engine="gtts", language="en")
+        c = mod.get_tts(engine="gtts", language="de")
+    assert a is b
+    assert a is not c
+    assert a._cache is mod.get_phrase_cache()
+
+
+def test_say_nowait_returns_immediately_and_plays_in_order():
+    import threading
+
+    import castor.tts_local as mod
+
+    gate = threading.Event()
+    played = []
+    tts = _gtts_engine()
+
+    def slow_synth(text):
+        gate.wait(timeout=2)
+        return text.encode()
+
+    with (
+        patch.object(tts, "synthesize", side_effect=slow_synth),
+        patch("castor.tts_local._play_audio", side_effect=played.append),
+    ):
+        tts.say_nowait("one")
+        tts.say_nowait("two")
+        assert played == []  # caller was not blocked on synthesis
+        gate.set()
+        assert mod.wait_for_playback(timeout=2)
+    assert played == [b"one", b"two"]
+
+
+async def test_synthesize_async():
+    tts = _gtts_engine()
+    with patch.object(tts, "_synth_gtts", return_value=b"MP3"):
+        assert await tts.synthesize_async("hi") == b"MP3"
+
+
+def test_warm_waits_for_in_flight_synthesis():
+    import sys
+    import threading
+
+    tts = _tts("piper")
+    piper_mod = MagicMock()
+    with patch.dict(sys.modules, {"piper": piper_mod}):
+        with tts._synth_lock:
+            t = threading.Thread(target=tts.warm)
+            t.start()
+            t.join(timeout=0.2)
+            assert t.is_alive()
+            piper_mod.PiperVoice.load.assert_not_called()
+        t.join(timeout=2.0)
+    piper_mod.PiperVoice.load.assert_called_once()
+    assert tts._piper_voice is piper_mod.PiperVoice.load.return_value
@@ -176,3 +176,88 @@ class TestSpeakerSentenceChunking:
         total_chars = sum(len(c) for c in chunks)
         # All characters must be preserved (minus whitespace trimming)
         assert total_chars >= len(text.strip()) - len(chunks)  # allow for join whitespace
+
+
+# ---------------------------------------------------------------------------
+# TranscriptionWorker
+# ---------------------------------------------------------------------------
+
+
+class TestTranscriptionWorker:
+    def test_whisper_model_loaded_once_and_fed_pcm(self, monkeypatch):
+        import sys
+
+        import numpy as np
+
+        fake_model = MagicMock()
+        fake_model.transcribe.return_value = {"text": " go forward "}
+        whisper_mod = MagicMock()
+        whisper_mod.load_model.return_value = fake_model
+        monkeypatch.setitem(sys.modules, "whisper", whisper_mod)
+        monkeypatch.setattr(voice_mod, "_whisper_models", {})
+
+        worker = voice_mod.TranscriptionWorker(engine="whisper_local", model_name="tiny")
+        try:
+            pcm = b"\x00\x10" * 16000
+            for _ in range(3):
+                result = worker.transcribe(pcm, timeout=5)
+                assert result["text"] == "go forward"
+                assert result["engine"] == "whisper_local"
+        finally:
+            worker.stop()
+
+        whisper_mod.load_model.assert_called_once_with("tiny")
+        arg = fake_model.transcribe.call_args[0][0]
+        assert isinstance(arg, np.ndarray) and arg.dtype == np.float32
+        assert worker.stats()["model_load_ms"] is not None
+
+    def test_stats_percentiles(self):
+        worker = voice_mod.TranscriptionWorker(backend=lambda pcm, rate: "ok")
+        try:
+            for _ in range(5):
+                worker.transcribe(b"\x01\x00" * 100, timeout=5)
+        finally:
+            worker.stop()
+        stats = worker.stats()
+        assert stats["jobs"] == 5
+        assert stats["sample_count"] == 5
+        assert stats["p50_ms"] is not None and stats["p99_ms"] >= stats["p50_ms"]
+
+    def test_stream_reports_partials(self):
+        import threading
+
+        seen = []
+        done = threading.Event()
+
+        def backend(pcm, rate):
+            return f"{len(pcm) // 2} samples"
+
+        def on_partial(result):
+            seen.append(result)
+            done.set()
+
+        worker = voice_mod.TranscriptionWorker(backend=backend)
+        chunks = [b"\x00\x00" * 8000] * 4  # 2 s at 16 kHz
+        try:
+            final = worker.stream(chunks, on_partial=on_partial, partial_every_s=0.5)
+            done.wait(2)
+        finally:
+            worker.stop()
+        assert final["text"] == "32000 samples"
+        assert not final["partial"]
+        assert seen and all(r["partial"] for r in seen)
+
+    def test_submit_wav_unpacks_pcm(self):
+        got = {}
+
+        def backend(pcm, rate):
+            got["pcm"], got["rate"] = pcm, rate
+            return "hi"
+
+        wav = voice_mod._pcm_to_wav(b"\x01\x02" * 10, 8000)
+        worker = voice_mod.TranscriptionWorker(backend=backend)
+        try:
+            assert worker.submit_wav(wav).result(5)["text"] == "hi"
+        finally:
+            worker.stop()
+        assert got == {"pcm": b"\x01\x02" * 10, "rate": 8000}
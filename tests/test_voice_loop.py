@@ -90,13 +90,13 @@ class TestVoiceAssistantLoopTTS:
     def test_tts_calls_say(self):
         loop = VoiceAssistantLoop()
         mock_tts = MagicMock()
-        with patch("castor.tts_local.LocalTTS", return_value=mock_tts):
+        with patch("castor.tts_local.get_tts", return_value=mock_tts):
             loop._tts("hello world")
         mock_tts.say.assert_called_once_with("hello world")
 
     def test_tts_exception_suppressed(self):
         loop = VoiceAssistantLoop()
-        with patch("castor.tts_local.LocalTTS", side_effect=Exception("no tts")):
+        with patch("castor.tts_local.get_tts", side_effect=Exception("no tts")):
             loop._tts("test")  # should not raise
 
 
@@ -110,3 +110,98 @@ class TestGetVoiceLoopSingleton:
         brain = MagicMock()
         loop = get_voice_loop(brain=brain)
         assert loop._brain is brain
+
+
+# ── Streaming pipeline ────────────────────────────────────────────────
+
+
+def _wav(segments):
+    """Build 16 kHz mono WAV bytes from (seconds, amplitude) segments."""
+    import io
+    import math
+    import struct
+    import wave
+
+    samples = []
+    for seconds, amp in segments:
+        n = int(16000 * seconds)
+        samples.extend(int(amp * math.sin(2 * math.pi * 440 * i / 16000)) for i in range(n))
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+    return buf.getvalue()
+
+
+class TestVADEndpointing:
+    def test_recording_stops_when_speaker_stops(self):
+        import io
+        import wave
+
+        src = vl_mod.WavFileSource(_wav([(0.3, 0), (1.0, 8000), (2.0, 0), (3.0, 8000)]))
+        vad = vl_mod.VoiceActivityDetector(use_webrtc=False)
+        audio = vl_mod.record_utterance(src, vad, silence_ms=300)
+        with wave.open(io.BytesIO(audio)) as wf:
+            seconds = wf.getnframes() / wf.getframerate()
+        # 1 s of speech + pre-roll + trailing silence, not the full clip
+        assert 1.0 <= seconds < 2.0
+        assert not src.exhausted
+
+    def test_no_speech_returns_empty(self):
+        src = vl_mod.WavFileSource(_wav([(1.0, 0)]))
+        vad = vl_mod.VoiceActivityDetector(use_webrtc=False)
+        assert vl_mod.record_utterance(src, vad, start_timeout_s=0.5) == b""
+
+    def test_loop_reuses_audio_source(self):
+        src = vl_mod.WavFileSource(_wav([(0.5, 8000), (1.0, 0), (0.5, 8000), (1.0, 0)]))
+        loop = VoiceAssistantLoop(
+            audio_source=src, vad=vl_mod.VoiceActivityDetector(use_webrtc=False)
+        )
+        assert loop._record_audio()
+        assert loop._record_audio()
+        assert loop._audio_source is src
+
+
+class TestStreamingReply:
+    def test_split_sentences(self):
+        chunks = ["Hello the", "re. How are", " you? Fine"]
+        assert list(vl_mod.split_sentences(chunks)) == ["Hello there.", "How are you?", "Fine"]
+
+    def test_first_sentence_spoken_before_stream_ends(self):
+        import threading
+
+        release = threading.Event()
+        spoken = []
+
+        def think_stream(image, text):
+            yield "Turning left now. "
+            release.wait(timeout=2)
+            yield "Done."
+
+        brain = MagicMock(spec=["think", "think_stream"])
+        brain.think_stream.side_effect = think_stream
+        loop = VoiceAssistantLoop(brain=brain)
+        loop._interpreter = MagicMock()
+        loop._interpreter.interpret.return_value = {
+            "safety": {"explanation_id": "x", "policy_id": "p"},
+            "execution_allowed": True,
+        }
+
+        def fake_tts(text):
+            spoken.append(text)
+            release.set()  # only unblocks the LLM once audio has started
+
+        loop._tts = fake_tts
+        reply = loop.respond("turn left")
+        assert spoken == ["Turning left now.", "Done."]
+        assert reply == "Turning left now. Done."
+        assert loop.stats["avg_first_audio_ms"] > 0
+
+    def test_tts_engine_reused_across_replies(self):
+        loop = VoiceAssistantLoop()
+        with patch("castor.tts_local.get_tts") as get_tts:
+            loop._tts("one")
+            loop._tts("two")
+        assert get_tts.call_count == 1